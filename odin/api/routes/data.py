@@ -6,11 +6,15 @@ Supports: BTC, ETH, SOL, XRP, BNB, SUI, HYPE
 
 import asyncio
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import aiohttp
+import numpy as np
 from fastapi import APIRouter, HTTPException, Query, Response, status
 
+from odin.core.data_collector import TechnicalIndicators
+from odin.core.indicator_cache import get_indicator_cache
+from odin.data.exchange_streams import get_stream_manager
 from odin.utils.cache import CACHE_PRESETS, cached
 from odin.utils.logging import (
     LogContext,
@@ -637,12 +641,118 @@ async def fetch_yahoo_price(symbol: str) -> Dict[str, Any]:
         return None
 
 
+# =============================================================================
+# Source Racing for Current Prices
+# =============================================================================
+
+PriceFetcher = Callable[[str], Awaitable[Optional[Dict[str, Any]]]]
+
+# Crypto price sources, richest data first
+CURRENT_PRICE_SOURCES: List[Tuple[str, PriceFetcher]] = [
+    ("kraken", fetch_kraken_price),  # Includes bid/ask
+    ("hyperliquid", fetch_hyperliquid_price),  # Includes funding rate and OI
+    ("coingecko", fetch_coingecko_price),
+    ("coinbase", fetch_coinbase_price),  # Spot price only
+]
+
+# How long a richer source may keep a faster, poorer answer waiting
+PRICE_PREFERENCE_WINDOW_MS = 150
+
+
+def _valid_price(data: Optional[Dict[str, Any]]) -> bool:
+    return bool(data) and (data.get("price") or 0) > 0
+
+
+async def race_price_sources(
+    symbol: str,
+    sources: List[Tuple[str, PriceFetcher]],
+    preference_window_ms: float = PRICE_PREFERENCE_WINDOW_MS,
+) -> Tuple[Optional[str], Optional[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Query all price sources at once and pick a winner.
+
+    Sources are ranked by list order. Until ``preference_window_ms`` has
+    passed, a valid answer is only taken if no higher-ranked source is still
+    pending; after that, the best answer received so far wins. Sources still
+    running when a winner is chosen are cancelled.
+
+    Args:
+        symbol: Asset symbol
+        sources: ``(name, fetcher)`` pairs in preference order
+        preference_window_ms: Milliseconds to wait for a richer source
+
+    Returns:
+        Tuple of (winning source name, its data, per-source race report)
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    deadline = started + preference_window_ms / 1000
+
+    tasks = {
+        asyncio.create_task(fetcher(symbol)): (rank, name)
+        for rank, (name, fetcher) in enumerate(sources)
+    }
+    report: Dict[str, Dict[str, Any]] = {
+        name: {"status": "cancelled", "latency_ms": None} for name, _ in sources
+    }
+    pending = set(tasks)
+    best: Optional[Tuple[int, str, Dict[str, Any]]] = None
+
+    try:
+        while pending:
+            if best is not None:
+                better_pending = any(tasks[task][0] < best[0] for task in pending)
+                if not better_pending or loop.time() >= deadline:
+                    break
+                timeout = deadline - loop.time()
+            else:
+                timeout = None
+
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                rank, name = tasks[task]
+                elapsed_ms = (loop.time() - started) * 1000
+                report[name]["latency_ms"] = round(elapsed_ms, 1)
+                try:
+                    data = task.result()
+                except Exception as e:
+                    logger.warning(f"Price source {name} failed for {symbol}: {e}")
+                    data = None
+
+                if not _valid_price(data):
+                    report[name]["status"] = "failed"
+                    continue
+
+                report[name]["status"] = "ok"
+                if best is None or rank < best[0]:
+                    best = (rank, name, data)
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    if best is None:
+        return None, None, report
+
+    report[best[1]]["status"] = "won"
+    return best[1], best[2], report
+
+
 @router.get("/current", response_model=Dict[str, Any])
 async def get_current_price(
     symbol: str = Query(
         default="BTC",
         description="Asset symbol (crypto, metal, or stock)",
-    )
+    ),
+    prefer_within_ms: int = Query(
+        default=PRICE_PREFERENCE_WINDOW_MS,
+        ge=0,
+        le=5000,
+        description="How long (ms) a richer crypto source may take to win",
+    ),
 ):
     """Get current price for crypto, precious metals, or stocks."""
     try:
@@ -689,67 +799,44 @@ async def get_current_price(
 
         coin_name = COIN_MAPPINGS[symbol]["name"]
 
-        # Try Kraken first (most complete data, includes bid/ask)
-        kraken_data = await fetch_kraken_price(symbol)
-        if kraken_data and kraken_data.get("price", 0) > 0:
-            return {
-                "success": True,
-                "message": f"{coin_name} data retrieved successfully",
-                "data": kraken_data,
-                "error": None,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-
-        # Try Hyperliquid (includes funding rate and open interest)
-        hyperliquid_data = await fetch_hyperliquid_price(symbol)
-        if hyperliquid_data and hyperliquid_data.get("price", 0) > 0:
-            return {
-                "success": True,
-                "message": f"{coin_name} data retrieved successfully (with funding rate)",
-                "data": hyperliquid_data,
-                "error": None,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-
-        # Fallback to CoinGecko
-        coingecko_data = await fetch_coingecko_price(symbol)
-        if coingecko_data and coingecko_data.get("price", 0) > 0:
-            return {
-                "success": True,
-                "message": f"{coin_name} data retrieved successfully",
-                "data": coingecko_data,
-                "error": None,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
+        winner, data, race = await race_price_sources(
+            symbol, CURRENT_PRICE_SOURCES, prefer_within_ms
+        )
+        if winner is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"All data sources are currently unavailable for {coin_name}",
+            )
 
-        # Last fallback to Coinbase
-        coinbase_data = await fetch_coinbase_price(symbol)
-        if coinbase_data and coinbase_data.get("price", 0) > 0:
+        message = f"{coin_name} data retrieved successfully"
+        if winner == "hyperliquid":
+            message += " (with funding rate)"
+        elif winner == "coinbase":
             # Supplement Coinbase data with estimated values
-            price = coinbase_data["price"]
-            coinbase_data.update(
-                {
-                    "change_24h": 0.0,
-                    "change_24h_abs": 0.0,
-                    "high_24h": round(price * 1.02, 2),
-                    "low_24h": round(price * 0.98, 2),
-                    "volume": 0.0,
-                    "volume_24h": 0.0,
-                }
-            )
-            return {
-                "success": True,
-                "message": f"{coin_name} data retrieved successfully (limited data)",
-                "data": coinbase_data,
-                "error": None,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+            price = data["price"]
+            data = {
+                **data,
+                "change_24h": 0.0,
+                "change_24h_abs": 0.0,
+                "high_24h": round(price * 1.02, 2),
+                "low_24h": round(price * 0.98, 2),
+                "volume": 0.0,
+                "volume_24h": 0.0,
             }
+            message += " (limited data)"
 
-        # All sources failed
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"All data sources are currently unavailable for {coin_name}",
-        )
+        return {
+            "success": True,
+            "message": message,
+            "data": data,
+            "error": None,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "source": {
+                "winner": winner,
+                "preference_window_ms": prefer_within_ms,
+                "sources": race,
+            },
+        }
 
     except HTTPException:
         raise
@@ -768,7 +855,9 @@ async def get_coin_price(
     )
 ):
     """Alias for /current endpoint - Get current asset price."""
-    return await get_current_price(symbol=symbol)
+    return await get_current_price(
+        symbol=symbol, prefer_within_ms=PRICE_PREFERENCE_WINDOW_MS
+    )
 
 
 @router.get("/assets", response_model=Dict[str, Any])
@@ -811,6 +900,50 @@ async def get_available_assets():
     }
 
 
+def _history_timeframe(hours: int) -> Tuple[str, int]:
+    """Bar size (name, minutes) used for a history window."""
+    if hours <= 24:
+        return "1h", 60  # 1 hour candles
+    elif hours <= 168:  # 7 days
+        return "4h", 240  # 4 hour candles
+    return "1d", 1440  # 1 day candles
+
+
+def local_history(symbol: str, hours: int) -> Optional[Dict[str, Any]]:
+    """
+    History from locally aggregated bars, if they cover the whole window.
+
+    Returns:
+        Same shape as fetch_kraken_history, or None when local bars are
+        missing at the start of the window or no trade has been streamed in
+        the current interval
+    """
+    timeframe, interval = _history_timeframe(hours)
+    seconds = interval * 60
+    now = datetime.now(timezone.utc).timestamp()
+    start = int(now - hours * 3600)
+
+    candles = get_stream_manager().candles
+    bars = candles.get_bars(symbol, timeframe, start=start)
+    current_open = int(now // seconds * seconds)
+    if not bars or bars[0]["timestamp"] > start + seconds:
+        return None
+    # Seeded or stored bars alone can be hours old: require the partial bar
+    # or a trade inside the current interval
+    if (
+        bars[-1]["timestamp"] < current_open
+        and candles.watermarks.get(symbol.upper(), 0.0) < current_open
+    ):
+        return None
+
+    return {
+        "history": bars,
+        "hours": hours,
+        "interval_minutes": interval,
+        "source": "local",
+    }
+
+
 @cached(ttl=CACHE_PRESETS["history"], key_prefix="kraken_history")
 async def fetch_kraken_history(symbol: str, hours: int) -> Dict[str, Any]:
     """Fetch historical data from Kraken with caching."""
@@ -818,12 +951,7 @@ async def fetch_kraken_history(symbol: str, hours: int) -> Dict[str, Any]:
     kraken_pair = coin_config["kraken"]
 
     # Determine interval based on hours requested
-    if hours <= 24:
-        interval = 60  # 1 hour candles
-    elif hours <= 168:  # 7 days
-        interval = 240  # 4 hour candles
-    else:
-        interval = 1440  # 1 day candles
+    _, interval = _history_timeframe(hours)
 
     async with aiohttp.ClientSession() as session:
         async with session.get(
@@ -880,7 +1008,12 @@ async def get_price_history(
     hours: int,
     symbol: str = Query(default="BTC", description="Cryptocurrency symbol")
 ):
-    """Get historical cryptocurrency price data from Kraken."""
+    """
+    Get historical cryptocurrency price data.
+
+    Served from bars aggregated from the live trade stream when they cover
+    the window; otherwise fetched from Kraken and used to seed local bars.
+    """
     if hours < 1 or hours > 720:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -896,12 +1029,16 @@ async def get_price_history(
         )
 
     try:
-        data = await fetch_kraken_history(symbol, hours)
+        data = local_history(symbol, hours)
         if data is None:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Kraken API unavailable",
-            )
+            data = await fetch_kraken_history(symbol, hours)
+            if data is None:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Kraken API unavailable",
+                )
+            timeframe, _ = _history_timeframe(hours)
+            get_stream_manager().candles.seed(symbol, timeframe, data["history"])
 
         return {
             "success": True,
@@ -921,7 +1058,7 @@ async def get_price_history(
 
 
 @router.get("/analytics/{symbol}", response_model=Dict[str, Any])
-@cached(ttl=300)
+@cached(ttl=300, stale_ttl=300)
 async def get_analytics(
     symbol: str,
     hours: int = Query(default=168, description="Hours of data for analysis"),
@@ -1012,6 +1149,163 @@ async def get_analytics(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/indicators/{symbol}", response_model=Dict[str, Any])
+@cached(ttl=CACHE_PRESETS["history"])
+async def get_indicators(
+    symbol: str,
+    hours: int = Query(default=168, description="Hours of data for analysis"),
+    include_series: bool = Query(
+        default=False, description="Include full indicator series"
+    ),
+):
+    """Get every technical indicator for a symbol in a single call."""
+    history_data = await get_price_history(hours=hours, symbol=symbol)
+    history = history_data["data"]["history"]
+    if not history:
+        raise HTTPException(status_code=400, detail="Insufficient data")
+
+    prices = [h["price"] for h in history]
+    indicator_cache = get_indicator_cache()
+    price_array = np.asarray(prices, dtype=float)
+    indicators = indicator_cache.get_or_compute(
+        "all_indicators",
+        {},
+        indicator_cache.fingerprint(price_array),
+        lambda: TechnicalIndicators.all_indicators(price_array),
+    )
+
+    data = {
+        "symbol": symbol.upper(),
+        "points": len(prices),
+        "current_price": prices[-1],
+        "latest": TechnicalIndicators.latest_values(indicators),
+    }
+
+    if include_series:
+        series = {"timestamps": [h["timestamp"] for h in history]}
+        for prefix in ("sma", "ema"):
+            for period, row in zip(indicators[f"{prefix}_periods"], indicators[prefix]):
+                series[f"{prefix}_{period}"] = _series_to_list(row)
+        for key, values in indicators.items():
+            if key not in ("sma", "ema", "sma_periods", "ema_periods"):
+                series[key] = _series_to_list(values)
+        data["series"] = series
+
+    return {
+        "success": True,
+        "message": f"Calculated indicators over {len(prices)} data points",
+        "data": data,
+        "error": None,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+@router.get("/candles/{symbol}", response_model=Dict[str, Any])
+async def get_candles(
+    symbol: str,
+    timeframe: str = Query(default="1m", description="1m, 5m, 1h, 4h or 1d"),
+    limit: int = Query(default=500, ge=1, le=5000),
+    include_partial: bool = Query(
+        default=True, description="Include the bar that is still forming"
+    ),
+):
+    """OHLCV bars aggregated locally from the live trade stream."""
+    symbol = symbol.upper()
+    candles = get_stream_manager().candles
+    if timeframe not in candles.timeframes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported timeframe: {timeframe}",
+        )
+
+    bars = candles.get_bars(
+        symbol, timeframe, limit=limit, include_partial=include_partial
+    )
+    partial = candles.partial_bar(symbol, timeframe)
+    return {
+        "success": True,
+        "data": {
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "bars": bars,
+            "partial": partial.to_dict() if partial else None,
+        },
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+DEPTH_BPS_BANDS = (10, 25, 50, 100)
+
+
+@router.get("/depth/{symbol}", response_model=Dict[str, Any])
+async def get_order_book_depth(
+    symbol: str,
+    levels: int = Query(default=50, ge=1, le=500, description="Levels per side"),
+    exchange: Optional[str] = Query(default=None, description="binance or kraken"),
+):
+    """
+    Order book depth served from the locally maintained L2 book.
+
+    Books for every coin in ``COIN_MAPPINGS`` are tracked from startup; this
+    request only reads them and never opens a depth stream itself.
+    """
+    symbol = symbol.upper()
+    if symbol not in COIN_MAPPINGS:
+        raise HTTPException(status_code=404, detail=f"Unknown symbol: {symbol}")
+
+    stream_mgr = get_stream_manager()
+    if exchange is not None and exchange not in stream_mgr.connectors:
+        raise HTTPException(
+            status_code=404, detail=f"Exchange not connected: {exchange}"
+        )
+
+    book = stream_mgr.get_order_book(symbol, exchange)
+    if book is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"No synced order book for {symbol}",
+        )
+
+    return {
+        "success": True,
+        "data": {
+            "symbol": symbol,
+            "exchange": book.exchange,
+            **book.snapshot(levels),
+            "depth_bps": {
+                str(bps): book.depth_at_bps(bps) for bps in DEPTH_BPS_BANDS
+            },
+        },
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+@router.get("/bbo/{symbol}", response_model=Dict[str, Any])
+async def get_consolidated_bbo(symbol: str):
+    """Best bid/offer across all connected exchanges, with per-venue staleness."""
+    symbol = symbol.upper()
+    if symbol not in COIN_MAPPINGS:
+        raise HTTPException(status_code=404, detail=f"Unknown symbol: {symbol}")
+
+    bbo = get_stream_manager().get_bbo(symbol)
+    if bbo is None or bbo["best"] is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"No fresh quotes for {symbol}",
+        )
+
+    return {
+        "success": True,
+        "data": bbo,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def _series_to_list(values) -> List[Any]:
+    """Convert an indicator array to JSON-safe values (NaN becomes None)."""
+    return [None if value != value else round(value, 4) for value in values.tolist()]
+
+
 def _calc_rsi(prices, period=14):
     if len(prices) < period + 1:
         return 50
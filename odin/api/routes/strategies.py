@@ -3,12 +3,14 @@ Strategy Management API - Consolidated from 6 separate files
 All strategy-related endpoints in one clean, organized file
 """
 
+import asyncio
 import logging
 import random
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
+import pandas as pd
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from odin.api.dependencies import (
@@ -21,16 +23,118 @@ from odin.api.dependencies import (
     require_authentication,
     validate_timeframe,
 )
+from odin.core.database import get_database
 from odin.core.portfolio_manager import PortfolioManager
+from odin.data.archive import get_price_archive
+from odin.data.exchange_streams import get_stream_manager
 from odin.strategies.base import BaseStrategy
+from odin.strategies.batch import BatchBacktester
 from odin.strategies.bollinger_bands import BollingerBandsStrategy
 from odin.strategies.macd import MACDStrategy
 from odin.strategies.moving_average import MovingAverageStrategy
+from odin.strategies.optimization import WalkForwardOptimizer
+from odin.strategies.result_cache import get_backtest_cache
+from odin.strategies.robustness import MonteCarloAnalyzer
 from odin.strategies.rsi import RSIStrategy
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Optimization request keys passed straight to WalkForwardOptimizer
+OPTIMIZER_OPTIONS = (
+    "method",
+    "objective",
+    "folds",
+    "train_fraction",
+    "anchored",
+    "n_trials",
+    "grid_points",
+    "warmup_bars",
+    "initial_capital",
+    "workers",
+    "seed",
+)
+# Upper bounds on optimization options that size the work of one request
+OPTIMIZER_LIMITS = {"workers": 8, "n_trials": 500, "folds": 20, "grid_points": 10}
+
+# Robustness request keys passed straight to MonteCarloAnalyzer
+ROBUSTNESS_OPTIONS = ("method", "paths", "confidence", "block_size", "workers", "seed")
+# Upper bounds on robustness options that size the work of one request
+ROBUSTNESS_LIMITS = {"paths": 100_000, "workers": 8}
+
+LEADERBOARD_NAMES = {
+    "ma": "Moving Average",
+    "rsi": "RSI Momentum",
+    "bb": "Bollinger Bands",
+    "macd": "MACD Trend",
+}
+
+
+def load_price_frame(
+    hours: int, symbol: str = "BTC", timeframe: str = "1h", align: int = 0
+) -> pd.DataFrame:
+    """
+    OHLCV bars for the last `hours` from the price archive and candle store.
+
+    When the columnar archive reaches back to the start of the window, the
+    archived range is read from it and only newer bars come from the candle
+    store.
+
+    Args:
+        hours: Lookback window
+        symbol: Asset symbol
+        timeframe: Bar size known to the candle aggregator
+        align: Snap the window start down to a multiple of this many
+            seconds, so repeated requests share a first bar
+
+    Returns:
+        DataFrame indexed by bar open time; empty if no bars are stored
+    """
+    start = int(time.time()) - hours * 3600
+    if align > 0:
+        start -= start % align
+    archived = None
+    archive = get_price_archive(symbol, timeframe)
+    if len(archive) and archive.start <= start:
+        archived = archive.frame(start=start)
+        start = archive.end + 1
+
+    rows = get_stream_manager().candles.get_bars(
+        symbol, timeframe, start=start, include_partial=False
+    )
+    if not rows:
+        rows = get_database().get_ohlcv(symbol, timeframe, start=start)
+
+    columns = ["open", "high", "low", "close", "volume"]
+    if not rows:
+        return archived if archived is not None else pd.DataFrame(columns=columns)
+    frame = pd.DataFrame(rows)
+    frame.index = pd.to_datetime(frame["timestamp"], unit="s")
+    frame = frame[columns].astype(float)
+    if archived is not None:
+        frame = pd.concat([archived, frame])
+    return frame
+
+
+def bounded_options(
+    config: Dict[str, Any], keys: Tuple[str, ...], limits: Dict[str, int]
+) -> Dict[str, Any]:
+    """
+    Pick the request keys passed to an analyzer, clamping those in ``limits``
+    to between 1 and their limit.
+
+    Raises:
+        ValueError: If a limited option is not an integer
+    """
+    options = {key: config[key] for key in keys if key in config}
+    for key, limit in limits.items():
+        if key in options:
+            try:
+                options[key] = max(1, min(int(options[key]), limit))
+            except (TypeError, ValueError):
+                raise ValueError(f"{key} must be an integer")
+    return options
+
 # =============================================================================
 # STRATEGY LISTING & ANALYSIS
 # =============================================================================
@@ -174,7 +278,14 @@ async def backtest_strategy(
     rate_limiter=Depends(get_strategy_rate_limiter),
     validated_hours: int = Depends(validate_timeframe),
 ):
-    """Run comprehensive backtest for strategy."""
+    """
+    Backtest a strategy on stored hourly bars, reusing cached runs.
+
+    The window start is aligned to the UTC day so repeated dashboard calls
+    share a first bar: identical data is served from the result cache, and
+    bars that arrived since the last call are simulated from the saved
+    state instead of from bar 0.
+    """
     try:
         # Validate backtest configuration
         default_config = {
@@ -184,18 +295,30 @@ async def backtest_strategy(
         }
         config = {**default_config, **backtest_config}
 
-        # Run backtest
-        backtest_result = await strategy.run_backtest(
-            hours=validated_hours,
-            config=config,
-            user_id=current_user["username"],
-        )
-
-        if not backtest_result or "error" in backtest_result:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=backtest_result.get("error", "Backtest failed"),
+        data = await asyncio.to_thread(load_price_frame, validated_hours, align=86400)
+        try:
+            result, cache_status = await asyncio.to_thread(
+                get_backtest_cache().run,
+                strategy,
+                data,
+                float(config["initial_capital"]),
             )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        performance = dict(vars(result.performance))
+        performance["avg_trade_duration"] = str(performance["avg_trade_duration"])
+        backtest_result = {
+            "performance": performance,
+            "trades": result.trades,
+            "total_trades": len(result.trades),
+            "start_date": str(result.start_date),
+            "end_date": str(result.end_date),
+            "bars": len(result.equity_curve),
+            "initial_capital": result.initial_capital,
+            "final_capital": result.final_capital,
+            "cache": cache_status,
+        }
 
         return {
             "strategy": strategy_name,
@@ -217,6 +340,60 @@ async def backtest_strategy(
         )
 
 
+@router.post("/{strategy_name}/robustness/{hours}")
+async def strategy_robustness(
+    strategy_name: str,
+    hours: int,
+    robustness_config: Dict[str, Any],
+    strategy: BaseStrategy = Depends(get_strategy_by_name),
+    current_user: dict = Depends(require_authentication),
+    rate_limiter=Depends(get_strategy_rate_limiter),
+    validated_hours: int = Depends(validate_timeframe),
+):
+    """
+    Monte Carlo confidence intervals for a strategy's backtest.
+
+    The backtest comes from the result cache; the config may set any
+    MonteCarloAnalyzer option (method, paths, confidence, block_size, ...)
+    and ``initial_capital``.
+    """
+    try:
+        data = await asyncio.to_thread(load_price_frame, validated_hours, align=86400)
+        initial_capital = float(robustness_config.get("initial_capital", 10000.0))
+
+        try:
+            options = bounded_options(
+                robustness_config, ROBUSTNESS_OPTIONS, ROBUSTNESS_LIMITS
+            )
+            analyzer = MonteCarloAnalyzer(**options)
+            result, cache_status = await asyncio.to_thread(
+                get_backtest_cache().run, strategy, data, initial_capital
+            )
+            report = await asyncio.to_thread(analyzer.run, result)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        return {
+            "strategy": strategy_name,
+            "robustness": report.to_dict(),
+            "backtest_cache": cache_status,
+            "config": robustness_config,
+            "hours": validated_hours,
+            "run_by": current_user["username"],
+            "timestamp": datetime.utcnow().isoformat(),
+            "status": "success",
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error analyzing robustness of {strategy_name}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Robustness analysis failed for {strategy_name}",
+        )
+
+
 # =============================================================================
 # STRATEGY COMPARISON
 # =============================================================================
@@ -228,6 +405,8 @@ async def compare_all_strategies(
     initial_balance: float = Query(
         10000.0, description="Initial balance for comparison"
     ),
+    rank_by: str = Query("total_return", description="Ranking metric"),
+    workers: int = Query(1, ge=1, le=8, description="Backtest worker processes"),
     ma_strategy: MovingAverageStrategy = Depends(get_ma_strategy),
     rsi_strategy: RSIStrategy = Depends(get_rsi_strategy),
     bb_strategy: BollingerBandsStrategy = Depends(get_bb_strategy),
@@ -236,7 +415,7 @@ async def compare_all_strategies(
     rate_limiter=Depends(get_strategy_rate_limiter),
     validated_hours: int = Depends(validate_timeframe),
 ):
-    """Compare live performance of all strategies."""
+    """Backtest all strategies on one shared price window and rank them."""
     try:
         strategies = {
             "ma": ma_strategy,
@@ -245,46 +424,52 @@ async def compare_all_strategies(
             "macd": macd_strategy,
         }
 
-        portfolio_manager = PortfolioManager()
-        comparison_results = {}
-
-        # Get comparison data for each strategy
-        for name, strategy in strategies.items():
-            try:
-                performance = await strategy.get_performance_metrics(
-                    hours=validated_hours
-                )
-                comparison_results[name] = {
-                    "performance": performance,
-                    "current_signal": await strategy.get_current_signal(),
-                    "win_rate": performance.get("win_rate", 0),
-                    "total_return": performance.get("total_return", 0),
-                    "sharpe_ratio": performance.get("sharpe_ratio", 0),
+        try:
+            batch = BatchBacktester(
+                strategies,
+                initial_capital=initial_balance,
+                rank_by=rank_by,
+                workers=workers,
+            )
+            result = await asyncio.to_thread(
+                batch.run, lambda: load_price_frame(validated_hours)
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        comparison_results = {
+            run.name: (
+                {
+                    "performance": run.performance,
+                    "final_capital": run.final_capital,
+                    "win_rate": run.performance["win_rate"],
+                    "total_return": run.performance["total_return"],
+                    "sharpe_ratio": run.performance["sharpe_ratio"],
                 }
-            except Exception as e:
-                logger.warning(f"Failed to get data for {name}: {e}")
-                comparison_results[name] = {"error": str(e)}
-
-        # Rank strategies by performance
-        valid_strategies = {
-            k: v for k, v in comparison_results.items() if "error" not in v
+                if run.performance is not None
+                else {"error": run.error}
+            )
+            for run in result.runs
         }
-        rankings = sorted(
-            valid_strategies.items(),
-            key=lambda x: x[1].get("total_return", 0),
-            reverse=True,
-        )
 
         return {
             "comparison": comparison_results,
-            "rankings": [{"strategy": k, "performance": v} for k, v in rankings],
+            "rankings": [
+                {"strategy": entry["name"], "performance": entry}
+                for entry in result.leaderboard
+            ],
             "hours_analyzed": validated_hours,
             "initial_balance": initial_balance,
             "strategies_compared": len(comparison_results),
+            "bars": result.bars,
+            "timings": result.timings,
+            "wall_time": result.wall_time,
             "timestamp": datetime.utcnow().isoformat(),
             "status": "success",
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error comparing strategies: {e}")
         raise HTTPException(
@@ -298,52 +483,43 @@ async def get_strategy_leaderboard(
     period_hours: int = Query(
         168, description="Period for leaderboard (default: 7 days)"
     ),
+    ma_strategy: MovingAverageStrategy = Depends(get_ma_strategy),
+    rsi_strategy: RSIStrategy = Depends(get_rsi_strategy),
+    bb_strategy: BollingerBandsStrategy = Depends(get_bb_strategy),
+    macd_strategy: MACDStrategy = Depends(get_macd_strategy),
     rate_limiter=Depends(get_strategy_rate_limiter),
 ):
-    """Get strategy performance leaderboard."""
+    """Get strategy performance leaderboard from a batch backtest."""
     try:
-        # Mock leaderboard data - replace with real implementation
+        strategies = {
+            "rsi": rsi_strategy,
+            "bb": bb_strategy,
+            "ma": ma_strategy,
+            "macd": macd_strategy,
+        }
+        try:
+            result = await asyncio.to_thread(
+                BatchBacktester(strategies).run,
+                lambda: load_price_frame(period_hours),
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No data for leaderboard: {e}",
+            )
+
         leaderboard = [
             {
-                "rank": 1,
-                "strategy": "rsi",
-                "display_name": "RSI Momentum",
-                "total_return": 8.5,
-                "win_rate": 67.2,
-                "trades": 23,
-                "sharpe_ratio": 1.84,
-                "max_drawdown": -2.1,
-            },
-            {
-                "rank": 2,
-                "strategy": "bb",
-                "display_name": "Bollinger Bands",
-                "total_return": 6.8,
-                "win_rate": 58.9,
-                "trades": 19,
-                "sharpe_ratio": 1.52,
-                "max_drawdown": -3.4,
-            },
-            {
-                "rank": 3,
-                "strategy": "ma",
-                "display_name": "Moving Average",
-                "total_return": 5.2,
-                "win_rate": 52.1,
-                "trades": 31,
-                "sharpe_ratio": 1.23,
-                "max_drawdown": -4.7,
-            },
-            {
-                "rank": 4,
-                "strategy": "macd",
-                "display_name": "MACD Trend",
-                "total_return": 3.9,
-                "win_rate": 49.6,
-                "trades": 27,
-                "sharpe_ratio": 0.97,
-                "max_drawdown": -5.2,
-            },
+                "rank": entry["rank"],
+                "strategy": entry["name"],
+                "display_name": LEADERBOARD_NAMES[entry["name"]],
+                "total_return": round(entry["total_return"] * 100, 2),
+                "win_rate": round(entry["win_rate"] * 100, 1),
+                "trades": entry["total_trades"],
+                "sharpe_ratio": round(entry["sharpe_ratio"], 2),
+                "max_drawdown": -round(entry["max_drawdown"] * 100, 2),
+            }
+            for entry in result.leaderboard
         ]
 
         return {
@@ -351,10 +527,13 @@ async def get_strategy_leaderboard(
             "period_hours": period_hours,
             "period_description": f"{period_hours // 24} days",
             "total_strategies": len(leaderboard),
+            "timings": result.timings,
             "timestamp": datetime.utcnow().isoformat(),
             "status": "success",
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting leaderboard: {e}")
         raise HTTPException(
@@ -510,30 +689,38 @@ async def optimize_strategy_parameters(
     rate_limiter=Depends(get_strategy_rate_limiter),
     validated_hours: int = Depends(validate_timeframe),
 ):
-    """Optimize strategy parameters using historical data."""
+    """
+    Walk-forward optimize strategy parameters on stored hourly bars.
+
+    The config may set any WalkForwardOptimizer option (method, objective,
+    folds, n_trials, ...) and ``auto_apply`` to adopt the latest fold's
+    parameters.
+    """
     try:
-        optimization_result = await strategy.optimize_parameters(
-            config=optimization_config,
-            hours=validated_hours,
-            include_live_performance=True,
-            user_id=current_user["username"],
-        )
+        data = await asyncio.to_thread(load_price_frame, validated_hours)
 
-        if not optimization_result or "error" in optimization_result:
+        try:
+            options = bounded_options(
+                optimization_config, OPTIMIZER_OPTIONS, OPTIMIZER_LIMITS
+            )
+            optimizer = WalkForwardOptimizer(
+                type(strategy), base_parameters=strategy.parameters, **options
+            )
+            result = await asyncio.to_thread(optimizer.run, data)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        if not result.folds:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=optimization_result.get(
-                    "error", "Parameter optimization failed"
-                ),
+                detail="Parameter optimization found no valid parameters",
             )
+        optimization_result = result.to_dict()
 
         # Apply optimized parameters if requested
         if optimization_config.get("auto_apply", False):
-            apply_result = await strategy.apply_optimized_parameters(
-                optimized_params=optimization_result["best_parameters"],
-                user_id=current_user["username"],
-            )
-            optimization_result["auto_applied"] = apply_result.get("success", False)
+            strategy.update_parameters(result.best_parameters)
+            optimization_result["auto_applied"] = True
 
         return {
             "strategy": strategy_name,
@@ -7,7 +7,8 @@ Implements pause→buffer→resume pattern for instant symbol switching.
 import asyncio
 import json
 import time
-from typing import Dict, Optional, Set
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Set
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
@@ -15,6 +16,7 @@ from odin.api.routes.data import COIN_MAPPINGS
 from odin.data.exchange_streams import (
     StreamData,
     StreamType,
+    encode_message,
     get_stream_manager,
 )
 from odin.utils.logging import get_logger
@@ -26,49 +28,207 @@ router = APIRouter()
 _stream_manager_started = False
 
 
+# Per-client send queue limits
+SEND_QUEUE_SIZE = 256
+TRADE_POLICIES = ("drop", "batch")
+
+# Exchanges connected when a client asks for the consolidated "best" feed
+BEST_FEED_EXCHANGES = ["binance", "kraken"]
+
+
 class ClientConnection:
-    """Represents a connected WebSocket client with its subscriptions."""
+    """
+    Represents a connected WebSocket client with its subscriptions.
+
+    Outgoing messages go through a bounded queue drained by a single writer
+    task, so a slow client never blocks the stream fan-out or other clients.
+    Non-trade stream updates (tickers, depth, klines) are conflated: only the
+    latest update per (stream type, exchange, symbol) is kept while it waits.
+    Trades either drop the oldest pending trade when the queue is full
+    ("drop") or are merged into one message per symbol ("batch"), which keeps
+    at most ``max_queue`` trades and drops the oldest beyond that.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue: int = SEND_QUEUE_SIZE,
+        trade_policy: str = "drop",
+    ):
+        if trade_policy not in TRADE_POLICIES:
+            raise ValueError(f"Unknown trade policy: {trade_policy}")
 
-    def __init__(self, websocket: WebSocket):
         self.websocket = websocket
         self.symbol: str = "BTC"
         self.subscribed_types: Set[StreamType] = {StreamType.TICKER}
+        self.best_symbols: Set[str] = set()
         self.paused = False
-        self.buffer: list = []
+        self.max_queue = max_queue
+        self.trade_policy = trade_policy
+        self.closed = False
+
+        # slot key -> (payload, first enqueue time); insertion order is send order
+        self._pending: "OrderedDict[tuple, list]" = OrderedDict()
+        self._trade_keys: Deque[tuple] = deque()
+        self._sequence = 0
+        self._wake = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+
+        self.metrics = {
+            "enqueued": 0,
+            "sent": 0,
+            "conflated": 0,
+            "dropped": 0,
+            "batched": 0,
+            "send_errors": 0,
+            "max_queue_depth": 0,
+            "lag_ms": 0.0,
+            "max_lag_ms": 0.0,
+        }
+        self._lag_total = 0.0
+
+    def start(self):
+        """Start the writer task if it is not already running."""
+        if self._writer is None and not self.closed:
+            self._writer = asyncio.create_task(self._write_loop())
+
+    async def close(self):
+        """Stop the writer task and discard anything still queued."""
+        self.closed = True
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+            self._writer = None
+        self._pending.clear()
+        self._trade_keys.clear()
 
     async def send(self, data: dict):
-        """Send data to client."""
-        try:
-            await self.websocket.send_text(json.dumps(data))
-        except Exception as e:
-            logger.error(f"Error sending to WebSocket: {e}")
+        """Queue a control message; these are never conflated or dropped."""
+        self._sequence += 1
+        self._enqueue(("message", self._sequence), data)
 
     def on_stream_data(self, stream_data: StreamData):
-        """Callback for stream data - queues for async send."""
-        if self.paused:
-            self.buffer.append(stream_data)
+        """Callback for stream data - queues for the writer task."""
+        if stream_data.stream_type != StreamType.TRADE:
+            key = (
+                stream_data.stream_type.value,
+                stream_data.exchange,
+                stream_data.symbol,
+            )
+            if key in self._pending:
+                self._pending[key][0] = stream_data
+                self.metrics["conflated"] += 1
+                return
+            self._enqueue(key, stream_data)
+            return
+
+        if self.trade_policy == "batch":
+            key = ("trade", stream_data.exchange, stream_data.symbol)
+            if key in self._pending:
+                batch = self._pending[key][0]
+                if len(batch) == batch.maxlen:
+                    self.metrics["dropped"] += 1
+                batch.append(stream_data)
+                self.metrics["batched"] += 1
+                return
+            self._enqueue(key, deque([stream_data], maxlen=self.max_queue))
             return
 
-        # Queue the send operation
-        asyncio.create_task(self._send_stream_data(stream_data))
+        if len(self._trade_keys) >= self.max_queue:
+            self._pending.pop(self._trade_keys.popleft(), None)
+            self.metrics["dropped"] += 1
+        self._sequence += 1
+        key = ("trade", self._sequence)
+        self._trade_keys.append(key)
+        self._enqueue(key, stream_data)
+
+    def _enqueue(self, key: tuple, payload: Any):
+        """Add a new slot to the queue and wake the writer."""
+        if self.closed:
+            return
+        self._pending[key] = [payload, time.monotonic()]
+        self.metrics["enqueued"] += 1
+        depth = len(self._pending)
+        if depth > self.metrics["max_queue_depth"]:
+            self.metrics["max_queue_depth"] = depth
+        self._wake.set()
+        if self._writer is None:
+            try:
+                self.start()
+            except RuntimeError:
+                pass  # No running loop yet; start() is called on connect
+
+    async def _write_loop(self):
+        """Single writer: drain queued slots in order, one send at a time."""
+        while not self.closed:
+            await self._wake.wait()
+            self._wake.clear()
+
+            while self._pending and not self.paused and not self.closed:
+                key, (payload, enqueued_at) = self._pending.popitem(last=False)
+                if key[0] == "trade" and len(key) == 2:
+                    self._trade_keys.popleft()
+
+                text = self._encode(payload)
+                try:
+                    await self.websocket.send_text(text)
+                except Exception as e:
+                    logger.error(f"Error sending to WebSocket: {e}")
+                    self.metrics["send_errors"] += 1
+                    self.closed = True
+                    break
+
+                lag_ms = (time.monotonic() - enqueued_at) * 1000
+                self.metrics["sent"] += 1
+                self.metrics["lag_ms"] = lag_ms
+                self.metrics["max_lag_ms"] = max(self.metrics["max_lag_ms"], lag_ms)
+                self._lag_total += lag_ms
+
+    @staticmethod
+    def _encode(payload: Any) -> str:
+        """JSON text for a queued payload.
+
+        Stream updates reuse the text StreamManager already serialized for
+        every subscriber; only control messages and trade batches are encoded
+        per client.
+        """
+        if isinstance(payload, StreamData):
+            return payload.encode()
+        if isinstance(payload, deque):
+            message = payload[-1].to_message()
+            message["data"] = {
+                **payload[-1].data,
+                "batch": [item.data for item in payload],
+            }
+            return encode_message(message)
+        return encode_message(payload)
 
     async def _send_stream_data(self, stream_data: StreamData):
-        """Send stream data to client."""
-        message = {
-            "type": "price_update",
-            "symbol": stream_data.symbol,
-            "exchange": stream_data.exchange,
-            "stream_type": stream_data.stream_type.value,
-            "data": stream_data.data,
-            "timestamp": stream_data.timestamp,
-        }
-        await self.send(message)
+        """Queue stream data for the client."""
+        self.on_stream_data(stream_data)
 
     async def flush_buffer(self):
-        """Flush buffered data after resume."""
-        for data in self.buffer:
-            await self._send_stream_data(data)
-        self.buffer.clear()
+        """Resume sending after a symbol switch."""
+        self._wake.set()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-client queue depth, drop and lag metrics."""
+        now = time.monotonic()
+        oldest = next(iter(self._pending.values()), None)
+        return {
+            **self.metrics,
+            "symbol": self.symbol,
+            "trade_policy": self.trade_policy,
+            "queue_depth": len(self._pending),
+            "max_queue": self.max_queue,
+            "avg_lag_ms": self._lag_total / self.metrics["sent"]
+            if self.metrics["sent"]
+            else 0.0,
+            "oldest_pending_ms": (now - oldest[1]) * 1000 if oldest else 0.0,
+        }
 
 
 class ConnectionManager:
@@ -81,20 +241,26 @@ class ConnectionManager:
         """Accept new connection."""
         await websocket.accept()
         client = ClientConnection(websocket)
+        client.start()
         self.connections[websocket] = client
         logger.info(f"WebSocket connected, total: {len(self.connections)}")
         return client
 
-    def disconnect(self, websocket: WebSocket):
-        """Remove connection."""
-        if websocket in self.connections:
-            del self.connections[websocket]
+    async def disconnect(self, websocket: WebSocket):
+        """Remove connection and stop its writer task."""
+        client = self.connections.pop(websocket, None)
+        if client is not None:
+            await client.close()
         logger.info(f"WebSocket disconnected, total: {len(self.connections)}")
 
     def get_client(self, websocket: WebSocket) -> Optional[ClientConnection]:
         """Get client for websocket."""
         return self.connections.get(websocket)
 
+    def get_metrics(self) -> List[Dict[str, Any]]:
+        """Send queue metrics for every connected client."""
+        return [client.get_metrics() for client in self.connections.values()]
+
 
 manager = ConnectionManager()
 
@@ -120,6 +286,7 @@ async def websocket_main_endpoint(websocket: WebSocket):
     Client messages:
     - {"type": "switch_symbol", "symbol": "ETH"} - Instant symbol switch
     - {"type": "subscribe", "symbols": ["BTC", "ETH"]} - Subscribe to multiple
+    - {"type": "subscribe_best", "symbols": ["BTC"]} - Consolidated BBO feed
     - {"type": "ping"} - Heartbeat
     """
     # Ensure stream manager is running
@@ -168,7 +335,9 @@ async def websocket_main_endpoint(websocket: WebSocket):
     finally:
         # Cleanup subscription
         await stream_mgr.unsubscribe(client.symbol, client.on_stream_data)
-        manager.disconnect(websocket)
+        for symbol in client.best_symbols:
+            await stream_mgr.unsubscribe_best(symbol, client.on_stream_data)
+        await manager.disconnect(websocket)
 
 
 async def handle_client_message(
@@ -255,12 +424,49 @@ async def handle_client_message(
         for symbol in symbols:
             await stream_mgr.unsubscribe(symbol.upper(), client.on_stream_data)
 
+    elif msg_type == "subscribe_best":
+        symbols = message.get("symbols", [])
+        if isinstance(symbols, str):
+            symbols = [symbols]
+
+        # The consolidated feed needs every venue, not just the default one
+        await stream_mgr.start(BEST_FEED_EXCHANGES)
+        subscribed = []
+        for symbol in symbols:
+            symbol = symbol.upper()
+            if symbol in COIN_MAPPINGS:
+                await stream_mgr.subscribe_best(symbol, client.on_stream_data)
+                client.best_symbols.add(symbol)
+                subscribed.append(symbol)
+
+        await client.send({
+            "type": "subscribed_best",
+            "symbols": subscribed,
+            "timestamp": time.time(),
+        })
+
+    elif msg_type == "unsubscribe_best":
+        symbols = message.get("symbols", [])
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        for symbol in symbols:
+            symbol = symbol.upper()
+            await stream_mgr.unsubscribe_best(symbol, client.on_stream_data)
+            client.best_symbols.discard(symbol)
+
     elif msg_type == "ping":
         await client.send({
             "type": "pong",
             "timestamp": time.time(),
         })
 
+    elif msg_type == "get_stats":
+        await client.send({
+            "type": "stats",
+            "metrics": client.get_metrics(),
+            "timestamp": time.time(),
+        })
+
     elif msg_type == "request_data":
         # Send latest cached data
         cached = stream_mgr.get_latest(client.symbol)
@@ -268,6 +474,20 @@ async def handle_client_message(
             await client._send_stream_data(cached)
 
 
+@router.get("/ws/stats")
+async def websocket_stats():
+    """Send queue depth, drops and lag for each connected client."""
+    clients = manager.get_metrics()
+    return {
+        "clients": clients,
+        "total_clients": len(clients),
+        "total_dropped": sum(client["dropped"] for client in clients),
+        "total_conflated": sum(client["conflated"] for client in clients),
+        "max_lag_ms": max((client["max_lag_ms"] for client in clients), default=0.0),
+        "timestamp": time.time(),
+    }
+
+
 @router.websocket("/ws/stream/{symbol}")
 async def websocket_symbol_stream(websocket: WebSocket, symbol: str):
     """
@@ -317,4 +537,4 @@ async def websocket_symbol_stream(websocket: WebSocket, symbol: str):
         pass
     finally:
         await stream_mgr.unsubscribe(symbol, client.on_stream_data)
-        manager.disconnect(websocket)
+        await manager.disconnect(websocket)
@@ -7,18 +7,21 @@ from multiple sources with failover and validation.
 """
 
 import asyncio
+import bisect
 import json
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from statistics import mean, stdev
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import aiohttp
 import numpy as np
 import pandas as pd
 import websockets
 
+from odin.data.exchange_streams import get_stream_manager
+
 # FIXED: Use correct imports
 from .database import DatabaseManager
 from .exceptions import (
@@ -27,6 +30,7 @@ from .exceptions import (
     DataValidationException,
     MarketDataException,
 )
+from .indicators import StreamingIndicators
 from .models import (
     DataCollectionResult,
     DataSourceStatus,
@@ -38,6 +42,68 @@ from .models import (
 logger = logging.getLogger(__name__)
 
 
+class LatencyHistogram:
+    """Bucketed request latency counts for a data source."""
+
+    # Bucket upper bounds in seconds; the last bucket is open ended
+    BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, seconds: float):
+        """Add one latency observation."""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean latency in seconds."""
+        return self.total / self.count if self.count else None
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Latency at quantile ``q`` (0-1), as the upper bound of its bucket.
+
+        Returns:
+            Seconds, ``inf`` for the open-ended bucket, or None with no samples
+        """
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return bound
+        return float("inf")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary for status reporting."""
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean * 1000, 1) if self.count else None,
+            "p50_ms": self._ms(self.percentile(0.5)),
+            "p95_ms": self._ms(self.percentile(0.95)),
+            "buckets": {
+                f"le_{bound * 1000:g}ms": count
+                for bound, count in zip(self.buckets, self.counts)
+            },
+            "overflow": self.counts[-1],
+        }
+
+    @staticmethod
+    def _ms(seconds: Optional[float]) -> Optional[float]:
+        if seconds is None or seconds == float("inf"):
+            return seconds
+        return seconds * 1000
+
+
 class DataSource:
     """Base class for data sources."""
 
@@ -48,6 +114,7 @@ class DataSource:
         self.last_update = None
         self.error_count = 0
         self.max_errors = 5
+        self.latency = LatencyHistogram()
 
     async def get_price(self) -> Optional[PriceData]:
         """Get current price data."""
@@ -749,7 +816,256 @@ class KrakenDataSource(DataSource):
 
 
 class TechnicalIndicators:
-    """Technical indicators calculator."""
+    """
+    Technical indicators calculator backed by NumPy.
+
+    The list methods return values from the first full window onwards, as
+    before. The ``*_array``/``*_matrix`` methods and ``all_indicators``
+    return arrays aligned with the input prices (NaN during warm up); SMAs
+    for several periods share one cumulative sum.
+    """
+
+    @staticmethod
+    def _prices_array(prices: Any) -> np.ndarray:
+        """Convert a price sequence to a float array."""
+        return np.asarray(prices, dtype=float).ravel()
+
+    @staticmethod
+    def _recursive_ema(seed: float, values: np.ndarray, alpha: float) -> np.ndarray:
+        """Run ``y = alpha * x + (1 - alpha) * y_prev`` starting from ``seed``."""
+        series = pd.Series(np.concatenate(([seed], values)))
+        return series.ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+    @staticmethod
+    def sma_matrix(prices: Any, periods: List[int]) -> np.ndarray:
+        """
+        Simple Moving Averages for several periods in one pass.
+
+        Args:
+            prices: Price sequence
+            periods: SMA periods
+
+        Returns:
+            Array of shape (len(periods), len(prices)), NaN during warm up
+        """
+        x = TechnicalIndicators._prices_array(prices)
+        n = len(x)
+        result = np.full((len(periods), n), np.nan)
+        if n == 0:
+            return result
+
+        # Shift by the first price to keep the cumulative sums small
+        offset = x[0]
+        cumulative = np.concatenate(([0.0], np.cumsum(x - offset)))
+        for row, period in enumerate(periods):
+            if period <= n:
+                window_sums = cumulative[period:] - cumulative[:-period]
+                result[row, period - 1 :] = window_sums / period + offset
+        return result
+
+    @staticmethod
+    def sma_array(prices: Any, period: int) -> np.ndarray:
+        """Simple Moving Average aligned with ``prices``."""
+        return TechnicalIndicators.sma_matrix(prices, [period])[0]
+
+    @staticmethod
+    def ema_matrix(prices: Any, periods: List[int]) -> np.ndarray:
+        """
+        Exponential Moving Averages for several periods.
+
+        Each EMA is seeded with the SMA of its first period, then runs as a
+        recursive filter.
+
+        Args:
+            prices: Price sequence
+            periods: EMA periods
+
+        Returns:
+            Array of shape (len(periods), len(prices)), NaN during warm up
+        """
+        x = TechnicalIndicators._prices_array(prices)
+        n = len(x)
+        result = np.full((len(periods), n), np.nan)
+        seeds = TechnicalIndicators.sma_matrix(x, periods)
+
+        for row, period in enumerate(periods):
+            if period <= n:
+                result[row, period - 1 :] = TechnicalIndicators._recursive_ema(
+                    seeds[row, period - 1], x[period:], 2 / (period + 1)
+                )
+        return result
+
+    @staticmethod
+    def ema_array(prices: Any, period: int) -> np.ndarray:
+        """Exponential Moving Average aligned with ``prices``."""
+        return TechnicalIndicators.ema_matrix(prices, [period])[0]
+
+    @staticmethod
+    def rolling_std_matrix(
+        prices: Any, periods: List[int], ddof: int = 1
+    ) -> np.ndarray:
+        """
+        Rolling standard deviations over sliding window views.
+
+        Each window is centered on its own mean; differences of cumulative
+        sums of x and x^2 cancel catastrophically once prices span several
+        orders of magnitude.
+
+        Args:
+            prices: Price sequence
+            periods: Window lengths
+            ddof: Delta degrees of freedom (1 = sample standard deviation)
+
+        Returns:
+            Array of shape (len(periods), len(prices)), NaN during warm up
+        """
+        x = TechnicalIndicators._prices_array(prices)
+        n = len(x)
+        result = np.full((len(periods), n), np.nan)
+        if n == 0:
+            return result
+
+        for row, period in enumerate(periods):
+            if period <= n and period > ddof:
+                windows = np.lib.stride_tricks.sliding_window_view(x, period)
+                result[row, period - 1 :] = windows.std(ddof=ddof, axis=-1)
+        return result
+
+    @staticmethod
+    def rsi_array(prices: Any, period: int = 14) -> np.ndarray:
+        """Relative Strength Index (Wilder's smoothing) aligned with ``prices``."""
+        x = TechnicalIndicators._prices_array(prices)
+        n = len(x)
+        result = np.full(n, np.nan)
+        if n < period + 1:
+            return result
+
+        changes = np.diff(x)
+        gains = np.where(changes > 0, changes, 0.0)
+        losses = np.where(changes < 0, -changes, 0.0)
+
+        alpha = 1 / period
+        avg_gain = TechnicalIndicators._recursive_ema(
+            gains[:period].mean(), gains[period:], alpha
+        )
+        avg_loss = TechnicalIndicators._recursive_ema(
+            losses[:period].mean(), losses[period:], alpha
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        result[period:] = np.where(avg_loss == 0, 100.0, rsi)
+        return result
+
+    @staticmethod
+    def macd_arrays(
+        prices: Any, fast: int = 12, slow: int = 26, signal: int = 9
+    ) -> Dict[str, np.ndarray]:
+        """MACD line, signal line and histogram aligned with ``prices``."""
+        x = TechnicalIndicators._prices_array(prices)
+        n = len(x)
+        ema_fast, ema_slow = TechnicalIndicators.ema_matrix(x, [fast, slow])
+        macd_line = ema_fast - ema_slow
+
+        signal_line = np.full(n, np.nan)
+        if n >= slow:
+            signal_line[slow - 1 :] = TechnicalIndicators.ema_array(
+                macd_line[slow - 1 :], signal
+            )
+
+        return {
+            "macd": macd_line,
+            "signal": signal_line,
+            "histogram": macd_line - signal_line,
+        }
+
+    @staticmethod
+    def bollinger_arrays(
+        prices: Any, period: int = 20, std_dev: float = 2
+    ) -> Dict[str, np.ndarray]:
+        """Bollinger Bands aligned with ``prices``."""
+        middle = TechnicalIndicators.sma_array(prices, period)
+        std = TechnicalIndicators.rolling_std_matrix(prices, [period])[0]
+        return {
+            "upper": middle + (std_dev * std),
+            "middle": middle,
+            "lower": middle - (std_dev * std),
+        }
+
+    @staticmethod
+    def all_indicators(
+        prices: Any,
+        sma_periods: List[int] = (5, 20, 50, 200),
+        ema_periods: List[int] = (12, 26),
+        rsi_period: int = 14,
+        macd_periods: Tuple[int, int, int] = (12, 26, 9),
+        bb_period: int = 20,
+        bb_std_dev: float = 2,
+    ) -> Dict[str, Any]:
+        """
+        Calculate every indicator for a price series in one call.
+
+        Args:
+            prices: Price sequence, oldest first
+            sma_periods: SMA periods (rows of ``sma``)
+            ema_periods: EMA periods (rows of ``ema``)
+            rsi_period: RSI period
+            macd_periods: MACD (fast, slow, signal) periods
+            bb_period: Bollinger Bands period
+            bb_std_dev: Bollinger Bands standard deviation multiplier
+
+        Returns:
+            Dictionary of arrays aligned with ``prices``; ``sma`` and ``ema``
+            are 2-D with one row per period
+        """
+        x = TechnicalIndicators._prices_array(prices)
+        sma_periods = list(sma_periods)
+        ema_periods = list(ema_periods)
+        fast, slow, signal = macd_periods
+
+        macd = TechnicalIndicators.macd_arrays(x, fast, slow, signal)
+        bands = TechnicalIndicators.bollinger_arrays(x, bb_period, bb_std_dev)
+
+        return {
+            "sma_periods": sma_periods,
+            "sma": TechnicalIndicators.sma_matrix(x, sma_periods),
+            "ema_periods": ema_periods,
+            "ema": TechnicalIndicators.ema_matrix(x, ema_periods),
+            "rsi": TechnicalIndicators.rsi_array(x, rsi_period),
+            "macd": macd["macd"],
+            "macd_signal": macd["signal"],
+            "macd_histogram": macd["histogram"],
+            "bb_upper": bands["upper"],
+            "bb_middle": bands["middle"],
+            "bb_lower": bands["lower"],
+        }
+
+    @staticmethod
+    def latest_values(indicators: Dict[str, Any]) -> Dict[str, Optional[float]]:
+        """
+        Flatten ``all_indicators`` output to the latest value of each series.
+
+        Args:
+            indicators: Output of ``all_indicators``
+
+        Returns:
+            Mapping such as ``sma_20`` or ``rsi`` to the last value (None
+            while warming up)
+        """
+
+        def last(values: np.ndarray) -> Optional[float]:
+            if len(values) == 0 or np.isnan(values[-1]):
+                return None
+            return float(values[-1])
+
+        latest = {}
+        for prefix in ("sma", "ema"):
+            for period, row in zip(indicators[f"{prefix}_periods"], indicators[prefix]):
+                latest[f"{prefix}_{period}"] = last(row)
+        for key, values in indicators.items():
+            if key not in ("sma", "ema", "sma_periods", "ema_periods"):
+                latest[key] = last(values)
+        return latest
 
     @staticmethod
     def sma(prices: List[float], period: int) -> List[float]:
@@ -757,12 +1073,7 @@ class TechnicalIndicators:
         if len(prices) < period:
             return []
 
-        sma_values = []
-        for i in range(period - 1, len(prices)):
-            sma = mean(prices[i - period + 1 : i + 1])
-            sma_values.append(sma)
-
-        return sma_values
+        return TechnicalIndicators.sma_array(prices, period)[period - 1 :].tolist()
 
     @staticmethod
     def ema(prices: List[float], period: int) -> List[float]:
@@ -770,18 +1081,7 @@ class TechnicalIndicators:
         if len(prices) < period:
             return []
 
-        multiplier = 2 / (period + 1)
-        ema_values = []
-
-        # First EMA value is SMA
-        first_ema = mean(prices[:period])
-        ema_values.append(first_ema)
-
-        for i in range(period, len(prices)):
-            ema = (prices[i] * multiplier) + (ema_values[-1] * (1 - multiplier))
-            ema_values.append(ema)
-
-        return ema_values
+        return TechnicalIndicators.ema_array(prices, period)[period - 1 :].tolist()
 
     @staticmethod
     def rsi(prices: List[float], period: int = 14) -> List[float]:
@@ -789,36 +1089,7 @@ class TechnicalIndicators:
         if len(prices) < period + 1:
             return []
 
-        price_changes = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
-        gains = [change if change > 0 else 0 for change in price_changes]
-        losses = [-change if change < 0 else 0 for change in price_changes]
-
-        rsi_values = []
-
-        # First RSI calculation
-        avg_gain = mean(gains[:period])
-        avg_loss = mean(losses[:period])
-
-        if avg_loss == 0:
-            rsi_values.append(100)
-        else:
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
-            rsi_values.append(rsi)
-
-        # Subsequent RSI calculations
-        for i in range(period, len(gains)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-
-            if avg_loss == 0:
-                rsi_values.append(100)
-            else:
-                rs = avg_gain / avg_loss
-                rsi = 100 - (100 / (1 + rs))
-                rsi_values.append(rsi)
-
-        return rsi_values
+        return TechnicalIndicators.rsi_array(prices, period)[period:].tolist()
 
     @staticmethod
     def macd(
@@ -828,26 +1099,14 @@ class TechnicalIndicators:
         if len(prices) < slow:
             return {"macd": [], "signal": [], "histogram": []}
 
-        ema_fast = TechnicalIndicators.ema(prices, fast)
-        ema_slow = TechnicalIndicators.ema(prices, slow)
-
-        # Align EMAs (slow EMA starts later)
-        start_index = slow - fast
-        ema_fast_aligned = ema_fast[start_index:]
+        arrays = TechnicalIndicators.macd_arrays(prices, fast, slow, signal)
+        signal_start = slow + signal - 2
 
-        macd_line = [
-            fast_val - slow_val
-            for fast_val, slow_val in zip(ema_fast_aligned, ema_slow)
-        ]
-        signal_line = TechnicalIndicators.ema(macd_line, signal)
-
-        # Calculate histogram
-        histogram = []
-        signal_start = len(macd_line) - len(signal_line)
-        for i in range(len(signal_line)):
-            histogram.append(macd_line[signal_start + i] - signal_line[i])
-
-        return {"macd": macd_line, "signal": signal_line, "histogram": histogram}
+        return {
+            "macd": arrays["macd"][slow - 1 :].tolist(),
+            "signal": arrays["signal"][signal_start:].tolist(),
+            "histogram": arrays["histogram"][signal_start:].tolist(),
+        }
 
     @staticmethod
     def bollinger_bands(
@@ -857,35 +1116,45 @@ class TechnicalIndicators:
         if len(prices) < period:
             return {"upper": [], "middle": [], "lower": []}
 
-        middle_band = TechnicalIndicators.sma(prices, period)
-
-        upper_band = []
-        lower_band = []
-
-        for i in range(period - 1, len(prices)):
-            price_slice = prices[i - period + 1 : i + 1]
-            std = stdev(price_slice)
-            sma = middle_band[i - period + 1]
-
-            upper_band.append(sma + (std_dev * std))
-            lower_band.append(sma - (std_dev * std))
-
-        return {"upper": upper_band, "middle": middle_band, "lower": lower_band}
+        bands = TechnicalIndicators.bollinger_arrays(prices, period, std_dev)
+        return {name: values[period - 1 :].tolist() for name, values in bands.items()}
 
 
 class DataCollector:
     """Main data collection and processing engine."""
 
-    def __init__(self, database: DatabaseManager, collection_interval: int = 30):
+    # Successful fetches needed before a source's latency affects ordering
+    LATENCY_MIN_SAMPLES = 5
+
+    # Local order books older than this fall back to REST depth
+    DEPTH_MAX_AGE = 5.0
+
+    def __init__(
+        self,
+        database: DatabaseManager,
+        collection_interval: int = 30,
+        indicators: Optional[StreamingIndicators] = None,
+        hedge_delay: Optional[float] = 0.5,
+    ):
         """
         Initialize data collector.
 
         Args:
             database: Database instance
             collection_interval: Data collection interval in seconds
+            indicators: Streaming indicator state to update (may be shared
+                with the strategy manager)
+            hedge_delay: Seconds to wait on a source before also asking the
+                next one; None tries sources strictly one after another
         """
         self.database = database
         self.collection_interval = collection_interval
+        self.hedge_delay = hedge_delay
+        self.last_source: Optional[str] = None
+
+        # Streaming indicators, warmed from the database once
+        self.indicators = indicators or StreamingIndicators()
+        self._indicators_seeded = indicators is not None and indicators.count > 0
 
         # Data sources - Real data only, ordered by reliability and global access
         self.data_sources: List[DataSource] = [
@@ -956,30 +1225,125 @@ class DataCollector:
                 logger.error(f"Data collection error: {e}")
                 await asyncio.sleep(5)  # Brief pause before retry
 
-    async def _collect_data(self):
-        """Collect data from sources."""
-        price_data = None
+    def _ordered_sources(self) -> List[DataSource]:
+        """
+        Healthy sources in fetch order.
 
-        # Try data sources in priority order
+        Sources are ordered by priority, then by median observed latency.
+        Sources without enough samples go first within their priority so
+        they get measured.
+        """
+        healthy = []
         for source in self.data_sources:
-            if not source.is_healthy():
+            if source.is_healthy():
+                healthy.append(source)
+            else:
                 logger.debug(f"Skipping unhealthy source: {source.name}")
-                continue
 
+        def sort_key(source: DataSource) -> Tuple[int, float]:
+            if source.latency.count < self.LATENCY_MIN_SAMPLES:
+                return (source.priority, 0.0)
+            return (source.priority, source.latency.percentile(0.5))
+
+        return sorted(healthy, key=sort_key)
+
+    @staticmethod
+    def _is_valid_price(price_data: Optional[PriceData]) -> bool:
+        """Whether a fetch result can be used."""
+        return price_data is not None and (price_data.price or 0) > 0
+
+    async def _fetch_sequential(self, sources: List[DataSource]) -> Optional[PriceData]:
+        """Try sources one after another until one returns a price."""
+        loop = asyncio.get_running_loop()
+        for source in sources:
+            started = loop.time()
             try:
                 price_data = await source.get_price()
-                if price_data:
-                    logger.debug(
-                        f"Got price data from {source.name}: ${price_data.price}"
-                    )
-                    break
             except Exception as e:
                 logger.warning(f"Failed to get data from {source.name}: {e}")
                 continue
 
+            source.latency.record(loop.time() - started)
+            if self._is_valid_price(price_data):
+                self.last_source = source.name
+                return price_data
+        return None
+
+    async def _fetch_hedged(self, sources: List[DataSource]) -> Optional[PriceData]:
+        """
+        Hedged fetch across sources.
+
+        Starts the first source and adds the next one each time
+        ``hedge_delay`` passes without a valid price (or immediately when a
+        request fails). The first valid price wins and the requests still in
+        flight are cancelled.
+        """
+        if not sources:
+            return None
+
+        loop = asyncio.get_running_loop()
+        waiting = list(sources)
+        pending: Dict[asyncio.Task, Tuple[DataSource, float]] = {}
+        next_launch = loop.time()
+
+        def launch():
+            nonlocal next_launch
+            source = waiting.pop(0)
+            task = asyncio.create_task(source.get_price())
+            pending[task] = (source, loop.time())
+            next_launch = loop.time() + self.hedge_delay
+
+        try:
+            launch()
+            while pending:
+                timeout = max(0.0, next_launch - loop.time()) if waiting else None
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    launch()
+                    continue
+
+                for task in done:
+                    source, started = pending.pop(task)
+                    try:
+                        price_data = task.result()
+                    except Exception as e:
+                        logger.warning(f"Failed to get data from {source.name}: {e}")
+                        continue
+
+                    source.latency.record(loop.time() - started)
+                    if self._is_valid_price(price_data):
+                        self.last_source = source.name
+                        return price_data
+
+                # A request came back empty-handed; don't wait to hedge
+                if waiting:
+                    launch()
+        finally:
+            now = loop.time()
+            for task, (source, started) in pending.items():
+                task.cancel()
+                # Lower bound on the loser's latency, so slow sources sink
+                source.latency.record(now - started)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return None
+
+    async def _collect_data(self):
+        """Collect data from sources."""
+        sources = self._ordered_sources()
+        if self.hedge_delay is None:
+            price_data = await self._fetch_sequential(sources)
+        else:
+            price_data = await self._fetch_hedged(sources)
+
         if not price_data:
             raise MarketDataException("All data sources failed")
 
+        logger.debug(f"Got price data from {self.last_source}: ${price_data.price}")
+
         # Validate data
         await self._validate_price_data(price_data)
 
@@ -1023,11 +1387,13 @@ class DataCollector:
             )
 
         # Bid/ask validation
-        if price_data.bid and price_data.ask:
-            if price_data.bid >= price_data.ask:
+        bid = getattr(price_data, "bid", None)
+        ask = getattr(price_data, "ask", None)
+        if bid and ask:
+            if bid >= ask:
                 raise DataValidationException("Invalid bid/ask: bid >= ask")
 
-            spread_pct = (price_data.ask - price_data.bid) / price_data.price
+            spread_pct = (ask - bid) / price_data.price
             if spread_pct > 0.01:  # 1% spread threshold
                 logger.warning(f"Large spread detected: {spread_pct:.2%}")
 
@@ -1052,55 +1418,18 @@ class DataCollector:
                     )
 
     async def _calculate_indicators(self, price_data: PriceData):
-        """Calculate technical indicators."""
+        """Update streaming indicators with the new price and attach them."""
         try:
-            # Get recent price history from database
-            recent_prices_data = self.database.get_recent_prices(limit=200)
-
-            if len(recent_prices_data) < 20:
-                logger.debug("Insufficient price history for indicators")
-                return
-
-            # Extract prices
-            prices = [float(p["price"]) for p in recent_prices_data]
-            prices.append(price_data.price)  # Add current price
-
-            # Calculate indicators
-            if len(prices) >= 5:
-                sma_5 = TechnicalIndicators.sma(prices, 5)
-                if sma_5:
-                    price_data.sma_5 = sma_5[-1]
-
-            if len(prices) >= 20:
-                sma_20 = TechnicalIndicators.sma(prices, 20)
-                if sma_20:
-                    price_data.sma_20 = sma_20[-1]
-
-                bb = TechnicalIndicators.bollinger_bands(prices, 20)
-                if bb["upper"]:
-                    price_data.bb_upper = bb["upper"][-1]
-                    price_data.bb_lower = bb["lower"][-1]
-
-            if len(prices) >= 12:
-                ema_12 = TechnicalIndicators.ema(prices, 12)
-                if ema_12:
-                    price_data.ema_12 = ema_12[-1]
-
-            if len(prices) >= 26:
-                ema_26 = TechnicalIndicators.ema(prices, 26)
-                if ema_26:
-                    price_data.ema_26 = ema_26[-1]
-
-                macd_data = TechnicalIndicators.macd(prices, 12, 26, 9)
-                if macd_data["macd"]:
-                    price_data.macd = macd_data["macd"][-1]
-                if macd_data["signal"]:
-                    price_data.macd_signal = macd_data["signal"][-1]
-
-            if len(prices) >= 14:
-                rsi = TechnicalIndicators.rsi(prices, 14)
-                if rsi:
-                    price_data.rsi = rsi[-1]
+            if not self._indicators_seeded:
+                # One-time warm up from stored history
+                # Rows keep their timestamps so a tick already stored is
+                # not folded in a second time by the update below
+                recent_prices_data = self.database.get_recent_prices(limit=200)
+                self.indicators.seed(recent_prices_data)
+                self._indicators_seeded = True
+
+            self.indicators.update(price_data.price, price_data.timestamp)
+            self.indicators.apply(price_data)
 
             logger.debug(f"Calculated indicators for price: ${price_data.price}")
 
@@ -1119,7 +1448,23 @@ class DataCollector:
     async def get_ohlc_data(
         self, timeframe: str = "1h", limit: int = 100
     ) -> List[OHLCData]:
-        """Get OHLC data from sources."""
+        """Get OHLC data, preferring bars built from the live trade stream."""
+        local = get_stream_manager().candles.get_bars("BTC", timeframe, limit=limit)
+        if len(local) >= limit:
+            ohlc_data = [
+                OHLCData(
+                    timestamp=datetime.fromtimestamp(bar["timestamp"], tz=timezone.utc),
+                    open=bar["open"],
+                    high=bar["high"],
+                    low=bar["low"],
+                    close=bar["close"],
+                    volume=bar["volume"],
+                )
+                for bar in local
+            ]
+            await self._calculate_ohlc_indicators(ohlc_data)
+            return ohlc_data
+
         for source in self.data_sources:
             if not source.is_healthy():
                 continue
@@ -1144,43 +1489,56 @@ class DataCollector:
         # Extract close prices
         close_prices = [float(candle.close) for candle in ohlc_data]
 
-        # Calculate indicators
-        sma_20 = TechnicalIndicators.sma(close_prices, 20)
-        ema_12 = TechnicalIndicators.ema(close_prices, 12)
-        ema_26 = TechnicalIndicators.ema(close_prices, 26)
-        rsi = TechnicalIndicators.rsi(close_prices, 14)
-        macd_data = TechnicalIndicators.macd(close_prices, 12, 26, 9)
-        bb = TechnicalIndicators.bollinger_bands(close_prices, 20)
+        # Calculate all indicators in one pass, aligned with the candles
+        indicators = TechnicalIndicators.all_indicators(
+            close_prices, sma_periods=[20], ema_periods=[12, 26]
+        )
+        columns = {
+            "sma_20": indicators["sma"][0],
+            "ema_12": indicators["ema"][0],
+            "ema_26": indicators["ema"][1],
+            "rsi": indicators["rsi"],
+            "macd": indicators["macd"],
+            "macd_signal": indicators["macd_signal"],
+            "bb_upper": indicators["bb_upper"],
+            "bb_lower": indicators["bb_lower"],
+        }
 
         # Add indicators to candles
-        for i, candle in enumerate(ohlc_data):
-            if i < len(sma_20):
-                candle.sma_20 = sma_20[i]
-
-            if i < len(ema_12):
-                candle.ema_12 = ema_12[i]
-
-            if i < len(ema_26):
-                candle.ema_26 = ema_26[i]
-
-            if i < len(rsi):
-                candle.rsi = rsi[i]
-
-            macd_index = i - (len(close_prices) - len(macd_data["macd"]))
-            if macd_index >= 0 and macd_index < len(macd_data["macd"]):
-                candle.macd = macd_data["macd"][macd_index]
-
-            signal_index = i - (len(close_prices) - len(macd_data["signal"]))
-            if signal_index >= 0 and signal_index < len(macd_data["signal"]):
-                candle.macd_signal = macd_data["signal"][signal_index]
+        for name, values in columns.items():
+            for candle, value in zip(ohlc_data, values.tolist()):
+                if not np.isnan(value):
+                    setattr(candle, name, value)
+
+    def _local_market_depth(
+        self, symbol: str = "BTC", levels: int = 50
+    ) -> Optional[MarketDepth]:
+        """Market depth from the streamed local order book, if fresh."""
+        book = get_stream_manager().get_order_book(symbol)
+        if book is None or time.time() - book.updated_at > self.DEPTH_MAX_AGE:
+            return None
 
-            bb_index = i - (len(close_prices) - len(bb["upper"]))
-            if bb_index >= 0 and bb_index < len(bb["upper"]):
-                candle.bb_upper = bb["upper"][bb_index]
-                candle.bb_lower = bb["lower"][bb_index]
+        top = book.top(levels)
+        bid_volume = sum(quantity for _, quantity in top["bids"])
+        ask_volume = sum(quantity for _, quantity in top["asks"])
+        total = bid_volume + ask_volume
+        return MarketDepth(
+            timestamp=datetime.fromtimestamp(book.updated_at, tz=timezone.utc),
+            bids=[tuple(level) for level in top["bids"]],
+            asks=[tuple(level) for level in top["asks"]],
+            spread=book.spread(),
+            mid_price=book.mid(),
+            total_bid_volume=bid_volume,
+            total_ask_volume=ask_volume,
+            depth_imbalance=(bid_volume - ask_volume) / total if total else 0.0,
+        )
 
     async def get_market_depth(self) -> Optional[MarketDepth]:
-        """Get market depth data."""
+        """Get market depth, preferring the local streamed order book."""
+        depth = self._local_market_depth()
+        if depth is not None:
+            return depth
+
         for source in self.data_sources:
             if not source.is_healthy():
                 continue
@@ -1204,6 +1562,7 @@ class DataCollector:
                 "healthy": source.is_healthy(),
                 "priority": source.priority,
                 "error_count": source.error_count,
+                "latency": source.latency.to_dict(),
                 "last_update": (
                     source.last_update.isoformat() if source.last_update else None
                 ),
@@ -1223,5 +1582,7 @@ class DataCollector:
                 self.latest_price.timestamp.isoformat() if self.latest_price else None
             ),
             "collection_interval": self.collection_interval,
+            "hedge_delay": self.hedge_delay,
+            "last_source": self.last_source,
             "source_status": self.get_source_status(),
         }
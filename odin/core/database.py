@@ -4,26 +4,273 @@ Odin Bitcoin Trading Bot - Simple SQLite Database (No SQLAlchemy ORM)
 
 import json
 import logging
+import queue
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# Rows per executemany transaction for bulk ingestion
+BULK_CHUNK_SIZE = 5000
+
+PriceRecords = Union[pd.DataFrame, Iterable[Any]]
+
+
+def _python_datetime(value: Any) -> Any:
+    """Convert pandas/NumPy timestamps to ``datetime`` for sqlite3."""
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    return value
+
+
+def price_records(data: PriceRecords) -> Iterator[Dict[str, Any]]:
+    """
+    Normalize price history into dicts with ``timestamp`` and ``price`` keys.
+
+    Args:
+        data: DataFrame (``timestamp`` column or DatetimeIndex, ``price`` or
+            ``close`` column) or an iterable of dicts, ``PriceData`` objects
+            or ``(timestamp, price[, volume[, market_cap]])`` tuples
+
+    Yields:
+        Price record dicts; extra keys such as ``volume`` are passed through
+    """
+    if isinstance(data, pd.DataFrame):
+        frame = data
+        if "timestamp" not in frame.columns:
+            frame = frame.rename_axis("timestamp").reset_index()
+        if "price" not in frame.columns and "close" in frame.columns:
+            frame = frame.assign(price=frame["close"])
+        frame = frame.astype(object).where(frame.notna(), None)
+        for record in frame.to_dict("records"):
+            record["timestamp"] = _python_datetime(record["timestamp"])
+            yield record
+        return
+
+    for item in data:
+        if isinstance(item, dict):
+            record = dict(item)
+        elif isinstance(item, (tuple, list)):
+            record = dict(zip(("timestamp", "price", "volume", "market_cap"), item))
+        else:
+            record = {
+                key: getattr(item, key)
+                for key in ("timestamp", "price", "volume", "source", "rsi", "macd")
+                if getattr(item, key, None) is not None
+            }
+        record["timestamp"] = _python_datetime(record["timestamp"])
+        yield record
+
+
+def chunked(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split an iterable into lists of at most ``size`` items."""
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def load_price_csv(path: Union[str, Path]) -> pd.DataFrame:
+    """
+    Load daily price history exported as CSV.
+
+    Reads the ``Start,End,Open,High,Low,Close,Volume,Market Cap`` layout of
+    ``scripts/bitcoin_20080225_20250525.csv`` (newest first, UTF-8 BOM).
+
+    Args:
+        path: CSV file
+
+    Returns:
+        DataFrame sorted oldest first with ``timestamp``, ``open``, ``high``,
+        ``low``, ``close``, ``price``, ``volume`` and ``market_cap`` columns
+    """
+    frame = pd.read_csv(path, encoding="utf-8-sig")
+    frame.columns = [column.strip().lower().replace(" ", "_") for column in frame]
+    frame = frame.rename(columns={"start": "timestamp"})
+    frame = frame.drop(columns=["end"], errors="ignore")
+    frame["timestamp"] = pd.to_datetime(frame["timestamp"])
+    frame["price"] = frame["close"]
+    return frame.sort_values("timestamp").reset_index(drop=True)
+
+
+class ConnectionPool:
+    """
+    Fixed-size pool of persistent SQLite connections.
+
+    Connections are opened lazily, configured once (WAL journal, synchronous
+    level, page cache) and then reused, so a query no longer pays for opening
+    the file and re-parsing its statements. Each connection is only ever used
+    by one thread at a time.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        size: int = 4,
+        timeout: float = 30.0,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        cache_size_kb: int = 16384,
+        cached_statements: int = 256,
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            db_path: SQLite database file
+            size: Maximum number of open connections
+            timeout: Seconds to wait for a free connection or a locked database
+            journal_mode: SQLite journal mode (WAL lets readers run during writes)
+            synchronous: SQLite synchronous level (OFF, NORMAL, FULL, EXTRA)
+            cache_size_kb: Page cache size per connection in KiB
+            cached_statements: Prepared statements cached per connection
+        """
+        if size < 1:
+            raise ValueError("Connection pool size must be at least 1")
+        if synchronous.upper() not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Invalid synchronous level: {synchronous}")
+
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self.journal_mode = journal_mode.upper()
+        self.synchronous = synchronous.upper()
+        self.cache_size_kb = cache_size_kb
+        self.cached_statements = cached_statements
+
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._opened = 0
+
+    def _open(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute(f"PRAGMA cache_size = {-abs(int(self.cache_size_kb))}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """Take an idle connection, opening one if the pool is not full."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                try:
+                    return self._open()
+                except Exception:
+                    self._opened -= 1
+                    raise
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No database connection available after {self.timeout}s"
+            )
+
+    def release(self, conn: sqlite3.Connection):
+        """Return a connection to the pool."""
+        conn.row_factory = None
+        self._idle.put(conn)
+
+    def close(self):
+        """Close all idle connections."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Pool usage counters."""
+        return {
+            "size": self.size,
+            "open": self._opened,
+            "idle": self._idle.qsize(),
+        }
+
 
 class DatabaseManager:
     """Simple SQLite database manager for Odin Bitcoin Trading Bot."""
 
-    def __init__(self, db_path: str = "data/bitcoin_data.db"):
+    def __init__(
+        self,
+        db_path: str = "data/bitcoin_data.db",
+        pool_size: int = 4,
+        synchronous: str = "NORMAL",
+        cache_size_kb: int = 16384,
+        cached_statements: int = 256,
+    ):
+        """
+        Initialize database manager.
+
+        Args:
+            db_path: SQLite database file
+            pool_size: Number of persistent connections kept open
+            synchronous: SQLite synchronous level; NORMAL is durable across
+                application crashes in WAL mode and avoids an fsync per commit
+            cache_size_kb: Page cache size per connection in KiB
+            cached_statements: Prepared statements cached per connection
+        """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pool = ConnectionPool(
+            self.db_path,
+            size=pool_size,
+            synchronous=synchronous,
+            cache_size_kb=cache_size_kb,
+            cached_statements=cached_statements,
+        )
         self._init_database()
 
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a pooled connection.
+
+        Commits on success and rolls back on error, like using a
+        ``sqlite3.Connection`` as a context manager.
+        """
+        conn = self.pool.acquire()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self.pool.release(conn)
+
     def _init_database(self):
         """Initialize database tables."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 conn.execute("PRAGMA foreign_keys = ON")
                 cursor = conn.cursor()
 
@@ -122,6 +369,45 @@ class DatabaseManager:
                 """
                 )
 
+                # OHLCV bars built from the trade stream
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS ohlcv_bars (
+                        symbol TEXT NOT NULL,
+                        timeframe TEXT NOT NULL,
+                        open_time INTEGER NOT NULL,
+                        open REAL NOT NULL,
+                        high REAL NOT NULL,
+                        low REAL NOT NULL,
+                        close REAL NOT NULL,
+                        volume REAL NOT NULL DEFAULT 0,
+                        trades INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (symbol, timeframe, open_time)
+                    ) WITHOUT ROWID
+                """
+                )
+
+                # Backtest results cached by strategy, parameters and data
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS backtest_results (
+                        cache_key TEXT PRIMARY KEY,
+                        strategy TEXT NOT NULL,
+                        parameters TEXT NOT NULL,
+                        initial_capital REAL NOT NULL,
+                        range_start TEXT NOT NULL,
+                        range_end TEXT NOT NULL,
+                        bars INTEGER NOT NULL,
+                        fingerprint TEXT NOT NULL,
+                        state TEXT NOT NULL,
+                        performance TEXT NOT NULL,
+                        trades TEXT NOT NULL,
+                        equity BLOB NOT NULL,
+                        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                """
+                )
+
                 # Create indexes for better performance
                 cursor.execute(
                     "CREATE INDEX IF NOT EXISTS idx_prices_timestamp ON bitcoin_prices(timestamp DESC)"
@@ -166,7 +452,7 @@ class DatabaseManager:
     ) -> bool:
         """Add Bitcoin price data."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -181,10 +467,71 @@ class DatabaseManager:
             logger.error(f"Error adding price data: {e}")
             return False
 
+    def add_price_data_bulk(
+        self, data: PriceRecords, chunk_size: int = BULK_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Insert many price rows with chunked ``executemany`` transactions.
+
+        Args:
+            data: DataFrame or iterable accepted by ``price_records``
+            chunk_size: Rows per transaction
+
+        Returns:
+            Ingestion report with ``success``, ``rows``, ``seconds`` and
+            ``rows_per_sec``; on failure ``success`` is False, ``error`` holds
+            the message and ``rows`` counts the chunks already committed
+        """
+        rows = (
+            (
+                record["timestamp"],
+                record["price"],
+                record.get("volume"),
+                record.get("market_cap"),
+            )
+            for record in price_records(data)
+        )
+
+        inserted = 0
+        error = None
+        started = time.perf_counter()
+        try:
+            with self.connection() as conn:
+                for chunk in chunked(rows, chunk_size):
+                    conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO bitcoin_prices (timestamp, price, volume, market_cap)
+                        VALUES (?, ?, ?, ?)
+                    """,
+                        chunk,
+                    )
+                    conn.commit()
+                    inserted += len(chunk)
+        except Exception as e:
+            error = str(e)
+            logger.error(f"Error bulk adding price data after {inserted} rows: {e}")
+        seconds = time.perf_counter() - started
+
+        report = {
+            "success": error is None,
+            "rows": inserted,
+            "seconds": seconds,
+            "rows_per_sec": inserted / seconds if seconds > 0 else float(inserted),
+        }
+        if error is not None:
+            report["error"] = error
+            return report
+
+        logger.info(
+            f"Bulk inserted {inserted} price rows in {seconds:.3f}s "
+            f"({report['rows_per_sec']:.0f} rows/sec)"
+        )
+        return report
+
     def get_recent_prices(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent Bitcoin prices."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 cursor.execute(
@@ -205,7 +552,7 @@ class DatabaseManager:
     def get_current_price(self) -> Optional[Dict[str, Any]]:
         """Get the most recent Bitcoin price."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 cursor.execute(
@@ -223,6 +570,106 @@ class DatabaseManager:
             logger.error(f"Error getting current price: {e}")
             return None
 
+    # OHLCV Bar Methods
+    def add_ohlcv_bulk(
+        self, bars: Iterable[Dict[str, Any]], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Upsert OHLCV bars with chunked ``executemany`` transactions.
+
+        Args:
+            bars: Dicts with symbol, timeframe, timestamp (bar open, epoch
+                seconds), open, high, low, close, volume and trades
+            chunk_size: Rows per transaction
+
+        Returns:
+            Ingestion report with ``rows``, ``seconds`` and ``rows_per_sec``
+        """
+        rows = (
+            (
+                bar["symbol"],
+                bar["timeframe"],
+                int(bar["timestamp"]),
+                bar["open"],
+                bar["high"],
+                bar["low"],
+                bar["close"],
+                bar.get("volume", 0.0),
+                bar.get("trades", 0),
+            )
+            for bar in bars
+        )
+
+        inserted = 0
+        started = time.perf_counter()
+        with self.connection() as conn:
+            for chunk in chunked(rows, chunk_size):
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO ohlcv_bars
+                        (symbol, timeframe, open_time, open, high, low, close,
+                         volume, trades)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    chunk,
+                )
+                conn.commit()
+                inserted += len(chunk)
+        seconds = time.perf_counter() - started
+
+        return {
+            "rows": inserted,
+            "seconds": seconds,
+            "rows_per_sec": inserted / seconds if seconds > 0 else float(inserted),
+        }
+
+    def get_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get stored OHLCV bars, oldest first.
+
+        Args:
+            symbol: Asset symbol
+            timeframe: Bar size (e.g. "1h")
+            start: Earliest bar open time to include (epoch seconds)
+            end: Bars must open before this time (epoch seconds)
+            limit: Return only the newest ``limit`` bars
+
+        Returns:
+            Bars in the history API format
+        """
+        query = """
+            SELECT open_time AS timestamp, close AS price, open, high, low, close,
+                   volume, trades
+            FROM ohlcv_bars
+            WHERE symbol = ? AND timeframe = ? AND open_time >= ? AND open_time < ?
+            ORDER BY open_time DESC
+        """
+        params: List[Any] = [
+            symbol.upper(),
+            timeframe,
+            start if start is not None else 0,
+            end if end is not None else 2**62,
+        ]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        try:
+            with self.connection() as conn:
+                conn.row_factory = sqlite3.Row
+                rows = conn.execute(query, params).fetchall()
+                return [dict(row) for row in reversed(rows)]
+        except Exception as e:
+            logger.error(f"Error getting OHLCV bars: {e}")
+            return []
+
     # Strategy Methods
     def add_strategy(
         self,
@@ -235,7 +682,7 @@ class DatabaseManager:
     ) -> bool:
         """Add or update strategy."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 params_json = json.dumps(parameters) if parameters else None
 
@@ -264,7 +711,7 @@ class DatabaseManager:
     def get_strategies(self, active_only: bool = False) -> List[Dict[str, Any]]:
         """Get all strategies."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
@@ -295,7 +742,7 @@ class DatabaseManager:
     def update_strategy_status(self, strategy_id: str, active: bool) -> bool:
         """Update strategy active status."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -327,7 +774,7 @@ class DatabaseManager:
     ) -> bool:
         """Add trade execution."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -365,7 +812,7 @@ class DatabaseManager:
     ) -> List[Dict[str, Any]]:
         """Get recent trades."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
@@ -401,7 +848,7 @@ class DatabaseManager:
     ) -> bool:
         """Add portfolio snapshot."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
 
                 allocation_json = (
@@ -436,7 +883,7 @@ class DatabaseManager:
     def get_latest_portfolio(self) -> Optional[Dict[str, Any]]:
         """Get latest portfolio snapshot."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 cursor.execute(
@@ -472,7 +919,7 @@ class DatabaseManager:
     ) -> bool:
         """Add strategy signal."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
 
                 indicators_json = (
@@ -511,7 +958,7 @@ class DatabaseManager:
     ) -> List[Dict[str, Any]]:
         """Get recent strategy signals."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
@@ -543,11 +990,70 @@ class DatabaseManager:
             logger.error(f"Error getting recent signals: {e}")
             return []
 
+    # Backtest Cache Methods
+    def save_backtest_result(self, record: Dict[str, Any]) -> bool:
+        """
+        Store or replace a cached backtest result.
+
+        Args:
+            record: Row for ``backtest_results``; ``state``, ``performance``
+                and ``trades`` are JSON-encoded here, ``equity`` is bytes
+        """
+        try:
+            with self.connection() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO backtest_results
+                    (cache_key, strategy, parameters, initial_capital, range_start,
+                     range_end, bars, fingerprint, state, performance, trades,
+                     equity, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                    (
+                        record["cache_key"],
+                        record["strategy"],
+                        record["parameters"],
+                        record["initial_capital"],
+                        record["range_start"],
+                        record["range_end"],
+                        record["bars"],
+                        record["fingerprint"],
+                        json.dumps(record["state"]),
+                        json.dumps(record["performance"]),
+                        json.dumps(record["trades"]),
+                        record["equity"],
+                    ),
+                )
+                conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Error saving backtest result: {e}")
+            return False
+
+    def get_backtest_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached backtest result with its JSON fields decoded."""
+        try:
+            with self.connection() as conn:
+                conn.row_factory = sqlite3.Row
+                row = conn.execute(
+                    "SELECT * FROM backtest_results WHERE cache_key = ?",
+                    (cache_key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                record = dict(row)
+                for field in ("state", "performance", "trades"):
+                    record[field] = json.loads(record[field])
+                return record
+        except Exception as e:
+            logger.error(f"Error getting backtest result: {e}")
+            return None
+
     # Statistics Methods
     def get_database_stats(self) -> Dict[str, Any]:
         """Get comprehensive database statistics."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
 
                 stats = {}
@@ -559,6 +1065,7 @@ class DatabaseManager:
                     "trades",
                     "portfolio_snapshots",
                     "strategy_signals",
+                    "ohlcv_bars",
                 ]
 
                 for table in tables:
@@ -606,8 +1113,8 @@ class DatabaseManager:
             return {}
 
     def close(self):
-        """Close database connection (no-op for SQLite with context managers)."""
-        pass
+        """Close pooled connections; they are reopened on next use."""
+        self.pool.close()
 
 
 # Convenience functions
@@ -0,0 +1,229 @@
+"""
+Indicator Result Cache
+
+Shares computed indicator series between strategies, API routes and
+backtests. Entries are keyed by a fingerprint of the input data plus the
+indicator name and parameters, so each indicator is computed once per data
+version, and the least recently used entries are evicted to stay under a
+memory budget.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from odin.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Default memory budget for cached results
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+ROLLING_STATS = ("mean", "std", "max", "min", "sum")
+
+
+def _freeze(value: Any) -> Any:
+    """Mark cached arrays read-only so callers cannot corrupt shared results."""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, dict):
+        for item in value.values():
+            _freeze(item)
+    return value
+
+
+def _size(value: Any) -> int:
+    """Approximate memory held by a cached result in bytes."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return int(np.sum(value.memory_usage(index=False)))
+    if isinstance(value, dict):
+        return sum(_size(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class IndicatorCache:
+    """
+    Thread-safe LRU cache of indicator results bounded by memory size.
+
+    Inputs are identified by content, not object identity: two frames with
+    the same close prices share cached moving averages regardless of index
+    or where they came from. Callers computing several indicators from one
+    column can fingerprint it once and pass ``key`` to skip re-hashing.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def fingerprint(*sources: Union[pd.Series, pd.DataFrame, np.ndarray]) -> str:
+        """
+        Content hash of one or more input series.
+
+        Args:
+            *sources: Series, frames (every column is hashed) or arrays
+
+        Returns:
+            Hex digest identifying the data version
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for source in sources:
+            if isinstance(source, pd.DataFrame):
+                columns = [source[column].to_numpy() for column in source.columns]
+            elif isinstance(source, pd.Series):
+                columns = [source.to_numpy()]
+            else:
+                columns = [np.asarray(source)]
+
+            for values in columns:
+                if values.dtype == object:
+                    values = pd.util.hash_array(values)
+                values = np.ascontiguousarray(values)
+                digest.update(f"{values.dtype.str}{values.shape}".encode())
+                digest.update(memoryview(values).cast("B"))
+        return digest.hexdigest()
+
+    def get_or_compute(
+        self,
+        name: str,
+        params: Dict[str, Hashable],
+        key: str,
+        compute: Callable[[], Any],
+    ) -> Any:
+        """
+        Cached result for an indicator, computing and storing it on a miss.
+
+        Args:
+            name: Indicator name; different formulas need different names
+            params: Indicator parameters
+            key: Fingerprint of the input data
+            compute: Produces the result (arrays, Series or dicts of them)
+
+        Returns:
+            The cached result; arrays in it are read-only
+        """
+        cache_key = (name, key, tuple(sorted(params.items())))
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        value = _freeze(compute())
+        size = _size(value)
+        if size > self.max_bytes:
+            return value
+
+        with self._lock:
+            previous = self._entries.pop(cache_key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self._entries[cache_key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes and self._entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+        return value
+
+    def series(
+        self,
+        name: str,
+        source: Union[pd.Series, pd.DataFrame],
+        params: Dict[str, Hashable],
+        compute: Callable[[], pd.Series],
+        key: Optional[str] = None,
+    ) -> pd.Series:
+        """
+        Cached indicator series aligned with ``source``.
+
+        Args:
+            name: Indicator name
+            source: Input series or frame; its index labels the result
+            params: Indicator parameters
+            compute: Produces the indicator as a Series or array
+            key: Fingerprint of ``source`` if already computed
+
+        Returns:
+            A writable copy of the cached values indexed like ``source``
+        """
+        key = key or self.fingerprint(source)
+        values = self.get_or_compute(
+            name, params, key, lambda: np.asarray(compute(), dtype=float).copy()
+        )
+        return pd.Series(values.copy(), index=source.index)
+
+    def rolling(
+        self,
+        series: pd.Series,
+        window: int,
+        stat: str = "mean",
+        key: Optional[str] = None,
+    ) -> pd.Series:
+        """Cached ``series.rolling(window).<stat>()``."""
+        if stat not in ROLLING_STATS:
+            raise ValueError(f"Unknown rolling statistic: {stat}")
+        return self.series(
+            f"rolling_{stat}",
+            series,
+            {"window": window},
+            lambda: getattr(series.rolling(window=window), stat)(),
+            key,
+        )
+
+    def ewm_mean(
+        self, series: pd.Series, key: Optional[str] = None, **ewm_params
+    ) -> pd.Series:
+        """Cached ``series.ewm(**ewm_params).mean()``."""
+        return self.series(
+            "ewm_mean",
+            series,
+            ewm_params,
+            lambda: series.ewm(**ewm_params).mean(),
+            key,
+        )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+# Global indicator cache instance
+_indicator_cache: Optional[IndicatorCache] = None
+
+
+def get_indicator_cache() -> IndicatorCache:
+    """Get or create the global indicator cache."""
+    global _indicator_cache
+    if _indicator_cache is None:
+        _indicator_cache = IndicatorCache()
+    return _indicator_cache
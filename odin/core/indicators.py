@@ -0,0 +1,434 @@
+"""
+Odin Core Indicators - Streaming Technical Indicators
+
+Incremental indicator objects that keep running state (ring-buffer sums,
+EMA state, Wilder averages, running variance) so every new price is folded
+in with constant work instead of recomputing from a price history.
+
+Values match the list-based ``TechnicalIndicators`` calculations in
+``odin.core.data_collector`` for the same sequence of prices.
+"""
+
+import logging
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingIndicator(ABC):
+    """Base class for indicators updated one value at a time."""
+
+    def __init__(self, period: int):
+        """
+        Initialize indicator.
+
+        Args:
+            period: Lookback period
+        """
+        if period < 1:
+            raise ValueError("Indicator period must be a positive integer")
+
+        self.period = period
+        self.count = 0
+        self.value: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        """True once enough values have been seen to produce a value."""
+        return self.value is not None
+
+    @abstractmethod
+    def update(self, price: float) -> Optional[float]:
+        """
+        Fold a new price into the indicator.
+
+        Args:
+            price: Latest price
+
+        Returns:
+            Current indicator value, or None while warming up
+        """
+        pass
+
+    def reset(self):
+        """Clear all running state."""
+        self.count = 0
+        self.value = None
+
+    def get_state(self) -> Dict[str, Any]:
+        """Running state as JSON-serializable values."""
+        state = {}
+        for name, value in vars(self).items():
+            if isinstance(value, StreamingIndicator):
+                value = value.get_state()
+            elif isinstance(value, deque):
+                value = list(value)
+            state[name] = value
+        return state
+
+    def set_state(self, state: Dict[str, Any]):
+        """
+        Restore running state saved by ``get_state``.
+
+        Raises:
+            ValueError: If the state was saved with a different period
+        """
+        if state.get("period", self.period) != self.period:
+            raise ValueError(
+                f"Indicator state has period {state['period']}, expected {self.period}"
+            )
+        for name, value in state.items():
+            current = getattr(self, name, None)
+            if isinstance(current, StreamingIndicator):
+                current.set_state(value)
+            elif isinstance(current, deque):
+                current.clear()
+                current.extend(value)
+            else:
+                setattr(self, name, value)
+
+
+class StreamingSMA(StreamingIndicator):
+    """Simple moving average over a ring buffer with a running sum."""
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self.window: deque = deque(maxlen=period)
+        self.total = 0.0
+
+    def update(self, price: float) -> Optional[float]:
+        if len(self.window) == self.period:
+            self.total -= self.window[0]
+        self.window.append(price)
+        self.total += price
+        self.count += 1
+
+        if len(self.window) == self.period:
+            self.value = self.total / self.period
+        return self.value
+
+    def reset(self):
+        super().reset()
+        self.window.clear()
+        self.total = 0.0
+
+
+class StreamingEMA(StreamingIndicator):
+    """Exponential moving average seeded with the SMA of the first period."""
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self.multiplier = 2 / (period + 1)
+        self.seed_total = 0.0
+
+    def update(self, price: float) -> Optional[float]:
+        self.count += 1
+
+        if self.value is None:
+            self.seed_total += price
+            if self.count == self.period:
+                self.value = self.seed_total / self.period
+            return self.value
+
+        self.value = (price * self.multiplier) + (self.value * (1 - self.multiplier))
+        return self.value
+
+    def reset(self):
+        super().reset()
+        self.seed_total = 0.0
+
+
+class StreamingRSI(StreamingIndicator):
+    """Relative Strength Index using Wilder's smoothing."""
+
+    def __init__(self, period: int = 14):
+        super().__init__(period)
+        self.previous_price: Optional[float] = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.changes = 0
+
+    def update(self, price: float) -> Optional[float]:
+        self.count += 1
+        previous_price, self.previous_price = self.previous_price, price
+        if previous_price is None:
+            return self.value
+
+        change = price - previous_price
+        gain = change if change > 0 else 0
+        loss = -change if change < 0 else 0
+        self.changes += 1
+
+        if self.changes <= self.period:
+            # Seed averages with the mean of the first period of changes
+            self.avg_gain += gain
+            self.avg_loss += loss
+            if self.changes < self.period:
+                return self.value
+            self.avg_gain /= self.period
+            self.avg_loss /= self.period
+        else:
+            self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+            self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+
+        if self.avg_loss == 0:
+            self.value = 100
+        else:
+            rs = self.avg_gain / self.avg_loss
+            self.value = 100 - (100 / (1 + rs))
+        return self.value
+
+    def reset(self):
+        super().reset()
+        self.previous_price = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.changes = 0
+
+
+class StreamingMACD(StreamingIndicator):
+    """MACD line, signal line and histogram from chained EMAs."""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        super().__init__(slow)
+        self.fast_ema = StreamingEMA(fast)
+        self.slow_ema = StreamingEMA(slow)
+        self.signal_ema = StreamingEMA(signal)
+        self.signal: Optional[float] = None
+        self.histogram: Optional[float] = None
+
+    def update(self, price: float) -> Optional[float]:
+        self.count += 1
+        fast_value = self.fast_ema.update(price)
+        slow_value = self.slow_ema.update(price)
+        if slow_value is None:
+            return self.value
+
+        self.value = fast_value - slow_value
+        self.signal = self.signal_ema.update(self.value)
+        if self.signal is not None:
+            self.histogram = self.value - self.signal
+        return self.value
+
+    def reset(self):
+        super().reset()
+        for ema in (self.fast_ema, self.slow_ema, self.signal_ema):
+            ema.reset()
+        self.signal = None
+        self.histogram = None
+
+
+class StreamingBollingerBands(StreamingIndicator):
+    """Bollinger Bands from a running mean and variance over a ring buffer."""
+
+    # Recompute the running sums from the window this often to stop drift
+    RESYNC_INTERVAL = 1000
+
+    def __init__(self, period: int = 20, std_dev: float = 2):
+        if period < 2:
+            raise ValueError("Bollinger Bands period must be at least 2")
+        super().__init__(period)
+        self.std_dev = std_dev
+        self.window: deque = deque(maxlen=period)
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.upper: Optional[float] = None
+        self.lower: Optional[float] = None
+
+    def update(self, price: float) -> Optional[float]:
+        self.count += 1
+
+        if len(self.window) == self.period:
+            # Welford removal of the value leaving the window
+            old = self.window[0]
+            n = self.period - 1
+            delta = old - self.mean
+            self.mean -= delta / n
+            self.m2 -= delta * (old - self.mean)
+
+        self.window.append(price)
+        n = len(self.window)
+        delta = price - self.mean
+        self.mean += delta / n
+        self.m2 += delta * (price - self.mean)
+
+        if self.count % self.RESYNC_INTERVAL == 0:
+            self._resync()
+
+        if n == self.period:
+            std = math.sqrt(max(self.m2, 0.0) / (n - 1))
+            self.value = self.mean
+            self.upper = self.mean + (self.std_dev * std)
+            self.lower = self.mean - (self.std_dev * std)
+        return self.value
+
+    def _resync(self):
+        """Recompute mean and sum of squared deviations from the window."""
+        n = len(self.window)
+        self.mean = sum(self.window) / n
+        self.m2 = sum((x - self.mean) ** 2 for x in self.window)
+
+    def reset(self):
+        super().reset()
+        self.window.clear()
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.upper = None
+        self.lower = None
+
+
+def _as_utc(timestamp: datetime) -> datetime:
+    """Treat naive timestamps as UTC so mixed sources compare cleanly."""
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
+class StreamingIndicators:
+    """
+    The indicator set attached to collected prices, updated per tick.
+
+    One instance can be shared between the data collector and the strategy
+    manager; prices at or before the last seen timestamp are ignored so a
+    tick fed by both is only counted once.
+    """
+
+    # Attribute names of the indicators in the set
+    INDICATORS = ("sma_5", "sma_20", "ema_12", "ema_26", "rsi", "macd", "bollinger")
+
+    def __init__(self):
+        self.sma_5 = StreamingSMA(5)
+        self.sma_20 = StreamingSMA(20)
+        self.ema_12 = StreamingEMA(12)
+        self.ema_26 = StreamingEMA(26)
+        self.rsi = StreamingRSI(14)
+        self.macd = StreamingMACD(12, 26, 9)
+        self.bollinger = StreamingBollingerBands(20, 2)
+
+        self.last_timestamp: Optional[datetime] = None
+        self.last_price: Optional[float] = None
+
+    @property
+    def count(self) -> int:
+        """Number of prices folded in."""
+        return self.sma_5.count
+
+    def update(
+        self, price: float, timestamp: Optional[datetime] = None
+    ) -> Dict[str, Optional[float]]:
+        """
+        Fold a new price into every indicator.
+
+        Args:
+            price: Latest price
+            timestamp: Price timestamp, used to skip already-seen ticks
+
+        Returns:
+            Current indicator values
+        """
+        if timestamp is not None:
+            timestamp = _as_utc(timestamp)
+            if self.last_timestamp is not None and timestamp <= self.last_timestamp:
+                return self.snapshot()
+
+        price = float(price)
+        for indicator in (
+            self.sma_5,
+            self.sma_20,
+            self.ema_12,
+            self.ema_26,
+            self.rsi,
+            self.macd,
+            self.bollinger,
+        ):
+            indicator.update(price)
+
+        self.last_price = price
+        if timestamp is not None:
+            self.last_timestamp = timestamp
+        return self.snapshot()
+
+    def seed(self, prices: Iterable[Any]):
+        """
+        Warm up from history, oldest first.
+
+        Args:
+            prices: Floats, ``PriceData`` objects or dicts with ``price`` and
+                optional ``timestamp`` keys
+        """
+        for item in prices:
+            if isinstance(item, dict):
+                timestamp = item.get("timestamp")
+                if isinstance(timestamp, str):
+                    try:
+                        timestamp = datetime.fromisoformat(timestamp)
+                    except ValueError:
+                        timestamp = None
+                self.update(item["price"], timestamp)
+            elif hasattr(item, "price"):
+                self.update(item.price, getattr(item, "timestamp", None))
+            else:
+                self.update(item)
+
+    def snapshot(self) -> Dict[str, Optional[float]]:
+        """Get current indicator values (None while warming up)."""
+        return {
+            "sma_5": self.sma_5.value,
+            "sma_20": self.sma_20.value,
+            "ema_12": self.ema_12.value,
+            "ema_26": self.ema_26.value,
+            "rsi": self.rsi.value,
+            "macd": self.macd.value,
+            "macd_signal": self.macd.signal,
+            "macd_histogram": self.macd.histogram,
+            "bb_upper": self.bollinger.upper,
+            "bb_middle": self.bollinger.value,
+            "bb_lower": self.bollinger.lower,
+        }
+
+    def apply(self, price_data: Any):
+        """Set the ready indicator values as attributes of ``price_data``."""
+        for name, value in self.snapshot().items():
+            if value is not None:
+                setattr(price_data, name, value)
+
+    def get_state(self) -> Dict[str, Any]:
+        """Running state of every indicator as JSON-serializable values."""
+        return {
+            "indicators": {
+                name: getattr(self, name).get_state() for name in self.INDICATORS
+            },
+            "last_timestamp": (
+                self.last_timestamp.isoformat() if self.last_timestamp else None
+            ),
+            "last_price": self.last_price,
+        }
+
+    def set_state(self, state: Dict[str, Any]):
+        """Restore indicator state saved by ``get_state``."""
+        for name, indicator_state in state["indicators"].items():
+            getattr(self, name).set_state(indicator_state)
+        last_timestamp = state.get("last_timestamp")
+        self.last_timestamp = (
+            _as_utc(datetime.fromisoformat(last_timestamp)) if last_timestamp else None
+        )
+        self.last_price = state.get("last_price")
+
+    def reset(self):
+        """Clear all indicator state."""
+        for indicator in (
+            self.sma_5,
+            self.sma_20,
+            self.ema_12,
+            self.ema_26,
+            self.rsi,
+            self.macd,
+            self.bollinger,
+        ):
+            indicator.reset()
+        self.last_timestamp = None
+        self.last_price = None
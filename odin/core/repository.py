@@ -6,13 +6,15 @@ Focused, working repository system without bloat.
 import asyncio
 import json
 import sqlite3
+import time
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ..utils.logging import get_logger
+from .database import BULK_CHUNK_SIZE, PriceRecords, chunked, price_records
 from .exceptions import ErrorCode, ErrorSeverity, OdinException
 
 logger = get_logger(__name__)
@@ -107,6 +109,58 @@ class DatabaseManager:
             traceback.print_exc()
             return QueryResult(success=False, error=error_msg)
 
+    async def execute_many(
+        self,
+        query: str,
+        rows: Iterable[Tuple],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> QueryResult:
+        """
+        Execute a statement for many parameter rows.
+
+        Rows are written with ``executemany`` in one transaction per chunk,
+        off the event loop.
+
+        Args:
+            query: Parameterized SQL statement
+            rows: Parameter tuples, consumed lazily
+            chunk_size: Rows per transaction
+
+        Returns:
+            QueryResult whose data is a report with ``rows``, ``seconds`` and
+            ``rows_per_sec``
+        """
+
+        def write(conn: sqlite3.Connection) -> int:
+            written = 0
+            for chunk in chunked(rows, chunk_size):
+                try:
+                    conn.executemany(query, chunk)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                written += len(chunk)
+            return written
+
+        try:
+            async with self.get_connection() as conn:
+                started = time.perf_counter()
+                written = await asyncio.to_thread(write, conn)
+                seconds = time.perf_counter() - started
+
+            report = {
+                "rows": written,
+                "seconds": seconds,
+                "rows_per_sec": written / seconds if seconds > 0 else float(written),
+            }
+            return QueryResult(success=True, data=report, rows_affected=written)
+
+        except Exception as e:
+            error_msg = str(e) if str(e) else f"{type(e).__name__}: {repr(e)}"
+            logger.error(f"Bulk query failed: {error_msg}")
+            return QueryResult(success=False, error=error_msg)
+
     async def _create_tables(self):
         """Create database tables."""
         tables = [
@@ -200,6 +254,47 @@ class PriceRepository:
         result = await self.db.execute_query(query, params)
         return result.success
 
+    async def save_prices(
+        self, data: PriceRecords, chunk_size: int = BULK_CHUNK_SIZE
+    ) -> QueryResult:
+        """
+        Save many price rows in chunked transactions.
+
+        Args:
+            data: DataFrame or iterable of price dicts/``PriceData`` objects
+            chunk_size: Rows per transaction
+
+        Returns:
+            QueryResult with the ingestion report (rows, seconds, rows_per_sec)
+        """
+        query = """INSERT OR REPLACE INTO bitcoin_prices 
+                   (timestamp, price, volume, source, rsi, macd) 
+                   VALUES (?, ?, ?, ?, ?, ?)"""
+
+        rows = (
+            (
+                (
+                    record["timestamp"].isoformat()
+                    if isinstance(record["timestamp"], datetime)
+                    else record["timestamp"]
+                ),
+                record["price"],
+                record.get("volume"),
+                record.get("source") or "unknown",
+                record.get("rsi"),
+                record.get("macd"),
+            )
+            for record in price_records(data)
+        )
+
+        result = await self.db.execute_many(query, rows, chunk_size)
+        if result.success:
+            logger.info(
+                f"Saved {result.data['rows']} prices in {result.data['seconds']:.3f}s "
+                f"({result.data['rows_per_sec']:.0f} rows/sec)"
+            )
+        return result
+
     async def get_latest_price(self) -> Optional[Dict[str, Any]]:
         """Get latest price."""
         query = "SELECT * FROM bitcoin_prices ORDER BY timestamp DESC LIMIT 1"
@@ -471,6 +566,14 @@ async def save_price_data(price_data: Dict[str, Any]) -> bool:
     return await repo.price_repo.save_price(price_data)
 
 
+async def save_price_data_bulk(
+    data: PriceRecords, chunk_size: int = BULK_CHUNK_SIZE
+) -> QueryResult:
+    """Save many price rows in chunked transactions."""
+    repo = await get_repository_manager()
+    return await repo.price_repo.save_prices(data, chunk_size)
+
+
 async def get_latest_price() -> Optional[Dict[str, Any]]:
     """Get latest price."""
     repo = await get_repository_manager()
@@ -30,6 +30,7 @@ from ..strategies import (
 )
 from .database import Database
 from .exceptions import StrategyConfigurationException, StrategyException
+from .indicators import StreamingIndicators
 from .models import PriceData, StrategySignal
 
 logger = logging.getLogger(__name__)
@@ -43,14 +44,19 @@ class EnhancedStrategyManager:
     the optimal strategy based on real-time market conditions and performance.
     """
 
-    def __init__(self, database: Database):
+    def __init__(
+        self, database: Database, indicators: Optional[StreamingIndicators] = None
+    ):
         """
         Initialize enhanced strategy manager with AI components.
 
         Args:
             database: Database instance for data persistence
+            indicators: Streaming indicator state (may be shared with the
+                data collector)
         """
         self.database = database
+        self.indicators = indicators or StreamingIndicators()
 
         # Strategy pool - all available strategies
         self.strategy_pool: Dict[str, Any] = {}
@@ -352,8 +358,13 @@ class EnhancedStrategyManager:
             # Get active strategy instance
             active_strategy = self.strategy_pool[self.active_strategy_id]["instance"]
 
+            # Fold ticks not seen yet into the streaming indicators
+            for price_point in price_data:
+                self.indicators.update(price_point.price, price_point.timestamp)
+
             # Convert price data to DataFrame
             df = self._price_data_to_dataframe(price_data)
+            df = active_strategy.calculate_indicators(df)
 
             # Generate signal
             signal = active_strategy.generate_signal(df)
@@ -364,6 +375,9 @@ class EnhancedStrategyManager:
 
                 # Add metadata about AI selection
                 if hasattr(signal, "indicators"):
+                    for name, value in self.indicators.snapshot().items():
+                        if value is not None:
+                            signal.indicators.setdefault(name, value)
                     signal.indicators.update(
                         {
                             "ai_selected_strategy": self.active_strategy_id,
@@ -11,6 +11,11 @@ from odin.data.exchange_streams import (
     KrakenConnector,
     get_stream_manager,
 )
+from odin.data.archive import PriceArchive, get_price_archive
+from odin.data.bbo import ConsolidatedBBO
+from odin.data.candles import CandleAggregator
+from odin.data.order_book import OrderBook
+from odin.data.recording import ReplayConnector, StreamRecorder, read_recording
 
 __all__ = [
     "StreamManager",
@@ -19,4 +24,12 @@ __all__ = [
     "BinanceConnector",
     "KrakenConnector",
     "get_stream_manager",
+    "OrderBook",
+    "ConsolidatedBBO",
+    "CandleAggregator",
+    "StreamRecorder",
+    "ReplayConnector",
+    "read_recording",
+    "PriceArchive",
+    "get_price_archive",
 ]
@@ -0,0 +1,391 @@
+"""
+Columnar Price Archive
+Append-only OHLCV history stored as one memory-mapped ``.npy`` file per
+column, so backtests and analytics can read years of bars as zero-copy
+NumPy views instead of building DataFrames from SQLite row dicts.
+
+Layout per symbol and timeframe::
+
+    <root>/<SYMBOL>/<timeframe>/
+        header.json      row count, first/last timestamp
+        timestamp.npy    int64 epoch seconds (bar open), strictly increasing
+        open.npy ... volume.npy   float64
+
+Column files are preallocated and grow by doubling; the header's row count
+is written last, so rows past it (from an interrupted append) are ignored.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from odin.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_ROOT = "data/archive"
+
+COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+PRICE_COLUMNS = COLUMNS[1:]
+
+# Rows allocated for a new archive
+INITIAL_CAPACITY = 4096
+
+# Rows read per SQLite fetch during imports
+IMPORT_CHUNK_SIZE = 50_000
+
+HEADER_VERSION = 1
+
+
+def _dtype(column: str) -> np.dtype:
+    return np.dtype(np.int64 if column == "timestamp" else np.float64)
+
+
+def _epoch_seconds(values: Any) -> np.ndarray:
+    """Epoch seconds from datetimes, datetime strings or numbers."""
+    array = np.asarray(values)
+    if array.dtype.kind in "iuf":
+        return array.astype(np.int64)
+    index = pd.DatetimeIndex(pd.to_datetime(array, utc=True, format="ISO8601"))
+    seconds = (index - pd.Timestamp(0, tz="UTC")) // pd.Timedelta(seconds=1)
+    return np.asarray(seconds, dtype=np.int64)
+
+
+class PriceArchive:
+    """
+    Append-only columnar OHLCV store for one symbol and timeframe.
+
+    Reads return read-only views of the mapped files; they stay valid until
+    the next append that grows the files.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        timeframe: str,
+        root: Union[str, Path] = DEFAULT_ROOT,
+    ):
+        self.symbol = symbol.upper()
+        self.timeframe = timeframe
+        self.path = Path(root) / self.symbol / timeframe
+        self.rows = 0
+        self.capacity = 0
+        self._maps: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        """Pick up rows appended by another process."""
+        header = self.path / "header.json"
+        if not header.exists():
+            return
+        meta = json.loads(header.read_text())
+        with self._lock:
+            if int(meta["capacity"]) != self.capacity:
+                self._maps.clear()
+            self.rows = int(meta["rows"])
+            self.capacity = int(meta["capacity"])
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @property
+    def start(self) -> Optional[int]:
+        """Open time of the first bar (epoch seconds)."""
+        return int(self._column("timestamp")[0]) if self.rows else None
+
+    @property
+    def end(self) -> Optional[int]:
+        """Open time of the last bar (epoch seconds)."""
+        return int(self._column("timestamp")[self.rows - 1]) if self.rows else None
+
+    def _file(self, column: str) -> Path:
+        return self.path / f"{column}.npy"
+
+    def _column(self, column: str) -> np.ndarray:
+        """Read-only mapping of a full column file (including spare capacity)."""
+        mapped = self._maps.get(column)
+        if mapped is None:
+            mapped = np.load(self._file(column), mmap_mode="r")
+            self._maps[column] = mapped
+        return mapped
+
+    def _write_header(self):
+        meta = {
+            "version": HEADER_VERSION,
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "rows": self.rows,
+            "capacity": self.capacity,
+            "columns": {column: _dtype(column).str for column in COLUMNS},
+            "start": self.start,
+            "end": self.end,
+        }
+        tmp = self.path / "header.json.tmp"
+        tmp.write_text(json.dumps(meta, indent=2))
+        os.replace(tmp, self.path / "header.json")
+
+    def _grow(self, needed: int):
+        """Reallocate every column file to hold at least ``needed`` rows."""
+        capacity = max(INITIAL_CAPACITY, self.capacity)
+        while capacity < needed:
+            capacity *= 2
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._maps.clear()
+        for column in COLUMNS:
+            tmp = self.path / f"{column}.npy.tmp"
+            grown = np.lib.format.open_memmap(
+                tmp, mode="w+", dtype=_dtype(column), shape=(capacity,)
+            )
+            if self.rows:
+                grown[: self.rows] = np.load(self._file(column), mmap_mode="r")[
+                    : self.rows
+                ]
+            grown.flush()
+            del grown
+            os.replace(tmp, self._file(column))
+        self.capacity = capacity
+
+    def append(self, timestamps: Any, **columns: Any) -> int:
+        """
+        Append bars newer than the last stored bar.
+
+        Rows at or before the current end are skipped, so re-running an
+        import only adds what is new.
+
+        Args:
+            timestamps: Bar open times (datetimes, strings or epoch seconds),
+                strictly increasing
+            **columns: ``open``, ``high``, ``low``, ``close`` and ``volume``
+                arrays aligned with ``timestamps``; ``volume`` defaults to 0
+
+        Returns:
+            Number of rows appended
+        """
+        missing = [c for c in ("open", "high", "low", "close") if c not in columns]
+        if missing:
+            raise ValueError(f"Missing archive columns: {missing}")
+
+        ts = _epoch_seconds(timestamps)
+        values = {
+            column: np.asarray(
+                columns.get(column, np.zeros(len(ts))), dtype=np.float64
+            )
+            for column in PRICE_COLUMNS
+        }
+        if len(ts) > 1 and not np.all(np.diff(ts) > 0):
+            raise ValueError("Archive timestamps must be strictly increasing")
+
+        with self._lock:
+            if self.rows:
+                keep = ts > self.end
+                ts = ts[keep]
+                values = {column: array[keep] for column, array in values.items()}
+            count = len(ts)
+            if not count:
+                return 0
+
+            if self.rows + count > self.capacity:
+                self._grow(self.rows + count)
+
+            stop = self.rows + count
+            for column in COLUMNS:
+                target = np.load(self._file(column), mmap_mode="r+")
+                target[self.rows:stop] = ts if column == "timestamp" else values[column]
+                target.flush()
+                del target
+
+            self.rows = stop
+            self._write_header()
+        return count
+
+    def append_frame(self, frame: pd.DataFrame) -> int:
+        """
+        Append an OHLCV frame indexed by bar open time.
+
+        A ``timestamp`` column is used instead of the index when present.
+        """
+        timestamps = frame["timestamp"] if "timestamp" in frame else frame.index
+        return self.append(
+            np.asarray(timestamps),
+            **{column: frame[column] for column in PRICE_COLUMNS if column in frame},
+        )
+
+    def _bounds(self, start: Optional[int], end: Optional[int]) -> Tuple[int, int]:
+        timestamps = self._column("timestamp")[: self.rows]
+        first = 0 if start is None else int(np.searchsorted(timestamps, start, "left"))
+        last = self.rows if end is None else int(np.searchsorted(timestamps, end, "left"))
+        return first, max(first, last)
+
+    def arrays(
+        self, start: Optional[int] = None, end: Optional[int] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Zero-copy column views for bars opening in ``[start, end)``.
+
+        Args:
+            start: Earliest bar open time (epoch seconds)
+            end: Bars must open before this time (epoch seconds)
+
+        Returns:
+            Read-only arrays keyed by column name
+        """
+        if not self.rows:
+            return {column: np.empty(0, dtype=_dtype(column)) for column in COLUMNS}
+        first, last = self._bounds(start, end)
+        return {column: self._column(column)[first:last] for column in COLUMNS}
+
+    def frame(
+        self, start: Optional[int] = None, end: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        OHLCV frame over :meth:`arrays` for bars opening in ``[start, end)``.
+
+        Columns are views of the mapped files (no copy); the index is a
+        naive UTC DatetimeIndex of bar open times.
+        """
+        arrays = self.arrays(start, end)
+        index = pd.to_datetime(arrays.pop("timestamp"), unit="s")
+        return pd.DataFrame(arrays, index=index, copy=False)
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "path": str(self.path),
+            "rows": self.rows,
+            "capacity": self.capacity,
+            "start": self.start,
+            "end": self.end,
+        }
+
+
+def import_price_csv(
+    path: Union[str, Path],
+    symbol: str = "BTC",
+    timeframe: str = "1d",
+    root: Union[str, Path] = DEFAULT_ROOT,
+) -> int:
+    """
+    Import daily history from the CSV export read by ``load_price_csv``.
+
+    Returns:
+        Number of rows appended
+    """
+    from odin.core.database import load_price_csv
+
+    frame = load_price_csv(path).drop_duplicates("timestamp")
+    appended = PriceArchive(symbol, timeframe, root).append_frame(frame)
+    logger.info(f"Archived {appended} {symbol} {timeframe} rows from {path}")
+    return appended
+
+
+def import_ohlcv_table(
+    db_path: Union[str, Path],
+    symbol: str,
+    timeframe: str,
+    root: Union[str, Path] = DEFAULT_ROOT,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+) -> int:
+    """
+    Import bars from the ``ohlcv_bars`` table (built by the candle aggregator).
+
+    Returns:
+        Number of rows appended
+    """
+    archive = PriceArchive(symbol, timeframe, root)
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.execute(
+            """
+            SELECT open_time, open, high, low, close, volume
+            FROM ohlcv_bars
+            WHERE symbol = ? AND timeframe = ? AND open_time > ?
+            ORDER BY open_time ASC
+        """,
+            (archive.symbol, timeframe, archive.end if archive.rows else -1),
+        )
+        appended = _append_cursor(archive, cursor, chunk_size)
+    finally:
+        conn.close()
+    logger.info(f"Archived {appended} {symbol} {timeframe} bars from {db_path}")
+    return appended
+
+
+def import_price_table(
+    db_path: Union[str, Path],
+    symbol: str = "BTC",
+    timeframe: str = "raw",
+    root: Union[str, Path] = DEFAULT_ROOT,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+) -> int:
+    """
+    Import price points from the ``bitcoin_prices`` table.
+
+    Each point becomes a flat bar (open = high = low = close = price).
+    Points sharing a second keep only the first.
+
+    Returns:
+        Number of rows appended
+    """
+    archive = PriceArchive(symbol, timeframe, root)
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.execute(
+            """
+            SELECT timestamp, price, price, price, price, COALESCE(volume, 0)
+            FROM bitcoin_prices
+            ORDER BY timestamp ASC
+        """
+        )
+        appended = _append_cursor(archive, cursor, chunk_size)
+    finally:
+        conn.close()
+    logger.info(f"Archived {appended} {symbol} {timeframe} prices from {db_path}")
+    return appended
+
+
+def _append_cursor(
+    archive: PriceArchive, cursor: sqlite3.Cursor, chunk_size: int
+) -> int:
+    """Append ``(timestamp, open, high, low, close, volume)`` rows in chunks."""
+    appended = 0
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            return appended
+        timestamps, *values = zip(*rows)
+        ts = _epoch_seconds(timestamps)
+        keep = np.concatenate(([True], np.diff(ts) > 0))
+        appended += archive.append(
+            ts[keep],
+            **{
+                column: np.asarray(column_values, dtype=np.float64)[keep]
+                for column, column_values in zip(PRICE_COLUMNS, values)
+            },
+        )
+
+
+# Archives opened through get_price_archive, keyed by (root, symbol, timeframe)
+_archives: Dict[Tuple[str, str, str], PriceArchive] = {}
+
+
+def get_price_archive(
+    symbol: str, timeframe: str, root: Union[str, Path] = DEFAULT_ROOT
+) -> PriceArchive:
+    """Get or open the shared archive for a symbol and timeframe."""
+    key = (str(root), symbol.upper(), timeframe)
+    archive = _archives.get(key)
+    if archive is None:
+        archive = PriceArchive(symbol, timeframe, root)
+        _archives[key] = archive
+    else:
+        archive.refresh()
+    return archive
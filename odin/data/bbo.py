@@ -0,0 +1,190 @@
+"""
+Consolidated Best Bid/Offer
+Merges top-of-book quotes from every connected exchange into one BBO per
+symbol, ignoring venues whose quotes have gone stale. USD stablecoin quotes
+are ranked at par with USD by default and flagged when they set the top.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Seconds after which a venue's quote no longer counts toward the BBO
+BBO_STALE_AFTER = 5.0
+
+# Quote currency of the consolidated book
+BBO_CURRENCY = "USD"
+
+# Quote currencies ranked at par with BBO_CURRENCY. Binance only lists USDT
+# pairs, so without them the book would hold USD venues alone; pass an empty
+# tuple to consolidate BBO_CURRENCY quotes only.
+BBO_PAR_CURRENCIES = ("USDT",)
+
+# Quote sources per venue, most preferred first: the depth stream's book top
+# updates faster than the ticker
+SOURCES = ("depth", "ticker")
+
+
+@dataclass
+class VenueQuote:
+    """Latest top of book from one exchange and source."""
+
+    bid: float
+    bid_size: Optional[float]
+    ask: float
+    ask_size: Optional[float]
+    updated_at: float
+    source: str  # "ticker" or "depth"
+    currency: str = BBO_CURRENCY
+
+
+class ConsolidatedBBO:
+    """
+    Best bid and offer for one symbol across exchanges.
+
+    Each venue keeps one quote per source; its fresh depth quote is used
+    when there is one, otherwise its fresh ticker. The consolidated top is
+    the highest fresh bid and lowest fresh ask among venues quoting in
+    ``currency`` or one of ``par_currencies``, whose prices are compared
+    one-for-one; ``at_par`` marks a top set by such a venue. A "change"
+    means a different best price or venue on either side, so size updates
+    at an unchanged price do not produce a new best-feed message.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        stale_after: float = BBO_STALE_AFTER,
+        currency: str = BBO_CURRENCY,
+        par_currencies: Iterable[str] = BBO_PAR_CURRENCIES,
+    ):
+        self.symbol = symbol
+        self.stale_after = stale_after
+        self.currency = currency
+        self.par_currencies = tuple(c for c in par_currencies if c != currency)
+        self.venues: Dict[str, Dict[str, VenueQuote]] = {}
+        self._last_top: Optional[Tuple] = None
+
+    def update(
+        self,
+        exchange: str,
+        bid: float,
+        ask: float,
+        bid_size: Optional[float] = None,
+        ask_size: Optional[float] = None,
+        source: str = "ticker",
+        now: Optional[float] = None,
+        currency: str = BBO_CURRENCY,
+    ) -> bool:
+        """
+        Record a venue quote.
+
+        Returns:
+            True if the consolidated top of book changed
+        """
+        if source not in SOURCES:
+            raise ValueError(f"Unknown quote source: {source}")
+        now = time.time() if now is None else now
+        self.venues.setdefault(exchange, {})[source] = VenueQuote(
+            bid, bid_size, ask, ask_size, now, source, currency
+        )
+        return self.changed(now)
+
+    def changed(self, now: Optional[float] = None) -> bool:
+        """Whether the top of book differs from the last time this returned True."""
+        best = self.best(now)
+        top = (
+            (best["bid"], best["bid_exchange"], best["ask"], best["ask_exchange"])
+            if best
+            else None
+        )
+        if top == self._last_top:
+            return False
+        self._last_top = top
+        return True
+
+    def _quote(self, exchange: str, now: float) -> Optional[VenueQuote]:
+        """A venue's preferred fresh quote, if any."""
+        quotes = self.venues.get(exchange, {})
+        for source in SOURCES:
+            quote = quotes.get(source)
+            if quote is not None and now - quote.updated_at <= self.stale_after:
+                return quote
+        return None
+
+    def consolidates(self, currency: str) -> bool:
+        """Whether quotes in ``currency`` count toward the consolidated top."""
+        return currency == self.currency or currency in self.par_currencies
+
+    def _fresh(self, now: float) -> Dict[str, VenueQuote]:
+        fresh = {}
+        for exchange in self.venues:
+            quote = self._quote(exchange, now)
+            if quote is not None and self.consolidates(quote.currency):
+                fresh[exchange] = quote
+        return fresh
+
+    def best(self, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Consolidated BBO from fresh venues.
+
+        Returns:
+            Dictionary with the best bid/ask, their venues, sizes and quote
+            currencies, mid, spread, whether the market is crossed and whether
+            a par currency set either side; None if no venue is fresh
+        """
+        now = time.time() if now is None else now
+        fresh = self._fresh(now)
+        if not fresh:
+            return None
+
+        bid_exchange = max(fresh, key=lambda exchange: fresh[exchange].bid)
+        ask_exchange = min(fresh, key=lambda exchange: fresh[exchange].ask)
+        bid = fresh[bid_exchange]
+        ask = fresh[ask_exchange]
+        return {
+            "bid": bid.bid,
+            "bid_size": bid.bid_size,
+            "bid_exchange": bid_exchange,
+            "ask": ask.ask,
+            "ask_size": ask.ask_size,
+            "ask_exchange": ask_exchange,
+            "bid_currency": bid.currency,
+            "ask_currency": ask.currency,
+            "mid": (bid.bid + ask.ask) / 2,
+            "spread": ask.ask - bid.bid,
+            "crossed": bid.bid >= ask.ask,
+            "at_par": bid.currency != self.currency
+            or ask.currency != self.currency,
+        }
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Consolidated BBO plus each venue's quote and staleness.
+
+        Venues show their preferred fresh quote, or their latest one when all
+        are stale; ``consolidated`` is False for quote currencies that are
+        neither the book's currency nor at par with it.
+        """
+        now = time.time() if now is None else now
+        venues = {}
+        for exchange, quotes in self.venues.items():
+            quote = self._quote(exchange, now) or max(
+                quotes.values(), key=lambda quote: quote.updated_at
+            )
+            venues[exchange] = {
+                "bid": quote.bid,
+                "ask": quote.ask,
+                "source": quote.source,
+                "currency": quote.currency,
+                "age_ms": (now - quote.updated_at) * 1000,
+                "stale": now - quote.updated_at > self.stale_after,
+                "consolidated": self.consolidates(quote.currency),
+            }
+        return {
+            "symbol": self.symbol,
+            "currency": self.currency,
+            "par_currencies": list(self.par_currencies),
+            "best": self.best(now),
+            "venues": venues,
+        }
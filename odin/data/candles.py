@@ -0,0 +1,344 @@
+"""
+Streaming Candle Aggregation
+Builds OHLCV bars from the live trade stream so history and analytics can
+be served locally instead of polling exchange OHLC endpoints. Bars follow one
+venue's trades; markets on different exchanges are not merged into a bar.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from odin.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Supported bar sizes in seconds
+TIMEFRAMES = {"1m": 60, "5m": 300, "1h": 3600, "4h": 14400, "1d": 86400}
+
+# Seconds after a bar ends during which late trades still update it
+LATE_TRADE_GRACE = 2.0
+
+# Closed bars kept in memory per symbol and timeframe
+MEMORY_BARS = 1500
+
+# Venue whose trades build the bars (the exchange the app always streams)
+CANDLE_EXCHANGE = "binance"
+
+
+@dataclass
+class Bar:
+    """One OHLCV bar; open/close follow trade time, not arrival order."""
+
+    symbol: str
+    timeframe: str
+    open_time: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    trades: int
+    first_trade: float
+    last_trade: float
+
+    @classmethod
+    def from_trade(
+        cls,
+        symbol: str,
+        timeframe: str,
+        open_time: int,
+        price: float,
+        quantity: float,
+        timestamp: float,
+    ) -> "Bar":
+        return cls(
+            symbol=symbol,
+            timeframe=timeframe,
+            open_time=open_time,
+            open=price,
+            high=price,
+            low=price,
+            close=price,
+            volume=quantity,
+            trades=1,
+            first_trade=timestamp,
+            last_trade=timestamp,
+        )
+
+    def add(self, price: float, quantity: float, timestamp: float):
+        """Fold a trade into the bar."""
+        if price > self.high:
+            self.high = price
+        if price < self.low:
+            self.low = price
+        if timestamp < self.first_trade:
+            self.first_trade = timestamp
+            self.open = price
+        if timestamp >= self.last_trade:
+            self.last_trade = timestamp
+            self.close = price
+        self.volume += quantity
+        self.trades += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Bar in the history format used by the data API."""
+        return {
+            "timestamp": self.open_time,
+            "price": self.close,
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+            "trades": self.trades,
+        }
+
+
+class CandleAggregator:
+    """
+    Aggregates trades into bars for every configured timeframe.
+
+    A bar stays open until its end time plus the grace window has passed,
+    measured against the newest trade seen for the symbol (or the wall
+    clock via advance()), so slightly late trades still land in the right
+    bar. Trades for bars that have already closed are counted and dropped.
+    Closed bars are kept in memory and, when a database is attached,
+    written in bulk by flush(). Only trades from ``exchange`` are
+    aggregated, so each bar's range and volume come from a single market.
+    """
+
+    def __init__(
+        self,
+        timeframes: Iterable[str] = tuple(TIMEFRAMES),
+        grace: float = LATE_TRADE_GRACE,
+        db=None,
+        memory_bars: int = MEMORY_BARS,
+        exchange: str = CANDLE_EXCHANGE,
+    ):
+        unknown = set(timeframes) - set(TIMEFRAMES)
+        if unknown:
+            raise ValueError(f"Unknown timeframes: {sorted(unknown)}")
+
+        self.timeframes = {name: TIMEFRAMES[name] for name in timeframes}
+        self.grace = grace
+        self.db = db
+        self.memory_bars = memory_bars
+        self.exchange = exchange
+
+        self.open_bars: Dict[Tuple[str, str], Dict[int, Bar]] = {}
+        self.closed_bars: Dict[Tuple[str, str], Deque[Bar]] = {}
+        self.closed_through: Dict[Tuple[str, str], int] = {}
+        self.watermarks: Dict[str, float] = {}
+        self.unflushed: List[Bar] = []
+        self.stats = {
+            "trades": 0,
+            "other_venue_trades": 0,
+            "late_trades": 0,
+            "dropped_trades": 0,
+            "bars_closed": 0,
+            "bars_flushed": 0,
+        }
+
+    def on_stream_data(self, data) -> None:
+        """StreamManager hook: aggregate TRADE events from the bar venue."""
+        if data.exchange != self.exchange:
+            self.stats["other_venue_trades"] += 1
+            return
+        trade_time = data.data.get("trade_time") or data.timestamp
+        # Binance reports milliseconds, Kraken seconds
+        if trade_time > 1e11:
+            trade_time /= 1000
+        self.add_trade(
+            data.symbol.upper(),
+            float(data.data["price"]),
+            float(data.data.get("quantity", 0.0)),
+            float(trade_time),
+        )
+
+    def add_trade(self, symbol: str, price: float, quantity: float, timestamp: float):
+        """Fold one trade into the open bar of every timeframe."""
+        watermark = self.watermarks.get(symbol, 0.0)
+        late = timestamp < watermark
+        dropped = False
+
+        for timeframe, seconds in self.timeframes.items():
+            key = (symbol, timeframe)
+            open_time = int(timestamp // seconds * seconds)
+            if open_time <= self.closed_through.get(key, -1):
+                dropped = True
+                continue
+
+            bars = self.open_bars.setdefault(key, {})
+            bar = bars.get(open_time)
+            if bar is None:
+                bars[open_time] = Bar.from_trade(
+                    symbol, timeframe, open_time, price, quantity, timestamp
+                )
+            else:
+                bar.add(price, quantity, timestamp)
+
+        self.stats["trades"] += 1
+        if dropped:
+            self.stats["dropped_trades"] += 1
+        elif late:
+            self.stats["late_trades"] += 1
+
+        if timestamp > watermark:
+            self.watermarks[symbol] = timestamp
+            self._close_due(symbol, timestamp)
+
+    def advance(self, now: Optional[float] = None):
+        """Close bars that are due by the wall clock, even without trades."""
+        now = time.time() if now is None else now
+        for symbol in list(self.watermarks):
+            self._close_due(symbol, now)
+
+    def _close_due(self, symbol: str, now: float):
+        for timeframe, seconds in self.timeframes.items():
+            key = (symbol, timeframe)
+            bars = self.open_bars.get(key)
+            if not bars:
+                continue
+            for open_time in sorted(bars):
+                if open_time + seconds + self.grace > now:
+                    break
+                self._close(key, bars.pop(open_time))
+
+    def _close(self, key: Tuple[str, str], bar: Bar):
+        closed = self.closed_bars.get(key)
+        if closed is None:
+            closed = self.closed_bars[key] = deque(maxlen=self.memory_bars)
+        closed.append(bar)
+        self.closed_through[key] = bar.open_time
+        self.unflushed.append(bar)
+        self.stats["bars_closed"] += 1
+
+    def seed(self, symbol: str, timeframe: str, history: Iterable[Dict[str, Any]]):
+        """
+        Load closed bars fetched elsewhere (e.g. an exchange OHLC endpoint).
+
+        Bars for the current interval, or any interval with live data, are
+        skipped so streamed trades stay authoritative.
+
+        Args:
+            symbol: Asset symbol
+            timeframe: One of the configured timeframes
+            history: Dicts with timestamp (bar open, seconds) and OHLCV values
+        """
+        key = (symbol.upper(), timeframe)
+        seconds = self.timeframes[timeframe]
+        current = int(time.time() // seconds * seconds)
+        live = self.open_bars.get(key, {})
+        known = {bar.open_time for bar in self.closed_bars.get(key, ())}
+
+        for row in sorted(history, key=lambda row: row["timestamp"]):
+            open_time = int(row["timestamp"])
+            if open_time >= current or open_time in live or open_time in known:
+                continue
+            if open_time <= self.closed_through.get(key, -1):
+                continue
+            close = row.get("close", row.get("price"))
+            bar = Bar(
+                symbol=key[0],
+                timeframe=timeframe,
+                open_time=open_time,
+                open=row.get("open", close),
+                high=row.get("high", close),
+                low=row.get("low", close),
+                close=close,
+                volume=row.get("volume", 0.0),
+                trades=row.get("trades", 0),
+                first_trade=open_time,
+                last_trade=open_time,
+            )
+            self._close(key, bar)
+        self.watermarks.setdefault(key[0], 0.0)
+
+    def partial_bar(self, symbol: str, timeframe: str) -> Optional[Bar]:
+        """The newest still-open bar for a symbol, if any."""
+        bars = self.open_bars.get((symbol.upper(), timeframe))
+        return bars[max(bars)] if bars else None
+
+    def get_bars(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[int] = None,
+        limit: Optional[int] = None,
+        include_partial: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Bars for a symbol, oldest first.
+
+        Memory covers recent closed and open bars; older bars are read from
+        the attached database.
+
+        Args:
+            symbol: Asset symbol
+            timeframe: One of the configured timeframes
+            start: Earliest bar open time (epoch seconds) to include
+            limit: Return at most this many of the newest bars
+            include_partial: Include bars that are still open
+
+        Returns:
+            List of bar dictionaries in the history API format
+        """
+        key = (symbol.upper(), timeframe)
+        closed = self.closed_bars.get(key, ())
+        bars: Dict[int, Dict[str, Any]] = {}
+
+        memory_start = closed[0].open_time if closed else None
+        if self.db is not None and (
+            memory_start is None or start is None or start < memory_start
+        ):
+            stored = self.db.get_ohlcv(key[0], timeframe, start=start, end=memory_start)
+            for row in stored:
+                bars[row["timestamp"]] = row
+
+        for bar in closed:
+            bars[bar.open_time] = bar.to_dict()
+        if include_partial:
+            for bar in self.open_bars.get(key, {}).values():
+                bars[bar.open_time] = bar.to_dict()
+
+        result = [bars[t] for t in sorted(bars) if start is None or t >= start]
+        return result[-limit:] if limit else result
+
+    def flush(self) -> int:
+        """Write closed bars to the database in one bulk insert."""
+        pending, self.unflushed = self.unflushed, []
+        try:
+            return self._write(pending)
+        except Exception as e:
+            logger.error(f"Failed to persist {len(pending)} bars: {e}")
+            self.unflushed = pending + self.unflushed
+            return 0
+
+    def _write(self, bars: List[Bar]) -> int:
+        if self.db is None or not bars:
+            return 0
+        report = self.db.add_ohlcv_bulk(
+            {**bar.to_dict(), "symbol": bar.symbol, "timeframe": bar.timeframe}
+            for bar in bars
+        )
+        self.stats["bars_flushed"] += report["rows"]
+        return report["rows"]
+
+    async def run(self, interval: float = 5.0):
+        """Close idle bars and persist closed ones periodically."""
+        while True:
+            await asyncio.sleep(interval)
+            self.advance()
+            if not self.unflushed:
+                continue
+
+            # Take the batch on the loop thread; only the write runs off it
+            pending, self.unflushed = self.unflushed, []
+            try:
+                await asyncio.to_thread(self._write, pending)
+            except Exception as e:
+                logger.error(f"Failed to persist {len(pending)} bars: {e}")
+                self.unflushed = pending + self.unflushed
@@ -10,21 +10,41 @@ import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
 
+import aiohttp
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from odin.data.bbo import BBO_PAR_CURRENCIES, ConsolidatedBBO
+from odin.data.candles import CANDLE_EXCHANGE, CandleAggregator
+from odin.data.order_book import OrderBook
 from odin.utils.logging import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
 
+def encode_message(message: Any) -> str:
+    """Serialize a message to JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        except TypeError:
+            pass  # Fall back to the standard encoder for unusual types
+    return json.dumps(message)
+
+
 class StreamType(Enum):
     TICKER = "ticker"
     TRADE = "trade"
     DEPTH = "depth"
     KLINE = "kline"
+    BBO = "bbo"
 
 
 @dataclass
@@ -35,6 +55,26 @@ class StreamData:
     stream_type: StreamType
     timestamp: float
     data: Dict[str, Any]
+    _encoded: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def to_message(self) -> Dict[str, Any]:
+        """Client-facing price_update message for this update."""
+        return {
+            "type": "price_update",
+            "symbol": self.symbol,
+            "exchange": self.exchange,
+            "stream_type": self.stream_type.value,
+            "data": self.data,
+            "timestamp": self.timestamp,
+        }
+
+    def encode(self) -> str:
+        """JSON text of to_message(), serialized once and then reused."""
+        if self._encoded is None:
+            self._encoded = encode_message(self.to_message())
+        return self._encoded
 
 
 @dataclass
@@ -49,6 +89,11 @@ class ExchangeStream:
 class ExchangeConnector(ABC):
     """Base class for exchange WebSocket connectors."""
 
+    # Levels per side included in DEPTH stream messages
+    DEPTH_LEVELS = 20
+    # Currency the connector's pairs are quoted in
+    QUOTE_CURRENCY = "USD"
+
     def __init__(self, on_data: Callable[[StreamData], None]):
         self.on_data = on_data
         self.ws = None
@@ -56,6 +101,8 @@ class ExchangeConnector(ABC):
         self.running = False
         self.reconnect_delay = 1
         self.max_reconnect_delay = 60
+        self.order_books: Dict[str, OrderBook] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
 
     @abstractmethod
     async def connect(self):
@@ -80,9 +127,37 @@ class ExchangeConnector(ABC):
     async def disconnect(self):
         """Disconnect from exchange."""
         self.running = False
+        for task in self._resync_tasks.values():
+            task.cancel()
         if self.ws:
             await self.ws.close()
 
+    def get_order_book(self, symbol: str) -> Optional[OrderBook]:
+        """Local order book for a symbol, if depth is being tracked."""
+        return self.order_books.get(symbol.upper())
+
+    def _schedule_resync(self, symbol: str):
+        """Start a book resync for a symbol unless one is already running."""
+        task = self._resync_tasks.get(symbol)
+        if task is None or task.done():
+            self._resync_tasks[symbol] = asyncio.create_task(
+                self._resync_order_book(symbol)
+            )
+
+    async def _resync_order_book(self, symbol: str):
+        """Bring an out-of-sync order book back in sync."""
+        pass
+
+    def _emit_depth(self, book: OrderBook):
+        """Forward the top of a synced book to subscribers."""
+        self.on_data(StreamData(
+            exchange=book.exchange,
+            symbol=book.symbol,
+            stream_type=StreamType.DEPTH,
+            timestamp=time.time(),
+            data=book.snapshot(self.DEPTH_LEVELS),
+        ))
+
 
 class BinanceConnector(ExchangeConnector):
     """
@@ -92,6 +167,10 @@ class BinanceConnector(ExchangeConnector):
 
     WS_URL = "wss://stream.binance.com:9443/ws"
     COMBINED_URL = "wss://stream.binance.com:9443/stream"
+    DEPTH_SNAPSHOT_URL = "https://api.binance.com/api/v3/depth"
+    DEPTH_SNAPSHOT_LIMIT = 1000
+    MAX_RESYNC_ATTEMPTS = 5
+    QUOTE_CURRENCY = "USDT"
 
     SYMBOL_MAP = {
         "BTC": "btcusdt",
@@ -193,6 +272,10 @@ class BinanceConnector(ExchangeConnector):
                 "low_24h": float(data.get("l", 0)),
                 "volume_24h": float(data.get("v", 0)),
                 "quote_volume": float(data.get("q", 0)),
+                "bid": float(data.get("b", 0)),
+                "bid_size": float(data.get("B", 0)),
+                "ask": float(data.get("a", 0)),
+                "ask_size": float(data.get("A", 0)),
             }
         )
         self.on_data(stream_data)
@@ -215,19 +298,54 @@ class BinanceConnector(ExchangeConnector):
         self.on_data(stream_data)
 
     async def _handle_depth(self, data: dict):
-        """Process order book depth update."""
+        """Apply a diff depth event (U/u update IDs) to the local book."""
         symbol = data.get("s", "").replace("USDT", "")
-        stream_data = StreamData(
-            exchange="binance",
-            symbol=symbol,
-            stream_type=StreamType.DEPTH,
-            timestamp=time.time(),
-            data={
-                "bids": [[float(p), float(q)] for p, q in data.get("b", [])],
-                "asks": [[float(p), float(q)] for p, q in data.get("a", [])],
-            }
+        book = self.order_books.get(symbol)
+        if book is None:
+            book = self.order_books[symbol] = OrderBook("binance", symbol)
+
+        applied = book.apply_diff(
+            data.get("b", []), data.get("a", []), data.get("U"), data.get("u")
         )
-        self.on_data(stream_data)
+        if applied:
+            self._emit_depth(book)
+        elif book.needs_snapshot:
+            self._schedule_resync(symbol)
+
+    async def _fetch_depth_snapshot(self, symbol: str) -> dict:
+        """Fetch a REST depth snapshot with its lastUpdateId."""
+        params = {
+            "symbol": self._normalize_symbol(symbol).upper(),
+            "limit": self.DEPTH_SNAPSHOT_LIMIT,
+        }
+        async with aiohttp.ClientSession() as session:
+            async with session.get(self.DEPTH_SNAPSHOT_URL, params=params) as response:
+                response.raise_for_status()
+                return await response.json()
+
+    async def _resync_order_book(self, symbol: str):
+        """Load a snapshot and replay the diffs buffered since the gap."""
+        book = self.order_books[symbol]
+        for attempt in range(self.MAX_RESYNC_ATTEMPTS):
+            try:
+                snapshot = await self._fetch_depth_snapshot(symbol)
+            except Exception as e:
+                logger.warning(f"Binance depth snapshot failed for {symbol}: {e}")
+                await asyncio.sleep(min(2 ** attempt, 30))
+                continue
+
+            if book.apply_snapshot(
+                snapshot.get("bids", []),
+                snapshot.get("asks", []),
+                snapshot.get("lastUpdateId"),
+            ):
+                logger.info(f"Binance {symbol} order book synced")
+                self._emit_depth(book)
+                return
+            # Buffered diffs are newer than the snapshot; fetch another
+            await asyncio.sleep(0.5)
+
+        logger.error(f"Could not sync Binance {symbol} order book")
 
     async def _handle_kline(self, data: dict):
         """Process kline/candlestick update."""
@@ -320,6 +438,7 @@ class KrakenConnector(ExchangeConnector):
     """
 
     WS_URL = "wss://ws.kraken.com"
+    BOOK_DEPTH = 10
 
     SYMBOL_MAP = {
         "BTC": "XBT/USD",
@@ -385,6 +504,9 @@ class KrakenConnector(ExchangeConnector):
             channel_name = data[-2]
             pair = data[-1]
             payload = data[1]
+            if channel_name.startswith("book") and len(data) == 5:
+                # Book updates carry asks and bids as two separate objects
+                payload = {**data[1], **data[2]}
 
             # Extract symbol
             symbol = pair.replace("/USD", "").replace("XBT", "BTC")
@@ -409,7 +531,9 @@ class KrakenConnector(ExchangeConnector):
                 "low_24h": float(data.get("l", [0, 0])[1]),
                 "volume_24h": float(data.get("v", [0, 0])[1]),
                 "bid": float(data.get("b", [0])[0]),
+                "bid_size": float(data.get("b", [0, 0, 0])[2]),
                 "ask": float(data.get("a", [0])[0]),
+                "ask_size": float(data.get("a", [0, 0, 0])[2]),
             }
         )
         self.on_data(stream_data)
@@ -432,18 +556,37 @@ class KrakenConnector(ExchangeConnector):
             self.on_data(stream_data)
 
     async def _handle_depth(self, symbol: str, data: dict):
-        """Process Kraken order book."""
-        stream_data = StreamData(
-            exchange="kraken",
-            symbol=symbol,
-            stream_type=StreamType.DEPTH,
-            timestamp=time.time(),
-            data={
-                "bids": [[float(p), float(q)] for p, q, _ in data.get("bs", data.get("b", []))],
-                "asks": [[float(p), float(q)] for p, q, _ in data.get("as", data.get("a", []))],
-            }
-        )
-        self.on_data(stream_data)
+        """Apply a Kraken book snapshot or update, verifying its checksum."""
+        book = self.order_books.get(symbol)
+        if book is None:
+            book = self.order_books[symbol] = OrderBook(
+                "kraken", symbol, max_depth=self.BOOK_DEPTH, keep_raw=True
+            )
+
+        if "as" in data or "bs" in data:
+            book.apply_snapshot(data.get("bs", []), data.get("as", []))
+        elif not book.apply_diff(data.get("b", []), data.get("a", [])):
+            return
+
+        checksum = data.get("c")
+        if checksum is not None and book.kraken_checksum() != int(checksum):
+            logger.warning(f"Kraken {symbol} book checksum mismatch, resyncing")
+            book.invalidate()
+            self._schedule_resync(symbol)
+            return
+
+        self._emit_depth(book)
+
+    async def _resync_order_book(self, symbol: str):
+        """Resubscribe to the book channel; Kraken replies with a snapshot."""
+        if not (self.ws and self.ws.open):
+            return
+        for event in ("unsubscribe", "subscribe"):
+            await self.ws.send(json.dumps({
+                "event": event,
+                "pair": [self._normalize_symbol(symbol)],
+                "subscription": {"name": "book", "depth": self.BOOK_DEPTH},
+            }))
 
     async def subscribe(self, symbol: str, stream_types: List[StreamType]):
         """Subscribe to Kraken streams."""
@@ -475,7 +618,7 @@ class KrakenConnector(ExchangeConnector):
                 msg = {
                     "event": "subscribe",
                     "pair": [kraken_symbol],
-                    "subscription": {"name": "book", "depth": 10}
+                    "subscription": {"name": "book", "depth": self.BOOK_DEPTH}
                 }
             else:
                 continue
@@ -499,27 +642,63 @@ class KrakenConnector(ExchangeConnector):
                 await self.ws.send(json.dumps(msg))
 
 
+# Connectors by exchange name
+CONNECTORS = {"binance": BinanceConnector, "kraken": KrakenConnector}
+
+
 class StreamManager:
     """
     Manages all exchange connections and routes data to subscribers.
     Implements pause→buffer→resume pattern for instant symbol switching.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        bbo_par_currencies: Iterable[str] = BBO_PAR_CURRENCIES,
+        candle_exchange: str = CANDLE_EXCHANGE,
+    ):
+        """
+        Initialize manager.
+
+        Args:
+            bbo_par_currencies: Quote currencies ranked at par with USD in the
+                consolidated BBO (empty to consolidate USD venues only)
+            candle_exchange: Exchange whose trades build the OHLCV bars
+        """
+        self.bbo_par_currencies = tuple(bbo_par_currencies)
         self.connectors: Dict[str, ExchangeConnector] = {}
         self.subscribers: Dict[str, Set[Callable]] = {}  # symbol -> callbacks
         self.paused_symbols: Set[str] = set()
         self.buffers: Dict[str, List[StreamData]] = {}
         self.latest_data: Dict[str, StreamData] = {}  # symbol -> latest ticker
+        self.candles = CandleAggregator(exchange=candle_exchange)
+        self.taps: List[Callable[[StreamData], None]] = []  # see every update
+        self.bbo: Dict[str, ConsolidatedBBO] = {}  # symbol -> cross-venue BBO
+        self.best_subscribers: Dict[str, Set[Callable]] = {}
+        self._bbo_task: Optional[asyncio.Task] = None
         self._lock = asyncio.Lock()
 
     def _on_stream_data(self, data: StreamData):
         """Handle incoming stream data."""
         symbol = data.symbol.upper()
 
-        # Always update latest data cache
+        for tap in self.taps:
+            try:
+                tap(data)
+            except Exception as e:
+                logger.error(f"Error in stream tap: {e}")
+
+        # Always update latest data cache and build bars from trades
         if data.stream_type == StreamType.TICKER:
             self.latest_data[symbol] = data
+            self._update_bbo(symbol, data)
+        elif data.stream_type == StreamType.DEPTH:
+            self._update_bbo(symbol, data)
+        elif data.stream_type == StreamType.TRADE:
+            try:
+                self.candles.on_stream_data(data)
+            except Exception as e:
+                logger.error(f"Error aggregating trade: {e}")
 
         # Check if symbol is paused (during switching)
         if symbol in self.paused_symbols:
@@ -528,14 +707,128 @@ class StreamManager:
             self.buffers[symbol].append(data)
             return
 
-        # Route to subscribers
-        if symbol in self.subscribers:
+        # Route to subscribers; serialize once so every client sends the same text
+        if self.subscribers.get(symbol):
+            data.encode()
             for callback in self.subscribers[symbol]:
                 try:
                     callback(data)
                 except Exception as e:
                     logger.error(f"Error in stream callback: {e}")
 
+    def _update_bbo(self, symbol: str, data: StreamData):
+        """Fold a ticker or depth snapshot into the consolidated BBO."""
+        if data.stream_type == StreamType.DEPTH:
+            if not data.data.get("synced", True):
+                return
+            bids, asks = data.data.get("bids"), data.data.get("asks")
+            if not bids or not asks:
+                return
+            bid, bid_size = bids[0][0], bids[0][1]
+            ask, ask_size = asks[0][0], asks[0][1]
+        else:
+            bid, ask = data.data.get("bid"), data.data.get("ask")
+            if not bid or not ask:
+                return
+            bid_size, ask_size = data.data.get("bid_size"), data.data.get("ask_size")
+
+        consolidated = self.bbo.get(symbol)
+        if consolidated is None:
+            consolidated = self.bbo[symbol] = ConsolidatedBBO(
+                symbol, par_currencies=self.bbo_par_currencies
+            )
+        changed = consolidated.update(
+            data.exchange,
+            float(bid),
+            float(ask),
+            bid_size,
+            ask_size,
+            source=data.stream_type.value,
+            currency=CONNECTORS.get(data.exchange, ExchangeConnector).QUOTE_CURRENCY,
+        )
+        if changed:
+            self._emit_best(symbol)
+
+    def _emit_best(self, symbol: str):
+        callbacks = self.best_subscribers.get(symbol)
+        if not callbacks:
+            return
+        best = StreamData(
+            exchange="consolidated",
+            symbol=symbol,
+            stream_type=StreamType.BBO,
+            timestamp=time.time(),
+            data=self.bbo[symbol].snapshot(),
+        )
+        best.encode()
+        for callback in list(callbacks):
+            try:
+                callback(best)
+            except Exception as e:
+                logger.error(f"Error in best feed callback: {e}")
+
+    def refresh_bbo(self):
+        """Re-evaluate every BBO so venues going stale are reflected."""
+        for symbol, consolidated in self.bbo.items():
+            if consolidated.changed():
+                self._emit_best(symbol)
+
+    async def _refresh_bbo_loop(self, interval: float = 1.0):
+        while any(self.best_subscribers.values()):
+            await asyncio.sleep(interval)
+            self.refresh_bbo()
+        self._bbo_task = None
+
+    def get_bbo(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Consolidated BBO and per-venue quotes for a symbol, if any."""
+        consolidated = self.bbo.get(symbol.upper())
+        return consolidated.snapshot() if consolidated else None
+
+    async def subscribe_best(
+        self,
+        symbol: str,
+        callback: Callable[[StreamData], None],
+        exchanges: Optional[List[str]] = None,
+    ):
+        """
+        Subscribe to the consolidated "best" feed for a symbol.
+
+        The callback receives a BBO StreamData whenever the best bid or ask
+        (price or venue) across all exchanges changes, including when a
+        venue's quote goes stale.
+
+        Args:
+            symbol: Asset symbol
+            callback: Receives BBO updates
+            exchanges: Connectors to source quotes from (default: all)
+        """
+        symbol = symbol.upper()
+        async with self._lock:
+            self.best_subscribers.setdefault(symbol, set()).add(callback)
+
+        for name in exchanges or list(self.connectors):
+            if name in self.connectors:
+                await self.connectors[name].subscribe(symbol, [StreamType.TICKER])
+
+        if self._bbo_task is None:
+            self._bbo_task = asyncio.create_task(self._refresh_bbo_loop())
+
+        if symbol in self.bbo and self.bbo[symbol].best() is not None:
+            callback(
+                StreamData(
+                    exchange="consolidated",
+                    symbol=symbol,
+                    stream_type=StreamType.BBO,
+                    timestamp=time.time(),
+                    data=self.bbo[symbol].snapshot(),
+                )
+            )
+
+    async def unsubscribe_best(self, symbol: str, callback: Callable):
+        """Stop receiving the consolidated feed for a symbol."""
+        async with self._lock:
+            self.best_subscribers.get(symbol.upper(), set()).discard(callback)
+
     async def start(self, exchanges: List[str] = None):
         """Start exchange connections."""
         if exchanges is None:
@@ -543,19 +836,21 @@ class StreamManager:
 
         tasks = []
         for exchange in exchanges:
-            if exchange == "binance":
-                connector = BinanceConnector(self._on_stream_data)
-            elif exchange == "kraken":
-                connector = KrakenConnector(self._on_stream_data)
-            else:
+            if exchange in self.connectors or exchange not in CONNECTORS:
                 continue
 
+            connector = CONNECTORS[exchange](self._on_stream_data)
             self.connectors[exchange] = connector
             tasks.append(asyncio.create_task(connector.connect()))
 
         if tasks:
             logger.info(f"Started {len(tasks)} exchange connections")
 
+    def add_connector(self, name: str, connector: ExchangeConnector):
+        """Register and start a custom connector (e.g. a ReplayConnector)."""
+        self.connectors[name] = connector
+        asyncio.create_task(connector.connect())
+
     async def stop(self):
         """Stop all connections."""
         for connector in self.connectors.values():
@@ -656,6 +951,34 @@ class StreamManager:
         """Get latest cached data for symbol."""
         return self.latest_data.get(symbol.upper())
 
+    async def track_order_book(self, symbol: str, exchange: str = "binance"):
+        """Subscribe to depth diffs so a local order book is maintained."""
+        if exchange in self.connectors:
+            await self.connectors[exchange].subscribe(
+                symbol.upper(), [StreamType.DEPTH]
+            )
+
+    def get_order_book(
+        self, symbol: str, exchange: Optional[str] = None
+    ) -> Optional[OrderBook]:
+        """
+        Get a synced local order book for a symbol.
+
+        Args:
+            symbol: Asset symbol (e.g. "BTC")
+            exchange: Restrict to one exchange; otherwise the first synced book
+
+        Returns:
+            OrderBook or None if no synced book is available
+        """
+        exchanges = [exchange] if exchange else list(self.connectors)
+        for name in exchanges:
+            connector = self.connectors.get(name)
+            book = connector.get_order_book(symbol) if connector else None
+            if book is not None and book.synced:
+                return book
+        return None
+
 
 # Global stream manager instance
 _stream_manager: Optional[StreamManager] = None
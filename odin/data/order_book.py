@@ -0,0 +1,289 @@
+"""
+Local L2 Order Books
+Maintains in-memory order books from exchange depth diffs so depth queries
+are answered locally instead of with REST calls.
+"""
+
+import bisect
+import time
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Pending diffs kept while waiting for a snapshot
+MAX_PENDING_DIFFS = 1000
+
+
+class BookSide:
+    """
+    One side of an order book as a sorted array of price levels.
+
+    Levels are kept best-first: bids are stored under negated prices so both
+    sides sort ascending. Lookups are a bisect; inserts and removals shift
+    the array, which stays small enough (hundreds to a few thousand levels)
+    that this beats a tree in practice.
+    """
+
+    def __init__(self, descending: bool):
+        self.descending = descending
+        self.keys: List[float] = []
+        self.quantities: Dict[float, float] = {}
+        # Exchange price/quantity strings, only kept when checksums need them
+        self.raw: Dict[float, Tuple[str, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _key(self, price: float) -> float:
+        return -price if self.descending else price
+
+    def _price(self, key: float) -> float:
+        return -key if self.descending else key
+
+    def update(
+        self, price: float, quantity: float, raw: Optional[Tuple[str, str]] = None
+    ):
+        """Set the quantity at a price level; zero removes the level."""
+        key = self._key(price)
+        if quantity <= 0:
+            if self.quantities.pop(key, None) is not None:
+                del self.keys[bisect.bisect_left(self.keys, key)]
+                self.raw.pop(key, None)
+            return
+
+        if key not in self.quantities:
+            bisect.insort(self.keys, key)
+        self.quantities[key] = quantity
+        if raw is not None:
+            self.raw[key] = raw
+
+    def clear(self):
+        self.keys.clear()
+        self.quantities.clear()
+        self.raw.clear()
+
+    def truncate(self, depth: int):
+        """Drop levels beyond the best `depth`."""
+        for key in self.keys[depth:]:
+            del self.quantities[key]
+            self.raw.pop(key, None)
+        del self.keys[depth:]
+
+    def best(self) -> Optional[float]:
+        return self._price(self.keys[0]) if self.keys else None
+
+    def top(self, n: int) -> List[List[float]]:
+        """Best `n` levels as [price, quantity] pairs."""
+        return [[self._price(key), self.quantities[key]] for key in self.keys[:n]]
+
+    def volume_to(self, price: float) -> float:
+        """Total quantity on levels at or better than `price`."""
+        end = bisect.bisect_right(self.keys, self._key(price))
+        return sum(map(self.quantities.__getitem__, self.keys[:end]))
+
+    def raw_top(self, n: int) -> List[Tuple[str, str]]:
+        return [self.raw[key] for key in self.keys[:n] if key in self.raw]
+
+
+class OrderBook:
+    """
+    L2 order book for one symbol on one exchange.
+
+    Sequenced feeds (Binance) pass update IDs to apply_diff/apply_snapshot;
+    a gap marks the book unsynced and needs_snapshot tells the connector to
+    fetch a fresh snapshot. Diffs that arrive while unsynced are buffered and
+    replayed on top of the next snapshot. Unsequenced feeds (Kraken) keep the
+    exchange's level strings (keep_raw) so the book can be checked against
+    the exchange checksum instead.
+    """
+
+    def __init__(
+        self,
+        exchange: str,
+        symbol: str,
+        max_depth: Optional[int] = None,
+        keep_raw: bool = False,
+    ):
+        self.exchange = exchange
+        self.symbol = symbol
+        self.max_depth = max_depth
+        self.keep_raw = keep_raw
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self.last_update_id: Optional[int] = None
+        self.synced = False
+        self.updated_at = 0.0
+        self.pending: List[Tuple[int, int, Sequence, Sequence]] = []
+        self.stats = {"snapshots": 0, "updates": 0, "gaps": 0, "stale": 0}
+
+    @property
+    def needs_snapshot(self) -> bool:
+        return not self.synced
+
+    def invalidate(self):
+        """Mark the book out of sync; queries return nothing until resynced."""
+        if self.synced:
+            self.stats["gaps"] += 1
+        self.synced = False
+
+    def apply_snapshot(
+        self,
+        bids: Iterable[Sequence],
+        asks: Iterable[Sequence],
+        update_id: Optional[int] = None,
+    ) -> bool:
+        """
+        Replace the book with a full snapshot.
+
+        Args:
+            bids: [price, quantity, ...] levels
+            asks: [price, quantity, ...] levels
+            update_id: Sequence number the snapshot is current to, if any
+
+        Returns:
+            True if the book is synced afterwards. False means buffered diffs
+            showed the snapshot was already out of date and another is needed.
+        """
+        self.bids.clear()
+        self.asks.clear()
+        self._apply_levels(bids, asks)
+        self.last_update_id = update_id
+        self.synced = True
+        self.stats["snapshots"] += 1
+        self.updated_at = time.time()
+
+        pending, self.pending = self.pending, []
+        for first_id, final_id, diff_bids, diff_asks in pending:
+            if not self.synced:
+                self.pending.append((first_id, final_id, diff_bids, diff_asks))
+            else:
+                self.apply_diff(diff_bids, diff_asks, first_id, final_id)
+        return self.synced
+
+    def apply_diff(
+        self,
+        bids: Iterable[Sequence],
+        asks: Iterable[Sequence],
+        first_id: Optional[int] = None,
+        final_id: Optional[int] = None,
+    ) -> bool:
+        """
+        Apply a depth diff.
+
+        Args:
+            bids: Changed [price, quantity, ...] bid levels; zero removes
+            asks: Changed [price, quantity, ...] ask levels; zero removes
+            first_id: First update ID in the event (Binance "U")
+            final_id: Final update ID in the event (Binance "u")
+
+        Returns:
+            True if the diff was applied to a synced book.
+        """
+        if not self.synced:
+            if final_id is not None:
+                self.pending.append((first_id, final_id, bids, asks))
+                del self.pending[:-MAX_PENDING_DIFFS]
+            return False
+
+        if final_id is not None and self.last_update_id is not None:
+            if final_id <= self.last_update_id:
+                self.stats["stale"] += 1
+                return False
+            if first_id > self.last_update_id + 1:
+                # Missed at least one event; keep this one for the resync
+                self.invalidate()
+                self.pending = [(first_id, final_id, bids, asks)]
+                return False
+
+        self._apply_levels(bids, asks)
+        if final_id is not None:
+            self.last_update_id = final_id
+        self.stats["updates"] += 1
+        self.updated_at = time.time()
+        return True
+
+    def _apply_levels(self, bids: Iterable[Sequence], asks: Iterable[Sequence]):
+        for side, levels in ((self.bids, bids), (self.asks, asks)):
+            for level in levels:
+                raw = (level[0], level[1]) if self.keep_raw else None
+                side.update(float(level[0]), float(level[1]), raw)
+        if self.max_depth is not None:
+            self.bids.truncate(self.max_depth)
+            self.asks.truncate(self.max_depth)
+
+    def kraken_checksum(self) -> int:
+        """CRC32 of the top 10 levels in Kraken's checksum format."""
+
+        def digits(value: str) -> str:
+            return value.replace(".", "").lstrip("0")
+
+        parts = [
+            digits(price) + digits(quantity)
+            for side in (self.asks, self.bids)
+            for price, quantity in side.raw_top(10)
+        ]
+        return zlib.crc32("".join(parts).encode())
+
+    # Queries
+
+    def best_bid(self) -> Optional[float]:
+        return self.bids.best() if self.synced else None
+
+    def best_ask(self) -> Optional[float]:
+        return self.asks.best() if self.synced else None
+
+    def mid(self) -> Optional[float]:
+        bid, ask = self.best_bid(), self.best_ask()
+        if bid is None or ask is None:
+            return None
+        return (bid + ask) / 2
+
+    def spread(self) -> Optional[float]:
+        bid, ask = self.best_bid(), self.best_ask()
+        if bid is None or ask is None:
+            return None
+        return ask - bid
+
+    def spread_bps(self) -> Optional[float]:
+        spread, mid = self.spread(), self.mid()
+        if spread is None or not mid:
+            return None
+        return spread / mid * 10_000
+
+    def top(self, n: int = 10) -> Dict[str, List[List[float]]]:
+        """Best `n` bid and ask levels."""
+        if not self.synced:
+            return {"bids": [], "asks": []}
+        return {"bids": self.bids.top(n), "asks": self.asks.top(n)}
+
+    def depth_at_bps(self, bps: float) -> Dict[str, float]:
+        """
+        Quantity resting within `bps` basis points of the mid price.
+
+        Returns:
+            Dictionary with bid and ask volume and the bid/ask imbalance
+        """
+        mid = self.mid()
+        if mid is None:
+            return {"bid_volume": 0.0, "ask_volume": 0.0, "imbalance": 0.0}
+
+        offset = mid * bps / 10_000
+        bid_volume = self.bids.volume_to(mid - offset)
+        ask_volume = self.asks.volume_to(mid + offset)
+        total = bid_volume + ask_volume
+        return {
+            "bid_volume": bid_volume,
+            "ask_volume": ask_volume,
+            "imbalance": (bid_volume - ask_volume) / total if total else 0.0,
+        }
+
+    def snapshot(self, levels: int = 20) -> Dict[str, Any]:
+        """Top-of-book summary for stream messages and API responses."""
+        return {
+            **self.top(levels),
+            "mid": self.mid(),
+            "spread": self.spread(),
+            "spread_bps": self.spread_bps(),
+            "synced": self.synced,
+            "last_update_id": self.last_update_id,
+            "updated_at": self.updated_at,
+        }
@@ -0,0 +1,237 @@
+"""
+Stream Recording and Replay
+Records normalized StreamData to an append-only file and plays it back
+through an ExchangeConnector, so busy sessions can be reproduced offline.
+
+File format: an 8-byte magic header followed by frames, each a 4-byte
+big-endian length and a JSON array [exchange, symbol, stream_type,
+timestamp, data]. Compressed recordings are gzip streams of the same bytes;
+appending adds a new gzip member, which readers handle transparently.
+"""
+
+import asyncio
+import gzip
+import json
+import struct
+import time
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, List, Optional, Union
+
+from odin.data.exchange_streams import (
+    ExchangeConnector,
+    StreamData,
+    StreamType,
+    encode_message,
+)
+from odin.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b"ODINREC1"
+FRAME_HEADER = struct.Struct(">I")
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _open_read(path: Path) -> BinaryIO:
+    with open(path, "rb") as f:
+        compressed = f.read(2) == GZIP_MAGIC
+    return gzip.open(path, "rb") if compressed else open(path, "rb")
+
+
+def read_recording(path: Union[str, Path]) -> Iterator[StreamData]:
+    """
+    Iterate the StreamData frames of a recording in order.
+
+    Args:
+        path: Recording file, compressed or not
+
+    Returns:
+        Iterator of StreamData; a truncated final frame is ignored
+    """
+    with _open_read(Path(path)) as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a stream recording")
+
+        while True:
+            header = f.read(FRAME_HEADER.size)
+            if len(header) < FRAME_HEADER.size:
+                return
+            (length,) = FRAME_HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                logger.warning(f"Truncated frame at end of {path}")
+                return
+
+            exchange, symbol, stream_type, timestamp, data = json.loads(payload)
+            yield StreamData(
+                exchange=exchange,
+                symbol=symbol,
+                stream_type=StreamType(stream_type),
+                timestamp=timestamp,
+                data=data,
+            )
+
+
+class StreamRecorder:
+    """
+    Appends StreamData frames to a recording file.
+
+    Use as a StreamManager tap (``stream_mgr.taps.append(recorder.record)``) to
+    capture everything the connectors produce.
+    """
+
+    def __init__(self, path: Union[str, Path], compress: bool = False):
+        self.path = Path(path)
+        self.compress = compress
+        self.frames = 0
+        self.bytes_written = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not self.path.exists() or self.path.stat().st_size == 0
+        if not is_new:
+            with open(self.path, "rb") as f:
+                existing_compressed = f.read(2) == GZIP_MAGIC
+            if existing_compressed != compress:
+                raise ValueError(
+                    f"{self.path} exists with compress={existing_compressed}"
+                )
+
+        self._file: BinaryIO = (
+            gzip.open(self.path, "ab", compresslevel=6)
+            if compress
+            else open(self.path, "ab")
+        )
+        if is_new:
+            self._file.write(MAGIC)
+
+    def record(self, data: StreamData):
+        """Append one frame."""
+        frame = [
+            data.exchange,
+            data.symbol,
+            data.stream_type.value,
+            data.timestamp,
+            data.data,
+        ]
+        payload = encode_message(frame).encode()
+        self._file.write(FRAME_HEADER.pack(len(payload)))
+        self._file.write(payload)
+        self.frames += 1
+        self.bytes_written += FRAME_HEADER.size + len(payload)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "StreamRecorder":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ReplayConnector(ExchangeConnector):
+    """
+    Plays a recording back as if it were a live exchange connection.
+
+    Frames are paced by their recorded timestamps divided by ``speed``;
+    ``speed=None`` replays as fast as possible. Only subscribed symbols and
+    stream types are emitted unless nothing has been subscribed.
+    """
+
+    def __init__(
+        self,
+        on_data: Callable[[StreamData], None],
+        path: Union[str, Path],
+        speed: Optional[float] = 1.0,
+        retime: bool = True,
+        loop: bool = False,
+    ):
+        """
+        Args:
+            on_data: Callback receiving each replayed StreamData
+            path: Recording file
+            speed: Playback rate (1.0 = real time, 10.0 = ten times faster,
+                None = no pacing)
+            retime: Stamp frames with the replay time instead of the
+                recorded time, so downstream latency is measured correctly
+            loop: Start over when the recording ends
+        """
+        super().__init__(on_data)
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive or None")
+        self.path = Path(path)
+        self.speed = speed
+        self.retime = retime
+        self.loop = loop
+        self.frames_sent = 0
+        self.finished = asyncio.Event()
+
+    def _normalize_symbol(self, symbol: str) -> str:
+        return symbol.upper()
+
+    async def subscribe(self, symbol: str, stream_types: List[StreamType]):
+        self.subscriptions.setdefault(self._normalize_symbol(symbol), set()).update(
+            stream_types
+        )
+
+    async def unsubscribe(self, symbol: str, stream_types: List[StreamType]):
+        symbol = self._normalize_symbol(symbol)
+        if symbol in self.subscriptions:
+            self.subscriptions[symbol] -= set(stream_types)
+            if not self.subscriptions[symbol]:
+                del self.subscriptions[symbol]
+
+    def _wanted(self, data: StreamData) -> bool:
+        if not self.subscriptions:
+            return True
+        return data.stream_type in self.subscriptions.get(data.symbol.upper(), ())
+
+    async def connect(self):
+        """Replay the recording until it ends (or forever with loop=True)."""
+        self.running = True
+        self.finished.clear()
+        try:
+            while self.running:
+                await self._play_once()
+                if not self.loop:
+                    break
+        finally:
+            self.running = False
+            self.finished.set()
+
+    async def _play_once(self):
+        first_recorded = None
+        started = time.monotonic()
+
+        for sent, data in enumerate(read_recording(self.path)):
+            if not self.running:
+                return
+
+            if self.speed is None:
+                # Yield now and then so consumers can keep up
+                if sent % 256 == 0:
+                    await asyncio.sleep(0)
+            else:
+                if first_recorded is None:
+                    first_recorded = data.timestamp
+                due = started + (data.timestamp - first_recorded) / self.speed
+                delay = due - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            if not self._wanted(data):
+                continue
+            if self.retime:
+                data.timestamp = time.time()
+            try:
+                self.on_data(data)
+            except Exception as e:
+                logger.error(f"Error in replay callback: {e}")
+            self.frames_sent += 1
+
+    async def disconnect(self):
+        self.running = False
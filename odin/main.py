@@ -19,7 +19,9 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 # Import enhanced systems
+from odin.api.routes.data import COIN_MAPPINGS
 from odin.core.config_manager import OdinConfig, get_config, get_config_manager
+from odin.core.database import get_database
 from odin.core.exceptions import (
     ErrorCode,
     ErrorHandler,
@@ -29,6 +31,8 @@ from odin.core.exceptions import (
 )
 from odin.core.repository import RepositoryManager, get_repository_manager
 from odin.core.shutdown import ShutdownManager, get_shutdown_manager
+from odin.data.exchange_streams import get_stream_manager
+from odin.utils.cache import start_cache_cleanup_task
 from odin.utils.console import ConsoleFormatter, get_console_formatter
 from odin.utils.logging import (
     LogContext,
@@ -124,6 +128,11 @@ class OdinApplication:
                     except asyncio.CancelledError:
                         pass
 
+            # Persist any bars closed since the last flush
+            stream_mgr = get_stream_manager()
+            stream_mgr.candles.flush()
+            await stream_mgr.stop()
+
             # Close repositories
             if self.repo_manager:
                 await self.repo_manager.close()
@@ -376,6 +385,22 @@ class OdinApplication:
             task = asyncio.create_task(self._cleanup_task())
             self.background_tasks.append(task)
 
+            # Expire API cache entries as their expiry wheel buckets come due
+            task = asyncio.create_task(start_cache_cleanup_task())
+            self.background_tasks.append(task)
+
+            # Close and persist bars built from the live trade stream
+            stream_mgr = get_stream_manager()
+            candles = stream_mgr.candles
+            candles.db = get_database()
+            task = asyncio.create_task(candles.run())
+            self.background_tasks.append(task)
+
+            # Maintain a local order book per supported coin for /depth
+            await stream_mgr.start(["binance"])
+            for symbol in COIN_MAPPINGS:
+                await stream_mgr.track_order_book(symbol, "binance")
+
             logger.info(f"Started {len(self.background_tasks)} background tasks")
             return True
 
@@ -0,0 +1,275 @@
+"""
+Multi-Strategy Batch Backtesting
+
+Backtests a pool of strategies on one price window. The window is loaded
+once and every strategy prepares its indicators from the same frame, so
+shared columns (rolling means, standard deviations, RSI, ...) come out of the
+indicator cache instead of being recomputed per strategy. Simulation uses the
+vectorized backtest engine and can fan out over a process pool that maps the
+data from a shared memory-mapped array, as the walk-forward optimizer does.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from .base import Strategy, StrategyPerformance
+from .shared_data import (
+    PRICE_COLUMNS,
+    mapped_price_frame,
+    process_pool,
+    release_mapped_frames,
+    write_price_memmap,
+)
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("load", "indicators", "simulation", "metrics")
+RANKING_METRICS = ("total_return", "sharpe_ratio", "calmar_ratio", "sortino_ratio")
+
+
+@dataclass
+class StrategyRun:
+    """Backtest outcome for one strategy in a batch."""
+
+    name: str
+    strategy: str
+    parameters: Dict[str, Any]
+    performance: Optional[Dict[str, Any]] = None
+    final_capital: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchResult:
+    """Batch backtest report with per-phase timings."""
+
+    bars: int
+    start: str
+    end: str
+    rank_by: str
+    workers: int = 1
+    runs: List[StrategyRun] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+    wall_time: float = 0.0
+
+    @property
+    def leaderboard(self) -> List[Dict[str, Any]]:
+        """Successful runs ranked by ``rank_by``, best first."""
+        ranked = sorted(
+            (run for run in self.runs if run.performance is not None),
+            key=lambda run: run.performance[self.rank_by],
+            reverse=True,
+        )
+        return [
+            {"rank": rank, "name": run.name, **run.performance}
+            for rank, run in enumerate(ranked, start=1)
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        result["leaderboard"] = self.leaderboard
+        return result
+
+
+def _performance_dict(performance: StrategyPerformance) -> Dict[str, Any]:
+    result = asdict(performance)
+    result["avg_trade_duration"] = performance.avg_trade_duration.total_seconds()
+    return result
+
+
+def _simulate(
+    strategy: Strategy, prepared: pd.DataFrame, initial_capital: float
+) -> Tuple[Dict[str, Any], float, Dict[str, float]]:
+    """
+    Run the vectorized backtest and metrics on an indicator frame.
+
+    Returns:
+        Performance metrics, final capital and phase timings
+    """
+    started = time.perf_counter()
+    equity, trades, _ = strategy._run_vectorized_backtest(prepared, initial_capital)
+    simulated = time.perf_counter()
+    performance = strategy._calculate_performance_metrics(
+        equity, trades, initial_capital
+    )
+    finished = time.perf_counter()
+
+    final_capital = float(equity.iloc[-1]) if len(equity) else initial_capital
+    timings = {"simulation": simulated - started, "metrics": finished - simulated}
+    return _performance_dict(performance), final_capital, timings
+
+
+def _run_in_worker(task: Tuple) -> Tuple[Optional[Dict[str, Any]], float, Dict, str]:
+    """Prepare and backtest one strategy on the mapped frame (worker process)."""
+    path, tz, strategy, initial_capital = task
+    frame = mapped_price_frame(path, tz)
+    try:
+        started = time.perf_counter()
+        strategy.validate_data(frame)
+        prepared = strategy.calculate_indicators(frame)
+        indicators = time.perf_counter() - started
+
+        performance, final_capital, timings = _simulate(
+            strategy, prepared, initial_capital
+        )
+        timings["indicators"] = indicators
+        return performance, final_capital, timings, ""
+    except Exception as e:
+        return None, initial_capital, {}, str(e)
+
+
+class BatchBacktester:
+    """
+    Backtest several strategies on one shared price window.
+
+    With ``workers`` > 1 each worker prepares indicators for its own
+    strategies, so only strategies in the same process share cached columns;
+    phase timings are then summed over workers.
+    """
+
+    def __init__(
+        self,
+        strategies: Dict[str, Strategy],
+        initial_capital: float = 10000.0,
+        rank_by: str = "total_return",
+        workers: Optional[int] = 1,
+    ):
+        """
+        Args:
+            strategies: Strategy instances keyed by display name
+            initial_capital: Starting capital for every backtest
+            rank_by: Leaderboard metric: "total_return", "sharpe_ratio",
+                "calmar_ratio" or "sortino_ratio"
+            workers: Worker processes (None: CPU count; 0 or 1 runs in this
+                process)
+        """
+        if not strategies:
+            raise ValueError("No strategies to backtest")
+        if rank_by not in RANKING_METRICS:
+            raise ValueError(f"Unknown ranking metric: {rank_by}")
+
+        self.strategies = dict(strategies)
+        self.initial_capital = initial_capital
+        self.rank_by = rank_by
+        self.workers = (os.cpu_count() or 1) if workers is None else max(1, workers)
+
+    def run(
+        self, data: Union[pd.DataFrame, Callable[[], pd.DataFrame]]
+    ) -> BatchResult:
+        """
+        Backtest every strategy and rank the results.
+
+        Args:
+            data: OHLCV frame, or a loader called once to produce it
+
+        Returns:
+            Batch result with one run per strategy and phase timings
+        """
+        started = time.perf_counter()
+        if callable(data):
+            data = data()
+        if data.empty:
+            raise ValueError("Data cannot be empty")
+        missing = [column for column in PRICE_COLUMNS if column not in data.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {missing}")
+        loaded = time.perf_counter()
+
+        result = BatchResult(
+            bars=len(data),
+            start=str(data.index[0]),
+            end=str(data.index[-1]),
+            rank_by=self.rank_by,
+            workers=self.workers,
+            timings={phase: 0.0 for phase in PHASES},
+        )
+        result.timings["load"] = loaded - started
+
+        if self.workers > 1 and len(self.strategies) > 1:
+            self._run_pool(data, result)
+        else:
+            self._run_local(data, result)
+
+        result.wall_time = time.perf_counter() - started
+        logger.info(
+            f"Batch backtested {len(self.strategies)} strategies on {len(data)} "
+            f"bars in {result.wall_time:.2f}s"
+        )
+        return result
+
+    def _new_run(self, name: str, strategy: Strategy) -> StrategyRun:
+        return StrategyRun(
+            name=name,
+            strategy=type(strategy).__name__,
+            parameters=dict(strategy.parameters),
+            final_capital=self.initial_capital,
+        )
+
+    def _run_local(self, data: pd.DataFrame, result: BatchResult):
+        """Indicator pass for the whole pool, then simulate each strategy."""
+        prepared: Dict[str, pd.DataFrame] = {}
+        runs: Dict[str, StrategyRun] = {}
+
+        phase_started = time.perf_counter()
+        for name, strategy in self.strategies.items():
+            runs[name] = self._new_run(name, strategy)
+            try:
+                strategy.validate_data(data)
+                prepared[name] = strategy.calculate_indicators(data)
+            except Exception as e:
+                logger.warning(f"Batch backtest: {name} indicators failed: {e}")
+                runs[name].error = str(e)
+        result.timings["indicators"] = time.perf_counter() - phase_started
+
+        for name, frame in prepared.items():
+            try:
+                performance, final_capital, timings = _simulate(
+                    self.strategies[name], frame, self.initial_capital
+                )
+            except Exception as e:
+                logger.warning(f"Batch backtest: {name} simulation failed: {e}")
+                runs[name].error = str(e)
+                continue
+            runs[name].performance = performance
+            runs[name].final_capital = final_capital
+            for phase, seconds in timings.items():
+                result.timings[phase] += seconds
+
+        result.runs = list(runs.values())
+
+    def _run_pool(self, data: pd.DataFrame, result: BatchResult):
+        """Run each strategy end to end in worker processes."""
+        directory = Path(tempfile.mkdtemp(prefix="odin-batch-"))
+        try:
+            path, tz = write_price_memmap(data, directory)
+            tasks = [
+                (path, tz, strategy, self.initial_capital)
+                for strategy in self.strategies.values()
+            ]
+            workers = min(self.workers, len(tasks))
+            with process_pool(workers) as executor:
+                outcomes = list(executor.map(_run_in_worker, tasks))
+        finally:
+            release_mapped_frames()
+            shutil.rmtree(directory, ignore_errors=True)
+
+        for (name, strategy), outcome in zip(self.strategies.items(), outcomes):
+            performance, final_capital, timings, error = outcome
+            run = self._new_run(name, strategy)
+            if performance is None:
+                logger.warning(f"Batch backtest: {name} failed: {error}")
+                run.error = error
+            else:
+                run.performance = performance
+                run.final_capital = final_capital
+                for phase, seconds in timings.items():
+                    result.timings[phase] += seconds
+            result.runs.append(run)
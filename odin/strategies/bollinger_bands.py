@@ -17,7 +17,18 @@ from typing import Any, Dict, Tuple
 import numpy as np
 import pandas as pd
 
-from .base import Signal, SignalType, Strategy, StrategyType
+from ..core.indicator_cache import get_indicator_cache
+from .base import (
+    Signal,
+    SignalSeries,
+    SignalType,
+    Strategy,
+    StrategyType,
+    column_values,
+    previous_values,
+    vector_max,
+    vector_min,
+)
 
 
 class BollingerBandsStrategy(Strategy):
@@ -90,10 +101,12 @@ class BollingerBandsStrategy(Strategy):
             Data with additional indicator columns
         """
         df = data.copy()
+        cache = get_indicator_cache()
+        close_key = cache.fingerprint(df["close"])
 
         # Calculate Bollinger Bands
-        df["bb_middle"] = df["close"].rolling(window=self.period).mean()
-        bb_std = df["close"].rolling(window=self.period).std()
+        df["bb_middle"] = cache.rolling(df["close"], self.period, key=close_key)
+        bb_std = cache.rolling(df["close"], self.period, "std", key=close_key)
         df["bb_upper"] = df["bb_middle"] + (bb_std * self.std_dev)
         df["bb_lower"] = df["bb_middle"] - (bb_std * self.std_dev)
 
@@ -126,15 +139,13 @@ class BollingerBandsStrategy(Strategy):
 
         # Volume analysis (if available)
         if "volume" in df.columns:
-            df["volume_sma"] = df["volume"].rolling(window=self.period).mean()
+            df["volume_sma"] = cache.rolling(df["volume"], self.period)
             df["volume_ratio"] = df["volume"] / df["volume_sma"]
         else:
             df["volume_ratio"] = 1.0
 
         # Volatility measures
-        df["price_volatility"] = (
-            df["close"].rolling(window=self.period).std() / df["close"]
-        )
+        df["price_volatility"] = bb_std / df["close"]
         df["bb_volatility"] = bb_std / df["bb_middle"]
 
         # Band touch detection
@@ -430,6 +441,99 @@ class BollingerBandsStrategy(Strategy):
 
         return max(0.0, min(1.0, risk_score))
 
+    def generate_signal_series(
+        self, data: pd.DataFrame, start: int = 0
+    ) -> SignalSeries:
+        """
+        Generate Bollinger Bands signals for every bar at once.
+
+        Args:
+            data: OHLCV data with calculated indicators
+            start: First bar to evaluate
+
+        Returns:
+            Signal codes, confidence and risk score per bar
+        """
+        close = data["close"].to_numpy(dtype=float)
+        bb_upper = data["bb_upper"].to_numpy(dtype=float)
+        bb_lower = data["bb_lower"].to_numpy(dtype=float)
+        volume_ratio = column_values(data, "volume_ratio", 1.0)
+        bb_trend = column_values(data, "bb_trend", 0)
+        if "bb_squeeze" in data.columns:
+            bb_squeeze = data["bb_squeeze"].to_numpy(dtype=bool)
+        else:
+            bb_squeeze = np.zeros(len(data), dtype=bool)
+
+        if self.breakout_mode:
+            squeeze_ready = bb_squeeze & (volume_ratio > 1.5)
+            conditions = [
+                (close > bb_upper)
+                & (previous_values(close) <= previous_values(bb_upper))
+                & (volume_ratio > 1.2),
+                (close < bb_lower)
+                & (previous_values(close) >= previous_values(bb_lower))
+                & (volume_ratio > 1.2),
+                squeeze_ready & (bb_trend > 0),
+                squeeze_ready & (bb_trend < 0),
+            ]
+        else:
+            percent_b = data["percent_b"].to_numpy(dtype=float)
+            bb_middle = data["bb_middle"].to_numpy(dtype=float)
+            conditions = [
+                (percent_b <= 0.1) & (close < bb_middle),
+                (percent_b >= 0.9) & (close > bb_middle),
+                (0.1 < percent_b) & (percent_b <= 0.3) & (bb_trend > 0),
+                (0.7 <= percent_b) & (percent_b < 0.9) & (bb_trend < 0),
+            ]
+        codes = np.select(conditions, [1, -1, 1, -1], 0)
+
+        with np.errstate(invalid="ignore"):
+            buy = codes == 1
+            sell = codes == -1
+            percent_b = column_values(data, "percent_b", 0.5)
+            bb_width = column_values(data, "bb_width", 0)
+
+            position_confidence = np.where(
+                buy,
+                vector_max(0, 1.0 - percent_b * 2),
+                vector_max(0, (percent_b - 0.5) * 2),
+            )
+            width_confidence = vector_min(bb_width * 10, 1.0)
+            volume_confidence = np.where(
+                volume_ratio > 1.0, vector_min((volume_ratio - 1.0) * 2.0, 1.0), 0.5
+            )
+            trend_confidence = np.where(
+                (buy & (bb_trend >= 0)) | (sell & (bb_trend <= 0)), 0.8, 0.3
+            )
+            squeeze_confidence = np.where(bb_squeeze, 0.9, 0.6)
+            distance_factor = np.abs(percent_b - 0.5) * 2
+
+            confidence = (
+                0.25 * position_confidence
+                + 0.2 * width_confidence
+                + 0.2 * volume_confidence
+                + 0.15 * trend_confidence
+                + 0.1 * squeeze_confidence
+                + 0.1 * distance_factor
+            )
+            confidence = vector_max(0.0, vector_min(1.0, confidence))
+
+            width_risk = vector_max(0, 1.0 - bb_width * 20)
+            middle_risk = 1.0 - np.abs(percent_b - 0.5) * 2
+            volume_risk = np.where(
+                volume_ratio < 1.0, vector_max(0, 1.0 - volume_ratio), 0.0
+            )
+            price_volatility = column_values(data, "price_volatility", 0)
+            volatility_risk = vector_min(price_volatility * 50, 1.0)
+            squeeze_risk = np.where(bb_squeeze, 0.7, 0.3)
+            risk_score = (
+                width_risk + middle_risk + volume_risk + volatility_risk + squeeze_risk
+            ) / 5
+            risk_score = vector_max(0.0, vector_min(1.0, risk_score))
+
+        first_bar = max(start, self.period - 1)
+        return SignalSeries.from_arrays(codes, confidence, risk_score, first_bar)
+
     def get_parameter_ranges(self) -> Dict[str, Tuple[float, float]]:
         """
         Get parameter ranges for optimization.
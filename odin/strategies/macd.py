@@ -16,7 +16,18 @@ from typing import Any, Dict, Tuple
 import numpy as np
 import pandas as pd
 
-from .base import Signal, SignalType, Strategy, StrategyType
+from ..core.indicator_cache import get_indicator_cache
+from .base import (
+    Signal,
+    SignalSeries,
+    SignalType,
+    Strategy,
+    StrategyType,
+    column_values,
+    previous_values,
+    vector_max,
+    vector_min,
+)
 
 
 class MACDStrategy(Strategy):
@@ -35,6 +46,8 @@ class MACDStrategy(Strategy):
     - SELL: MACD line crosses below zero (bearish momentum)
     """
 
+    STATE_ATTRIBUTES = ("previous_macd_above_signal", "previous_macd_above_zero")
+
     def __init__(
         self,
         fast_period: int = 12,
@@ -90,10 +103,13 @@ class MACDStrategy(Strategy):
             Data with additional indicator columns
         """
         df = data.copy()
+        cache = get_indicator_cache()
+        close_key = cache.fingerprint(df["close"])
 
         # Calculate EMAs
-        df["ema_fast"] = df["close"].ewm(span=self.fast_period).mean()
-        df["ema_slow"] = df["close"].ewm(span=self.slow_period).mean()
+        close = df["close"]
+        df["ema_fast"] = cache.ewm_mean(close, key=close_key, span=self.fast_period)
+        df["ema_slow"] = cache.ewm_mean(close, key=close_key, span=self.slow_period)
 
         # Calculate MACD line
         df["macd"] = df["ema_fast"] - df["ema_slow"]
@@ -119,13 +135,15 @@ class MACDStrategy(Strategy):
 
         # Volume analysis (if available)
         if "volume" in df.columns:
-            df["volume_ema"] = df["volume"].ewm(span=self.fast_period).mean()
+            df["volume_ema"] = cache.ewm_mean(df["volume"], span=self.fast_period)
             df["volume_ratio"] = df["volume"] / df["volume_ema"]
         else:
             df["volume_ratio"] = 1.0
 
         # Volatility measures
-        df["price_volatility"] = df["close"].rolling(window=self.fast_period).std()
+        df["price_volatility"] = cache.rolling(
+            df["close"], self.fast_period, "std", key=close_key
+        )
         df["macd_volatility"] = df["macd"].rolling(window=self.fast_period).std()
 
         # Zero line distance
@@ -454,6 +472,151 @@ class MACDStrategy(Strategy):
 
         return max(0.0, min(1.0, risk_score))
 
+    def generate_signal_series(
+        self, data: pd.DataFrame, start: int = 0
+    ) -> SignalSeries:
+        """
+        Generate MACD signals for every bar at once.
+
+        Crossover state carried between calls of ``generate_signal`` is
+        reproduced by comparing each bar with the previous one, and the
+        ``previous_macd_*`` attributes are left as the bar loop would leave
+        them.
+
+        Args:
+            data: OHLCV data with calculated indicators
+            start: First bar to evaluate
+
+        Returns:
+            Signal codes, confidence and risk score per bar
+        """
+        n = len(data)
+        first_bar = max(start, max(self.slow_period, self.signal_period))
+
+        macd = data["macd"].to_numpy(dtype=float)
+        macd_signal = data["macd_signal"].to_numpy(dtype=float)
+        histogram = data["macd_histogram"].to_numpy(dtype=float)
+        above_signal = macd > macd_signal
+        above_zero = macd > 0
+
+        # -1 marks "no previous state" (None before the first evaluated bar)
+        previous_above_signal = previous_values(above_signal.astype(np.int8))
+        previous_above_zero = previous_values(above_zero.astype(np.int8))
+        if first_bar < n:
+            for previous, initial in (
+                (previous_above_signal, self.previous_macd_above_signal),
+                (previous_above_zero, self.previous_macd_above_zero),
+            ):
+                previous[first_bar] = -1 if initial is None else int(bool(initial))
+
+        volume_ratio = column_values(data, "volume_ratio", 1.0)
+        histogram_slope = column_values(data, "histogram_slope", 0)
+        macd_momentum = column_values(data, "macd_momentum", 0)
+        price_momentum = column_values(data, "price_momentum", 0)
+
+        signal_cross = (previous_above_signal >= 0) & (
+            previous_above_signal != above_signal
+        )
+        zero_cross = (
+            (previous_above_zero >= 0)
+            & (previous_above_zero != above_zero)
+            & (volume_ratio > 1.2)
+        )
+        strong_histogram = np.abs(histogram_slope) > 0.001
+        divergence = (
+            (np.abs(price_momentum) > 0.001)
+            & (np.abs(macd_momentum) > 0.001)
+            & ((price_momentum * macd_momentum) < 0)
+        )
+
+        codes = np.select(
+            [
+                signal_cross,
+                zero_cross,
+                strong_histogram
+                & (histogram > 0)
+                & (histogram_slope > 0)
+                & (macd_momentum > 0)
+                & above_signal,
+                strong_histogram
+                & (histogram < 0)
+                & (histogram_slope < 0)
+                & (macd_momentum < 0)
+                & ~above_signal,
+                divergence & (macd_momentum > 0) & (price_momentum < 0),
+                divergence & (macd_momentum < 0) & (price_momentum > 0),
+            ],
+            [
+                np.where(above_signal, 1, -1),
+                np.where(above_zero, 1, -1),
+                1,
+                -1,
+                1,
+                -1,
+            ],
+            0,
+        )
+
+        with np.errstate(invalid="ignore"):
+            buy = codes == 1
+            macd_value = column_values(data, "macd", 0)
+            signal_value = column_values(data, "macd_signal", 0)
+            macd_slope = column_values(data, "macd_slope", 0)
+
+            strength_confidence = vector_min(np.abs(macd_value) * 1000, 1.0)
+            momentum_confidence = vector_min(np.abs(histogram_slope) * 5000, 1.0)
+            momentum_alignment = np.where(
+                buy,
+                np.where((macd_slope > 0) & (macd_momentum > 0), 1.0, 0.3),
+                np.where((macd_slope < 0) & (macd_momentum < 0), 1.0, 0.3),
+            )
+            volume_confidence = np.where(
+                volume_ratio > 1.0, vector_min((volume_ratio - 1.0) * 2.0, 1.0), 0.5
+            )
+            zero_confidence = np.where(
+                buy,
+                np.where(macd_value > 0, 0.8, 0.4),
+                np.where(macd_value < 0, 0.8, 0.4),
+            )
+            separation_confidence = vector_min(
+                np.abs(macd_value - signal_value) * 2000, 1.0
+            )
+
+            confidence = (
+                0.25 * strength_confidence
+                + 0.2 * momentum_confidence
+                + 0.2 * momentum_alignment
+                + 0.15 * volume_confidence
+                + 0.1 * zero_confidence
+                + 0.1 * separation_confidence
+            )
+            confidence = vector_max(0.0, vector_min(1.0, confidence))
+
+            macd_volatility = column_values(data, "macd_volatility", 0)
+            volatility_risk = vector_min(macd_volatility * 1000, 1.0)
+            proximity_risk = vector_max(
+                0, 1.0 - np.abs(macd_value - signal_value) * 2000
+            )
+            zero_risk = vector_max(0, 1.0 - np.abs(macd_value) * 2000)
+            volume_risk = np.where(
+                volume_ratio < 1.0, vector_max(0, 1.0 - volume_ratio), 0.0
+            )
+            momentum_risk = np.where((macd_slope * histogram_slope) < 0, 0.7, 0.2)
+            risk_score = (
+                volatility_risk
+                + proximity_risk
+                + zero_risk
+                + volume_risk
+                + momentum_risk
+            ) / 5
+            risk_score = vector_max(0.0, vector_min(1.0, risk_score))
+
+        if first_bar < n:
+            self.previous_macd_above_signal = bool(above_signal[-1])
+            self.previous_macd_above_zero = bool(above_zero[-1])
+
+        return SignalSeries.from_arrays(codes, confidence, risk_score, first_bar)
+
     def get_parameter_ranges(self) -> Dict[str, Tuple[float, float]]:
         """
         Get parameter ranges for optimization.
@@ -17,8 +17,18 @@ import numpy as np
 import pandas as pd
 
 # Import from core models for single source of truth
+from ..core.indicator_cache import get_indicator_cache
 from ..core.models import SignalType
-from .base import Signal, Strategy, StrategyType
+from .base import (
+    Signal,
+    SignalSeries,
+    Strategy,
+    StrategyType,
+    column_values,
+    previous_values,
+    vector_max,
+    vector_min,
+)
 
 
 class MovingAverageStrategy(Strategy):
@@ -76,10 +86,12 @@ class MovingAverageStrategy(Strategy):
             Data with additional indicator columns
         """
         df = data.copy()
+        cache = get_indicator_cache()
+        close_key = cache.fingerprint(df["close"])
 
         # Calculate moving averages
-        df["ma_short"] = df["close"].rolling(window=self.short_window).mean()
-        df["ma_long"] = df["close"].rolling(window=self.long_window).mean()
+        df["ma_short"] = cache.rolling(df["close"], self.short_window, key=close_key)
+        df["ma_long"] = cache.rolling(df["close"], self.long_window, key=close_key)
 
         # Calculate additional indicators for confidence scoring
         df["ma_diff"] = df["ma_short"] - df["ma_long"]
@@ -94,13 +106,15 @@ class MovingAverageStrategy(Strategy):
 
         # Volume trend (if available)
         if "volume" in df.columns:
-            df["volume_ma"] = df["volume"].rolling(window=self.short_window).mean()
+            df["volume_ma"] = cache.rolling(df["volume"], self.short_window)
             df["volume_ratio"] = df["volume"] / df["volume_ma"]
         else:
             df["volume_ratio"] = 1.0
 
         # Volatility measure
-        df["volatility"] = df["close"].rolling(window=self.short_window).std()
+        df["volatility"] = cache.rolling(
+            df["close"], self.short_window, "std", key=close_key
+        )
         df["volatility_norm"] = df["volatility"] / df["close"]
 
         return df
@@ -276,6 +290,69 @@ class MovingAverageStrategy(Strategy):
 
         return max(0.0, min(1.0, risk_score))
 
+    def generate_signal_series(
+        self, data: pd.DataFrame, start: int = 0
+    ) -> SignalSeries:
+        """
+        Generate crossover signals for every bar at once.
+
+        Args:
+            data: OHLCV data with calculated indicators
+            start: First bar to evaluate
+
+        Returns:
+            Signal codes, confidence and risk score per bar
+        """
+        ma_short = data["ma_short"].to_numpy(dtype=float)
+        ma_long = data["ma_long"].to_numpy(dtype=float)
+        ma_short_previous = previous_values(ma_short)
+        ma_long_previous = previous_values(ma_long)
+
+        golden_cross = (ma_short_previous <= ma_long_previous) & (ma_short > ma_long)
+        death_cross = (ma_short_previous >= ma_long_previous) & (ma_short < ma_long)
+        codes = np.select([golden_cross, death_cross], [1, -1], 0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            buy = codes == 1
+
+            trend_strength = np.abs(column_values(data, "ma_diff_pct", 0))
+            trend_confidence = vector_min(trend_strength / 2.0, 1.0)
+
+            price_vs_ma_short = column_values(data, "price_vs_ma_short", 0)
+            price_momentum = np.where(
+                buy,
+                vector_max(0, price_vs_ma_short) / 5.0,
+                vector_max(0, -price_vs_ma_short) / 5.0,
+            )
+            price_confidence = vector_min(price_momentum, 1.0)
+
+            volume_ratio = column_values(data, "volume_ratio", 1.0)
+            volume_confidence = np.where(
+                volume_ratio > 1.0, vector_min((volume_ratio - 1.0) * 2.0, 1.0), 0.5
+            )
+
+            volatility_norm = column_values(data, "volatility_norm", 0)
+            volatility_confidence = vector_max(0, 1.0 - volatility_norm * 50)
+
+            confidence = (
+                0.4 * trend_confidence
+                + 0.3 * price_confidence
+                + 0.2 * volume_confidence
+                + 0.1 * volatility_confidence
+            )
+            confidence = vector_max(0.0, vector_min(1.0, confidence))
+
+            volatility_risk = vector_min(volatility_norm * 20, 1.0)
+            trend_risk = vector_max(0, 1.0 - trend_strength / 2.0)
+            volume_risk = np.where(
+                volume_ratio < 1.0, vector_max(0, 1.0 - volume_ratio), 0.0
+            )
+            risk_score = (volatility_risk + trend_risk + volume_risk) / 3
+            risk_score = vector_max(0.0, vector_min(1.0, risk_score))
+
+        first_bar = max(start, max(self.short_window, self.long_window) - 1)
+        return SignalSeries.from_arrays(codes, confidence, risk_score, first_bar)
+
     def get_parameter_ranges(self) -> Dict[str, Tuple[float, float]]:
         """
         Get parameter ranges for optimization.
@@ -0,0 +1,520 @@
+"""
+Walk-Forward Parameter Optimization
+
+Searches the ranges returned by ``Strategy.get_parameter_ranges()`` with grid,
+random or Bayesian-style (Parzen estimator) search, fitting on rolling train
+windows and scoring the chosen parameters on the following out-of-sample
+window. Backtests fan out over a process pool; the price data is written once
+to a memory-mapped array that every worker maps read-only, so tasks carry only
+parameters and window bounds.
+"""
+
+import itertools
+import logging
+import math
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+import pandas as pd
+
+from .base import Strategy
+from .shared_data import (
+    PRICE_COLUMNS,
+    mapped_price_frame,
+    process_pool,
+    release_mapped_frames,
+    write_price_memmap,
+)
+
+logger = logging.getLogger(__name__)
+
+SEARCH_METHODS = ("grid", "random", "bayesian")
+OBJECTIVES = ("sharpe", "total_return", "calmar")
+
+# Bayesian search: random trials before the estimator takes over, the share of
+# trials treated as "good", and candidates scored per suggestion
+BAYES_INITIAL_TRIALS = 10
+BAYES_GOOD_FRACTION = 0.25
+BAYES_CANDIDATES = 64
+BAYES_BANDWIDTH = 0.15
+
+# Largest grid searched per fold; bigger spaces should use random/bayesian
+MAX_GRID_TRIALS = 1000
+
+
+@dataclass
+class FoldResult:
+    """Best parameters found on one train window and how they did out of sample."""
+
+    fold: int
+    train_start: str
+    train_end: str
+    test_start: str
+    test_end: str
+    best_parameters: Dict[str, Any]
+    train_score: float
+    test_metrics: Dict[str, float]
+    trials: int
+    wall_time: float
+
+
+@dataclass
+class OptimizationResult:
+    """Walk-forward optimization report."""
+
+    strategy: str
+    method: str
+    objective: str
+    folds: List[FoldResult] = field(default_factory=list)
+    best_parameters: Dict[str, Any] = field(default_factory=dict)
+    trials: int = 0
+    workers: int = 1
+    wall_time: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        # Folds whose out-of-sample backtest failed have no test metrics
+        tested = [fold for fold in self.folds if fold.test_metrics]
+        test_returns = [fold.test_metrics["total_return"] for fold in tested]
+        result["out_of_sample_return"] = (
+            float(np.prod([1 + r for r in test_returns]) - 1) if test_returns else 0.0
+        )
+        result["untested_folds"] = [
+            fold.fold for fold in self.folds if not fold.test_metrics
+        ]
+        return result
+
+
+def walk_forward_splits(
+    n: int, folds: int, train_fraction: float = 0.7, anchored: bool = False
+) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """
+    Train/test bar ranges for a walk-forward run.
+
+    The test windows are consecutive and together cover the final
+    ``1 - train_fraction`` of the data; each is preceded by a train window of
+    fixed length (rolling) or starting at bar 0 (anchored).
+
+    Args:
+        n: Number of bars
+        folds: Number of train/test splits
+        train_fraction: Share of the data in the first train window
+        anchored: Grow the train window from the start instead of rolling it
+
+    Returns:
+        List of ((train_start, train_end), (test_start, test_end)) half-open
+        bar ranges
+    """
+    if folds < 1:
+        raise ValueError("folds must be at least 1")
+    if not 0 < train_fraction < 1:
+        raise ValueError("train_fraction must be between 0 and 1")
+
+    test_size = round(n * (1 - train_fraction)) // folds
+    train_size = n - folds * test_size
+    if test_size < 1 or train_size < 1:
+        raise ValueError(f"Not enough data ({n} bars) for {folds} folds")
+
+    splits = []
+    for k in range(folds):
+        test_start = train_size + k * test_size
+        train_start = 0 if anchored else test_start - train_size
+        splits.append(((train_start, test_start), (test_start, test_start + test_size)))
+    return splits
+
+
+class ParameterSpace:
+    """
+    Parameter ranges mapped onto the unit cube.
+
+    Ranges whose bounds are both ints are searched as integers, matching
+    the way strategies declare window lengths and flags.
+    """
+
+    def __init__(self, ranges: Dict[str, Tuple[float, float]]):
+        if not ranges:
+            raise ValueError("No parameter ranges to search")
+        self.names = list(ranges)
+        self.low = np.array([float(ranges[name][0]) for name in self.names])
+        self.high = np.array([float(ranges[name][1]) for name in self.names])
+        self.integer = np.array(
+            [
+                all(isinstance(bound, (int, np.integer)) for bound in ranges[name])
+                for name in self.names
+            ]
+        )
+
+    def to_params(self, unit: Sequence[float]) -> Dict[str, Any]:
+        values = self.low + np.clip(unit, 0.0, 1.0) * (self.high - self.low)
+        return {
+            name: int(round(value)) if integer else round(float(value), 6)
+            for name, value, integer in zip(self.names, values, self.integer)
+        }
+
+    def to_unit(self, params: Dict[str, Any]) -> np.ndarray:
+        values = np.array([float(params[name]) for name in self.names])
+        span = np.where(self.high > self.low, self.high - self.low, 1.0)
+        return (values - self.low) / span
+
+    def grid(self, points: int) -> List[Dict[str, Any]]:
+        """Every combination of ``points`` evenly spaced values per parameter."""
+        axes = []
+        for low, high, integer in zip(self.low, self.high, self.integer):
+            values = np.linspace(low, high, points)
+            if integer:
+                values = np.unique(np.round(values))
+            axes.append(values)
+
+        size = math.prod(len(values) for values in axes)
+        if size > MAX_GRID_TRIALS:
+            raise ValueError(
+                f"Grid of {size} trials exceeds {MAX_GRID_TRIALS}; "
+                "use fewer points or random/bayesian search"
+            )
+        return [
+            self.to_params(self.to_unit(dict(zip(self.names, combo))))
+            for combo in itertools.product(*axes)
+        ]
+
+    def sample(self, rng: np.random.Generator, count: int) -> List[Dict[str, Any]]:
+        return [self.to_params(u) for u in rng.random((count, len(self.names)))]
+
+
+def _parzen_log_density(points: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """Log density of a Gaussian mixture on the unit cube, plus a uniform prior."""
+    diff = (points[:, None, :] - centers[None, :, :]) / BAYES_BANDWIDTH
+    kernel = np.exp(-0.5 * diff**2) / (BAYES_BANDWIDTH * math.sqrt(2 * math.pi))
+    # Mix each dimension with a uniform component so unexplored space never
+    # has zero density
+    density = (kernel.sum(axis=1) + 1.0) / (len(centers) + 1)
+    return np.log(density).sum(axis=1)
+
+
+def suggest_bayesian(
+    space: ParameterSpace,
+    history: List[Tuple[Dict[str, Any], float]],
+    rng: np.random.Generator,
+    count: int,
+) -> List[Dict[str, Any]]:
+    """
+    Propose parameters by tree-structured Parzen estimation.
+
+    Trials are split into the best ``BAYES_GOOD_FRACTION`` and the rest;
+    candidates drawn around good trials are ranked by how much more likely
+    they are under the good density than the bad one.
+
+    Args:
+        space: Parameter space
+        history: (parameters, score) pairs evaluated so far
+        rng: Random generator
+        count: Number of suggestions
+
+    Returns:
+        List of parameter dictionaries
+    """
+    scored = [(params, score) for params, score in history if np.isfinite(score)]
+    if len(scored) < BAYES_INITIAL_TRIALS:
+        return space.sample(rng, count)
+
+    scored.sort(key=lambda item: item[1], reverse=True)
+    n_good = max(1, int(math.ceil(len(scored) * BAYES_GOOD_FRACTION)))
+    good = np.array([space.to_unit(params) for params, _ in scored[:n_good]])
+    bad = np.array([space.to_unit(params) for params, _ in scored[n_good:]])
+
+    picks = rng.integers(0, len(good), BAYES_CANDIDATES * count)
+    candidates = np.clip(
+        good[picks] + rng.normal(0, BAYES_BANDWIDTH, (len(picks), good.shape[1])),
+        0.0,
+        1.0,
+    )
+    gain = _parzen_log_density(candidates, good) - _parzen_log_density(candidates, bad)
+
+    seen = {tuple(sorted(params.items())) for params, _ in history}
+    suggestions = []
+    for i in np.argsort(-gain):
+        params = space.to_params(candidates[i])
+        key = tuple(sorted(params.items()))
+        if key not in seen:
+            seen.add(key)
+            suggestions.append(params)
+            if len(suggestions) == count:
+                break
+    if len(suggestions) < count:
+        suggestions += space.sample(rng, count - len(suggestions))
+    return suggestions
+
+
+def window_metrics(
+    equity: np.ndarray, start: int, periods_per_year: float
+) -> Dict[str, float]:
+    """
+    Return, Sharpe, max drawdown and Calmar over ``equity[start:]``.
+
+    Returns are measured from the bar before ``start`` so a position carried
+    into the window is counted from the window's first bar.
+    """
+    base = equity[start - 1] if start > 0 else equity[0]
+    window = np.concatenate(([base], equity[start:]))
+    total_return = float(window[-1] / base - 1) if base else 0.0
+
+    returns = np.diff(window) / window[:-1]
+    sharpe = 0.0
+    if len(returns) > 1:
+        std = returns.std(ddof=1)
+        if std > 0:
+            sharpe = float(returns.mean() / std * math.sqrt(periods_per_year))
+
+    running_max = np.maximum.accumulate(window)
+    max_drawdown = float(((running_max - window) / running_max).max())
+
+    calmar = 0.0
+    years = len(returns) / periods_per_year
+    if max_drawdown > 0 and years > 0 and 1 + total_return > 0:
+        calmar = float(((1 + total_return) ** (1 / years) - 1) / max_drawdown)
+
+    return {
+        "total_return": total_return,
+        "sharpe": sharpe,
+        "max_drawdown": max_drawdown,
+        "calmar": calmar,
+    }
+
+
+def _evaluate(task: Tuple) -> Optional[Dict[str, float]]:
+    """
+    Backtest one parameter set on one window (runs in a worker process).
+
+    Returns:
+        Window metrics, or None if the parameters are invalid or the backtest
+        fails
+    """
+    (
+        path,
+        tz,
+        strategy_class,
+        base_parameters,
+        parameters,
+        (start, end),
+        warmup,
+        initial_capital,
+    ) = task
+    frame = mapped_price_frame(path, tz)
+    first = max(0, start - warmup)
+
+    try:
+        strategy = strategy_class(**base_parameters)
+        strategy.update_parameters(parameters)
+        result = strategy.backtest(
+            frame.iloc[first:end], initial_capital=initial_capital, vectorized=True
+        )
+    except ValueError:
+        return None
+    except Exception as e:
+        logger.debug(f"Backtest failed for {parameters}: {e}")
+        return None
+
+    equity = result.equity_curve.to_numpy(dtype=float)
+    periods_per_year = Strategy._periods_per_year(result.equity_curve.index)
+    metrics = window_metrics(equity, start - first, periods_per_year)
+    window_start = result.equity_curve.index[start - first]
+    try:
+        metrics["trades"] = sum(
+            1 for trade in result.trades if trade["timestamp"] >= window_start
+        )
+    except TypeError:
+        # Non-datetime index: trades carry wall-clock timestamps
+        metrics["trades"] = len(result.trades)
+    return metrics
+
+
+class WalkForwardOptimizer:
+    """
+    Walk-forward optimizer for a strategy class.
+
+    For each fold, parameters are searched on the train window and the best
+    set is backtested on the following test window. Each backtest also sees
+    ``warmup_bars`` bars before its window so indicators are primed; only bars
+    inside the window are scored.
+    """
+
+    def __init__(
+        self,
+        strategy_class: Type[Strategy],
+        base_parameters: Optional[Dict[str, Any]] = None,
+        ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+        method: str = "bayesian",
+        objective: str = "sharpe",
+        folds: int = 4,
+        train_fraction: float = 0.7,
+        anchored: bool = False,
+        n_trials: int = 40,
+        grid_points: int = 4,
+        warmup_bars: int = 100,
+        initial_capital: float = 10000.0,
+        workers: Optional[int] = 1,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            strategy_class: Strategy to optimize
+            base_parameters: Constructor arguments for every trial
+            ranges: Parameter ranges (default: the strategy's own ranges)
+            method: "grid", "random" or "bayesian"
+            objective: Train-window metric to maximize: "sharpe",
+                "total_return" or "calmar"
+            folds: Number of walk-forward splits
+            train_fraction: Share of the data in the first train window
+            anchored: Grow train windows from the first bar
+            n_trials: Trials per fold for random and Bayesian search
+            grid_points: Values per parameter for grid search
+            warmup_bars: Bars before each window used to prime indicators
+            initial_capital: Starting capital for each backtest
+            workers: Worker processes (None: CPU count; 0 or 1 runs in this
+                process)
+            seed: Random seed for reproducible searches
+        """
+        if method not in SEARCH_METHODS:
+            raise ValueError(f"Unknown search method: {method}")
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective: {objective}")
+
+        self.strategy_class = strategy_class
+        self.base_parameters = dict(base_parameters or {})
+        if ranges is None:
+            ranges = strategy_class(**self.base_parameters).get_parameter_ranges()
+        self.space = ParameterSpace(ranges)
+        self.method = method
+        self.objective = objective
+        self.folds = folds
+        self.train_fraction = train_fraction
+        self.anchored = anchored
+        self.n_trials = n_trials
+        self.grid_points = grid_points
+        self.warmup_bars = warmup_bars
+        self.initial_capital = initial_capital
+        self.workers = (os.cpu_count() or 1) if workers is None else max(1, workers)
+        self.seed = seed
+
+    def run(self, data: pd.DataFrame) -> OptimizationResult:
+        """
+        Optimize over ``data`` and report the best parameters per fold.
+
+        Args:
+            data: OHLCV data ordered by time
+
+        Returns:
+            Optimization result; ``best_parameters`` are those of the latest
+            fold, i.e. the set to trade next
+        """
+        missing = [column for column in PRICE_COLUMNS if column not in data.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {missing}")
+
+        started = time.perf_counter()
+        splits = walk_forward_splits(
+            len(data), self.folds, self.train_fraction, self.anchored
+        )
+        result = OptimizationResult(
+            strategy=self.strategy_class.__name__,
+            method=self.method,
+            objective=self.objective,
+            workers=self.workers,
+        )
+        rng = np.random.default_rng(self.seed)
+
+        directory = Path(tempfile.mkdtemp(prefix="odin-optimize-"))
+        executor = None
+        try:
+            path, tz = write_price_memmap(data, directory)
+            if self.workers > 1:
+                executor = process_pool(self.workers)
+
+            def evaluate(candidates, window):
+                tasks = [
+                    (
+                        path,
+                        tz,
+                        self.strategy_class,
+                        self.base_parameters,
+                        params,
+                        window,
+                        self.warmup_bars,
+                        self.initial_capital,
+                    )
+                    for params in candidates
+                ]
+                if executor is None:
+                    return list(map(_evaluate, tasks))
+                chunksize = max(1, len(tasks) // (self.workers * 4))
+                return list(executor.map(_evaluate, tasks, chunksize=chunksize))
+
+            for fold, (train, test) in enumerate(splits):
+                fold_started = time.perf_counter()
+                history = self._search(evaluate, train, rng)
+                valid = [item for item in history if item[1] > -np.inf]
+                if not valid:
+                    logger.warning(f"No valid parameters on fold {fold}")
+                    continue
+
+                best_params, train_score = max(valid, key=lambda item: item[1])
+                test_metrics = evaluate([best_params], test)[0]
+                if test_metrics is None:
+                    logger.warning(f"Out-of-sample backtest failed on fold {fold}")
+                result.folds.append(
+                    FoldResult(
+                        fold=fold,
+                        train_start=str(data.index[train[0]]),
+                        train_end=str(data.index[train[1] - 1]),
+                        test_start=str(data.index[test[0]]),
+                        test_end=str(data.index[test[1] - 1]),
+                        best_parameters=best_params,
+                        train_score=float(train_score),
+                        test_metrics=test_metrics or {},
+                        trials=len(history),
+                        wall_time=time.perf_counter() - fold_started,
+                    )
+                )
+                result.trials += len(history) + 1
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            release_mapped_frames()
+            shutil.rmtree(directory, ignore_errors=True)
+
+        if result.folds:
+            result.best_parameters = result.folds[-1].best_parameters
+        result.wall_time = time.perf_counter() - started
+        logger.info(
+            f"Optimized {result.strategy} ({self.method}, {len(result.folds)} folds, "
+            f"{result.trials} backtests) in {result.wall_time:.2f}s"
+        )
+        return result
+
+    def _search(self, evaluate, window, rng) -> List[Tuple[Dict[str, Any], float]]:
+        """Run the configured search on one window; returns (params, score)."""
+
+        def scored(candidates):
+            metrics = evaluate(candidates, window)
+            return [
+                (params, m[self.objective] if m else -np.inf)
+                for params, m in zip(candidates, metrics)
+            ]
+
+        if self.method == "grid":
+            return scored(self.space.grid(self.grid_points))
+        if self.method == "random":
+            return scored(self.space.sample(rng, self.n_trials))
+
+        # Bayesian: evaluate in rounds of one batch per worker pool
+        history: List[Tuple[Dict[str, Any], float]] = []
+        batch = max(self.workers, 4)
+        while len(history) < self.n_trials:
+            count = min(batch, self.n_trials - len(history))
+            history += scored(suggest_bayesian(self.space, history, rng, count))
+        return history
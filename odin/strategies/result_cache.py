@@ -0,0 +1,202 @@
+"""
+Persistent Backtest Result Cache
+
+Stores backtest results in SQLite keyed by strategy class, parameters,
+initial capital and the first bar of the data. Each entry records how many
+bars it covers and a fingerprint of those price rows. A request over the same
+rows is served from the store; a request whose data extends the stored rows
+resumes the saved run over the new bars only.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import timedelta
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..core.database import DatabaseManager, get_database
+from ..core.indicator_cache import IndicatorCache
+from .base import BacktestResult, PortfolioState, Strategy, StrategyPerformance
+
+logger = logging.getLogger(__name__)
+
+PRICE_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+# How a result was produced
+CACHE_HIT = "hit"
+CACHE_RESUMED = "resumed"
+CACHE_MISS = "miss"
+
+
+def rows_fingerprint(data: pd.DataFrame, bars: int) -> str:
+    """Content hash of the first ``bars`` OHLCV rows and their timestamps."""
+    rows = data[PRICE_COLUMNS].iloc[:bars]
+    index = rows.index
+    index_values = index.asi8 if isinstance(index, pd.DatetimeIndex) else index
+    return IndicatorCache.fingerprint(rows, np.asarray(index_values))
+
+
+def json_value(value: Any) -> Any:
+    """JSON-compatible form of a timestamp or NumPy scalar (``json`` default)."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def encode_trades(trades) -> list:
+    """Backtest trades with JSON-compatible values, for storage."""
+    return [{key: json_value(value) for key, value in t.items()} for t in trades]
+
+
+def decode_trades(trades) -> list:
+    """Trades from ``encode_trades`` with their timestamps restored."""
+    decoded = []
+    for trade in trades:
+        trade = dict(trade)
+        trade["timestamp"] = pd.Timestamp(trade["timestamp"])
+        decoded.append(trade)
+    return decoded
+
+
+class BacktestResultCache:
+    """
+    Disk-backed cache of vectorized backtest results.
+
+    Cached results do not carry the per-bar ``signals`` of the bars they
+    were stored with; resumed results include signals for the new bars only.
+    """
+
+    def __init__(self, db: Optional[DatabaseManager] = None):
+        self.db = db or get_database()
+
+    @staticmethod
+    def cache_key(
+        strategy: Strategy, initial_capital: float, data: pd.DataFrame
+    ) -> Tuple[str, str]:
+        """
+        Key for a strategy configuration on data starting at ``data``'s first bar.
+
+        Returns:
+            Hex key and the JSON-encoded parameters it covers
+        """
+        parameters = json.dumps(strategy.parameters, sort_keys=True, default=str)
+        material = json.dumps(
+            [
+                type(strategy).__name__,
+                parameters,
+                float(initial_capital),
+                str(data.index[0]),
+            ]
+        )
+        return hashlib.sha256(material.encode()).hexdigest(), parameters
+
+    def run(
+        self,
+        strategy: Strategy,
+        data: pd.DataFrame,
+        initial_capital: float = 10000.0,
+    ) -> Tuple[BacktestResult, str]:
+        """
+        Backtest ``strategy`` on ``data``, reusing a stored run when possible.
+
+        Args:
+            strategy: Strategy to backtest
+            data: OHLCV data ordered by time
+            initial_capital: Starting capital amount
+
+        Returns:
+            The result covering all of ``data`` and how it was produced:
+            "hit", "resumed" or "miss"
+        """
+        if data.empty:
+            raise ValueError("Data cannot be empty")
+
+        key, parameters = self.cache_key(strategy, initial_capital, data)
+        stored = self.db.get_backtest_result(key)
+
+        if stored is not None and 0 < stored["bars"] <= len(data):
+            bars = stored["bars"]
+            if rows_fingerprint(data, bars) == stored["fingerprint"]:
+                previous = self._decode(stored, data)
+                if bars == len(data):
+                    return previous, CACHE_HIT
+                result = strategy.extend_backtest(data, previous)
+                self._save(key, strategy, parameters, data, result)
+                logger.info(
+                    f"Resumed cached {type(strategy).__name__} backtest "
+                    f"from bar {bars} to {len(data)}"
+                )
+                return result, CACHE_RESUMED
+
+        result = strategy.backtest(data, initial_capital, vectorized=True)
+        self._save(key, strategy, parameters, data, result)
+        return result, CACHE_MISS
+
+    def _save(
+        self,
+        key: str,
+        strategy: Strategy,
+        parameters: str,
+        data: pd.DataFrame,
+        result: BacktestResult,
+    ):
+        performance = dict(vars(result.performance))
+        performance["avg_trade_duration"] = (
+            result.performance.avg_trade_duration.total_seconds()
+        )
+        self.db.save_backtest_result(
+            {
+                "cache_key": key,
+                "strategy": type(strategy).__name__,
+                "parameters": parameters,
+                "initial_capital": result.initial_capital,
+                "range_start": str(data.index[0]),
+                "range_end": str(data.index[-1]),
+                "bars": result.state.bars,
+                "fingerprint": rows_fingerprint(data, result.state.bars),
+                "state": vars(result.state),
+                "performance": performance,
+                "trades": encode_trades(result.trades),
+                "equity": result.equity_curve.to_numpy(dtype=np.float64).tobytes(),
+            }
+        )
+
+    @staticmethod
+    def _decode(stored: Dict[str, Any], data: pd.DataFrame) -> BacktestResult:
+        bars = stored["bars"]
+        equity = pd.Series(
+            np.frombuffer(stored["equity"], dtype=np.float64).copy(),
+            index=data.index[:bars],
+        )
+        performance = dict(stored["performance"])
+        performance["avg_trade_duration"] = timedelta(
+            seconds=performance["avg_trade_duration"]
+        )
+        return BacktestResult(
+            performance=StrategyPerformance(**performance),
+            signals=[],
+            equity_curve=equity,
+            trades=decode_trades(stored["trades"]),
+            start_date=data.index[0],
+            end_date=data.index[bars - 1],
+            initial_capital=stored["initial_capital"],
+            final_capital=float(equity.iloc[-1]),
+            state=PortfolioState(**stored["state"]),
+        )
+
+
+# Global backtest result cache instance
+_backtest_cache: Optional[BacktestResultCache] = None
+
+
+def get_backtest_cache() -> BacktestResultCache:
+    """Get or create the global backtest result cache."""
+    global _backtest_cache
+    if _backtest_cache is None:
+        _backtest_cache = BacktestResultCache()
+    return _backtest_cache
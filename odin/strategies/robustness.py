@@ -0,0 +1,296 @@
+"""
+Monte Carlo Robustness Analysis
+
+Turns the point estimates of a backtest into distributions. Thousands of
+alternative equity paths are drawn from a finished ``BacktestResult`` and
+scored in batch with array operations; no strategy is re-run per path.
+
+Two resampling methods are available:
+- trades: bootstrap the equity growth of completed round trips, which
+  tests how much the result depends on the order and luck of its trades
+- blocks: moving-block bootstrap of the per-bar equity returns, which keeps
+  short-range autocorrelation (volatility clusters, held positions) intact
+
+Paths are generated in chunks, optionally spread over a process pool. Every
+chunk has its own seed derived from one root seed, so results do not depend
+on the number of workers.
+"""
+
+import logging
+import math
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .base import BacktestResult, Strategy
+from .shared_data import process_pool
+
+logger = logging.getLogger(__name__)
+
+METHODS = ("trades", "blocks")
+METRICS = ("total_return", "sharpe_ratio", "max_drawdown")
+
+# Upper bound on path x step values generated at once per chunk
+CHUNK_VALUES = 2_000_000
+# Paths are split into at least this many chunks so a pool has work to share
+MIN_CHUNKS = 16
+
+
+@dataclass
+class MetricInterval:
+    """Distribution of one metric across resampled paths."""
+
+    point: float  # Value of the original, unresampled path
+    mean: float
+    median: float
+    lower: float
+    upper: float
+
+
+@dataclass
+class RobustnessReport:
+    """Confidence intervals from a Monte Carlo run."""
+
+    method: str
+    paths: int
+    confidence: float
+    steps: int  # Trades or bar returns per path
+    block_size: int
+    metrics: Dict[str, MetricInterval] = field(default_factory=dict)
+    probability_of_loss: float = 0.0
+    workers: int = 1
+    wall_time: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def trade_growth(result: BacktestResult) -> np.ndarray:
+    """
+    Equity growth factor of each completed round trip.
+
+    A trade's growth is the equity at its sell bar over the equity at its buy
+    bar, so the uninvested cash share is accounted for.
+    """
+    equity = result.equity_curve
+    buys, sells = [], []
+    open_trade = None
+    for trade in result.trades:
+        if trade["type"] == "buy" and trade["amount"] > 0:
+            open_trade = trade
+        elif trade["type"] == "sell" and open_trade is not None:
+            buys.append(open_trade["timestamp"])
+            sells.append(trade["timestamp"])
+            open_trade = None
+
+    if not buys:
+        return np.empty(0)
+    positions = equity.index.get_indexer(pd.Index(buys + sells))
+    if (positions < 0).any():
+        raise ValueError("Trade timestamps are not on the equity curve index")
+
+    values = equity.to_numpy(dtype=float)
+    entry, exit = positions[: len(buys)], positions[len(buys) :]
+    return values[exit] / values[entry]
+
+
+def bar_returns(result: BacktestResult) -> np.ndarray:
+    """Per-bar equity returns, as used by the backtest's Sharpe ratio."""
+    returns = result.equity_curve.pct_change().replace([np.inf, -np.inf], np.nan)
+    return returns.dropna().to_numpy(dtype=float)
+
+
+def _sample_paths(
+    rng: np.random.Generator,
+    values: np.ndarray,
+    count: int,
+    block_size: int,
+) -> np.ndarray:
+    """
+    Resample ``values`` into ``count`` paths of the same length.
+
+    Blocks of ``block_size`` consecutive values start at uniformly drawn
+    offsets and are concatenated; a block size of 1 is the plain bootstrap.
+    """
+    n = len(values)
+    blocks = -(-n // block_size)
+    starts = rng.integers(0, n - block_size + 1, size=(count, blocks))
+    offsets = np.arange(block_size)
+    index = (starts[:, :, None] + offsets).reshape(count, -1)[:, :n]
+    return values[index]
+
+
+def path_metrics(
+    growth: np.ndarray, periods_per_year: float
+) -> Dict[str, np.ndarray]:
+    """
+    Total return, annualized Sharpe ratio and max drawdown of each path.
+
+    Args:
+        growth: Per-step growth factors, one path per row
+        periods_per_year: Steps per year, for annualizing the Sharpe ratio
+
+    Returns:
+        One array per metric, one value per path
+    """
+    returns = growth - 1.0
+    equity = np.cumprod(growth, axis=1)
+
+    mean = returns.mean(axis=1)
+    std = returns.std(axis=1, ddof=1) if returns.shape[1] > 1 else np.zeros(len(mean))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(std > 0, mean / std * math.sqrt(periods_per_year), 0.0)
+
+    # Drawdowns are measured from the starting equity (1.0) onwards
+    running_max = np.maximum.accumulate(np.maximum(equity, 1.0), axis=1)
+    drawdown = ((running_max - equity) / running_max).max(axis=1)
+
+    return {
+        "total_return": equity[:, -1] - 1.0,
+        "sharpe_ratio": sharpe,
+        "max_drawdown": np.maximum(drawdown, 0.0),
+    }
+
+
+def _run_chunk(task: Tuple) -> Dict[str, np.ndarray]:
+    """Generate and score one chunk of paths (may run in a worker process)."""
+    values, count, block_size, periods_per_year, seed = task
+    rng = np.random.default_rng(seed)
+    return path_metrics(
+        _sample_paths(rng, values, count, block_size), periods_per_year
+    )
+
+
+class MonteCarloAnalyzer:
+    """
+    Resample a backtest's trades or bar returns into confidence intervals.
+    """
+
+    def __init__(
+        self,
+        method: str = "blocks",
+        paths: int = 5000,
+        confidence: float = 0.95,
+        block_size: Optional[int] = None,
+        workers: Optional[int] = 1,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            method: "trades" (bootstrap round trips) or "blocks" (block
+                bootstrap of per-bar returns)
+            paths: Number of resampled paths
+            confidence: Two-sided confidence level of the intervals
+            block_size: Consecutive values per block (None: cube root of the
+                number of values for "blocks", 1 for "trades")
+            workers: Worker processes (None: CPU count; 0 or 1 runs in this
+                process)
+            seed: Root seed for reproducible paths
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown resampling method: {method}")
+        if paths < 1:
+            raise ValueError("Paths must be a positive integer")
+        if not 0 < confidence < 1:
+            raise ValueError("Confidence must be between 0 and 1")
+        if block_size is not None and block_size < 1:
+            raise ValueError("Block size must be a positive integer")
+
+        self.method = method
+        self.paths = int(paths)
+        self.confidence = confidence
+        self.block_size = block_size
+        self.workers = (os.cpu_count() or 1) if workers is None else max(1, workers)
+        self.seed = seed
+
+    def run(self, result: BacktestResult) -> RobustnessReport:
+        """
+        Resample ``result`` and summarize the metric distributions.
+
+        Args:
+            result: Finished backtest
+
+        Returns:
+            Report with an interval per metric
+
+        Raises:
+            ValueError: If the backtest has too few trades or bars to resample
+        """
+        started = time.perf_counter()
+        bars_per_year = Strategy._periods_per_year(result.equity_curve.index)
+
+        if self.method == "trades":
+            values = trade_growth(result)
+            if len(values) < 2:
+                raise ValueError("Need at least 2 completed trades to resample")
+            years = len(result.equity_curve) / bars_per_year
+            periods_per_year = len(values) / years
+            block_size = self.block_size or 1
+        else:
+            values = 1.0 + bar_returns(result)
+            if len(values) < 2:
+                raise ValueError("Need at least 3 bars to resample")
+            periods_per_year = bars_per_year
+            block_size = self.block_size or max(1, round(len(values) ** (1 / 3)))
+        block_size = min(block_size, len(values))
+
+        metrics = self._resample(values, block_size, periods_per_year)
+        original = path_metrics(values[None, :], periods_per_year)
+
+        alpha = (1 - self.confidence) / 2
+        report = RobustnessReport(
+            method=self.method,
+            paths=self.paths,
+            confidence=self.confidence,
+            steps=len(values),
+            block_size=block_size,
+            probability_of_loss=float((metrics["total_return"] < 0).mean()),
+            workers=self.workers,
+        )
+        for name in METRICS:
+            samples = metrics[name]
+            lower, median, upper = np.quantile(samples, [alpha, 0.5, 1 - alpha])
+            report.metrics[name] = MetricInterval(
+                point=float(original[name][0]),
+                mean=float(samples.mean()),
+                median=float(median),
+                lower=float(lower),
+                upper=float(upper),
+            )
+
+        report.wall_time = time.perf_counter() - started
+        logger.info(
+            f"Monte Carlo ({self.method}): {self.paths} paths of {len(values)} "
+            f"steps in {report.wall_time:.2f}s"
+        )
+        return report
+
+    def _resample(
+        self, values: np.ndarray, block_size: int, periods_per_year: float
+    ) -> Dict[str, np.ndarray]:
+        """Score every path, chunk by chunk."""
+        chunk = max(1, min(CHUNK_VALUES // len(values), -(-self.paths // MIN_CHUNKS)))
+        counts = [chunk] * (self.paths // chunk)
+        if self.paths % chunk:
+            counts.append(self.paths % chunk)
+
+        seeds = np.random.SeedSequence(self.seed).spawn(len(counts))
+        tasks = [
+            (values, count, block_size, periods_per_year, seed)
+            for count, seed in zip(counts, seeds)
+        ]
+
+        if self.workers > 1 and len(tasks) > 1:
+            workers = min(self.workers, len(tasks))
+            with process_pool(workers) as executor:
+                chunks: List[Dict[str, np.ndarray]] = list(
+                    executor.map(_run_chunk, tasks)
+                )
+        else:
+            chunks = [_run_chunk(task) for task in tasks]
+
+        return {name: np.concatenate([c[name] for c in chunks]) for name in METRICS}
@@ -17,8 +17,18 @@ import numpy as np
 import pandas as pd
 
 # Import from core models for single source of truth
+from ..core.indicator_cache import get_indicator_cache
 from ..core.models import SignalType
-from .base import Signal, Strategy, StrategyType
+from .base import (
+    Signal,
+    SignalSeries,
+    Strategy,
+    StrategyType,
+    column_values,
+    previous_values,
+    vector_max,
+    vector_min,
+)
 
 
 class RSIStrategy(Strategy):
@@ -35,6 +45,8 @@ class RSIStrategy(Strategy):
     - HOLD: When RSI is in neutral territory
     """
 
+    STATE_ATTRIBUTES = ("previous_rsi_state",)
+
     def __init__(
         self, period: int = 14, oversold: float = 30, overbought: float = 70, **kwargs
     ):
@@ -85,9 +97,17 @@ class RSIStrategy(Strategy):
             Data with additional indicator columns
         """
         df = data.copy()
+        cache = get_indicator_cache()
+        close_key = cache.fingerprint(df["close"])
 
         # Calculate RSI
-        df["rsi"] = self._calculate_rsi(df["close"], self.period)
+        df["rsi"] = cache.series(
+            "rsi_wilder",
+            df["close"],
+            {"period": self.period},
+            lambda: self._calculate_rsi(df["close"], self.period),
+            key=close_key,
+        )
 
         # Calculate RSI moving average for smoothing
         df["rsi_ma"] = df["rsi"].rolling(window=3).mean()
@@ -102,18 +122,18 @@ class RSIStrategy(Strategy):
 
         # Volume confirmation (if available)
         if "volume" in df.columns:
-            df["volume_ma"] = df["volume"].rolling(window=self.period).mean()
+            df["volume_ma"] = cache.rolling(df["volume"], self.period)
             df["volume_ratio"] = df["volume"] / df["volume_ma"]
         else:
             df["volume_ratio"] = 1.0
 
         # Volatility measure
-        df["volatility"] = df["close"].rolling(window=self.period).std()
+        df["volatility"] = cache.rolling(df["close"], self.period, "std", key=close_key)
         df["volatility_norm"] = df["volatility"] / df["close"]
 
         # Support and resistance levels
-        df["price_high"] = df["high"].rolling(window=self.period).max()
-        df["price_low"] = df["low"].rolling(window=self.period).min()
+        df["price_high"] = cache.rolling(df["high"], self.period, "max")
+        df["price_low"] = cache.rolling(df["low"], self.period, "min")
         df["price_range"] = df["price_high"] - df["price_low"]
         df["price_position"] = (df["close"] - df["price_low"]) / df["price_range"]
 
@@ -381,6 +401,103 @@ class RSIStrategy(Strategy):
 
         return max(0.0, min(1.0, risk_score))
 
+    def generate_signal_series(
+        self, data: pd.DataFrame, start: int = 0
+    ) -> SignalSeries:
+        """
+        Generate RSI signals for every bar at once.
+
+        The oversold/overbought state carried between calls of
+        ``generate_signal`` is reproduced by shifting the per-bar state, and
+        ``previous_rsi_state`` is left as the bar loop would leave it.
+
+        Args:
+            data: OHLCV data with calculated indicators
+            start: First bar to evaluate
+
+        Returns:
+            Signal codes, confidence and risk score per bar
+        """
+        states = {"neutral": 0, "oversold": 1, "overbought": 2}
+        n = len(data)
+        first_bar = max(start, self.period)
+
+        rsi = data["rsi"].to_numpy(dtype=float)
+        previous_rsi = previous_values(rsi)
+        rsi_change = column_values(data, "rsi_change", 0)
+
+        state = np.select([rsi <= self.oversold, rsi >= self.overbought], [1, 2], 0)
+        previous_state = previous_values(state)
+        if first_bar < n:
+            previous_state[first_bar] = states.get(self.previous_rsi_state, -1)
+
+        neutral = state == 0
+        codes = np.select(
+            [
+                (previous_state == 1) & neutral & (rsi > previous_rsi),
+                (previous_state == 2) & neutral & (rsi < previous_rsi),
+                (rsi <= self.oversold - 5) & (rsi > previous_rsi) & (rsi_change > 2),
+                (rsi >= self.overbought + 5)
+                & (rsi < previous_rsi)
+                & (rsi_change < -2),
+            ],
+            [1, -1, 1, -1],
+            0,
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            buy = codes == 1
+            sell = codes == -1
+
+            rsi_extreme = np.where(
+                buy,
+                vector_max(0, self.oversold - rsi) / self.oversold,
+                vector_max(0, rsi - self.overbought) / (100 - self.overbought),
+            )
+            rsi_confidence = vector_min(rsi_extreme * 2, 1.0)
+            momentum_confidence = vector_min(np.abs(rsi_change) / 10.0, 1.0)
+
+            volume_ratio = column_values(data, "volume_ratio", 1.0)
+            volume_confidence = np.where(
+                volume_ratio > 1.0, vector_min((volume_ratio - 1.0) * 2.0, 1.0), 0.5
+            )
+
+            price_position = column_values(data, "price_position", 0.5)
+            position_confidence = np.where(buy, 1.0 - price_position, price_position)
+
+            price_momentum = column_values(data, "price_momentum", 0)
+            divergence_confidence = np.where(
+                (buy & (price_momentum < 0) & (rsi_change > 0))
+                | (sell & (price_momentum > 0) & (rsi_change < 0)),
+                0.8,
+                0.5,
+            )
+
+            confidence = (
+                0.3 * rsi_confidence
+                + 0.25 * momentum_confidence
+                + 0.2 * volume_confidence
+                + 0.15 * position_confidence
+                + 0.1 * divergence_confidence
+            )
+            confidence = vector_max(0.0, vector_min(1.0, confidence))
+
+            volatility_norm = column_values(data, "volatility_norm", 0)
+            volatility_risk = vector_min(volatility_norm * 20, 1.0)
+            neutral_risk = vector_max(0, 1.0 - np.abs(rsi - 50) / 30)
+            volume_risk = np.where(
+                volume_ratio < 1.0, vector_max(0, 1.0 - volume_ratio), 0.0
+            )
+            range_risk = 1.0 - np.abs(price_position - 0.5) * 2
+            risk_score = (volatility_risk + neutral_risk + volume_risk + range_risk) / 4
+            risk_score = vector_max(0.0, vector_min(1.0, risk_score))
+
+        if first_bar < n:
+            state_names = {code: name for name, code in states.items()}
+            self.previous_rsi_state = state_names[int(state[-1])]
+
+        return SignalSeries.from_arrays(codes, confidence, risk_score, first_bar)
+
     def get_parameter_ranges(self) -> Dict[str, Tuple[float, float]]:
         """
         Get parameter ranges for optimization.
@@ -0,0 +1,284 @@
+"""
+Resumable Backtest Sessions
+
+A session backtests one strategy over a growing price history. Each call to
+``advance`` simulates only the bars appended since the previous call, and the
+session can be checkpointed to a JSON file holding everything needed to carry
+on after a restart: the portfolio (cash, position, bars simulated), the
+strategy's signal state, the streaming indicator accumulators, the equity
+curve and the trades so far.
+
+Usage:
+    session = BacktestSession(RSIStrategy(), path="data/sessions/rsi.json")
+    session.advance(archive.frame())
+    ...
+    session = BacktestSession.restore("data/sessions/rsi.json")
+    session.advance(archive.frame())  # only the new bars are simulated
+"""
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ..core.indicators import StreamingIndicators
+from . import STRATEGY_REGISTRY, get_strategy
+from .base import BacktestResult, PortfolioState, Strategy
+from .result_cache import decode_trades, encode_trades, json_value
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SessionCheckpoint:
+    """Saved state of a backtest session."""
+
+    strategy: str  # STRATEGY_REGISTRY name
+    parameters: Dict[str, Any]
+    initial_capital: float
+    vectorized: bool
+    portfolio: PortfolioState
+    strategy_state: Dict[str, Any] = field(default_factory=dict)
+    indicators: Dict[str, Any] = field(default_factory=dict)
+    last_timestamp: Optional[str] = None  # Last simulated bar
+    last_close: Optional[float] = None
+    equity: List[float] = field(default_factory=list)
+    trades: List[Dict[str, Any]] = field(default_factory=list)
+    saved_at: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SessionCheckpoint":
+        data = dict(data)
+        data["portfolio"] = PortfolioState(**data["portfolio"])
+        return cls(**data)
+
+
+def _registry_name(strategy: Strategy) -> str:
+    for name, strategy_class in STRATEGY_REGISTRY.items():
+        if type(strategy) is strategy_class:
+            return name
+    raise ValueError(f"{type(strategy).__name__} is not a registered strategy")
+
+
+class BacktestSession:
+    """
+    Backtest that advances over newly appended bars and survives restarts.
+
+    ``advance`` must be given the full history each time (for example
+    ``PriceArchive.frame()``): indicators are recalculated over all of it,
+    while trading is simulated from the saved portfolio over the new bars
+    only. The streaming indicators are folded forward over the new closes,
+    so ``indicators.snapshot()`` gives current values without a recompute.
+    """
+
+    def __init__(
+        self,
+        strategy: Strategy,
+        initial_capital: float = 10000.0,
+        path: Optional[Union[str, Path]] = None,
+        vectorized: bool = True,
+    ):
+        """
+        Args:
+            strategy: Registered strategy instance to run
+            initial_capital: Starting capital amount
+            path: Checkpoint file written after every advance (None: only
+                on ``save``)
+            vectorized: Simulate with array operations instead of replaying
+                the strategy bar by bar
+        """
+        self.strategy_name = _registry_name(strategy)
+        self.strategy = strategy
+        self.initial_capital = float(initial_capital)
+        self.path = Path(path) if path else None
+        self.vectorized = vectorized
+        self.indicators = StreamingIndicators()
+        self.result: Optional[BacktestResult] = None
+
+        # Timestamp and close of the last simulated bar
+        self.last_timestamp: Optional[str] = None
+        self.last_close: Optional[float] = None
+
+        # Restored checkpoint whose equity is not yet aligned with data
+        self._restored: Optional[SessionCheckpoint] = None
+
+    @property
+    def bars(self) -> int:
+        """Number of bars simulated so far."""
+        if self.result is not None:
+            return self.result.state.bars
+        if self._restored is not None:
+            return self._restored.portfolio.bars
+        return 0
+
+    @classmethod
+    def restore(cls, path: Union[str, Path]) -> "BacktestSession":
+        """
+        Recreate a session from its checkpoint file.
+
+        Args:
+            path: Checkpoint written by ``save``
+
+        Returns:
+            Session that continues after the last checkpointed bar
+        """
+        with open(path) as f:
+            checkpoint = SessionCheckpoint.from_dict(json.load(f))
+
+        strategy = get_strategy(checkpoint.strategy)(**checkpoint.parameters)
+        strategy.set_state(checkpoint.strategy_state)
+
+        session = cls(
+            strategy,
+            initial_capital=checkpoint.initial_capital,
+            path=path,
+            vectorized=checkpoint.vectorized,
+        )
+        session.indicators.set_state(checkpoint.indicators)
+        session.last_timestamp = checkpoint.last_timestamp
+        session.last_close = checkpoint.last_close
+        session._restored = checkpoint
+        logger.info(
+            f"Restored {checkpoint.strategy} session at bar "
+            f"{checkpoint.portfolio.bars} ({checkpoint.last_timestamp})"
+        )
+        return session
+
+    def advance(self, data: pd.DataFrame) -> BacktestResult:
+        """
+        Simulate the bars of ``data`` that the session has not seen yet.
+
+        Args:
+            data: OHLCV history from the session's first bar, ordered by
+                time; rows already simulated must be unchanged
+
+        Returns:
+            Backtest result covering all of ``data``
+
+        Raises:
+            ValueError: If ``data`` does not continue the simulated history
+        """
+        if data.empty:
+            raise ValueError("Data cannot be empty")
+
+        previous = self._previous(data)
+        first = previous.state.bars if previous is not None else 0
+        if previous is None:
+            result = self.strategy.backtest(
+                data, self.initial_capital, vectorized=self.vectorized
+            )
+        elif previous.state.bars == len(data):
+            result = previous
+        else:
+            result = self.strategy.extend_backtest(
+                data, previous, vectorized=self.vectorized
+            )
+
+        closes = data["close"].to_numpy(dtype=float)
+        for timestamp, price in zip(data.index[first:], closes[first:]):
+            self.indicators.update(
+                price, timestamp if isinstance(timestamp, datetime) else None
+            )
+
+        self.result = result
+        self.last_timestamp = str(data.index[-1])
+        self.last_close = float(closes[-1])
+        self._restored = None
+        if self.path is not None:
+            self.save()
+        return result
+
+    def _previous(self, data: pd.DataFrame) -> Optional[BacktestResult]:
+        """The result to continue from, checked against ``data``."""
+        checkpoint = self._restored
+        if self.result is None and checkpoint is None:
+            return None
+
+        bars = self.bars
+        if len(data) < bars:
+            raise ValueError(
+                f"Data has {len(data)} bars but the session has simulated {bars}"
+            )
+        if bars and str(data.index[bars - 1]) != self.last_timestamp:
+            raise ValueError(
+                f"Data does not continue the session: bar {bars - 1} is "
+                f"{data.index[bars - 1]}, expected {self.last_timestamp}"
+            )
+        if bars and float(data["close"].iloc[bars - 1]) != self.last_close:
+            raise ValueError(
+                f"Close at {self.last_timestamp} differs from the simulated bar"
+            )
+
+        if self.result is not None:
+            return self.result
+
+        equity = pd.Series(
+            np.asarray(checkpoint.equity, dtype=float), index=data.index[:bars]
+        )
+        trades = decode_trades(checkpoint.trades)
+        return BacktestResult(
+            performance=self.strategy._calculate_performance_metrics(
+                equity, trades, self.initial_capital
+            ),
+            signals=[],
+            equity_curve=equity,
+            trades=trades,
+            start_date=data.index[0],
+            end_date=data.index[bars - 1],
+            initial_capital=self.initial_capital,
+            final_capital=float(equity.iloc[-1]) if bars else self.initial_capital,
+            state=checkpoint.portfolio,
+        )
+
+    def checkpoint(self) -> SessionCheckpoint:
+        """Current session state."""
+        if self.result is None:
+            if self._restored is not None:
+                return self._restored
+            raise ValueError("Session has not simulated any bars")
+
+        result = self.result
+        return SessionCheckpoint(
+            strategy=self.strategy_name,
+            parameters=dict(self.strategy.parameters),
+            initial_capital=self.initial_capital,
+            vectorized=self.vectorized,
+            portfolio=result.state,
+            strategy_state=self.strategy.get_state(),
+            indicators=self.indicators.get_state(),
+            last_timestamp=self.last_timestamp,
+            last_close=self.last_close,
+            equity=result.equity_curve.to_numpy(dtype=float).tolist(),
+            trades=encode_trades(result.trades),
+            saved_at=datetime.now(timezone.utc).isoformat(),
+        )
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """
+        Write the checkpoint, replacing the previous file atomically.
+
+        Args:
+            path: Destination (defaults to the session's path)
+
+        Returns:
+            Path written
+        """
+        path = Path(path) if path else self.path
+        if path is None:
+            raise ValueError("No checkpoint path given")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(path.name + ".tmp")
+        with open(temporary, "w") as f:
+            json.dump(self.checkpoint().to_dict(), f, default=json_value)
+        os.replace(temporary, path)
+        return path
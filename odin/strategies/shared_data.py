@@ -0,0 +1,89 @@
+"""
+Price Data Shared with Worker Processes
+
+The walk-forward optimizer and the batch backtester fan backtests out over a
+process pool. The price window is written once to a memory-mapped array that
+every worker maps read-only, so tasks carry only a path and small arguments
+instead of a pickled DataFrame.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Frames mapped by this process, keyed by memmap path
+_frames: Dict[str, pd.DataFrame] = {}
+
+
+def process_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool whose workers start fresh rather than forking this process.
+
+    Pools are created from API worker threads, and a forked child can inherit
+    locks held by other threads. ``forkserver`` is used where available,
+    ``spawn`` elsewhere.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+
+def write_price_memmap(
+    data: pd.DataFrame, directory: Path
+) -> Tuple[str, Optional[str]]:
+    """
+    Store the index and OHLCV columns as rows of one float64 array on disk.
+
+    Column-major rows let each worker build its frame as a view of the
+    mapping instead of copying it.
+
+    Returns:
+        Array path and the index time zone ("none" for a non-datetime index)
+    """
+    path = directory / "prices.npy"
+    array = np.lib.format.open_memmap(
+        path, mode="w+", dtype=np.float64, shape=(1 + len(PRICE_COLUMNS), len(data))
+    )
+    tz = "none"
+    if isinstance(data.index, pd.DatetimeIndex):
+        tz = str(data.index.tz) if data.index.tz is not None else None
+        # asi8 counts in the index's own unit (ns, us, ...); pin it first
+        array[0] = data.index.as_unit("ns").asi8 / 1e9
+    else:
+        array[0] = np.arange(len(data))
+    for i, column in enumerate(PRICE_COLUMNS, start=1):
+        array[i] = data[column].to_numpy(dtype=float)
+    array.flush()
+    del array
+    return str(path), tz
+
+
+def mapped_price_frame(path: str, tz: Optional[str]) -> pd.DataFrame:
+    """OHLCV frame over the memory-mapped array (mapped once per process)."""
+    frame = _frames.get(path)
+    if frame is None:
+        array = np.load(path, mmap_mode="r")
+        if tz == "none":
+            index = pd.RangeIndex(array.shape[1])
+        else:
+            index = pd.to_datetime(array[0], unit="s").round("ms")
+            if tz:
+                index = index.tz_localize("UTC").tz_convert(tz)
+        frame = pd.DataFrame(
+            array[1:].T, index=index, columns=list(PRICE_COLUMNS), copy=False
+        )
+        _frames[path] = frame
+    return frame
+
+
+def release_mapped_frames():
+    """Drop this process's mapped frames so their files can be removed."""
+    _frames.clear()
@@ -0,0 +1,660 @@
+"""
+Event-Driven Execution Simulator
+
+Replays trade and depth events and executes a strategy's bar signals as
+orders against them, with exchange costs the bar backtest leaves out:
+maker/taker fees, order latency, slippage from walking the local order book
+and queue position for resting limit orders.
+
+Market events come from a stream recording (``recording_events``) or from
+archived bars (``archive_events``, which plays each bar as open, high/low
+and close trades). They are consumed in order; the simulator's own events
+(bar closes, order arrivals, limit order timeouts, equity marks) wait in a
+heap and run between market events by time.
+
+Signals are computed once per run on the bar frame, exactly as the
+vectorized backtest does, and acted on at each bar close. With zero fees,
+latency and slippage and market orders on archived bars, the simulation
+reproduces the bar backtest; ``SimulationResult.compare`` shows how far the
+modelled costs move the result.
+"""
+
+import heapq
+import logging
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..data.exchange_streams import StreamType
+from ..data.order_book import BookSide, OrderBook
+from ..data.recording import read_recording
+from .base import (
+    BACKTEST_WARMUP_BARS,
+    BacktestResult,
+    Strategy,
+    StrategyPerformance,
+)
+
+logger = logging.getLogger(__name__)
+
+# Market event kinds: (time, TRADE, price, quantity, side) and
+# (time, DEPTH, bids, asks, None)
+TRADE = 0
+DEPTH = 1
+
+# Scheduled event kinds; at equal times market events run first, then these
+# in this order, so a zero-latency order fills before the bar's equity mark
+BAR_CLOSE = 1
+ARRIVAL = 2
+TIMEOUT = 3
+MARK = 4
+
+ORDER_TYPES = ("market", "limit")
+
+MarketEvent = Tuple[float, int, Any, Any, Any]
+
+
+@dataclass
+class ExecutionCosts:
+    """Fee, latency and slippage assumptions."""
+
+    maker_fee_bps: float = 0.0
+    taker_fee_bps: float = 0.0
+    latency: float = 0.0  # Seconds from decision to order arrival
+    latency_jitter: float = 0.0  # Extra uniform random latency, seconds
+    slippage_bps: float = 0.0  # Applied to fills the order book cannot cover
+
+
+@dataclass
+class SimOrder:
+    """A working order."""
+
+    side: str  # "buy" or "sell"
+    order_type: str
+    decided_at: float
+    reference_price: float  # Last trade price when the order was decided
+    confidence: float
+    notional: float = 0.0  # Quote amount to spend (buys)
+    quantity: float = 0.0  # Base amount to sell, or to buy once priced
+    limit_price: Optional[float] = None
+    queue_ahead: float = 0.0  # Resting quantity ahead of a limit order
+    filled: float = 0.0
+    filled_value: float = 0.0
+    fees: float = 0.0
+    maker_quantity: float = 0.0
+
+    @property
+    def remaining(self) -> float:
+        return max(self.quantity - self.filled, 0.0)
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of an event-driven simulation."""
+
+    performance: StrategyPerformance
+    equity_curve: pd.Series
+    trades: List[Dict[str, Any]]
+    initial_capital: float
+    final_capital: float
+    fees_paid: float = 0.0
+    events: int = 0
+    skipped_signals: int = 0  # Signals ignored while an order was working
+    wall_time: float = 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.wall_time if self.wall_time > 0 else 0.0
+
+    def compare(self, backtest: BacktestResult) -> Dict[str, Dict[str, float]]:
+        """
+        Side-by-side headline metrics against a bar backtest.
+
+        Args:
+            backtest: Backtest of the same strategy on the same bars
+
+        Returns:
+            Simulated, backtested and difference values per metric
+        """
+        simulated = {
+            "total_return": self.performance.total_return,
+            "sharpe_ratio": self.performance.sharpe_ratio,
+            "max_drawdown": self.performance.max_drawdown,
+            "final_capital": self.final_capital,
+            "round_trips": _round_trips(self.trades),
+        }
+        bar = {
+            "total_return": backtest.performance.total_return,
+            "sharpe_ratio": backtest.performance.sharpe_ratio,
+            "max_drawdown": backtest.performance.max_drawdown,
+            "final_capital": backtest.final_capital,
+            "round_trips": _round_trips(backtest.trades),
+        }
+        return {
+            name: {
+                "simulated": simulated[name],
+                "backtest": bar[name],
+                "difference": simulated[name] - bar[name],
+            }
+            for name in simulated
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        performance = asdict(self.performance)
+        performance["avg_trade_duration"] = (
+            self.performance.avg_trade_duration.total_seconds()
+        )
+        return {
+            "performance": performance,
+            "trades": len(self.trades),
+            "initial_capital": self.initial_capital,
+            "final_capital": self.final_capital,
+            "fees_paid": self.fees_paid,
+            "events": self.events,
+            "skipped_signals": self.skipped_signals,
+            "wall_time": self.wall_time,
+            "events_per_second": self.events_per_second,
+        }
+
+
+def _round_trips(trades: List[Dict[str, Any]]) -> int:
+    return sum(1 for t in trades if t["type"] == "sell")
+
+
+def _epoch_seconds(index: pd.DatetimeIndex) -> np.ndarray:
+    """Epoch seconds of a naive-UTC or tz-aware DatetimeIndex."""
+    if index.tz is None:
+        index = index.tz_localize("UTC")
+    return np.asarray(
+        (index - pd.Timestamp(0, tz="UTC")) / pd.Timedelta(seconds=1), dtype=float
+    )
+
+
+def bar_seconds(bars: pd.DataFrame) -> float:
+    """Median spacing of a bar frame's DatetimeIndex, in seconds."""
+    if not isinstance(bars.index, pd.DatetimeIndex) or len(bars) < 2:
+        raise ValueError("Bars need a DatetimeIndex with at least 2 rows")
+    return float(np.median(np.diff(_epoch_seconds(bars.index))))
+
+
+def archive_events(
+    bars: pd.DataFrame, seconds: Optional[float] = None
+) -> Iterator[MarketEvent]:
+    """
+    Trade events from OHLCV bars, e.g. ``PriceArchive.frame()``.
+
+    Each bar becomes four trades, a quarter of the way apart and each
+    carrying a quarter of its volume: the open, the high and low (low first
+    on up bars) and the close at the bar's end. Sides are None, so resting
+    limit orders at the traded price are filled from them.
+
+    Args:
+        bars: OHLCV frame indexed by bar open time
+        seconds: Bar length (default: inferred from the index)
+    """
+    seconds = seconds or bar_seconds(bars)
+    opens = _epoch_seconds(bars.index)
+    o, h, l, c, v = (
+        bars[column].to_numpy(dtype=float).tolist()
+        for column in ("open", "high", "low", "close", "volume")
+    )
+    step = seconds / 4
+    for t, bar_open, high, low, close, volume in zip(opens.tolist(), o, h, l, c, v):
+        quantity = volume / 4
+        first, second = (low, high) if close >= bar_open else (high, low)
+        yield (t + step, TRADE, bar_open, quantity, None)
+        yield (t + 2 * step, TRADE, first, quantity, None)
+        yield (t + 3 * step, TRADE, second, quantity, None)
+        yield (t + seconds, TRADE, close, quantity, None)
+
+
+def recording_events(
+    path: Union[str, Path],
+    symbol: Optional[str] = None,
+    exchange: Optional[str] = None,
+) -> Iterator[MarketEvent]:
+    """
+    Trade and depth events from a stream recording.
+
+    Args:
+        path: Recording written by ``StreamRecorder``
+        symbol: Only events for this symbol
+        exchange: Only events from this exchange
+    """
+    for data in read_recording(path):
+        if symbol is not None and data.symbol != symbol:
+            continue
+        if exchange is not None and data.exchange != exchange:
+            continue
+        if data.stream_type == StreamType.TRADE:
+            yield (
+                data.timestamp,
+                TRADE,
+                float(data.data["price"]),
+                float(data.data["quantity"]),
+                data.data.get("side"),
+            )
+        elif data.stream_type == StreamType.DEPTH and data.data.get("synced", True):
+            yield (
+                data.timestamp,
+                DEPTH,
+                data.data.get("bids", []),
+                data.data.get("asks", []),
+                None,
+            )
+
+
+def trade_bars(events: Iterable[MarketEvent], seconds: float) -> pd.DataFrame:
+    """
+    OHLCV bars built from the trade events of a stream.
+
+    Args:
+        events: Market events in time order
+        seconds: Bar length
+
+    Returns:
+        Frame indexed by bar open time (naive UTC); bars without trades are
+        omitted
+    """
+    times, prices, quantities = [], [], []
+    for event in events:
+        if event[1] == TRADE:
+            times.append(event[0])
+            prices.append(event[2])
+            quantities.append(event[3])
+    if not times:
+        return pd.DataFrame(columns=["open", "high", "low", "close", "volume"])
+
+    frame = pd.DataFrame(
+        {"price": prices, "volume": quantities},
+        index=(np.asarray(times) // seconds) * seconds,
+    )
+    grouped = frame.groupby(level=0)
+    bars = grouped["price"].agg(["first", "max", "min", "last"])
+    bars.columns = ["open", "high", "low", "close"]
+    bars["volume"] = grouped["volume"].sum()
+    bars.index = pd.to_datetime(bars.index, unit="s")
+    return bars
+
+
+def _walk(
+    side: BookSide, quantity: Optional[float] = None, notional: Optional[float] = None
+) -> Tuple[float, float]:
+    """
+    Take liquidity from the best levels of ``side``.
+
+    Args:
+        side: Book side to take from (asks for buys, bids for sells)
+        quantity: Base amount to take, or
+        notional: Quote amount to spend
+
+    Returns:
+        Base quantity and quote value filled (less than asked for when the
+        book runs out)
+    """
+    filled = value = 0.0
+    for key in side.keys:
+        price = -key if side.descending else key
+        available = side.quantities[key]
+        if notional is not None:
+            take = min(available, (notional - value) / price)
+        else:
+            take = min(available, quantity - filled)
+        filled += take
+        value += take * price
+        if (notional is not None and value >= notional * (1 - 1e-12)) or (
+            quantity is not None and filled >= quantity
+        ):
+            break
+    return filled, value
+
+
+class TickSimulator:
+    """
+    Execute a strategy's bar signals against a market event stream.
+
+    Trading rules follow the bar backtest: a BUY while flat commits
+    ``max_position_size * confidence * (1 - risk_score)`` of cash, a SELL
+    while holding closes the whole position. Only one order works at a time;
+    signals arriving meanwhile are skipped.
+
+    Market orders walk the local order book built from depth events (the
+    simulated fill does not deplete it); whatever the book cannot cover, or
+    everything when no depth is available, fills at the last trade price
+    moved by ``slippage_bps``. Limit orders rest at the best bid/ask (or the
+    last price without a book) behind the quantity already at that level;
+    trades at the price consume the queue before filling the order, trades
+    through the price fill it, and shrinking depth at the level moves it up.
+    Unfilled limit quantity is sent as a market order after ``limit_timeout``.
+    """
+
+    def __init__(
+        self,
+        strategy: Strategy,
+        initial_capital: float = 10000.0,
+        costs: Optional[ExecutionCosts] = None,
+        order_type: str = "market",
+        limit_timeout: float = 60.0,
+        symbol: str = "BTC",
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            strategy: Strategy whose signals are traded
+            initial_capital: Starting cash
+            costs: Fees, latency and fallback slippage (default: none)
+            order_type: "market" (taker) or "limit" (maker, then taker on
+                timeout)
+            limit_timeout: Seconds a limit order rests before the remainder
+                is sent as a market order
+            symbol: Symbol of the simulated order book
+            seed: Seed for latency jitter
+        """
+        if order_type not in ORDER_TYPES:
+            raise ValueError(f"Unknown order type: {order_type}")
+        if limit_timeout <= 0:
+            raise ValueError("Limit timeout must be positive")
+
+        self.strategy = strategy
+        self.initial_capital = float(initial_capital)
+        self.costs = costs or ExecutionCosts()
+        self.order_type = order_type
+        self.limit_timeout = limit_timeout
+        self.symbol = symbol
+        self.seed = seed
+
+    def run(
+        self, events: Iterable[MarketEvent], bars: pd.DataFrame
+    ) -> SimulationResult:
+        """
+        Simulate trading ``bars``' signals on ``events``.
+
+        Args:
+            events: Market events in time order
+            bars: OHLCV bars the strategy's signals are computed on, indexed
+                by bar open time; each bar's signal is acted on at its close
+
+        Returns:
+            Simulation result with an equity curve marked at each bar close
+        """
+        started = time.perf_counter()
+        strategy = self.strategy
+        strategy.validate_data(bars)
+        seconds = bar_seconds(bars)
+        n = len(bars)
+
+        prepared = strategy.calculate_indicators(bars.copy())
+        start = min(BACKTEST_WARMUP_BARS - 1, n)
+        series = strategy.generate_signal_series(prepared, start=start)
+        codes = series.signal.astype(np.int8)
+        codes[:start] = 0
+        with np.errstate(invalid="ignore"):
+            fraction = np.minimum(
+                strategy.max_position_size
+                * series.confidence
+                * (1 - series.risk_score),
+                1.0,
+            )
+        closes = _epoch_seconds(bars.index) + seconds
+
+        self._reset()
+        self._schedule(closes[0], BAR_CLOSE, 0)
+        events_seen = 0
+        heap = self._heap
+
+        for event in events:
+            t = event[0]
+            while heap and heap[0][0] < t:
+                self._dispatch(heapq.heappop(heap), codes, fraction, series, closes)
+            events_seen += 1
+            if event[1] == TRADE:
+                self.last_price = event[2]
+                if self.working is not None and self.working.limit_price is not None:
+                    self._on_trade(t, event[2], event[3], event[4])
+            else:
+                self.book.apply_snapshot(event[2], event[3])
+                if self.working is not None and self.working.limit_price is not None:
+                    self._on_depth()
+
+        while heap:
+            self._dispatch(heapq.heappop(heap), codes, fraction, series, closes)
+
+        # Bars closing after the last event are marked at the last price
+        equity = np.asarray(self.marks, dtype=float)
+        equity[:start] = self.initial_capital
+        equity_series = pd.Series(equity, index=bars.index)
+
+        performance = strategy._calculate_performance_metrics(
+            equity_series, self.trades, self.initial_capital
+        )
+        result = SimulationResult(
+            performance=performance,
+            equity_curve=equity_series,
+            trades=self.trades,
+            initial_capital=self.initial_capital,
+            final_capital=float(equity[-1]) if n else self.initial_capital,
+            fees_paid=self.fees_paid,
+            events=events_seen,
+            skipped_signals=self.skipped_signals,
+            wall_time=time.perf_counter() - started,
+        )
+        logger.info(
+            f"Simulated {strategy.name} over {events_seen} events in "
+            f"{result.wall_time:.2f}s ({result.events_per_second:,.0f} events/s)"
+        )
+        return result
+
+    # Scheduler
+
+    def _reset(self):
+        self._heap: List[Tuple[float, int, int, Any]] = []
+        self._sequence = 0
+        self._rng = np.random.default_rng(self.seed)
+        self.book = OrderBook("simulated", self.symbol)
+        self.cash = self.initial_capital
+        self.position = 0.0
+        self.last_price: Optional[float] = None
+        self.working: Optional[SimOrder] = None
+        self.trades: List[Dict[str, Any]] = []
+        self.marks: List[float] = []
+        self.fees_paid = 0.0
+        self.skipped_signals = 0
+
+    def _schedule(self, at: float, kind: int, payload: Any = None):
+        self._sequence += 1
+        heapq.heappush(self._heap, (at, kind, self._sequence, payload))
+
+    def _latency(self) -> float:
+        jitter = self.costs.latency_jitter
+        return self.costs.latency + (self._rng.uniform(0, jitter) if jitter else 0.0)
+
+    def _dispatch(self, scheduled, codes, fraction, series, closes):
+        at, kind, _, payload = scheduled
+        if kind == BAR_CLOSE:
+            i = payload
+            self._decide(at, int(codes[i]), float(fraction[i]), series.confidence[i])
+            self._schedule(at, MARK)
+            if i + 1 < len(closes):
+                self._schedule(closes[i + 1], BAR_CLOSE, i + 1)
+        elif kind == ARRIVAL:
+            self._arrive(at, payload)
+        elif kind == TIMEOUT:
+            if payload is self.working and payload.remaining > 0:
+                payload.order_type = "market"
+                payload.limit_price = None
+                self._schedule(at + self._latency(), ARRIVAL, payload)
+        elif kind == MARK:
+            price = self.last_price if self.last_price is not None else 0.0
+            self.marks.append(self.cash + self.position * price)
+
+    # Orders
+
+    def _decide(self, at: float, code: int, fraction: float, confidence: float):
+        """Turn a bar close signal into an order."""
+        if code == 0 or self.last_price is None:
+            return
+        if self.working is not None:
+            self.skipped_signals += 1
+            return
+
+        if code == 1 and self.position == 0:
+            notional = self.cash * fraction
+            if not notional > 0:
+                return
+            order = SimOrder(
+                side="buy",
+                order_type=self.order_type,
+                decided_at=at,
+                reference_price=self.last_price,
+                confidence=float(confidence),
+                notional=notional,
+            )
+        elif code == -1 and self.position > 0:
+            order = SimOrder(
+                side="sell",
+                order_type=self.order_type,
+                decided_at=at,
+                reference_price=self.last_price,
+                confidence=float(confidence),
+                quantity=self.position,
+            )
+        else:
+            return
+
+        self.working = order
+        self._schedule(at + self._latency(), ARRIVAL, order)
+
+    def _arrive(self, at: float, order: SimOrder):
+        """An order reaches the exchange."""
+        if order.order_type == "market":
+            self._fill_market(at, order)
+            return
+
+        book_side = self.book.bids if order.side == "buy" else self.book.asks
+        best = book_side.best() if self.book.synced else None
+        order.limit_price = best if best is not None else self.last_price
+        if order.side == "buy":
+            order.quantity = order.notional / order.limit_price
+        order.queue_ahead = self._level_quantity(order) if best is not None else 0.0
+        self._schedule(at + self.limit_timeout, TIMEOUT, order)
+
+    def _level_quantity(self, order: SimOrder) -> float:
+        if order.side == "buy":
+            return self.book.bids.quantities.get(-order.limit_price, 0.0)
+        return self.book.asks.quantities.get(order.limit_price, 0.0)
+
+    def _fill_market(self, at: float, order: SimOrder):
+        buying = order.side == "buy"
+        book_side = self.book.asks if buying else self.book.bids
+        if buying:
+            spend = order.notional - order.filled_value
+            quantity, value = (
+                _walk(book_side, notional=spend) if self.book.synced else (0.0, 0.0)
+            )
+            shortfall = spend - value
+        else:
+            quantity, value = (
+                _walk(book_side, quantity=order.remaining)
+                if self.book.synced
+                else (0.0, 0.0)
+            )
+            shortfall = order.remaining - quantity
+
+        if shortfall > 0:
+            slip = self.costs.slippage_bps / 10_000
+            price = self.last_price * (1 + slip if buying else 1 - slip)
+            extra = shortfall / price if buying else shortfall
+            quantity += extra
+            value += extra * price
+
+        if buying:
+            order.quantity = order.filled + quantity
+        self._fill(at, order, quantity, value, maker=False)
+
+    def _on_trade(self, at: float, price: float, quantity: float, side: Optional[str]):
+        """Match a market trade against the resting limit order."""
+        order = self.working
+        limit = order.limit_price
+        buying = order.side == "buy"
+        through = price < limit if buying else price > limit
+        if through:
+            self._fill(at, order, order.remaining, order.remaining * limit, maker=True)
+            return
+        if price != limit or side == order.side:
+            return
+
+        # A trade at our price first takes the quantity queued ahead of us
+        available = quantity - order.queue_ahead
+        order.queue_ahead = max(order.queue_ahead - quantity, 0.0)
+        if available > 0:
+            take = min(available, order.remaining)
+            self._fill(at, order, take, take * limit, maker=True)
+
+    def _on_depth(self):
+        """Cancellations at the order's level move it up the queue."""
+        order = self.working
+        order.queue_ahead = min(order.queue_ahead, self._level_quantity(order))
+
+    def _fill(
+        self, at: float, order: SimOrder, quantity: float, value: float, maker: bool
+    ):
+        """Book a (partial) fill and finish the order once it is complete."""
+        fee_bps = self.costs.maker_fee_bps if maker else self.costs.taker_fee_bps
+        fee = value * fee_bps / 10_000
+
+        if order.side == "buy":
+            cost = value + fee
+            if cost > self.cash:
+                # Price moved against a full-cash order: buy what cash allows
+                scale = self.cash / cost
+                quantity, value, fee = quantity * scale, value * scale, fee * scale
+                order.quantity = order.filled + quantity
+            self.cash -= value + fee
+            self.position += quantity
+        else:
+            self.cash += value - fee
+            self.position -= quantity
+            if self.position < 1e-12:
+                self.position = 0.0
+
+        order.filled += quantity
+        order.filled_value += value
+        order.fees += fee
+        if maker:
+            order.maker_quantity += quantity
+        self.fees_paid += fee
+
+        if order.remaining <= order.quantity * 1e-12:
+            self._complete(at, order)
+
+    def _complete(self, at: float, order: SimOrder):
+        price = order.filled_value / order.filled if order.filled else 0.0
+        if order.maker_quantity >= order.filled:
+            liquidity = "maker"
+        elif order.maker_quantity > 0:
+            liquidity = "mixed"
+        else:
+            liquidity = "taker"
+        slippage = (price / order.reference_price - 1) * 10_000
+        if order.side == "sell":
+            slippage = -slippage
+
+        self.trades.append(
+            {
+                "type": order.side,
+                "timestamp": pd.Timestamp(at, unit="s"),
+                "price": price,
+                "amount": order.filled,
+                "value": order.filled_value,
+                "confidence": order.confidence,
+                "fee": order.fees,
+                "liquidity": liquidity,
+                "slippage_bps": slippage,
+                "latency": at - order.decided_at,
+            }
+        )
+        self.working = None
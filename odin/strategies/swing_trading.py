@@ -16,12 +16,63 @@ from typing import Any, Dict, Optional, Tuple
 import numpy as np
 import pandas as pd
 
+from ..core.indicator_cache import get_indicator_cache
 from ..core.models import SignalType
-from .base import Signal, Strategy, StrategyType
+from .base import (
+    Signal,
+    SignalSeries,
+    Strategy,
+    StrategyType,
+    column_values,
+    previous_values,
+    vector_max,
+    vector_min,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _latest_level_below(prices: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    """
+    Most recent earlier level strictly below each price.
+
+    A level is dominated once a later level at or below it appears: any
+    price above the older level is also above the newer one. The surviving
+    levels therefore increase in both time and value, so for each price the
+    answer is the last surviving level below it, found by binary search.
+    Prices between two consecutive levels share one set of survivors and
+    are searched as a batch.
+
+    Args:
+        prices: Price per bar
+        levels: Level per bar, NaN where the bar sets no level
+
+    Returns:
+        Level per bar, NaN where no earlier level lies below the price
+    """
+    result = np.full(len(prices), np.nan)
+    survivors = np.empty(len(prices))
+    count = 0
+    start = 0
+
+    for position in list(np.flatnonzero(~np.isnan(levels))) + [len(prices)]:
+        # Bars up to and including this level only see the earlier ones
+        stop = min(position + 1, len(prices))
+        if count and stop > start:
+            segment = prices[start:stop]
+            below = np.searchsorted(survivors[:count], segment, side="left") - 1
+            found = (below >= 0) & ~np.isnan(segment)
+            result[start:stop][found] = survivors[below[found]]
+        start = stop
+
+        if position < len(prices):
+            count = int(np.searchsorted(survivors[:count], levels[position], "left"))
+            survivors[count] = levels[position]
+            count += 1
+
+    return result
+
+
 class SwingTradingStrategy(Strategy):
     """
     Advanced Swing Trading Strategy Implementation.
@@ -111,17 +162,31 @@ class SwingTradingStrategy(Strategy):
             Data with additional indicator columns
         """
         df = data.copy()
+        cache = get_indicator_cache()
+        close_key = cache.fingerprint(df["close"])
 
         # Moving Averages
-        df["ma_fast"] = df["close"].rolling(window=self.ma_fast).mean()
-        df["ma_slow"] = df["close"].rolling(window=self.ma_slow).mean()
+        df["ma_fast"] = cache.rolling(df["close"], self.ma_fast, key=close_key)
+        df["ma_slow"] = cache.rolling(df["close"], self.ma_slow, key=close_key)
         df["ma_trend"] = np.where(df["ma_fast"] > df["ma_slow"], 1, -1)
 
-        # RSI
-        df["rsi"] = self._calculate_rsi(df["close"], self.rsi_period)
+        # RSI (simple-average, unlike RSIStrategy's Wilder smoothing)
+        df["rsi"] = cache.series(
+            "rsi_sma",
+            df["close"],
+            {"period": self.rsi_period},
+            lambda: self._calculate_rsi(df["close"], self.rsi_period),
+            key=close_key,
+        )
 
         # ATR for volatility and stop placement
-        df["atr"] = self._calculate_atr(df, period=14)
+        price_columns = df[["high", "low", "close"]]
+        df["atr"] = cache.series(
+            "atr",
+            price_columns,
+            {"period": 14},
+            lambda: self._calculate_atr(price_columns, period=14),
+        )
 
         # Swing highs and lows
         df["swing_high"] = self._detect_swing_highs(df["high"])
@@ -143,7 +208,7 @@ class SwingTradingStrategy(Strategy):
 
         # Volume analysis
         if "volume" in df.columns:
-            df["volume_sma"] = df["volume"].rolling(window=20).mean()
+            df["volume_sma"] = cache.rolling(df["volume"], 20)
             df["volume_ratio"] = df["volume"] / df["volume_sma"]
         else:
             df["volume_ratio"] = 1.0
@@ -335,62 +400,31 @@ class SwingTradingStrategy(Strategy):
         return atr.fillna(0)
 
     def _detect_swing_highs(self, highs: pd.Series, lookback: int = 5) -> pd.Series:
-        """Detect swing high points."""
-        swing_highs = pd.Series(index=highs.index, dtype=float)
-
-        for i in range(lookback, len(highs) - lookback):
-            if highs.iloc[i] == max(highs.iloc[i-lookback:i+lookback+1]):
-                swing_highs.iloc[i] = highs.iloc[i]
-
-        return swing_highs
+        """Detect swing highs: bars that are the max of a centered window."""
+        window_max = highs.rolling(window=2 * lookback + 1, center=True).max()
+        return highs.where(highs == window_max)
 
     def _detect_swing_lows(self, lows: pd.Series, lookback: int = 5) -> pd.Series:
-        """Detect swing low points."""
-        swing_lows = pd.Series(index=lows.index, dtype=float)
-
-        for i in range(lookback, len(lows) - lookback):
-            if lows.iloc[i] == min(lows.iloc[i-lookback:i+lookback+1]):
-                swing_lows.iloc[i] = lows.iloc[i]
-
-        return swing_lows
+        """Detect swing lows: bars that are the min of a centered window."""
+        window_min = lows.rolling(window=2 * lookback + 1, center=True).min()
+        return lows.where(lows == window_min)
 
     def _find_nearest_support(self, data: pd.DataFrame) -> pd.Series:
-        """Find nearest support level."""
-        current_price = data["close"]
-        swing_lows = data["swing_low"].dropna()
-
-        nearest_support = pd.Series(index=data.index, dtype=float)
-
-        for i in range(len(data)):
-            price = current_price.iloc[i]
-            relevant_lows = swing_lows[swing_lows.index < data.index[i]]
-            below_price = relevant_lows[relevant_lows < price]
-
-            if len(below_price) > 0:
-                nearest_support.iloc[i] = below_price.iloc[-1]
-            else:
-                nearest_support.iloc[i] = price * 0.95  # Default 5% below
-
-        return nearest_support
+        """Find the most recent earlier swing low below each close."""
+        close = data["close"].to_numpy(dtype=float)
+        support = _latest_level_below(close, data["swing_low"].to_numpy(dtype=float))
+        # Default 5% below
+        support = np.where(np.isnan(support), close * 0.95, support)
+        return pd.Series(support, index=data.index)
 
     def _find_nearest_resistance(self, data: pd.DataFrame) -> pd.Series:
-        """Find nearest resistance level."""
-        current_price = data["close"]
-        swing_highs = data["swing_high"].dropna()
-
-        nearest_resistance = pd.Series(index=data.index, dtype=float)
-
-        for i in range(len(data)):
-            price = current_price.iloc[i]
-            relevant_highs = swing_highs[swing_highs.index < data.index[i]]
-            above_price = relevant_highs[relevant_highs > price]
-
-            if len(above_price) > 0:
-                nearest_resistance.iloc[i] = above_price.iloc[-1]
-            else:
-                nearest_resistance.iloc[i] = price * 1.05  # Default 5% above
-
-        return nearest_resistance
+        """Find the most recent earlier swing high above each close."""
+        close = data["close"].to_numpy(dtype=float)
+        swing_highs = data["swing_high"].to_numpy(dtype=float)
+        resistance = -_latest_level_below(-close, -swing_highs)
+        # Default 5% above
+        resistance = np.where(np.isnan(resistance), close * 1.05, resistance)
+        return pd.Series(resistance, index=data.index)
 
     def _calculate_trend_strength(self, data: pd.DataFrame) -> pd.Series:
         """Calculate trend strength (simplified ADX)."""
@@ -459,6 +493,83 @@ class SwingTradingStrategy(Strategy):
 
         return sum(risk_factors) / len(risk_factors)
 
+    def generate_signal_series(
+        self, data: pd.DataFrame, start: int = 0
+    ) -> SignalSeries:
+        """
+        Generate swing signals for every bar at once.
+
+        Args:
+            data: OHLCV data with calculated indicators
+            start: First bar to evaluate
+
+        Returns:
+            Signal codes, confidence and risk score per bar
+        """
+        close = data["close"].to_numpy(dtype=float)
+        rsi = data["rsi"].to_numpy(dtype=float)
+        ma_trend = data["ma_trend"].to_numpy(dtype=float)
+        ma_fast = data["ma_fast"].to_numpy(dtype=float)
+        trend_strength = column_values(data, "trend_strength", 0)
+        previous_trend = previous_values(ma_trend)
+
+        crossover_bull = (ma_trend == 1) & (previous_trend == -1)
+        crossover_bear = (ma_trend == -1) & (previous_trend == 1)
+        not_extreme = (rsi < self.rsi_overbought) & (rsi > self.rsi_oversold)
+        bullish_setup = (ma_trend == 1) & not_extreme & (close > ma_fast)
+        bearish_setup = (
+            ~bullish_setup & (ma_trend == -1) & not_extreme & (close < ma_fast)
+        )
+        strong_trend = trend_strength > 0.5
+
+        codes = np.select(
+            [
+                bullish_setup & crossover_bull,
+                bullish_setup & (rsi < 50) & strong_trend,
+                bearish_setup & crossover_bear,
+                bearish_setup & (rsi > 50) & strong_trend,
+                (rsi < self.rsi_oversold) & (ma_trend == 1),
+                (rsi > self.rsi_overbought) & (ma_trend == -1),
+            ],
+            [1, 1, -1, -1, 1, -1],
+            0,
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            buy = codes == 1
+            sell = codes == -1
+
+            trend_alignment = np.where(
+                (buy & (ma_trend == 1)) | (sell & (ma_trend == -1)), 0.8, 0.4
+            )
+            rsi_confidence = np.where(
+                buy,
+                vector_max(
+                    0, (self.rsi_overbought - rsi) / self.rsi_overbought
+                ),
+                vector_max(0, (rsi - self.rsi_oversold) / (100 - self.rsi_oversold)),
+            )
+            strength_confidence = vector_min(1.0, trend_strength)
+            volume_ratio = column_values(data, "volume_ratio", 1)
+            volume_confidence = np.where(
+                volume_ratio > 1, vector_min(1.0, volume_ratio / 1.5), 0.5
+            )
+            confidence = (
+                trend_alignment
+                + rsi_confidence
+                + strength_confidence
+                + volume_confidence
+            ) / 4
+
+            atr = column_values(data, "atr", 0)
+            price = column_values(data, "close", 1)
+            atr_risk = np.where(price > 0, vector_min(1.0, atr / price * 20), 0.5)
+            rsi_risk = np.abs(rsi - 50) / 50
+            risk_score = (atr_risk + rsi_risk + (1 - trend_strength)) / 3
+
+        first_bar = max(start, max(self.ma_slow, self.rsi_period) + 4)
+        return SignalSeries.from_arrays(codes, confidence, risk_score, first_bar)
+
     def get_parameter_ranges(self) -> Dict[str, Tuple[float, float]]:
         """Get parameter ranges for optimization."""
         return {
@@ -6,11 +6,18 @@ Provides in-memory caching with TTL support for API endpoints
 import asyncio
 import hashlib
 import json
+import os
 import time
 from datetime import datetime, timedelta, timezone
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, Tuple
-
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from odin.utils.cache_backends import (
+    CacheBackend,
+    CacheEntry,
+    MemoryBackend,
+    SocketBackend,
+)
 from odin.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -18,25 +25,59 @@ logger = get_logger(__name__)
 
 class CacheManager:
     """
-    In-memory cache manager with TTL support and automatic cleanup.
-    Thread-safe using asyncio locks.
+    Cache manager with TTL support, single-flight loading and automatic
+    cleanup.
+
+    Storage is delegated to a ``CacheBackend``: by default an in-process
+    LRU (``MemoryBackend``), or a ``SocketBackend`` shared by every worker
+    process on the host. Backend failures are logged and treated as misses.
+
+    With the in-process backend, reads and writes never await between
+    looking up and mutating an entry, so they are safe for concurrent
+    coroutines on one event loop without a lock.
     """
 
-    def __init__(self, default_ttl: int = 300, max_size: int = 1000):
+    def __init__(
+        self,
+        default_ttl: int = 300,
+        max_size: int = 1000,
+        max_bytes: Optional[int] = None,
+        wheel_resolution: float = 1.0,
+        backend: Optional[CacheBackend] = None,
+    ):
         """
         Initialize cache manager.
 
         Args:
             default_ttl: Default time-to-live in seconds (default: 5 minutes)
             max_size: Maximum number of cache entries (default: 1000)
+            max_bytes: Optional limit on the approximate total size of cached
+                values; least recently used entries are evicted to stay under
+            wheel_resolution: Width in seconds of each expiry wheel bucket
+            backend: Storage backend (default: in-process ``MemoryBackend``
+                built from the limits above)
         """
-        self.cache: Dict[str, Tuple[Any, float]] = {}
+        self.backend = backend or MemoryBackend(
+            max_size=max_size, max_bytes=max_bytes, wheel_resolution=wheel_resolution
+        )
         self.default_ttl = default_ttl
-        self.max_size = max_size
-        self.lock = asyncio.Lock()
         self.hits = 0
         self.misses = 0
-        self.evictions = 0
+        self.backend_errors = 0
+
+        # Single-flight loads in progress, by key
+        self.inflight: Dict[str, asyncio.Task] = {}
+        self.coalesced = 0
+        self.stale_hits = 0
+        self.refreshes = 0
+
+    @property
+    def max_size(self) -> int:
+        return self.backend.stats()["max_size"]
+
+    def _backend_failed(self, operation: str, error: Exception):
+        self.backend_errors += 1
+        logger.warning(f"Cache backend {operation} failed: {error}")
 
     def _generate_key(self, prefix: str, *args, **kwargs) -> str:
         """Generate cache key from function arguments."""
@@ -58,23 +99,53 @@ class CacheManager:
         Returns:
             Cached value or None if not found/expired
         """
-        async with self.lock:
-            if key not in self.cache:
-                self.misses += 1
-                return None
+        value, _ = await self.get_stale(key, allow_stale=False)
+        return value
 
-            value, expires_at = self.cache[key]
+    async def get_stale(
+        self, key: str, allow_stale: bool = True
+    ) -> Tuple[Optional[Any], bool]:
+        """
+        Get value from cache, optionally accepting an expired one.
 
-            # Check if expired
-            if time.time() > expires_at:
-                del self.cache[key]
-                self.misses += 1
-                return None
+        Entries set with ``stale_ttl`` stay readable for that long after they
+        expire, for stale-while-revalidate.
 
-            self.hits += 1
-            return value
+        Args:
+            key: Cache key
+            allow_stale: Return expired values still inside their stale window
 
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        Returns:
+            Tuple of (value or None, True if the value is fresh)
+        """
+        try:
+            entry = await self.backend.get(key)
+        except Exception as e:
+            self._backend_failed("get", e)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None, False
+
+        now = time.time()
+
+        # Check if expired
+        if now > entry.expires_at:
+            if now > entry.stale_until:
+                await self.delete(key)
+            elif allow_stale:
+                self.stale_hits += 1
+                return entry.value, False
+            self.misses += 1
+            return None, False
+
+        self.hits += 1
+        return entry.value, True
+
+    async def set(
+        self, key: str, value: Any, ttl: Optional[int] = None, stale_ttl: int = 0
+    ) -> None:
         """
         Set value in cache with TTL.
 
@@ -82,17 +153,90 @@ class CacheManager:
             key: Cache key
             value: Value to cache
             ttl: Time-to-live in seconds (uses default if None)
+            stale_ttl: Seconds past expiry the value may still be served stale
+        """
+        expires_at = time.time() + (ttl or self.default_ttl)
+        entry = CacheEntry(value, expires_at, expires_at + stale_ttl)
+        try:
+            await self.backend.set(key, entry)
+        except Exception as e:
+            self._backend_failed("set", e)
+
+    def _start_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int],
+        stale_ttl: int,
+    ) -> Tuple[asyncio.Task, bool]:
+        """Return the in-flight load for ``key``, starting one if needed."""
+        task = self.inflight.get(key)
+        if task is not None:
+            return task, False
+
+        async def load():
+            result = await loader()
+            await self.set(key, result, ttl=ttl, stale_ttl=stale_ttl)
+            return result
+
+        task = asyncio.create_task(load())
+        self.inflight[key] = task
+
+        def finished(done: asyncio.Task):
+            if self.inflight.get(key) is done:
+                del self.inflight[key]
+            if not done.cancelled():
+                # Mark the exception retrieved; callers re-raise it themselves
+                done.exception()
+
+        task.add_done_callback(finished)
+        return task, True
+
+    async def load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        stale_ttl: int = 0,
+    ) -> Any:
+        """
+        Load a missing value once for all concurrent callers.
+
+        The first caller for ``key`` runs ``loader`` and caches its result;
+        callers arriving while it runs await the same result (or exception).
+        A cancelled caller does not cancel the shared load.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument coroutine function producing the value
+            ttl: Time-to-live in seconds (uses default if None)
+            stale_ttl: Seconds past expiry the value may still be served stale
+
+        Returns:
+            Loaded value
         """
-        async with self.lock:
-            # Enforce max size with LRU eviction
-            if len(self.cache) >= self.max_size and key not in self.cache:
-                # Remove oldest entry
-                oldest_key = min(self.cache.keys(), key=lambda k: self.cache[k][1])
-                del self.cache[oldest_key]
-                self.evictions += 1
+        task, started = self._start_load(key, loader, ttl, stale_ttl)
+        if not started:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def refresh(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        stale_ttl: int = 0,
+    ) -> asyncio.Task:
+        """
+        Reload ``key`` in the background unless a load is already running.
 
-            expires_at = time.time() + (ttl or self.default_ttl)
-            self.cache[key] = (value, expires_at)
+        Returns:
+            The in-flight load task
+        """
+        task, started = self._start_load(key, loader, ttl, stale_ttl)
+        if started:
+            self.refreshes += 1
+        return task
 
     async def delete(self, key: str) -> bool:
         """
@@ -104,10 +248,10 @@ class CacheManager:
         Returns:
             True if key existed, False otherwise
         """
-        async with self.lock:
-            if key in self.cache:
-                del self.cache[key]
-                return True
+        try:
+            return await self.backend.delete(key)
+        except Exception as e:
+            self._backend_failed("delete", e)
             return False
 
     async def clear(self) -> int:
@@ -117,28 +261,27 @@ class CacheManager:
         Returns:
             Number of entries cleared
         """
-        async with self.lock:
-            count = len(self.cache)
-            self.cache.clear()
-            return count
+        return await self.backend.clear()
 
     async def cleanup_expired(self) -> int:
         """
         Remove expired entries from cache.
 
+        The in-process backend only visits the expiry wheel buckets that have
+        come due.
+
         Returns:
             Number of entries removed
         """
-        async with self.lock:
-            now = time.time()
-            expired_keys = [
-                key for key, (_, expires_at) in self.cache.items() if now > expires_at
-            ]
-
-            for key in expired_keys:
-                del self.cache[key]
+        try:
+            return await self.backend.expire(time.time())
+        except Exception as e:
+            self._backend_failed("expire", e)
+            return 0
 
-            return len(expired_keys)
+    async def close(self):
+        """Release backend resources."""
+        await self.backend.close()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
@@ -146,36 +289,90 @@ class CacheManager:
         hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
 
         return {
-            "size": len(self.cache),
-            "max_size": self.max_size,
+            **self.backend.stats(),
             "hits": self.hits,
             "misses": self.misses,
-            "evictions": self.evictions,
             "hit_rate": round(hit_rate, 2),
             "total_requests": total_requests,
+            "coalesced": self.coalesced,
+            "stale_hits": self.stale_hits,
+            "refreshes": self.refreshes,
+            "inflight": len(self.inflight),
+            "backend_errors": self.backend_errors,
         }
 
 
 # Global cache instance
 _cache_manager: Optional[CacheManager] = None
 
+# Environment variables selecting the cache backend
+CACHE_BACKEND_ENV = "ODIN_CACHE_BACKEND"  # "memory" (default) or "socket"
+CACHE_ADDRESS_ENV = "ODIN_CACHE_ADDRESS"  # Unix socket path or tcp://host:port
+CACHE_SECRET_ENV = "ODIN_CACHE_SECRET"  # Shared secret, required for tcp://
 
-def get_cache_manager(default_ttl: int = 300, max_size: int = 1000) -> CacheManager:
+
+def create_cache_backend(
+    name: str = "memory",
+    max_size: int = 1000,
+    max_bytes: Optional[int] = None,
+    address: Optional[str] = None,
+    secret: Optional[str] = None,
+) -> CacheBackend:
+    """
+    Build a cache backend by name.
+
+    Args:
+        name: ``memory`` for a per-process cache, ``socket`` for one cache
+            shared by all worker processes on the host
+        max_size: Maximum cache entries
+        max_bytes: Optional approximate byte limit
+        address: Socket backend address (default: per-user Unix socket)
+        secret: Socket backend shared secret (required for TCP addresses)
+
+    Returns:
+        CacheBackend instance
+    """
+    if name == "memory":
+        return MemoryBackend(max_size=max_size, max_bytes=max_bytes)
+    if name == "socket":
+        return SocketBackend(
+            address, max_size=max_size, max_bytes=max_bytes, secret=secret
+        )
+    raise ValueError(f"Unknown cache backend: {name}")
+
+
+def get_cache_manager(
+    default_ttl: int = 300, max_size: int = 1000, max_bytes: Optional[int] = None
+) -> CacheManager:
     """
     Get or create global cache manager instance.
 
+    The backend is chosen by the ``ODIN_CACHE_BACKEND`` environment variable;
+    set it to ``socket`` when running several uvicorn workers so they share
+    one cache.
+
     Args:
         default_ttl: Default TTL in seconds
         max_size: Maximum cache size
+        max_bytes: Optional approximate byte limit
 
     Returns:
         CacheManager instance
     """
     global _cache_manager
     if _cache_manager is None:
-        _cache_manager = CacheManager(default_ttl=default_ttl, max_size=max_size)
+        backend_name = os.getenv(CACHE_BACKEND_ENV, "memory").lower()
+        backend = create_cache_backend(
+            backend_name,
+            max_size=max_size,
+            max_bytes=max_bytes,
+            address=os.getenv(CACHE_ADDRESS_ENV),
+            secret=os.getenv(CACHE_SECRET_ENV),
+        )
+        _cache_manager = CacheManager(default_ttl=default_ttl, backend=backend)
         logger.info(
-            f"Initialized cache manager with TTL={default_ttl}s, max_size={max_size}"
+            f"Initialized {backend_name} cache manager with TTL={default_ttl}s, "
+            f"max_size={max_size}"
         )
     return _cache_manager
 
@@ -184,14 +381,21 @@ def cached(
     ttl: Optional[int] = None,
     key_prefix: Optional[str] = None,
     skip_cache_on_error: bool = True,
+    stale_ttl: int = 0,
 ):
     """
     Decorator to cache async function results.
 
+    Concurrent calls that miss on the same key share a single call of the
+    function. With ``stale_ttl``, an expired result is returned immediately
+    for up to ``stale_ttl`` seconds while one background call refreshes it.
+
     Args:
         ttl: Time-to-live in seconds (uses default if None)
         key_prefix: Custom cache key prefix (uses function name if None)
         skip_cache_on_error: Don't cache if function raises exception
+        stale_ttl: Seconds to serve an expired result while revalidating
+            (0 disables stale-while-revalidate)
 
     Example:
         @cached(ttl=60, key_prefix="price")
@@ -206,47 +410,57 @@ def cached(
             prefix = key_prefix or func.__name__
             cache_key = cache._generate_key(prefix, *args, **kwargs)
 
-            # Try to get from cache
-            cached_value = await cache.get(cache_key)
-            if cached_value is not None:
-                logger.debug(
-                    f"Cache hit for {prefix}",
-                    extra={"cache_key": cache_key[:8]},
-                )
-                return cached_value
-
-            # Execute function
-            try:
-                result = await func(*args, **kwargs)
+            async def call():
+                # Execute function; errors are not cached
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(
+                        f"Error in cached function {prefix}: {e}",
+                        extra={"cache_key": cache_key[:8]},
+                    )
+                    raise
 
-                # Cache successful result
-                await cache.set(cache_key, result, ttl=ttl)
                 logger.debug(
                     f"Cached result for {prefix}",
                     extra={"cache_key": cache_key[:8], "ttl": ttl or cache.default_ttl},
                 )
-
                 return result
 
-            except Exception as e:
-                # Don't cache errors
-                logger.error(
-                    f"Error in cached function {prefix}: {e}",
-                    extra={"cache_key": cache_key[:8]},
-                )
-                raise
+            # Try to get from cache
+            cached_value, fresh = await cache.get_stale(
+                cache_key, allow_stale=stale_ttl > 0
+            )
+            if cached_value is not None:
+                if not fresh:
+                    logger.debug(
+                        f"Serving stale {prefix} while revalidating",
+                        extra={"cache_key": cache_key[:8]},
+                    )
+                    cache.refresh(cache_key, call, ttl=ttl, stale_ttl=stale_ttl)
+                else:
+                    logger.debug(
+                        f"Cache hit for {prefix}",
+                        extra={"cache_key": cache_key[:8]},
+                    )
+                return cached_value
+
+            return await cache.load(cache_key, call, ttl=ttl, stale_ttl=stale_ttl)
 
         return wrapper
 
     return decorator
 
 
-async def start_cache_cleanup_task(interval: int = 300):
+async def start_cache_cleanup_task(interval: float = 1.0):
     """
-    Background task to periodically clean up expired cache entries.
+    Background task that turns the cache expiry wheel.
+
+    Each pass only visits the wheel buckets that came due since the last one,
+    so it can run every second regardless of cache size.
 
     Args:
-        interval: Cleanup interval in seconds (default: 5 minutes)
+        interval: Cleanup interval in seconds (default: 1 second)
     """
     cache = get_cache_manager()
     logger.info(f"Starting cache cleanup task (interval={interval}s)")
@@ -256,7 +470,7 @@ async def start_cache_cleanup_task(interval: int = 300):
             await asyncio.sleep(interval)
             removed = await cache.cleanup_expired()
             if removed > 0:
-                logger.info(f"Cache cleanup: removed {removed} expired entries")
+                logger.debug(f"Cache cleanup: removed {removed} expired entries")
         except Exception as e:
             logger.error(f"Error in cache cleanup task: {e}")
 
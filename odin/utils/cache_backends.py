@@ -0,0 +1,647 @@
+"""
+Cache Storage Backends
+Storage behind CacheManager: an in-process LRU and a host-local socket
+backend shared by every worker process on the machine.
+"""
+
+import asyncio
+import errno
+import hmac
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+from odin.utils.logging import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: no Unix sockets to elect over
+    fcntl = None
+
+logger = get_logger(__name__)
+
+# Frames larger than this are rejected by the socket server
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+_HEADER = struct.Struct("!I")
+
+
+@dataclass
+class CacheEntry:
+    """Cached value with its expiry times and approximate size."""
+
+    value: Any
+    expires_at: float
+    stale_until: float
+    size: int = 0
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of a cached value in bytes."""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+class CacheBackend(ABC):
+    """
+    Storage interface used by ``CacheManager``.
+
+    Backends only store entries; TTL decisions, statistics and single-flight
+    loading stay in the manager.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        """Get an entry (expired or not), marking it recently used."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, entry: CacheEntry) -> bool:
+        """Store an entry; returns False if it was rejected."""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """Remove an entry; returns True if it existed."""
+        pass
+
+    @abstractmethod
+    async def clear(self) -> int:
+        """Remove all entries; returns how many there were."""
+        pass
+
+    @abstractmethod
+    async def expire(self, now: float) -> int:
+        """Drop entries whose stale window ended before ``now``."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Storage statistics (size, limits, evictions)."""
+        pass
+
+    async def close(self):
+        """Release resources."""
+
+
+class MemoryBackend(CacheBackend):
+    """
+    In-process LRU store.
+
+    Entries live in an ``OrderedDict`` in least-recently-used order, so reads,
+    writes and evictions are O(1). Expiry is tracked on a timing wheel of
+    ``wheel_resolution``-second buckets: expiring only touches the buckets
+    that have come due instead of scanning every entry.
+    """
+
+    name = "memory"
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        max_bytes: Optional[int] = None,
+        wheel_resolution: float = 1.0,
+    ):
+        """
+        Initialize backend.
+
+        Args:
+            max_size: Maximum number of entries
+            max_bytes: Optional limit on the approximate total size of cached
+                values; least recently used entries are evicted to stay under
+            wheel_resolution: Width in seconds of each expiry wheel bucket
+        """
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.evictions = 0
+
+        # Expiry wheel: bucket tick -> keys whose stale window ends in it
+        self.wheel_resolution = wheel_resolution
+        self._wheel: Dict[int, Set[str]] = {}
+        self._wheel_position = self._tick(time.time())
+        self.expired = 0
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> bool:
+        self._expire_due(time.time())
+
+        entry.size = estimate_size(entry.value) if self.max_bytes else 0
+        if self.max_bytes and entry.size > self.max_bytes:
+            logger.debug(f"Value of {entry.size} bytes exceeds cache limit")
+            self._remove(key)
+            return False
+
+        self._remove(key)
+        self.entries[key] = entry
+        self.total_bytes += entry.size
+        self._schedule(key, entry.stale_until)
+
+        # Enforce limits with LRU eviction
+        while len(self.entries) > self.max_size or (
+            self.max_bytes and self.total_bytes > self.max_bytes
+        ):
+            _, evicted = self.entries.popitem(last=False)
+            self.total_bytes -= evicted.size
+            self.evictions += 1
+        return True
+
+    async def delete(self, key: str) -> bool:
+        return self._remove(key)
+
+    async def clear(self) -> int:
+        count = len(self.entries)
+        self.entries.clear()
+        self._wheel.clear()
+        self.total_bytes = 0
+        return count
+
+    async def expire(self, now: float) -> int:
+        return self._expire_due(now)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "expired": self.expired,
+        }
+
+    def _remove(self, key: str) -> bool:
+        """Drop an entry and its size accounting."""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return False
+        self.total_bytes -= entry.size
+        return True
+
+    def _tick(self, timestamp: float) -> int:
+        return int(timestamp // self.wheel_resolution)
+
+    def _schedule(self, key: str, when: float):
+        """Put ``key`` in the first wheel bucket that starts after ``when``."""
+        self._wheel.setdefault(self._tick(when) + 1, set()).add(key)
+
+    def _expire_due(self, now: float) -> int:
+        """Advance the expiry wheel to ``now`` and drop entries that ran out."""
+        current = self._tick(now)
+        if current <= self._wheel_position:
+            return 0
+
+        if current - self._wheel_position > len(self._wheel):
+            due = sorted(tick for tick in self._wheel if tick <= current)
+        else:
+            due = range(self._wheel_position + 1, current + 1)
+        self._wheel_position = current
+
+        removed = 0
+        for tick in due:
+            for key in self._wheel.pop(tick, ()):
+                entry = self.entries.get(key)
+                # Entries re-set since scheduling sit in a later bucket too
+                if entry is not None and entry.stale_until <= now:
+                    self._remove(key)
+                    removed += 1
+
+        self.expired += removed
+        return removed
+
+
+def default_socket_address() -> str:
+    """
+    Per-user cache server socket for this host.
+
+    The socket lives in ``$XDG_RUNTIME_DIR`` when it is set, otherwise in an
+    ``odin-<uid>`` directory under the temp dir that only the owner can enter.
+
+    Raises:
+        OSError: Without Unix sockets (use a ``tcp://`` address and a secret),
+            or if the fallback directory is reachable by other users
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError(
+            errno.EAFNOSUPPORT,
+            "Unix sockets unavailable; configure a tcp:// cache address "
+            "with a shared secret",
+        )
+    directory = os.getenv("XDG_RUNTIME_DIR")
+    if not directory:
+        directory = os.path.join(tempfile.gettempdir(), f"odin-{os.getuid()}")
+        _private_directory(directory)
+    return os.path.join(directory, "odin-cache.sock")
+
+
+def _private_directory(path: str):
+    """Create ``path`` owner-only, refusing an existing one others control."""
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise PermissionError(
+            errno.EACCES, f"Cache socket directory is not private: {path}"
+        )
+
+
+def _check_socket_owner(path: str):
+    """Refuse to talk to a socket file created by another user."""
+    info = os.lstat(path)
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError(
+            errno.EACCES, f"Cache socket is not owned by this user: {path}"
+        )
+
+
+def _peer_uid(writer: asyncio.StreamWriter) -> Optional[int]:
+    """User id of the process at the other end of a Unix socket, if known."""
+    sock = writer.get_extra_info("socket")
+    if (
+        sock is None
+        or not hasattr(socket, "SO_PEERCRED")
+        or sock.family != getattr(socket, "AF_UNIX", None)
+    ):
+        return None
+    credentials = struct.Struct("3i")
+    pid, uid, gid = credentials.unpack(
+        sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, credentials.size)
+    )
+    return uid
+
+
+def _parse_address(address: str) -> Tuple[Optional[str], Optional[Tuple[str, int]]]:
+    """Split an address into a Unix socket path or a TCP (host, port)."""
+    if address.startswith("tcp://"):
+        host, _, port = address[len("tcp://") :].rpartition(":")
+        return None, (host or "127.0.0.1", int(port))
+    return address, None
+
+
+def _require_secret(address: str, secret: Optional[str]):
+    if address.startswith("tcp://") and not secret:
+        raise ValueError("TCP cache addresses require a shared secret")
+
+
+async def _write_frame(writer: asyncio.StreamWriter, payload: Any):
+    data = json.dumps(payload, default=str).encode()
+    writer.write(_HEADER.pack(len(data)) + data)
+    await writer.drain()
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Any:
+    (length,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    if length > MAX_FRAME_BYTES:
+        raise ValueError(f"Cache frame of {length} bytes exceeds limit")
+    frame = json.loads(await reader.readexactly(length))
+    if not isinstance(frame, list) or len(frame) != 2:
+        raise ValueError("Malformed cache frame")
+    return frame
+
+
+@contextmanager
+def _election_lock(path: str) -> Iterator[None]:
+    """Serialize workers checking for and binding the server socket."""
+    if fcntl is None:
+        yield
+        return
+    # O_NOFOLLOW: a symlink planted at the lock path must not be opened
+    fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+class CacheServer:
+    """
+    Serves a ``MemoryBackend`` to other processes over a local socket.
+
+    Frames are a 4-byte length followed by a JSON ``[op, args]`` request or
+    ``[ok, result]`` reply; cached values are stored as JSON, with other
+    types converted to strings. Unix sockets are created with owner-only
+    permissions and connections from other users are dropped. With a
+    ``secret`` (required for TCP), every connection must first send
+    ``["auth", [secret]]``.
+    """
+
+    OPS = ("get", "set", "delete", "clear", "expire", "stats")
+
+    def __init__(
+        self,
+        address: str,
+        backend: Optional[MemoryBackend] = None,
+        secret: Optional[str] = None,
+    ):
+        _require_secret(address, secret)
+        self.address = address
+        self.backend = backend or MemoryBackend()
+        self.secret = secret
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self):
+        """
+        Bind the socket.
+
+        Raises:
+            OSError: If another live server already owns the address
+        """
+        path, tcp = _parse_address(self.address)
+        if tcp is not None:
+            self._server = await asyncio.start_server(self._handle, *tcp)
+        else:
+            with _election_lock(path):
+                if os.path.exists(path):
+                    if await self._is_alive(path):
+                        raise OSError(
+                            errno.EADDRINUSE, f"Cache server running at {path}"
+                        )
+                    # Left behind by a worker that exited
+                    os.unlink(path)
+                self._server = await asyncio.start_unix_server(self._handle, path)
+                os.chmod(path, 0o600)
+        logger.info(f"Cache server listening on {self.address}")
+
+    @staticmethod
+    async def _is_alive(path: str) -> bool:
+        try:
+            _, writer = await asyncio.open_unix_connection(path)
+        except OSError:
+            return False
+        writer.close()
+        return True
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            peer = _peer_uid(writer)
+            if peer is not None and peer != os.getuid():
+                logger.warning(f"Rejected cache connection from uid {peer}")
+                return
+            if self.secret is not None and not await self._authenticate(
+                reader, writer
+            ):
+                return
+
+            while True:
+                op, args = await _read_frame(reader)
+                try:
+                    if op not in self.OPS or not isinstance(args, list):
+                        raise ValueError(f"Unknown cache operation: {op}")
+                    result = await self._run(op, args)
+                    reply = [True, result]
+                except Exception as e:
+                    reply = [False, f"{type(e).__name__}: {e}"]
+                await _write_frame(writer, reply)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as e:
+            logger.warning(f"Cache server connection error: {e}")
+        finally:
+            writer.close()
+
+    async def _authenticate(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        op, args = await _read_frame(reader)
+        secret = args[0] if op == "auth" and isinstance(args, list) and args else ""
+        if isinstance(secret, str) and hmac.compare_digest(
+            secret.encode(), self.secret.encode()
+        ):
+            await _write_frame(writer, [True, None])
+            return True
+        logger.warning("Rejected cache connection with a wrong secret")
+        await _write_frame(writer, [False, "Authentication failed"])
+        return False
+
+    async def _run(self, op: str, args: list) -> Any:
+        if op == "stats":
+            return self.backend.stats()
+        if op == "expire":
+            removed = await self.backend.expire(*args)
+            return [removed, self.backend.stats()]
+        if op == "get":
+            entry = await self.backend.get(*args)
+            return asdict(entry) if entry is not None else None
+        if op == "set":
+            key, entry = args
+            return await self.backend.set(key, CacheEntry(**entry))
+        return await getattr(self.backend, op)(*args)
+
+    async def close(self):
+        """Stop accepting connections and remove the socket file."""
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+        path, tcp = _parse_address(self.address)
+        if tcp is None and os.path.exists(path):
+            os.unlink(path)
+
+
+class SocketBackend(CacheBackend):
+    """
+    Client for a host-local ``CacheServer``, shared by all worker processes.
+
+    The first worker that finds no server running starts one in its own
+    event loop; the rest connect to it. If the hosting worker exits, the
+    next request from another worker takes over (with an empty cache).
+    """
+
+    name = "socket"
+
+    def __init__(
+        self,
+        address: Optional[str] = None,
+        max_size: int = 1000,
+        max_bytes: Optional[int] = None,
+        host_server: bool = True,
+        timeout: float = 1.0,
+        secret: Optional[str] = None,
+    ):
+        """
+        Initialize backend.
+
+        Args:
+            address: Unix socket path or ``tcp://host:port``
+            max_size: Entry limit used if this process hosts the server
+            max_bytes: Byte limit used if this process hosts the server
+            host_server: Start a server when none is running
+            timeout: Seconds to wait for a reply
+            secret: Shared secret sent before any request; required for TCP
+
+        Raises:
+            ValueError: If a TCP address is given without a secret
+        """
+        self.address = address or default_socket_address()
+        _require_secret(self.address, secret)
+        self.secret = secret
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.host_server = host_server
+        self.timeout = timeout
+
+        self.server: Optional[CacheServer] = None
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._remote_stats: Dict[str, Any] = {
+            "size": 0,
+            "max_size": max_size,
+            "bytes": 0,
+            "max_bytes": max_bytes,
+            "evictions": 0,
+            "expired": 0,
+        }
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = await self._call("get", key)
+        return CacheEntry(**entry) if entry is not None else None
+
+    async def set(self, key: str, entry: CacheEntry) -> bool:
+        return await self._call("set", key, asdict(entry))
+
+    async def delete(self, key: str) -> bool:
+        return await self._call("delete", key)
+
+    async def clear(self) -> int:
+        return await self._call("clear")
+
+    async def expire(self, now: float) -> int:
+        removed, self._remote_stats = await self._call("expire", now)
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Last statistics reported by the server (refreshed by ``expire``)."""
+        return {
+            **self._remote_stats,
+            "backend": self.name,
+            "address": self.address,
+            "hosting": self.server is not None,
+        }
+
+    async def _call(self, op: str, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Streams, locks and a hosted server belong to one event loop
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._reader = self._writer = None
+            self._abandon_server()
+
+        async with self._lock:
+            await self._ensure_connected()
+            try:
+                ok, result = await self._request(op, list(args))
+            except BaseException:
+                self._disconnect()
+                raise
+
+        if not ok:
+            raise RuntimeError(f"Cache server error: {result}")
+        return result
+
+    async def _request(self, op: str, args: list) -> Tuple[bool, Any]:
+        await _write_frame(self._writer, [op, args])
+        return await asyncio.wait_for(_read_frame(self._reader), timeout=self.timeout)
+
+    async def _open(self):
+        path, tcp = _parse_address(self.address)
+        if tcp is not None:
+            streams = await asyncio.open_connection(*tcp)
+        else:
+            _check_socket_owner(path)
+            streams = await asyncio.open_unix_connection(path)
+
+        if self.secret is not None:
+            self._reader, self._writer = streams
+            try:
+                ok, _ = await self._request("auth", [self.secret])
+            except BaseException:
+                self._disconnect()
+                raise
+            if not ok:
+                self._disconnect()
+                raise PermissionError(errno.EACCES, "Cache server rejected secret")
+        return streams
+
+    async def _ensure_connected(self):
+        if self._writer is not None and not self._writer.is_closing():
+            return
+
+        try:
+            self._reader, self._writer = await self._open()
+            return
+        except OSError:
+            if not self.host_server:
+                raise
+
+        server = CacheServer(
+            self.address,
+            MemoryBackend(max_size=self.max_size, max_bytes=self.max_bytes),
+            secret=self.secret,
+        )
+        try:
+            await server.start()
+            self.server = server
+        except OSError as e:
+            # Another worker won the race to host the server
+            logger.debug(f"Cache server not started here: {e}")
+        self._reader, self._writer = await self._open()
+
+    def _abandon_server(self):
+        """Drop a server hosted on an event loop that is no longer running."""
+        if self.server is None:
+            return
+        try:
+            self.server._server.close()
+        except Exception:
+            pass
+        path, tcp = _parse_address(self.address)
+        if tcp is None and os.path.exists(path):
+            os.unlink(path)
+        self.server = None
+
+    def _disconnect(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def close(self):
+        """Close the connection and any server hosted by this process."""
+        self._disconnect()
+        if self.server is not None:
+            await self.server.close()
+            self.server = None
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Database Benchmark Script
+Measures price inserts/sec and reads/sec for the core SQLite DatabaseManager,
+comparing a fresh connection per call (the old behaviour) with the pooled
+WAL connections, plus read throughput while a writer is active.
+"""
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from odin.core.database import DatabaseManager
+
+INSERT_SQL = """
+    INSERT OR REPLACE INTO bitcoin_prices (timestamp, price, volume, market_cap)
+    VALUES (?, ?, ?, ?)
+"""
+CURRENT_SQL = """
+    SELECT timestamp, price, volume, market_cap
+    FROM bitcoin_prices
+    ORDER BY timestamp DESC
+    LIMIT 1
+"""
+
+
+def unpooled_insert(db_path: Path, timestamp: datetime, price: float):
+    """Insert with a fresh connection and the default rollback journal."""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(INSERT_SQL, (timestamp, price, 1.0, None))
+        conn.commit()
+
+
+def unpooled_read(db_path: Path):
+    """Read the current price with a fresh connection."""
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        row = conn.execute(CURRENT_SQL).fetchone()
+        return dict(row) if row else None
+
+
+def rate(count: int, seconds: float) -> float:
+    return count / seconds if seconds > 0 else float("inf")
+
+
+def run_unpooled(db_path: Path, inserts: int, reads: int) -> dict:
+    """Benchmark the connect-per-call pattern."""
+    DatabaseManager(str(db_path), synchronous="FULL").close()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("PRAGMA journal_mode = DELETE")
+
+    start_time = datetime(2024, 1, 1)
+    started = time.perf_counter()
+    for i in range(inserts):
+        unpooled_insert(db_path, start_time + timedelta(minutes=i), 50000.0 + i)
+    insert_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(reads):
+        unpooled_read(db_path)
+    read_seconds = time.perf_counter() - started
+
+    return {
+        "inserts_per_sec": rate(inserts, insert_seconds),
+        "reads_per_sec": rate(reads, read_seconds),
+    }
+
+
+def run_pooled(db_path: Path, inserts: int, reads: int) -> dict:
+    """Benchmark the pooled WAL DatabaseManager."""
+    db = DatabaseManager(str(db_path))
+
+    start_time = datetime(2024, 1, 1)
+    started = time.perf_counter()
+    for i in range(inserts):
+        db.add_price_data(start_time + timedelta(minutes=i), 50000.0 + i, 1.0)
+    insert_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(reads):
+        db.get_current_price()
+    read_seconds = time.perf_counter() - started
+
+    db.close()
+    return {
+        "inserts_per_sec": rate(inserts, insert_seconds),
+        "reads_per_sec": rate(reads, read_seconds),
+    }
+
+
+def run_concurrent(db: DatabaseManager, reads: int) -> dict:
+    """Read the current price while another thread keeps writing."""
+    stop = threading.Event()
+    written = [0]
+
+    def writer():
+        timestamp = datetime(2030, 1, 1)
+        while not stop.is_set():
+            db.add_price_data(timestamp + timedelta(seconds=written[0]), 60000.0, 1.0)
+            written[0] += 1
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+
+    started = time.perf_counter()
+    for _ in range(reads):
+        db.get_current_price()
+    read_seconds = time.perf_counter() - started
+
+    stop.set()
+    thread.join()
+    return {
+        "reads_per_sec": rate(reads, read_seconds),
+        "writes_during_reads": written[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SQLite database layer")
+    parser.add_argument("--inserts", type=int, default=2000)
+    parser.add_argument("--reads", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        before = run_unpooled(Path(tmp) / "before.db", args.inserts, args.reads)
+        after = run_pooled(Path(tmp) / "after.db", args.inserts, args.reads)
+
+        db = DatabaseManager(str(Path(tmp) / "after.db"))
+        concurrent = run_concurrent(db, args.reads)
+        db.close()
+
+    print(f"{'':<28}{'inserts/sec':>14}{'reads/sec':>14}")
+    print(
+        f"{'connection per call':<28}"
+        f"{before['inserts_per_sec']:>14,.0f}{before['reads_per_sec']:>14,.0f}"
+    )
+    print(
+        f"{'pooled + WAL':<28}"
+        f"{after['inserts_per_sec']:>14,.0f}{after['reads_per_sec']:>14,.0f}"
+    )
+    print(
+        f"\nReads with a concurrent writer: {concurrent['reads_per_sec']:,.0f}/sec "
+        f"({concurrent['writes_during_reads']:,} writes interleaved)"
+    )
+    print(
+        f"Speedup: inserts {after['inserts_per_sec'] / before['inserts_per_sec']:.1f}x, "
+        f"reads {after['reads_per_sec'] / before['reads_per_sec']:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+WebSocket Fan-out Benchmark Script
+Measures stream messages/sec delivered through StreamManager to a growing
+number of WebSocket clients, comparing per-client json.dumps (the old
+behaviour) with the pre-serialized broadcast path. With --replay, a recorded
+session is played through a ReplayConnector instead, reporting throughput
+and per-client send lag.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from odin.api.routes.websockets import ClientConnection
+from odin.data.exchange_streams import StreamData, StreamManager, StreamType
+from odin.data.recording import ReplayConnector
+
+
+class NullWebSocket:
+    """Accepts every frame immediately and counts them."""
+
+    def __init__(self):
+        self.frames = 0
+
+    async def send_text(self, text: str):
+        self.frames += 1
+
+
+class PerClientJSONConnection(ClientConnection):
+    """ClientConnection that serializes every message itself."""
+
+    @staticmethod
+    def _encode(payload):
+        if isinstance(payload, StreamData):
+            return json.dumps(payload.to_message())
+        return ClientConnection._encode(payload)
+
+
+def make_ticker(i: int) -> StreamData:
+    price = 50000.0 + i * 0.01
+    return StreamData(
+        exchange="binance",
+        symbol="BTC",
+        stream_type=StreamType.TICKER,
+        timestamp=time.time(),
+        data={
+            "price": price,
+            "change_24h": 1.2345,
+            "high_24h": price * 1.02,
+            "low_24h": price * 0.98,
+            "volume_24h": 12345.678,
+            "quote_volume": 617283900.12,
+        },
+    )
+
+
+async def run(connection_class, clients: int, messages: int) -> float:
+    """Push `messages` tickers to `clients` subscribers; return sends/sec."""
+    stream_mgr = StreamManager()
+    connections = [connection_class(NullWebSocket()) for _ in range(clients)]
+    for connection in connections:
+        connection.start()
+        await stream_mgr.subscribe("BTC", connection.on_stream_data)
+
+    updates = [make_ticker(i) for i in range(messages)]
+    started = time.perf_counter()
+    for update in updates:
+        stream_mgr._on_stream_data(update)
+        # Let every writer drain so nothing is conflated away
+        await asyncio.sleep(0)
+    while any(connection._pending for connection in connections):
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+
+    sent = sum(connection.websocket.frames for connection in connections)
+    for connection in connections:
+        await connection.close()
+    return sent / elapsed if elapsed > 0 else float("inf")
+
+
+async def run_replay(path: Path, clients: int, speed) -> dict:
+    """Replay a recording to `clients` subscribers of every recorded symbol."""
+    stream_mgr = StreamManager()
+    replay = ReplayConnector(stream_mgr._on_stream_data, path, speed=speed)
+    stream_mgr.connectors["replay"] = replay
+
+    connections = [ClientConnection(NullWebSocket()) for _ in range(clients)]
+    symbols = {"BTC", "ETH", "SOL", "XRP", "BNB", "SUI", "HYPE"}
+    for connection in connections:
+        connection.start()
+        for symbol in symbols:
+            await stream_mgr.subscribe(symbol, connection.on_stream_data, exchange="")
+
+    started = time.perf_counter()
+    await replay.connect()
+    while any(connection._pending for connection in connections):
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+
+    metrics = [connection.get_metrics() for connection in connections]
+    for connection in connections:
+        await connection.close()
+    sent = sum(m["sent"] for m in metrics)
+    return {
+        "frames": replay.frames_sent,
+        "sends_per_sec": sent / elapsed if elapsed > 0 else float("inf"),
+        "conflated": sum(m["conflated"] for m in metrics),
+        "avg_lag_ms": sum(m["avg_lag_ms"] for m in metrics) / len(metrics),
+        "max_lag_ms": max(m["max_lag_ms"] for m in metrics),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark WebSocket fan-out")
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 10, 100, 500])
+    parser.add_argument("--replay", type=Path, help="Recording to play back")
+    parser.add_argument(
+        "--speed", type=float, default=None, help="Replay rate (default: max)"
+    )
+    args = parser.parse_args()
+
+    if args.replay:
+        print(
+            f"{'clients':>8}{'frames':>10}{'sends/sec':>14}"
+            f"{'conflated':>12}{'avg lag ms':>12}{'max lag ms':>12}"
+        )
+        for clients in args.clients:
+            result = await run_replay(args.replay, clients, args.speed)
+            print(
+                f"{clients:>8}{result['frames']:>10,}{result['sends_per_sec']:>14,.0f}"
+                f"{result['conflated']:>12,}{result['avg_lag_ms']:>12.2f}"
+                f"{result['max_lag_ms']:>12.2f}"
+            )
+        return
+
+    print(f"{'clients':>8}{'per-client json':>20}{'pre-serialized':>20}{'speedup':>10}")
+    for clients in args.clients:
+        before = await run(PerClientJSONConnection, clients, args.messages)
+        after = await run(ClientConnection, clients, args.messages)
+        print(
+            f"{clients:>8}{before:>16,.0f}/sec{after:>16,.0f}/sec"
+            f"{after / before:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Price Archive Import Script
+Builds or extends the columnar price archive from the CSV history export
+and the SQLite price tables. Re-running only appends rows newer than what
+is already archived.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from odin.data.archive import (
+    DEFAULT_ROOT,
+    PriceArchive,
+    import_ohlcv_table,
+    import_price_csv,
+    import_price_table,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import history into the price archive")
+    parser.add_argument("--root", type=Path, default=Path(DEFAULT_ROOT))
+    parser.add_argument("--symbol", default="BTC")
+    parser.add_argument("--csv", type=Path, help="Daily CSV export to import as 1d")
+    parser.add_argument("--db", type=Path, help="SQLite database to import from")
+    parser.add_argument(
+        "--timeframes",
+        nargs="+",
+        default=["1m", "5m", "1h", "4h", "1d"],
+        help="ohlcv_bars timeframes to import from --db",
+    )
+    parser.add_argument(
+        "--prices", action="store_true", help="Also import bitcoin_prices as 'raw'"
+    )
+    args = parser.parse_args()
+
+    if not args.csv and not args.db:
+        parser.error("Nothing to import: pass --csv and/or --db")
+
+    if args.csv:
+        added = import_price_csv(args.csv, args.symbol, "1d", args.root)
+        print(f"{args.csv}: {added:,} rows -> {args.symbol} 1d")
+
+    if args.db:
+        for timeframe in args.timeframes:
+            added = import_ohlcv_table(args.db, args.symbol, timeframe, args.root)
+            print(f"{args.db} ohlcv_bars: {added:,} rows -> {args.symbol} {timeframe}")
+        if args.prices:
+            added = import_price_table(args.db, args.symbol, "raw", args.root)
+            print(f"{args.db} bitcoin_prices: {added:,} rows -> {args.symbol} raw")
+
+    for archive_dir in sorted((args.root / args.symbol.upper()).glob("*")):
+        info = PriceArchive(args.symbol, archive_dir.name, args.root).info()
+        print(f"  {info['timeframe']:>4}: {info['rows']:,} rows")
+
+
+if __name__ == "__main__":
+    main()
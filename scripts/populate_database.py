@@ -6,6 +6,7 @@ Populates database with sample Bitcoin price data for testing.
 
 import sys
 import asyncio
+import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -15,7 +16,8 @@ sys.path.insert(0, str(project_root))
 
 # Simple imports to avoid dependency issues
 try:
-    from odin.core.repository import get_repository_manager, save_price_data
+    from odin.core.database import load_price_csv
+    from odin.core.repository import get_repository_manager, save_price_data_bulk
     REPO_AVAILABLE = True
 except ImportError:
     REPO_AVAILABLE = False
@@ -56,11 +58,9 @@ async def create_sample_data():
             
             sample_data.append(price_data)
         
-        # Save to database
-        success_count = 0
-        for data in sample_data:
-            if await save_price_data(data):
-                success_count += 1
+        # Save to database in one bulk transaction
+        result = await save_price_data_bulk(sample_data)
+        success_count = result.data["rows"] if result.success else 0
         
         print(f"Successfully saved {success_count}/{len(sample_data)} price records")
         
@@ -75,8 +75,39 @@ async def create_sample_data():
         print(f"Error creating sample data: {e}")
         return False
 
+async def load_csv_history(csv_path):
+    """Bulk load daily price history from a CSV export."""
+    try:
+        print(f"Loading price history from {csv_path}...")
+        history = load_price_csv(csv_path)
+        history["source"] = "csv_import"
+        
+        result = await save_price_data_bulk(history)
+        if not result.success:
+            print(f"Bulk load failed: {result.error}")
+            return False
+        
+        report = result.data
+        print(
+            f"Saved {report['rows']} price records in {report['seconds']:.3f}s "
+            f"({report['rows_per_sec']:,.0f} rows/sec)"
+        )
+        return report["rows"] > 0
+        
+    except Exception as e:
+        print(f"Error loading CSV history: {e}")
+        return False
+
 async def main():
     """Main function."""
+    parser = argparse.ArgumentParser(description="Populate the Odin price database")
+    parser.add_argument(
+        "--csv",
+        help="Load price history from a CSV export "
+        "(e.g. scripts/bitcoin_20080225_20250525.csv) instead of sample data",
+    )
+    args = parser.parse_args()
+    
     print("Simple Database Population Script")
     print("=" * 40)
     
@@ -87,7 +118,10 @@ async def main():
         return
     
     try:
-        success = await create_sample_data()
+        if args.csv:
+            success = await load_csv_history(args.csv)
+        else:
+            success = await create_sample_data()
         
         if success:
             print("\nDatabase population completed successfully!")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Stream Recording Script
+Records a live exchange session (tickers, trades and depth) to a replayable
+file for offline load tests with ReplayConnector.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from odin.data.exchange_streams import StreamType, get_stream_manager
+from odin.data.recording import StreamRecorder
+
+
+async def record(args):
+    stream_mgr = get_stream_manager()
+    with StreamRecorder(args.output, compress=args.compress) as recorder:
+        stream_mgr.taps.append(recorder.record)
+        await stream_mgr.start(args.exchanges)
+        await asyncio.sleep(2)  # Let the connections open
+
+        stream_types = [StreamType.TICKER, StreamType.TRADE]
+        if args.depth:
+            stream_types.append(StreamType.DEPTH)
+        for exchange in args.exchanges:
+            for symbol in args.symbols:
+                await stream_mgr.connectors[exchange].subscribe(symbol, stream_types)
+
+        print(f"Recording {', '.join(args.symbols)} for {args.seconds}s...")
+        await asyncio.sleep(args.seconds)
+        await stream_mgr.stop()
+
+    print(
+        f"Wrote {recorder.frames:,} frames "
+        f"({recorder.bytes_written / 1024:,.0f} KiB before compression) "
+        f"to {args.output}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record live exchange streams")
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--seconds", type=float, default=60)
+    parser.add_argument("--symbols", nargs="+", default=["BTC", "ETH"])
+    parser.add_argument("--exchanges", nargs="+", default=["binance"])
+    parser.add_argument("--depth", action="store_true", help="Also record depth")
+    parser.add_argument("--compress", action="store_true", help="gzip the file")
+    asyncio.run(record(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
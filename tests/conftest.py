@@ -305,6 +305,30 @@ def sample_historical_data():
         }
 
 
+@pytest.fixture(scope="session")
+def make_ohlcv():
+    """Factory for random-walk OHLCV frames with an hourly index."""
+    import numpy as np
+    import pandas as pd
+
+    def factory(periods: int = 400, seed: int = 7) -> pd.DataFrame:
+        rng = np.random.default_rng(seed)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, periods)))
+        index = pd.date_range("2024-01-01", periods=periods, freq="h")
+        return pd.DataFrame(
+            {
+                "open": close * (1 + rng.normal(0, 0.002, periods)),
+                "high": close * 1.01,
+                "low": close * 0.99,
+                "close": close,
+                "volume": rng.uniform(100, 1000, periods),
+            },
+            index=index,
+        )
+
+    return factory
+
+
 @pytest.fixture
 def mock_api_client():
     """Mock API client for external service testing."""
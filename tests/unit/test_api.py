@@ -369,6 +369,107 @@ class TestDataEndpoints:
             print("⚠️  Parameter validation not found or not working")
 
 
+def fake_fetcher(price, delay):
+    """Price fetcher that answers after an injected delay."""
+    import asyncio
+
+    async def fetch(symbol):
+        await asyncio.sleep(delay)
+        return {"price": price, "source": f"fake-{price}"} if price else None
+
+    return fetch
+
+
+class TestCurrentPriceRace:
+    """Racing crypto price sources for /current."""
+
+    async def test_richer_source_wins_inside_window(self):
+        from odin.api.routes.data import race_price_sources
+
+        sources = [("rich", fake_fetcher(100.0, 0.05)), ("fast", fake_fetcher(101.0, 0.0))]
+        winner, data, report = await race_price_sources("BTC", sources, 500)
+
+        assert winner == "rich"
+        assert data["price"] == 100.0
+        assert report["rich"]["status"] == "won"
+        assert report["fast"]["status"] == "ok"
+        assert report["fast"]["latency_ms"] <= report["rich"]["latency_ms"]
+
+    async def test_fast_source_wins_after_window(self):
+        from odin.api.routes.data import race_price_sources
+
+        sources = [("slow", fake_fetcher(100.0, 2.0)), ("fast", fake_fetcher(101.0, 0.0))]
+        winner, data, report = await race_price_sources("BTC", sources, 50)
+
+        assert winner == "fast"
+        assert report["slow"] == {"status": "cancelled", "latency_ms": None}
+        assert report["fast"]["latency_ms"] < 1000
+        print("✅ Degraded source no longer adds its timeout to the request")
+
+    async def test_failed_sources_are_skipped(self):
+        from odin.api.routes.data import race_price_sources
+
+        sources = [("down", fake_fetcher(None, 0.0)), ("up", fake_fetcher(99.0, 0.01))]
+        winner, data, report = await race_price_sources("BTC", sources, 1000)
+
+        assert winner == "up"
+        assert report["down"]["status"] == "failed"
+
+        winner, data, _ = await race_price_sources(
+            "BTC", [("down", fake_fetcher(None, 0.0))], 0
+        )
+        assert winner is None and data is None
+
+    async def test_current_endpoint_reports_race(self):
+        from odin.api.routes import data as data_routes
+
+        sources = [("kraken", fake_fetcher(0, 0.0)), ("coinbase", fake_fetcher(50000.0, 0.0))]
+        with patch.object(data_routes, "CURRENT_PRICE_SOURCES", sources):
+            response = await data_routes.get_current_price(symbol="BTC", prefer_within_ms=10)
+
+        assert response["source"]["winner"] == "coinbase"
+        assert "(limited data)" in response["message"]
+        assert response["data"]["high_24h"] == 51000.0
+        assert set(response["source"]["sources"]) == {"kraken", "coinbase"}
+
+
+class TestStrategyRequestOptions:
+    """Limits on options that size strategy analysis work."""
+
+    def test_limited_options_are_clamped(self):
+        from odin.api.routes.strategies import (
+            OPTIMIZER_LIMITS,
+            OPTIMIZER_OPTIONS,
+            bounded_options,
+        )
+
+        options = bounded_options(
+            {"workers": 64, "n_trials": 10**6, "method": "random", "debug": True},
+            OPTIMIZER_OPTIONS,
+            OPTIMIZER_LIMITS,
+        )
+        assert options == {"workers": 8, "n_trials": 500, "method": "random"}
+        assert bounded_options({"workers": 0}, OPTIMIZER_OPTIONS, OPTIMIZER_LIMITS) == {
+            "workers": 1
+        }
+        with pytest.raises(ValueError):
+            bounded_options({"workers": None}, OPTIMIZER_OPTIONS, OPTIMIZER_LIMITS)
+
+    def test_robustness_paths_are_clamped(self):
+        from odin.api.routes.strategies import (
+            ROBUSTNESS_LIMITS,
+            ROBUSTNESS_OPTIONS,
+            bounded_options,
+        )
+
+        options = bounded_options(
+            {"paths": 10**9, "workers": 32, "confidence": 0.9},
+            ROBUSTNESS_OPTIONS,
+            ROBUSTNESS_LIMITS,
+        )
+        assert options == {"paths": 100_000, "workers": 8, "confidence": 0.9}
+
+
 class TestWebSocketEndpoints:
     """Test WebSocket endpoints if available."""
     
@@ -0,0 +1,132 @@
+"""
+Price archive tests for Odin Trading Bot.
+Covers the columnar memory-mapped OHLCV store and its importers.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from odin.core.database import DatabaseManager
+from odin.data import archive as archive_module
+from odin.data.archive import (
+    PriceArchive,
+    import_ohlcv_table,
+    import_price_csv,
+    import_price_table,
+)
+
+# 2024-01-01 00:00:00 UTC
+T0 = 1704067200
+
+
+def hourly(n, start=0):
+    index = pd.to_datetime(T0 + 3600 * np.arange(start, start + n), unit="s")
+    values = np.arange(start, start + n, dtype=float)
+    return pd.DataFrame(
+        {
+            "open": values,
+            "high": values + 1,
+            "low": values - 1,
+            "close": values + 0.5,
+            "volume": values * 10,
+        },
+        index=index,
+    )
+
+
+@pytest.fixture(autouse=True)
+def small_capacity(monkeypatch):
+    monkeypatch.setattr(archive_module, "INITIAL_CAPACITY", 8)
+
+
+class TestPriceArchive:
+    """Appending and reading ranges."""
+
+    def test_append_grows_and_persists(self, tmp_path):
+        archive = PriceArchive("btc", "1h", tmp_path)
+        assert archive.append_frame(hourly(5)) == 5
+        assert archive.append_frame(hourly(20, start=5)) == 20
+        assert archive.capacity >= 25
+
+        reopened = PriceArchive("BTC", "1h", tmp_path)
+        assert len(reopened) == 25
+        assert reopened.start == T0
+        assert reopened.end == T0 + 24 * 3600
+        pd.testing.assert_frame_equal(
+            reopened.frame(), pd.concat([hourly(5), hourly(20, start=5)]),
+            check_freq=False, check_index_type=False,
+        )
+
+    def test_range_is_zero_copy_view(self, tmp_path):
+        archive = PriceArchive("BTC", "1h", tmp_path)
+        archive.append_frame(hourly(30))
+
+        arrays = archive.arrays(start=T0 + 3 * 3600, end=T0 + 6 * 3600)
+        assert list(arrays["timestamp"]) == [T0 + h * 3600 for h in (3, 4, 5)]
+        assert isinstance(arrays["close"].base, np.memmap)
+        assert not arrays["close"].flags.writeable
+
+        frame = archive.frame(start=T0 + 3 * 3600, end=T0 + 6 * 3600)
+        assert np.shares_memory(frame["close"].to_numpy(), archive._column("close"))
+        assert list(frame["close"]) == [3.5, 4.5, 5.5]
+
+    def test_append_skips_existing_rows(self, tmp_path):
+        archive = PriceArchive("BTC", "1h", tmp_path)
+        archive.append_frame(hourly(10))
+        assert archive.append_frame(hourly(15)) == 5
+        assert len(archive) == 15
+
+    def test_rejects_unsorted_timestamps(self, tmp_path):
+        archive = PriceArchive("BTC", "1h", tmp_path)
+        with pytest.raises(ValueError):
+            archive.append_frame(hourly(5).iloc[::-1])
+
+    def test_refresh_sees_other_writer(self, tmp_path):
+        reader = PriceArchive("BTC", "1h", tmp_path)
+        writer = PriceArchive("BTC", "1h", tmp_path)
+        writer.append_frame(hourly(20))
+        assert len(reader) == 0
+        reader.refresh()
+        assert reader.frame()["close"].iloc[-1] == 19.5
+
+
+class TestImporters:
+    """Imports from the CSV export and SQLite tables."""
+
+    def test_import_csv(self, tmp_path):
+        csv = tmp_path / "history.csv"
+        csv.write_text(
+            "\ufeffStart,End,Open,High,Low,Close,Volume,Market Cap\n"
+            "2024-01-02,2024-01-03,2,3,1,2.5,20,200\n"
+            "2024-01-01,2024-01-02,1,2,0.5,1.5,10,100\n"
+        )
+        assert import_price_csv(csv, "BTC", "1d", tmp_path / "archive") == 2
+
+        frame = PriceArchive("BTC", "1d", tmp_path / "archive").frame()
+        assert list(frame.index.strftime("%Y-%m-%d")) == ["2024-01-01", "2024-01-02"]
+        assert list(frame["close"]) == [1.5, 2.5]
+
+    def test_import_sqlite_tables(self, tmp_path):
+        db_path = tmp_path / "prices.db"
+        db = DatabaseManager(str(db_path))
+        db.add_ohlcv_bulk(
+            {"symbol": "BTC", "timeframe": "1h", "timestamp": T0 + 3600 * i,
+             "open": i, "high": i + 1, "low": i - 1, "close": i, "volume": 1.0}
+            for i in range(12)
+        )
+        db.add_price_data_bulk(
+            {"timestamp": pd.Timestamp(T0 + 60 * i, unit="s"), "price": 100.0 + i,
+             "volume": 5.0}
+            for i in range(3)
+        )
+        root = tmp_path / "archive"
+
+        assert import_ohlcv_table(db_path, "BTC", "1h", root, chunk_size=5) == 12
+        assert import_ohlcv_table(db_path, "BTC", "1h", root) == 0
+        assert PriceArchive("BTC", "1h", root).end == T0 + 11 * 3600
+
+        assert import_price_table(db_path, "BTC", "raw", root) == 3
+        raw = PriceArchive("BTC", "raw", root).arrays()
+        assert list(raw["timestamp"]) == [T0, T0 + 60, T0 + 120]
+        assert list(raw["high"]) == [100.0, 101.0, 102.0]
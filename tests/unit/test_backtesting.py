@@ -0,0 +1,127 @@
+"""
+Backtesting tests for Odin Trading Bot.
+Covers the bar-by-bar and vectorized backtest engines.
+"""
+
+import numpy as np
+import pytest
+
+from odin.strategies.bollinger_bands import BollingerBandsStrategy
+from odin.strategies.macd import MACDStrategy
+from odin.strategies.moving_average import MovingAverageStrategy
+from odin.strategies.rsi import RSIStrategy
+from odin.strategies.swing_trading import SwingTradingStrategy
+
+
+STRATEGY_FACTORIES = [
+    pytest.param(lambda: MovingAverageStrategy(short_window=5, long_window=20), id="ma"),
+    pytest.param(lambda: RSIStrategy(), id="rsi"),
+    pytest.param(lambda: MACDStrategy(), id="macd"),
+    pytest.param(lambda: BollingerBandsStrategy(), id="bb"),
+    pytest.param(lambda: BollingerBandsStrategy(breakout_mode=True), id="bb-breakout"),
+    pytest.param(lambda: SwingTradingStrategy(), id="swing"),
+]
+
+
+class TestVectorizedBacktest:
+    """Vectorized backtest must reproduce the bar loop."""
+
+    @pytest.mark.parametrize("factory", STRATEGY_FACTORIES)
+    def test_trades_match_bar_loop(self, factory, make_ohlcv):
+        """Trades, signals and equity match the bar-by-bar backtest."""
+        data = make_ohlcv()
+
+        loop_result = factory().backtest(data.copy())
+        vector_result = factory().backtest(data.copy(), vectorized=True)
+
+        loop_trades = [(t["type"], t["timestamp"], t["price"]) for t in loop_result.trades]
+        vector_trades = [
+            (t["type"], t["timestamp"], t["price"]) for t in vector_result.trades
+        ]
+        assert vector_trades == loop_trades
+
+        for loop_trade, vector_trade in zip(loop_result.trades, vector_result.trades):
+            assert vector_trade["amount"] == pytest.approx(loop_trade["amount"])
+            assert vector_trade["value"] == pytest.approx(loop_trade["value"])
+
+        assert [s.signal for s in vector_result.signals] == [
+            s.signal for s in loop_result.signals
+        ]
+        np.testing.assert_allclose(
+            vector_result.equity_curve.to_numpy(),
+            loop_result.equity_curve.to_numpy(),
+            rtol=1e-9,
+        )
+        assert vector_result.final_capital == pytest.approx(loop_result.final_capital)
+        print(f"✅ {len(vector_trades)} trades match bar loop")
+
+    def test_stateful_strategy_state_matches(self, make_ohlcv):
+        """RSI and MACD crossover state ends where the bar loop leaves it."""
+        data = make_ohlcv(seed=3)
+
+        for factory in (RSIStrategy, MACDStrategy):
+            loop_strategy, vector_strategy = factory(), factory()
+            loop_strategy.backtest(data.copy())
+            vector_strategy.backtest(data.copy(), vectorized=True)
+
+            assert getattr(vector_strategy, "previous_rsi_state", None) == getattr(
+                loop_strategy, "previous_rsi_state", None
+            )
+            assert getattr(
+                vector_strategy, "previous_macd_above_signal", None
+            ) == getattr(loop_strategy, "previous_macd_above_signal", None)
+
+    def test_short_data_keeps_initial_capital(self, make_ohlcv):
+        """Fewer bars than the warmup leave equity at the initial capital."""
+        data = make_ohlcv(periods=15)
+        result = MovingAverageStrategy().backtest(data, vectorized=True)
+
+        assert result.trades == []
+        assert result.signals == []
+        assert (result.equity_curve == 10000).all()
+        assert result.performance.total_return == 0.0
+
+
+class TestExtendBacktest:
+    """Resuming a backtest over appended bars."""
+
+    @pytest.mark.parametrize("factory", STRATEGY_FACTORIES)
+    @pytest.mark.parametrize("bars", [10, 150, 333])
+    def test_extend_matches_full_run(self, factory, bars, make_ohlcv):
+        """Extending a prefix run reproduces the full vectorized backtest."""
+        data = make_ohlcv(periods=500, seed=2)
+
+        full = factory().backtest(data.copy(), vectorized=True)
+        prefix = factory().backtest(data.iloc[:bars].copy(), vectorized=True)
+        extended = factory().extend_backtest(data.copy(), prefix)
+
+        np.testing.assert_allclose(
+            extended.equity_curve.to_numpy(), full.equity_curve.to_numpy(), rtol=1e-9
+        )
+        assert [(t["type"], t["timestamp"]) for t in extended.trades] == [
+            (t["type"], t["timestamp"]) for t in full.trades
+        ]
+        assert [s.signal for s in extended.signals] == [s.signal for s in full.signals]
+        assert extended.state.bars == len(data)
+        assert extended.state.cash == pytest.approx(full.state.cash)
+        assert extended.state.position == pytest.approx(full.state.position)
+        assert extended.performance.total_return == pytest.approx(
+            full.performance.total_return
+        )
+
+    def test_loop_and_vectorized_states_agree(self, make_ohlcv):
+        """Both engines leave the same cash and position."""
+        data = make_ohlcv(seed=9)
+        loop = RSIStrategy().backtest(data.copy())
+        vector = RSIStrategy().backtest(data.copy(), vectorized=True)
+
+        assert loop.state.bars == vector.state.bars == len(data)
+        assert loop.state.cash == pytest.approx(vector.state.cash)
+        assert loop.state.position == pytest.approx(vector.state.position)
+
+    def test_requires_state(self, make_ohlcv):
+        data = make_ohlcv()
+        result = MovingAverageStrategy().backtest(data.copy(), vectorized=True)
+        result.state = None
+        with pytest.raises(ValueError):
+            MovingAverageStrategy().extend_backtest(data, result)
@@ -0,0 +1,95 @@
+"""
+Batch backtest tests for Odin Trading Bot.
+Covers running a strategy pool on one shared window, in and out of process.
+"""
+
+import pytest
+
+from odin.core.indicator_cache import IndicatorCache
+from odin.strategies.batch import PHASES, BatchBacktester
+from odin.strategies.bollinger_bands import BollingerBandsStrategy
+from odin.strategies.macd import MACDStrategy
+from odin.strategies.moving_average import MovingAverageStrategy
+from odin.strategies.rsi import RSIStrategy
+
+
+def strategy_pool():
+    return {
+        "ma": MovingAverageStrategy(short_window=5, long_window=20),
+        "rsi": RSIStrategy(),
+        "bb": BollingerBandsStrategy(),
+        "macd": MACDStrategy(),
+    }
+
+
+class TestBatchBacktester:
+    """Shared-window batch backtests."""
+
+    def test_matches_individual_backtests(self, make_ohlcv):
+        data = make_ohlcv()
+        result = BatchBacktester(strategy_pool()).run(data)
+
+        for run in result.runs:
+            expected = strategy_pool()[run.name].backtest(data.copy(), vectorized=True)
+            assert run.error is None
+            assert run.final_capital == pytest.approx(expected.final_capital)
+            assert run.performance["total_return"] == pytest.approx(
+                expected.performance.total_return
+            )
+            assert run.performance["total_trades"] == expected.performance.total_trades
+
+    def test_leaderboard_and_timings(self, make_ohlcv):
+        calls = []
+
+        def load():
+            calls.append(1)
+            return make_ohlcv()
+
+        result = BatchBacktester(strategy_pool(), rank_by="sharpe_ratio").run(load)
+
+        assert calls == [1]
+        assert set(result.timings) == set(PHASES)
+        assert all(seconds >= 0 for seconds in result.timings.values())
+        sharpes = [entry["sharpe_ratio"] for entry in result.leaderboard]
+        assert sharpes == sorted(sharpes, reverse=True)
+        assert [entry["rank"] for entry in result.leaderboard] == [1, 2, 3, 4]
+        assert result.to_dict()["bars"] == 400
+
+    def test_indicators_shared_across_pool(self, monkeypatch, make_ohlcv):
+        cache = IndicatorCache()
+        monkeypatch.setattr(
+            "odin.core.indicator_cache._indicator_cache", cache, raising=False
+        )
+        BatchBacktester(
+            {
+                "rsi": RSIStrategy(period=20),
+                "bb": BollingerBandsStrategy(period=20),
+            }
+        ).run(make_ohlcv())
+        assert cache.hits > 0
+
+    def test_process_pool_matches_local(self, make_ohlcv):
+        data = make_ohlcv(seed=5)
+        local = BatchBacktester(strategy_pool()).run(data)
+        pooled = BatchBacktester(strategy_pool(), workers=2).run(data)
+
+        assert pooled.workers == 2
+        for local_run, pooled_run in zip(local.runs, pooled.runs):
+            assert pooled_run.name == local_run.name
+            assert pooled_run.performance["total_return"] == pytest.approx(
+                local_run.performance["total_return"]
+            )
+
+    def test_failed_strategy_reported(self, make_ohlcv):
+        pool = strategy_pool()
+        pool["broken"] = MovingAverageStrategy(short_window=5, long_window=20)
+        pool["broken"].calculate_indicators = None
+        result = BatchBacktester(pool).run(make_ohlcv())
+
+        broken = next(run for run in result.runs if run.name == "broken")
+        assert broken.error
+        assert len(result.leaderboard) == 4
+
+    def test_rejects_empty_data(self, make_ohlcv):
+        with pytest.raises(ValueError):
+            BatchBacktester(strategy_pool()).run(make_ohlcv().iloc[:0])
@@ -0,0 +1,154 @@
+"""
+Consolidated BBO tests for Odin Trading Bot.
+Covers cross-venue best bid/offer merging, staleness and the best feed.
+"""
+
+import time
+
+from odin.data.bbo import ConsolidatedBBO
+from odin.data.exchange_streams import StreamData, StreamManager, StreamType
+
+
+def ticker(exchange, bid, ask, symbol="BTC"):
+    return StreamData(
+        exchange=exchange,
+        symbol=symbol,
+        stream_type=StreamType.TICKER,
+        timestamp=time.time(),
+        data={"price": (bid + ask) / 2, "bid": bid, "ask": ask},
+    )
+
+
+def depth(exchange, bid, ask, symbol="BTC"):
+    return StreamData(
+        exchange=exchange,
+        symbol=symbol,
+        stream_type=StreamType.DEPTH,
+        timestamp=time.time(),
+        data={"bids": [[bid, 1.0]], "asks": [[ask, 2.0]], "synced": True},
+    )
+
+
+class TestConsolidatedBBO:
+    """Merging quotes across venues."""
+
+    def test_best_across_venues(self):
+        bbo = ConsolidatedBBO("BTC")
+        bbo.update("binance", 100.0, 101.0, now=0.0)
+        bbo.update("kraken", 100.5, 101.5, 0.4, 0.6, now=0.0)
+
+        best = bbo.best(now=1.0)
+        assert best["bid"] == 100.5
+        assert best["bid_exchange"] == "kraken"
+        assert best["bid_size"] == 0.4
+        assert best["ask"] == 101.0
+        assert best["ask_exchange"] == "binance"
+        assert best["spread"] == 0.5
+        assert not best["crossed"]
+
+    def test_stale_venue_ignored(self):
+        bbo = ConsolidatedBBO("BTC", stale_after=5.0)
+        bbo.update("binance", 100.0, 101.0, now=0.0)
+        bbo.update("kraken", 100.5, 101.5, now=10.0)
+
+        best = bbo.best(now=11.0)
+        assert best["bid_exchange"] == "kraken"
+        assert best["ask"] == 101.5
+        venues = bbo.snapshot(now=11.0)["venues"]
+        assert venues["binance"]["stale"]
+        assert not venues["kraken"]["stale"]
+        assert bbo.best(now=100.0) is None
+
+    def test_changed_only_on_top_of_book(self):
+        bbo = ConsolidatedBBO("BTC")
+        assert bbo.update("binance", 100.0, 101.0, now=0.0)
+        # Worse quote elsewhere and size-only changes leave the top alone
+        assert not bbo.update("kraken", 99.0, 102.0, now=0.0)
+        assert not bbo.update("binance", 100.0, 101.0, 5.0, 5.0, now=0.1)
+        assert bbo.update("kraken", 100.2, 102.0, now=0.2)
+        # Binance going stale alone moves the best ask to Kraken
+        assert bbo.changed(now=5.15)
+        assert bbo.best(now=5.15)["ask"] == 102.0
+
+    def test_depth_preferred_over_ticker(self):
+        bbo = ConsolidatedBBO("BTC")
+        bbo.update("kraken", 100.0, 101.0, source="depth", now=0.0)
+        # A slower ticker arriving later does not replace the book top
+        bbo.update("kraken", 99.5, 101.5, source="ticker", now=0.5)
+        assert bbo.best(now=1.0)["bid"] == 100.0
+        assert bbo.snapshot(now=1.0)["venues"]["kraken"]["source"] == "depth"
+
+        # Once the depth stream goes quiet the ticker takes over
+        bbo.update("kraken", 99.8, 101.2, source="ticker", now=5.5)
+        assert bbo.best(now=6.0)["bid"] == 99.8
+
+    def test_par_currency_consolidated_and_flagged(self):
+        bbo = ConsolidatedBBO("BTC", currency="USD")
+        bbo.update("binance", 100.6, 100.7, now=0.0, currency="USDT")
+        bbo.update("kraken", 100.0, 101.0, now=0.0, currency="USD")
+
+        best = bbo.best(now=1.0)
+        assert best["bid_exchange"] == best["ask_exchange"] == "binance"
+        assert best["bid_currency"] == "USDT"
+        assert best["at_par"]
+        snapshot = bbo.snapshot(now=1.0)
+        assert snapshot["par_currencies"] == ["USDT"]
+        assert snapshot["venues"]["binance"]["consolidated"]
+
+    def test_strict_currency_excludes_other_quotes(self):
+        bbo = ConsolidatedBBO("BTC", currency="USD", par_currencies=())
+        bbo.update("binance", 100.6, 100.7, now=0.0, currency="USDT")
+        bbo.update("kraken", 100.0, 101.0, now=0.0, currency="USD")
+
+        best = bbo.best(now=1.0)
+        assert best["bid_exchange"] == best["ask_exchange"] == "kraken"
+        assert not best["at_par"]
+        venues = bbo.snapshot(now=1.0)["venues"]
+        assert venues["binance"]["currency"] == "USDT"
+        assert not venues["binance"]["consolidated"]
+
+
+class TestBestFeed:
+    """StreamManager consolidated feed."""
+
+    async def test_emits_on_change_only(self):
+        stream_mgr = StreamManager()
+        received = []
+        await stream_mgr.subscribe_best("btc", received.append)
+
+        stream_mgr._on_stream_data(ticker("coinbase", 100.0, 101.0))
+        stream_mgr._on_stream_data(depth("kraken", 99.0, 102.0))
+        stream_mgr._on_stream_data(depth("kraken", 100.5, 102.0))
+        stream_mgr._on_stream_data(ticker("coinbase", 100.0, 101.0))
+        # Binance quotes USDT pairs, ranked at par with the USD venues
+        stream_mgr._on_stream_data(depth("binance", 100.8, 100.9))
+
+        assert len(received) == 3
+        assert all(update.stream_type == StreamType.BBO for update in received)
+        best = received[-1].data["best"]
+        assert best["bid_exchange"] == best["ask_exchange"] == "binance"
+        assert best["at_par"]
+        assert set(received[-1].data["venues"]) == {"binance", "coinbase", "kraken"}
+        snapshot = stream_mgr.get_bbo("BTC")
+        assert snapshot["venues"]["binance"]["currency"] == "USDT"
+
+        await stream_mgr.unsubscribe_best("BTC", received.append)
+        stream_mgr._on_stream_data(ticker("coinbase", 100.95, 100.98))
+        assert len(received) == 3
+        stream_mgr._bbo_task.cancel()
+
+    async def test_usd_only_book(self):
+        stream_mgr = StreamManager(bbo_par_currencies=())
+        stream_mgr._on_stream_data(ticker("coinbase", 100.0, 101.0))
+        stream_mgr._on_stream_data(depth("binance", 100.8, 100.9))
+
+        snapshot = stream_mgr.get_bbo("BTC")
+        assert snapshot["best"]["bid_exchange"] == "coinbase"
+        assert not snapshot["venues"]["binance"]["consolidated"]
+
+    async def test_quotes_without_bid_ask_ignored(self):
+        stream_mgr = StreamManager()
+        stream_mgr._on_stream_data(
+            StreamData("binance", "BTC", StreamType.TICKER, time.time(), {"price": 1})
+        )
+        assert stream_mgr.get_bbo("BTC") is None
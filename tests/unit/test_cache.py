@@ -0,0 +1,333 @@
+"""
+Cache tests for Odin Trading Bot.
+Covers CacheManager and the cached decorator.
+"""
+
+import asyncio
+import socket
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from odin.utils import cache as cache_module
+from odin.utils.cache import CacheManager, cached
+from odin.utils.cache_backends import (
+    CacheBackend,
+    CacheServer,
+    SocketBackend,
+    _election_lock,
+    default_socket_address,
+)
+
+PROJECT_ROOT = Path(__file__).parents[2]
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Fresh global cache manager for each test."""
+    manager = CacheManager(default_ttl=60, max_size=100)
+    monkeypatch.setattr(cache_module, "_cache_manager", manager)
+    return manager
+
+
+class TestSingleFlight:
+    """Concurrent misses on one key share a single call."""
+
+    async def test_concurrent_misses_coalesce(self, cache):
+        calls = 0
+
+        @cached(ttl=60)
+        async def fetch(symbol):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"symbol": symbol, "price": 50000.0}
+
+        results = await asyncio.gather(*(fetch("BTC") for _ in range(50)))
+
+        assert calls == 1
+        assert all(result == {"symbol": "BTC", "price": 50000.0} for result in results)
+        assert cache.get_stats()["coalesced"] == 49
+        assert cache.get_stats()["inflight"] == 0
+
+        # Different arguments are separate keys
+        await fetch("ETH")
+        assert calls == 2
+        print("✅ 50 concurrent cold requests made 1 upstream call")
+
+    async def test_error_shared_and_not_cached(self, cache):
+        calls = 0
+
+        @cached(ttl=60)
+        async def broken():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(*(broken() for _ in range(5)), return_exceptions=True)
+        assert calls == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        with pytest.raises(RuntimeError):
+            await broken()
+        assert calls == 2
+
+    async def test_cancelled_caller_does_not_cancel_load(self, cache):
+        @cached(ttl=60)
+        async def slow():
+            await asyncio.sleep(0.05)
+            return 42
+
+        first = asyncio.create_task(slow())
+        second = asyncio.create_task(slow())
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == 42
+        assert first.cancelled()
+
+
+class TestStaleWhileRevalidate:
+    """Expired values served while one refresh runs."""
+
+    async def test_stale_value_served_during_refresh(self, cache):
+        prices = iter([100.0, 200.0])
+        calls = 0
+
+        @cached(ttl=1, stale_ttl=30)
+        async def price():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return next(prices)
+
+        assert await price() == 100.0
+
+        # Expire the entry but keep it inside the stale window
+        key = next(iter(cache.backend.entries))
+        cache.backend.entries[key].expires_at -= 5
+
+        stale = await asyncio.gather(*(price() for _ in range(10)))
+        assert stale == [100.0] * 10
+        assert cache.get_stats()["refreshes"] == 1
+
+        await asyncio.sleep(0.05)
+        assert await price() == 200.0
+        assert calls == 2
+        assert cache.get_stats()["stale_hits"] == 10
+
+    async def test_without_stale_ttl_expired_is_a_miss(self, cache):
+        await cache.set("key", "value", ttl=1)
+        cache.backend.entries["key"].expires_at -= 5
+        cache.backend.entries["key"].stale_until -= 5
+
+        assert await cache.get("key") is None
+        assert await cache.get_stale("key") == (None, False)
+        assert await cache.cleanup_expired() == 0
+
+
+class TestLRUCache:
+    """O(1) LRU eviction, byte limits and the expiry wheel."""
+
+    def test_incomplete_backend_cannot_be_created(self):
+        class GetOnly(CacheBackend):
+            async def get(self, key):
+                return None
+
+        with pytest.raises(TypeError):
+            GetOnly()
+
+    async def test_evicts_least_recently_used(self):
+        cache = CacheManager(max_size=3)
+        for key in ("a", "b", "c"):
+            await cache.set(key, key.upper())
+
+        # Touch "a" so "b" becomes the least recently used
+        assert await cache.get("a") == "A"
+        await cache.set("d", "D")
+
+        assert list(cache.backend.entries) == ["c", "a", "d"]
+        assert await cache.get("b") is None
+        assert cache.get_stats()["evictions"] == 1
+
+    async def test_byte_limit(self):
+        cache = CacheManager(max_size=100, max_bytes=100)
+        await cache.set("small", "x" * 10)
+        await cache.set("medium", "y" * 60)
+        await cache.set("other", "z" * 30)
+
+        backend = cache.backend
+        assert "small" not in backend.entries
+        assert backend.total_bytes <= 100
+
+        # A single value larger than the limit is not cached at all
+        await cache.set("huge", "h" * 500)
+        assert "huge" not in backend.entries
+
+        await cache.delete("medium")
+        assert backend.total_bytes == backend.entries["other"].size
+
+    async def test_expiry_wheel_visits_only_due_buckets(self):
+        cache = CacheManager(max_size=10_000, wheel_resolution=1.0)
+        for i in range(1000):
+            await cache.set(f"long-{i}", i, ttl=3600)
+        await cache.set("short", 1, ttl=1)
+        await cache.set("renewed", 1, ttl=1)
+        await cache.set("renewed", 2, ttl=3600)
+
+        assert await cache.cleanup_expired() == 0
+
+        # Pretend time passed; only the short entry's bucket comes due
+        backend = cache.backend
+        now = time.time() + 5
+        assert backend._expire_due(now) == 1
+        assert "short" not in backend.entries
+        assert backend.entries["renewed"].value == 2
+        assert len(backend.entries) == 1001
+        assert all(tick > backend._tick(now) for tick in backend._wheel)
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+class TestSocketBackend:
+    """Host-wide cache shared by worker processes over a Unix socket."""
+
+    @pytest.fixture
+    def address(self, tmp_path):
+        return str(tmp_path / "cache.sock")
+
+    async def test_workers_share_entries(self, address):
+        first = CacheManager(backend=SocketBackend(address))
+        second = CacheManager(backend=SocketBackend(address))
+        try:
+            await first.set("price:BTC", {"price": 50000.0}, ttl=60)
+
+            assert await second.get("price:BTC") == {"price": 50000.0}
+            assert first.backend.server is not None
+            assert second.backend.server is None
+
+            assert await second.delete("price:BTC")
+            assert await first.get("price:BTC") is None
+            assert await first.cleanup_expired() == 0
+            assert first.get_stats()["backend"] == "socket"
+        finally:
+            await second.close()
+            await first.close()
+
+    async def test_other_process_reads_cached_value(self, address):
+        manager = CacheManager(backend=SocketBackend(address))
+        try:
+            await manager.set("history:BTC", [1, 2, 3], ttl=60)
+
+            script = textwrap.dedent(
+                f"""
+                import asyncio
+                from odin.utils.cache import CacheManager
+                from odin.utils.cache_backends import SocketBackend
+
+                async def main():
+                    cache = CacheManager(backend=SocketBackend({address!r}, host_server=False))
+                    print(await cache.get("history:BTC"))
+                    await cache.set("from-worker", "hello", ttl=60)
+                    await cache.close()
+
+                asyncio.run(main())
+                """
+            )
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-c",
+                script,
+                cwd=str(PROJECT_ROOT),
+                stdout=asyncio.subprocess.PIPE,
+            )
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=30)
+
+            assert stdout.decode().strip().splitlines()[-1] == "[1, 2, 3]"
+            assert await manager.get("from-worker") == "hello"
+            print("✅ Second process read the shared cache")
+        finally:
+            await manager.close()
+
+    async def test_unreachable_server_is_a_miss(self, address):
+        manager = CacheManager(backend=SocketBackend(address, host_server=False))
+
+        await manager.set("key", "value")
+        assert await manager.get("key") is None
+        assert manager.get_stats()["backend_errors"] == 2
+
+    async def test_takes_over_stale_socket(self, address):
+        first = SocketBackend(address)
+        manager = CacheManager(backend=first)
+        await manager.set("key", "value")
+        # Simulate the hosting worker dying without cleanup
+        first._disconnect()
+        first.server._server.close()
+        first.server = None
+
+        survivor = CacheManager(backend=SocketBackend(address))
+        try:
+            await survivor.set("key", "fresh")
+            assert survivor.backend.server is not None
+            assert await survivor.get("key") == "fresh"
+        finally:
+            await survivor.close()
+
+    async def test_lock_does_not_follow_symlinks(self, address, tmp_path):
+        target = tmp_path / "victim"
+        target.write_text("keep")
+        Path(f"{address}.lock").symlink_to(target)
+
+        with pytest.raises(OSError):
+            with _election_lock(address):
+                pass
+        assert target.read_text() == "keep"
+
+    def test_default_address_is_private(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+
+        directory = Path(default_socket_address()).parent
+        assert directory.stat().st_mode & 0o777 == 0o700
+
+        directory.chmod(0o755)
+        with pytest.raises(PermissionError):
+            default_socket_address()
+
+
+class TestTcpCacheServer:
+    """Cache server over TCP, guarded by a shared secret."""
+
+    @pytest.fixture
+    def address(self):
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            return f"tcp://127.0.0.1:{probe.getsockname()[1]}"
+
+    def test_requires_secret(self, address):
+        with pytest.raises(ValueError):
+            SocketBackend(address)
+        with pytest.raises(ValueError):
+            CacheServer(address)
+
+    async def test_rejects_wrong_secret(self, address):
+        host = CacheManager(backend=SocketBackend(address, secret="s3cret"))
+        intruder = CacheManager(
+            backend=SocketBackend(address, secret="guess", host_server=False)
+        )
+        try:
+            await host.set("key", {"value": 1})
+            assert await intruder.get("key") is None
+            assert intruder.get_stats()["backend_errors"] == 1
+
+            peer = CacheManager(
+                backend=SocketBackend(address, secret="s3cret", host_server=False)
+            )
+            assert await peer.get("key") == {"value": 1}
+            await peer.close()
+        finally:
+            await intruder.close()
+            await host.close()
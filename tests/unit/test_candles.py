@@ -0,0 +1,161 @@
+"""
+Candle aggregation tests for Odin Trading Bot.
+Covers building OHLCV bars from the live trade stream.
+"""
+
+import time
+
+import pytest
+
+from odin.api.routes.data import local_history
+from odin.core.database import DatabaseManager
+from odin.data import exchange_streams
+from odin.data.candles import CandleAggregator
+from odin.data.exchange_streams import StreamData, StreamManager, StreamType
+
+# 2024-01-01 00:00:00 UTC
+T0 = 1704067200
+
+
+@pytest.fixture
+def candles():
+    return CandleAggregator(timeframes=["1m", "5m"], grace=2.0)
+
+
+class TestCandleAggregator:
+    """Trades folded into bars per timeframe."""
+
+    def test_builds_ohlcv(self, candles):
+        trades = [(1, 100, 1), (10, 105, 2), (20, 95, 1), (59, 101, 3)]
+        for offset, price, quantity in trades:
+            candles.add_trade("BTC", price, quantity, T0 + offset)
+
+        bar = candles.partial_bar("BTC", "1m")
+        assert bar.to_dict() == {
+            "timestamp": T0,
+            "price": 101,
+            "open": 100,
+            "high": 105,
+            "low": 95,
+            "close": 101,
+            "volume": 7,
+            "trades": 4,
+        }
+        assert candles.partial_bar("BTC", "5m").volume == 7
+
+    def test_bar_closes_after_grace(self, candles):
+        candles.add_trade("BTC", 100, 1, T0 + 30)
+        candles.add_trade("BTC", 102, 1, T0 + 61)
+        # Still inside the grace window: the first bar stays open
+        assert candles.get_bars("BTC", "1m", include_partial=False) == []
+
+        candles.add_trade("BTC", 103, 1, T0 + 62)
+        closed = candles.get_bars("BTC", "1m", include_partial=False)
+        assert [bar["timestamp"] for bar in closed] == [T0]
+        assert len(candles.get_bars("BTC", "1m")) == 2
+
+    def test_late_trade_within_grace(self, candles):
+        candles.add_trade("BTC", 100, 1, T0 + 30)
+        candles.add_trade("BTC", 110, 1, T0 + 61)
+        # Arrives after a newer trade but still belongs to the first minute
+        candles.add_trade("BTC", 90, 1, T0 + 59.5)
+        candles.add_trade("BTC", 111, 1, T0 + 70)
+
+        first = candles.get_bars("BTC", "1m")[0]
+        assert first["low"] == 90
+        assert first["close"] == 90
+        assert first["volume"] == 2
+        assert candles.stats["late_trades"] == 1
+
+        # Too late: the first minute has closed
+        candles.add_trade("BTC", 50, 1, T0 + 40)
+        assert candles.get_bars("BTC", "1m")[0]["low"] == 90
+        assert candles.stats["dropped_trades"] == 1
+
+    def test_advance_closes_idle_bars(self, candles):
+        candles.add_trade("BTC", 100, 1, T0 + 30)
+        candles.advance(now=T0 + 63)
+        assert len(candles.get_bars("BTC", "1m", include_partial=False)) == 1
+        assert candles.partial_bar("BTC", "1m") is None
+        assert candles.partial_bar("BTC", "5m") is not None
+
+    def test_seed_keeps_live_bars(self, candles):
+        candles.add_trade("BTC", 100, 1, T0 + 130)
+        candles.seed("BTC", "1m", [
+            {"timestamp": T0, "open": 1, "high": 2, "low": 1, "price": 2},
+            {"timestamp": T0 + 60, "open": 2, "high": 3, "low": 2, "price": 3},
+            {"timestamp": T0 + 120, "price": 9},
+        ])
+
+        bars = candles.get_bars("BTC", "1m")
+        assert [bar["close"] for bar in bars] == [2, 3, 100]
+
+    def test_closed_bars_flushed_in_bulk(self, candles, tmp_path):
+        db = DatabaseManager(str(tmp_path / "bars.db"))
+        candles.db = db
+        for minute in range(10):
+            candles.add_trade("BTC", 100 + minute, 1, T0 + minute * 60 + 1)
+        candles.advance(now=T0 + 3600)
+
+        assert candles.flush() == 12  # ten 1m bars and two 5m bars
+        assert candles.unflushed == []
+        assert db.get_database_stats()["ohlcv_bars_count"] == 12
+
+        # A restarted aggregator reads older bars back from the database
+        restarted = CandleAggregator(timeframes=["1m", "5m"], db=db)
+        bars = restarted.get_bars("BTC", "5m")
+        assert [bar["close"] for bar in bars] == [104, 109]
+        assert restarted.get_bars("BTC", "1m", start=T0 + 480)[0]["open"] == 108
+        db.close()
+
+    def test_stream_manager_aggregates_trades(self):
+        stream_mgr = StreamManager()
+        for offset, price in [(0, 100.0), (30, 101.0)]:
+            stream_mgr._on_stream_data(StreamData(
+                exchange="binance",
+                symbol="BTC",
+                stream_type=StreamType.TRADE,
+                timestamp=T0 + offset,
+                data={
+                    "price": price,
+                    "quantity": 0.5,
+                    "trade_time": (T0 + offset) * 1000,
+                },
+            ))
+
+        # A second venue's market stays out of the bars
+        stream_mgr._on_stream_data(StreamData(
+            exchange="kraken",
+            symbol="BTC",
+            stream_type=StreamType.TRADE,
+            timestamp=T0 + 40,
+            data={"price": 150.0, "quantity": 9.0, "trade_time": T0 + 40},
+        ))
+
+        bar = stream_mgr.candles.partial_bar("BTC", "1m")
+        assert bar.open_time == T0
+        assert bar.close == 101.0
+        assert bar.high == 101.0
+        assert bar.volume == 1.0
+        assert stream_mgr.candles.stats["other_venue_trades"] == 1
+
+    def test_history_served_from_local_bars(self, monkeypatch):
+        stream_mgr = StreamManager()
+        monkeypatch.setattr(exchange_streams, "_stream_manager", stream_mgr)
+        assert local_history("BTC", 24) is None
+
+        hour = int(time.time() // 3600 * 3600)
+        history = [
+            {"timestamp": hour - i * 3600, "price": 50000.0 + i} for i in range(1, 26)
+        ]
+        stream_mgr.candles.seed("BTC", "1h", history)
+        # Closed bars up to the last hour, but nothing streamed since
+        assert local_history("BTC", 24) is None
+
+        stream_mgr.candles.add_trade("BTC", 49000.0, 1.0, time.time())
+
+        data = local_history("BTC", 24)
+        assert data["source"] == "local"
+        assert data["interval_minutes"] == 60
+        assert data["history"][-1]["price"] == 49000.0
+        assert len(data["history"]) == 24
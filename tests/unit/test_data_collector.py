@@ -8,6 +8,10 @@ from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime, timezone
 import asyncio
 
+from odin.core.data_collector import DataCollector, DataSource
+from odin.core.exceptions import MarketDataException
+from odin.core.models import PriceData
+
 
 def module_available(module_name):
     """Check if a module is available for import."""
@@ -464,6 +468,111 @@ class TestDataValidation:
 
 
 # Utility functions
+class FakeSource(DataSource):
+    """Local data source returning a fixed price after an injected delay."""
+
+    def __init__(self, name, delay, price=50000.0, priority=1, fail=False):
+        super().__init__(name, priority=priority)
+        self.delay = delay
+        self.price = price
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = False
+
+    async def get_price(self):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.name} unavailable")
+        return PriceData(timestamp=datetime.now(timezone.utc), price=self.price)
+
+
+def make_collector(sources, hedge_delay=0.05):
+    collector = DataCollector(database=Mock(), hedge_delay=hedge_delay)
+    collector.data_sources = sources
+    return collector
+
+
+class TestHedgedFetch:
+    """Hedged price fetching across fake sources with injected delays."""
+
+    async def test_hedge_beats_slow_primary(self):
+        slow = FakeSource("slow", delay=1.0, price=50000.0)
+        fast = FakeSource("fast", delay=0.01, price=50100.0)
+        collector = make_collector([slow, fast])
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        price = await collector._fetch_hedged(collector._ordered_sources())
+
+        assert price.price == 50100.0
+        assert collector.last_source == "fast"
+        assert loop.time() - started < 0.5
+        assert slow.cancelled
+        print("✅ Hedged fetch returned the backup source without waiting")
+
+    async def test_fast_primary_never_hedges(self):
+        primary = FakeSource("primary", delay=0.0)
+        backup = FakeSource("backup", delay=0.0)
+        collector = make_collector([primary, backup], hedge_delay=0.2)
+
+        price = await collector._fetch_hedged(collector._ordered_sources())
+
+        assert price is not None
+        assert collector.last_source == "primary"
+        assert backup.calls == 0
+
+    async def test_failure_launches_next_immediately(self):
+        broken = FakeSource("broken", delay=0.0, fail=True)
+        backup = FakeSource("backup", delay=0.0, price=50200.0)
+        collector = make_collector([broken, backup], hedge_delay=5.0)
+
+        price = await asyncio.wait_for(
+            collector._fetch_hedged(collector._ordered_sources()), timeout=1.0
+        )
+        assert price.price == 50200.0
+
+    async def test_all_sources_failing_raises(self):
+        collector = make_collector(
+            [FakeSource("a", delay=0.0, fail=True), FakeSource("b", delay=0.0, fail=True)]
+        )
+        with pytest.raises(MarketDataException):
+            await collector._collect_data()
+
+    async def test_latency_reorders_sources(self):
+        sluggish = FakeSource("sluggish", delay=0.06)
+        quick = FakeSource("quick", delay=0.0)
+        collector = make_collector([sluggish, quick], hedge_delay=None)
+        collector.LATENCY_MIN_SAMPLES = 2
+
+        for _ in range(2):
+            sluggish.latency.record(0.3)
+            quick.latency.record(0.01)
+
+        assert [s.name for s in collector._ordered_sources()] == ["quick", "sluggish"]
+        # Priority still outranks latency
+        sluggish.priority = 0
+        assert collector._ordered_sources()[0].name == "sluggish"
+
+    async def test_collect_data_records_latency_and_notifies(self):
+        source = FakeSource("only", delay=0.0)
+        collector = make_collector([source])
+        collector._indicators_seeded = True
+        received = []
+        collector.add_callback(received.append)
+
+        await collector._collect_data()
+
+        assert received and received[0].price == 50000.0
+        assert source.latency.count == 1
+        status = collector.get_source_status()["only"]["latency"]
+        assert status["count"] == 1 and status["p50_ms"] == 25.0
+
+
 def create_mock_price_data():
     """Create mock price data for testing."""
     try:
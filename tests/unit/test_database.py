@@ -0,0 +1,140 @@
+"""
+Database tests for Odin Trading Bot.
+Covers the pooled SQLite DatabaseManager and bulk price ingestion.
+"""
+
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from odin.core.database import DatabaseManager, load_price_csv
+from odin.core.repository import RepositoryManager
+
+HISTORY_CSV = Path(__file__).parents[2] / "scripts" / "bitcoin_20080225_20250525.csv"
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "test.db"), pool_size=2)
+    yield manager
+    manager.close()
+
+
+class TestPooledDatabase:
+    """Persistent connection pool with WAL journaling."""
+
+    def test_connections_are_configured(self, db):
+        with db.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            # NORMAL == 1
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -16384
+
+    def test_connections_are_reused(self, db):
+        start = datetime(2024, 1, 1)
+        for i in range(20):
+            assert db.add_price_data(start + timedelta(minutes=i), 50000.0 + i, 1.0)
+
+        assert db.get_current_price()["price"] == 50019.0
+        assert len(db.get_recent_prices(limit=5)) == 5
+        assert db.pool.stats["open"] == 1
+
+    def test_reader_not_blocked_by_open_write(self, db):
+        db.add_price_data(datetime(2024, 1, 1), 50000.0)
+
+        with db.connection() as writer:
+            writer.execute(
+                "INSERT INTO bitcoin_prices (timestamp, price) VALUES (?, ?)",
+                (datetime(2024, 1, 2), 51000.0),
+            )
+            # Uncommitted write holds the lock; WAL readers see the last commit
+            result = {}
+            reader = threading.Thread(
+                target=lambda: result.update(price=db.get_current_price())
+            )
+            reader.start()
+            reader.join(timeout=5)
+            assert result["price"]["price"] == 50000.0
+
+        assert db.get_current_price()["price"] == 51000.0
+        print("✅ Readers proceed during an open write transaction")
+
+    def test_failed_write_rolls_back(self, db):
+        with pytest.raises(Exception):
+            with db.connection() as conn:
+                conn.execute(
+                    "INSERT INTO bitcoin_prices (timestamp, price) VALUES (?, ?)",
+                    (datetime(2024, 1, 1), 50000.0),
+                )
+                conn.execute(
+                    "INSERT INTO bitcoin_prices (timestamp, price) VALUES (?, ?)",
+                    (datetime(2024, 1, 2), -1.0),
+                )
+
+        assert db.get_current_price() is None
+
+    def test_close_reopens_lazily(self, db):
+        db.add_price_data(datetime(2024, 1, 1), 50000.0)
+        db.close()
+        assert db.pool.stats["open"] == 0
+        assert db.get_current_price()["price"] == 50000.0
+
+
+class TestBulkIngestion:
+    """Chunked executemany price loading."""
+
+    def test_bulk_insert_dataframe_and_tuples(self, db):
+        index = pd.date_range("2024-01-01", periods=25, freq="h")
+        frame = pd.DataFrame({"close": range(1, 26), "volume": 2.0}, index=index)
+
+        report = db.add_price_data_bulk(frame, chunk_size=10)
+        assert report["rows"] == 25
+        assert report["rows_per_sec"] > 0
+
+        # Tuples upsert on the unique timestamp
+        db.add_price_data_bulk([(index[-1].to_pydatetime(), 99.0)])
+        recent = db.get_recent_prices(limit=2)
+        assert [row["price"] for row in recent] == [24.0, 99.0]
+        assert recent[0]["volume"] == 2.0
+        assert db.get_database_stats()["bitcoin_prices_count"] == 25
+
+    def test_bulk_insert_reports_failure(self, db):
+        index = pd.date_range("2024-01-01", periods=5, freq="h")
+        good = [(ts.to_pydatetime(), 100.0) for ts in index]
+
+        report = db.add_price_data_bulk(good + [(object(), 1.0)], chunk_size=5)
+        assert report["success"] is False
+        assert report["rows"] == 5
+        assert "error" in report
+
+    @pytest.mark.skipif(not HISTORY_CSV.exists(), reason="history CSV not present")
+    def test_load_history_csv(self, db):
+        history = load_price_csv(HISTORY_CSV)
+        assert history["timestamp"].is_monotonic_increasing
+
+        report = db.add_price_data_bulk(history)
+        assert report["rows"] == len(history)
+        assert db.get_current_price()["price"] == history["close"].iloc[-1]
+        print(f"✅ Loaded {report['rows']} rows at {report['rows_per_sec']:,.0f}/sec")
+
+    async def test_repository_bulk_save(self, tmp_path):
+        manager = RepositoryManager(str(tmp_path / "repo.db"))
+        await manager.initialize()
+        start = datetime(2024, 1, 1)
+        records = [
+            {"timestamp": start + timedelta(minutes=i), "price": 100.0 + i}
+            for i in range(30)
+        ]
+
+        result = await manager.price_repo.save_prices(records, chunk_size=7)
+        assert result.success
+        assert result.data["rows"] == 30
+
+        latest = await manager.price_repo.get_latest_price()
+        assert latest["price"] == 129.0
+        assert latest["source"] == "unknown"
+        assert (await manager.get_stats())["price_records"] == 30
+        await manager.close()
@@ -0,0 +1,106 @@
+"""
+Indicator cache tests for Odin Trading Bot.
+Covers content fingerprints, reuse across strategies and memory-bounded LRU.
+"""
+
+import pandas as pd
+import pytest
+
+from odin.core.indicator_cache import IndicatorCache
+from odin.strategies.moving_average import MovingAverageStrategy
+from odin.strategies.rsi import RSIStrategy
+
+
+class TestFingerprint:
+    """Content-based data keys."""
+
+    def test_same_content_same_key(self, make_ohlcv):
+        df = make_ohlcv(periods=120)
+        other = df.copy()
+        other.index = range(len(other))
+        assert IndicatorCache.fingerprint(df["close"]) == IndicatorCache.fingerprint(
+            other["close"]
+        )
+
+    def test_changed_value_changes_key(self, make_ohlcv):
+        df = make_ohlcv(periods=120)
+        key = IndicatorCache.fingerprint(df["close"])
+        df.iloc[-1, df.columns.get_loc("close")] += 0.01
+        assert IndicatorCache.fingerprint(df["close"]) != key
+
+
+class TestIndicatorCache:
+    """Hits, misses and eviction."""
+
+    def test_rolling_reused(self, make_ohlcv):
+        cache = IndicatorCache()
+        df = make_ohlcv(periods=120)
+        first = cache.rolling(df["close"], 20)
+        second = cache.rolling(df["close"].copy(), 20)
+
+        pd.testing.assert_series_equal(
+            first, df["close"].rolling(20).mean(), check_names=False
+        )
+        pd.testing.assert_series_equal(first, second)
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_params_and_names_separate(self, make_ohlcv):
+        cache = IndicatorCache()
+        df = make_ohlcv(periods=120)
+        cache.rolling(df["close"], 20)
+        cache.rolling(df["close"], 10)
+        cache.rolling(df["close"], 20, "std")
+        assert cache.misses == 3
+        assert cache.hits == 0
+
+    def test_returned_series_writable(self, make_ohlcv):
+        cache = IndicatorCache()
+        df = make_ohlcv(periods=120)
+        result = cache.rolling(df["close"], 5)
+        result.iloc[-1] = -1.0
+        assert cache.rolling(df["close"], 5).iloc[-1] != -1.0
+
+    def test_lru_eviction_by_bytes(self, make_ohlcv):
+        series_bytes = 120 * 8
+        cache = IndicatorCache(max_bytes=2 * series_bytes)
+        df = make_ohlcv(periods=120)
+        cache.rolling(df["close"], 5)
+        cache.rolling(df["close"], 10)
+        cache.rolling(df["close"], 5)
+        cache.rolling(df["close"], 20)
+
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["bytes"] <= cache.max_bytes
+        cache.rolling(df["close"], 5)
+        assert cache.hits == 2
+
+    def test_unknown_rolling_stat(self, make_ohlcv):
+        with pytest.raises(ValueError):
+            IndicatorCache().rolling(make_ohlcv(periods=120)["close"], 5, "median")
+
+
+class TestStrategyIntegration:
+    """Strategies share cached columns."""
+
+    def test_strategies_share_close_stats(self, monkeypatch, make_ohlcv):
+        cache = IndicatorCache()
+        monkeypatch.setattr(
+            "odin.core.indicator_cache._indicator_cache", cache, raising=False
+        )
+        df = make_ohlcv(periods=120)
+
+        RSIStrategy(period=14).calculate_indicators(df)
+        misses = cache.misses
+        result = MovingAverageStrategy(
+            short_window=14, long_window=30
+        ).calculate_indicators(df)
+
+        assert cache.hits > 0
+        assert cache.misses < misses + 5
+        pd.testing.assert_series_equal(
+            result["volatility"],
+            df["close"].rolling(14).std(),
+            check_names=False,
+        )
@@ -0,0 +1,162 @@
+"""
+Technical indicator tests for Odin Trading Bot.
+Streaming indicators must agree with the batch calculations.
+"""
+
+import statistics
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from odin.core.data_collector import TechnicalIndicators
+from odin.core.database import load_price_csv
+from odin.core.indicators import (
+    StreamingBollingerBands,
+    StreamingEMA,
+    StreamingIndicator,
+    StreamingIndicators,
+    StreamingMACD,
+    StreamingRSI,
+    StreamingSMA,
+)
+
+HISTORY_CSV = Path(__file__).parents[2] / "scripts" / "bitcoin_20080225_20250525.csv"
+
+
+@pytest.fixture
+def prices():
+    """Random-walk price series around Bitcoin levels."""
+    rng = np.random.default_rng(42)
+    return list(50000 * np.exp(np.cumsum(rng.normal(0, 0.01, 300))))
+
+
+def stream(indicator, prices):
+    """Feed prices one at a time and collect the ready values."""
+    values = [indicator.update(price) for price in prices]
+    return [value for value in values if value is not None]
+
+
+class TestStreamingIndicators:
+    """Streaming indicators against TechnicalIndicators."""
+
+    def test_sma_matches_batch(self, prices):
+        assert stream(StreamingSMA(20), prices) == pytest.approx(
+            TechnicalIndicators.sma(prices, 20)
+        )
+
+    def test_ema_matches_batch(self, prices):
+        assert stream(StreamingEMA(12), prices) == pytest.approx(
+            TechnicalIndicators.ema(prices, 12)
+        )
+
+    def test_rsi_matches_batch(self, prices):
+        assert stream(StreamingRSI(14), prices) == pytest.approx(
+            TechnicalIndicators.rsi(prices, 14)
+        )
+
+    def test_macd_matches_batch(self, prices):
+        macd = StreamingMACD(12, 26, 9)
+        signals = []
+        for price in prices:
+            macd.update(price)
+            if macd.signal is not None:
+                signals.append(macd.signal)
+
+        batch = TechnicalIndicators.macd(prices, 12, 26, 9)
+        assert macd.value == pytest.approx(batch["macd"][-1])
+        assert signals == pytest.approx(batch["signal"])
+        assert macd.histogram == pytest.approx(batch["histogram"][-1])
+
+    def test_bollinger_matches_batch(self, prices):
+        bands = StreamingBollingerBands(20, 2)
+        upper = []
+        for price in prices:
+            if bands.update(price) is not None:
+                upper.append(bands.upper)
+
+        batch = TechnicalIndicators.bollinger_bands(prices, 20, 2)
+        assert upper == pytest.approx(batch["upper"])
+        assert bands.lower == pytest.approx(batch["lower"][-1])
+
+    def test_indicator_set_skips_seen_timestamps(self, prices):
+        indicators = StreamingIndicators()
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for i, price in enumerate(prices[:50]):
+            indicators.update(price, start + timedelta(minutes=i))
+
+        before = indicators.snapshot()
+        # Same tick delivered again (e.g. by a second consumer) is ignored
+        indicators.update(prices[49] * 2, start + timedelta(minutes=49))
+
+        assert indicators.count == 50
+        assert indicators.snapshot() == before
+        assert before["sma_20"] == pytest.approx(np.mean(prices[30:50]))
+        print("✅ Shared indicator set counts each tick once")
+
+    def test_seeded_rows_keep_timestamps(self, prices):
+        # Rows as returned by Database.get_recent_prices
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        rows = [
+            {"timestamp": (start + timedelta(minutes=i)).isoformat(), "price": price}
+            for i, price in enumerate(prices[:30])
+        ]
+        indicators = StreamingIndicators()
+        indicators.seed(rows)
+
+        # The newest stored tick arriving live is not counted twice
+        indicators.update(prices[29], start + timedelta(minutes=29))
+        assert indicators.count == 30
+
+    def test_base_class_is_abstract(self):
+        with pytest.raises(TypeError):
+            StreamingIndicator(5)
+
+
+class TestBatchIndicators:
+    """NumPy batch indicators."""
+
+    def test_sma_matrix_rows_match_single_period(self, prices):
+        periods = [5, 20, 50, 200]
+        matrix = TechnicalIndicators.sma_matrix(prices, periods)
+
+        assert matrix.shape == (len(periods), len(prices))
+        for row, period in zip(matrix, periods):
+            assert np.isnan(row[: period - 1]).all()
+            expected = [np.mean(prices[i - period + 1 : i + 1]) for i in range(period - 1, len(prices))]
+            assert row[period - 1 :] == pytest.approx(expected)
+
+    def test_rolling_std_matches_sample_std(self, prices):
+        std = TechnicalIndicators.rolling_std_matrix(prices, [20])[0]
+        expected = [np.std(prices[i - 19 : i + 1], ddof=1) for i in range(19, len(prices))]
+        assert std[19:] == pytest.approx(expected)
+
+    @pytest.mark.skipif(not HISTORY_CSV.exists(), reason="history CSV not present")
+    def test_rolling_std_on_full_history(self):
+        # Prices run from $0.05 to $110k: no window may lose precision
+        closes = load_price_csv(HISTORY_CSV)["close"].tolist()
+        std = TechnicalIndicators.rolling_std_matrix(closes, [20])[0]
+
+        expected = [
+            statistics.stdev(closes[i - 19 : i + 1]) for i in range(19, len(closes))
+        ]
+        assert std[19:] == pytest.approx(expected, rel=1e-9, abs=1e-12)
+
+    def test_all_indicators_single_call(self, prices):
+        indicators = TechnicalIndicators.all_indicators(prices)
+        latest = TechnicalIndicators.latest_values(indicators)
+
+        assert indicators["sma"].shape == (4, len(prices))
+        assert latest["sma_200"] == pytest.approx(np.mean(prices[-200:]))
+        assert latest["ema_12"] == pytest.approx(TechnicalIndicators.ema(prices, 12)[-1])
+        assert latest["rsi"] == pytest.approx(TechnicalIndicators.rsi(prices, 14)[-1])
+        assert latest["bb_upper"] > latest["bb_middle"] > latest["bb_lower"]
+
+    def test_short_series_warms_up(self):
+        indicators = TechnicalIndicators.all_indicators([50000.0, 50100.0, 50050.0])
+        latest = TechnicalIndicators.latest_values(indicators)
+
+        assert latest["sma_5"] is None
+        assert latest["rsi"] is None
+        assert TechnicalIndicators.sma([1.0, 2.0], 5) == []
@@ -0,0 +1,153 @@
+"""
+Optimization tests for Odin Trading Bot.
+Covers walk-forward splits, parameter search and the process-pool optimizer.
+"""
+
+import numpy as np
+import pytest
+
+from odin.strategies.moving_average import MovingAverageStrategy
+from odin.strategies.optimization import (
+    ParameterSpace,
+    WalkForwardOptimizer,
+    suggest_bayesian,
+    walk_forward_splits,
+    window_metrics,
+)
+from odin.strategies.shared_data import mapped_price_frame, write_price_memmap
+
+
+class TestWalkForwardSplits:
+    """Train/test window layout."""
+
+    def test_rolling(self):
+        splits = walk_forward_splits(1000, folds=3, train_fraction=0.7)
+        assert splits == [
+            ((0, 700), (700, 800)),
+            ((100, 800), (800, 900)),
+            ((200, 900), (900, 1000)),
+        ]
+
+    def test_anchored(self):
+        splits = walk_forward_splits(1000, folds=2, train_fraction=0.8, anchored=True)
+        assert splits == [((0, 800), (800, 900)), ((0, 900), (900, 1000))]
+
+    def test_too_little_data(self):
+        with pytest.raises(ValueError):
+            walk_forward_splits(5, folds=10)
+
+
+class TestParameterSearch:
+    """Parameter spaces and suggestions."""
+
+    def test_grid_keeps_integer_ranges_integral(self):
+        space = ParameterSpace({"period": (10, 30), "std_dev": (1.5, 2.5)})
+        grid = space.grid(3)
+        assert len(grid) == 9
+        assert {params["period"] for params in grid} == {10, 20, 30}
+        assert {params["std_dev"] for params in grid} == {1.5, 2.0, 2.5}
+        assert all(isinstance(params["period"], int) for params in grid)
+
+    def test_bayesian_concentrates_on_good_region(self):
+        space = ParameterSpace({"x": (0.0, 1.0), "y": (0.0, 1.0)})
+        rng = np.random.default_rng(0)
+
+        def score(params):
+            return -((params["x"] - 0.8) ** 2 + (params["y"] - 0.2) ** 2)
+
+        history = [(params, score(params)) for params in space.sample(rng, 30)]
+        for _ in range(5):
+            suggestions = suggest_bayesian(space, history, rng, 4)
+            history += [(params, score(params)) for params in suggestions]
+
+        late = [params for params, _ in history[-8:]]
+        distance = np.mean([-score(params) for params in late])
+        assert distance < np.mean([-score(params) for params, _ in history[:30]])
+
+    def test_window_metrics(self):
+        equity = np.array([100.0, 100.0, 110.0, 99.0, 121.0])
+        metrics = window_metrics(equity, start=2, periods_per_year=252)
+        assert metrics["total_return"] == pytest.approx(0.21)
+        assert metrics["max_drawdown"] == pytest.approx(0.1)
+
+
+class TestMappedPrices:
+    """Price data shared with worker processes through a memmap."""
+
+    @pytest.mark.parametrize("unit", ["s", "us", "ns"])
+    def test_round_trip_keeps_timestamps(self, tmp_path, unit, make_ohlcv):
+        data = make_ohlcv(periods=50)
+        data.index = data.index.as_unit(unit).tz_localize("UTC")
+
+        frame = mapped_price_frame(*write_price_memmap(data, tmp_path))
+        assert frame.index.equals(data.index)
+        assert (frame["close"] == data["close"]).all()
+
+
+class TestWalkForwardOptimizer:
+    """End-to-end optimization."""
+
+    def test_process_pool_matches_in_process(self, make_ohlcv):
+        data = make_ohlcv(periods=600)
+        options = dict(
+            method="grid", grid_points=3, folds=2, warmup_bars=60, seed=1
+        )
+
+        serial = WalkForwardOptimizer(MovingAverageStrategy, workers=1, **options)
+        parallel = WalkForwardOptimizer(MovingAverageStrategy, workers=2, **options)
+        serial_result = serial.run(data)
+        parallel_result = parallel.run(data)
+
+        assert len(serial_result.folds) == 2
+        for a, b in zip(serial_result.folds, parallel_result.folds):
+            assert a.best_parameters == b.best_parameters
+            assert a.test_metrics == b.test_metrics
+        assert serial_result.best_parameters == serial_result.folds[-1].best_parameters
+
+        report = serial_result.to_dict()
+        assert report["wall_time"] > 0
+        assert "out_of_sample_return" in report
+
+    def test_invalid_parameters_are_skipped(self, make_ohlcv):
+        data = make_ohlcv(periods=400)
+        optimizer = WalkForwardOptimizer(
+            MovingAverageStrategy,
+            ranges={"short_window": (5, 30), "long_window": (10, 20)},
+            method="random",
+            n_trials=12,
+            folds=1,
+            warmup_bars=40,
+            workers=1,
+            seed=2,
+        )
+        result = optimizer.run(data)
+        best = result.best_parameters
+        assert best["short_window"] < best["long_window"]
+
+    def test_failed_test_window_is_reported(self, monkeypatch, make_ohlcv):
+        data = make_ohlcv(periods=400)
+        backtest = MovingAverageStrategy.backtest
+
+        def failing_on_test_window(self, frame, *args, **kwargs):
+            if frame.index[-1] == data.index[-1]:
+                raise RuntimeError("exchange data gap")
+            return backtest(self, frame, *args, **kwargs)
+
+        monkeypatch.setattr(MovingAverageStrategy, "backtest", failing_on_test_window)
+        optimizer = WalkForwardOptimizer(
+            MovingAverageStrategy,
+            method="random",
+            n_trials=6,
+            folds=2,
+            warmup_bars=40,
+            workers=1,
+            seed=3,
+        )
+        result = optimizer.run(data)
+
+        assert [fold.test_metrics == {} for fold in result.folds] == [False, True]
+        report = result.to_dict()
+        assert report["untested_folds"] == [1]
+        assert report["out_of_sample_return"] == pytest.approx(
+            result.folds[0].test_metrics["total_return"]
+        )
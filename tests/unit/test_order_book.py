@@ -0,0 +1,218 @@
+"""
+Order book tests for Odin Trading Bot.
+Covers the local L2 book and exchange diff sequencing.
+"""
+
+import asyncio
+
+import pytest
+
+from fastapi import HTTPException
+
+from odin.api.routes.data import get_order_book_depth
+from odin.data import exchange_streams
+from odin.data.exchange_streams import (
+    BinanceConnector,
+    KrakenConnector,
+    StreamManager,
+    StreamType,
+)
+from odin.data.order_book import OrderBook
+
+
+@pytest.fixture
+def book():
+    book = OrderBook("binance", "BTC")
+    book.apply_snapshot(
+        bids=[["100.0", "1.0"], ["99.0", "2.0"], ["98.0", "3.0"]],
+        asks=[["101.0", "1.5"], ["102.0", "2.5"], ["103.0", "3.5"]],
+        update_id=10,
+    )
+    return book
+
+
+def diff(first_id, final_id, bids=(), asks=()):
+    return {
+        "e": "depthUpdate",
+        "s": "BTCUSDT",
+        "U": first_id,
+        "u": final_id,
+        "b": list(bids),
+        "a": list(asks),
+    }
+
+
+class TestOrderBook:
+    """Sorted price levels and queries."""
+
+    def test_queries(self, book):
+        assert book.best_bid() == 100.0
+        assert book.best_ask() == 101.0
+        assert book.mid() == 100.5
+        assert book.spread() == 1.0
+        assert book.spread_bps() == pytest.approx(1 / 100.5 * 10_000)
+        assert book.top(2) == {
+            "bids": [[100.0, 1.0], [99.0, 2.0]],
+            "asks": [[101.0, 1.5], [102.0, 2.5]],
+        }
+
+        # 100 bps of 100.5 reaches down to 99.495 and up to 101.505
+        depth = book.depth_at_bps(100)
+        assert depth["bid_volume"] == 1.0
+        assert depth["ask_volume"] == 1.5
+        assert book.depth_at_bps(300)["bid_volume"] == 6.0
+
+    def test_diff_inserts_updates_and_removes(self, book):
+        assert book.apply_diff(
+            bids=[["100.5", "0.5"], ["99.0", "0"]],
+            asks=[["101.0", "4.0"]],
+            first_id=11,
+            final_id=12,
+        )
+        assert book.top(3)["bids"] == [[100.5, 0.5], [100.0, 1.0], [98.0, 3.0]]
+        assert book.best_ask() == 101.0
+        assert book.asks.top(1) == [[101.0, 4.0]]
+        assert book.last_update_id == 12
+
+    def test_stale_diff_ignored(self, book):
+        assert not book.apply_diff([["100.0", "9.0"]], [], first_id=5, final_id=10)
+        assert book.best_bid() == 100.0
+        assert book.bids.top(1) == [[100.0, 1.0]]
+        assert book.stats["stale"] == 1
+
+    def test_gap_unsyncs_until_snapshot(self, book):
+        assert not book.apply_diff([["100.0", "5.0"]], [], first_id=15, final_id=16)
+        assert book.needs_snapshot
+        assert book.mid() is None
+        assert book.stats["gaps"] == 1
+
+        book.apply_diff([["100.0", "6.0"]], [], first_id=17, final_id=18)
+        assert book.apply_snapshot([["100.0", "1.0"]], [["101.0", "1.0"]], update_id=16)
+        # Event 15-16 is covered by the snapshot, 17-18 replays on top
+        assert book.bids.top(1) == [[100.0, 6.0]]
+        assert book.last_update_id == 18
+
+    def test_snapshot_older_than_buffer_needs_another(self):
+        book = OrderBook("binance", "BTC")
+        assert not book.apply_diff([], [], first_id=50, final_id=55)
+        assert not book.apply_snapshot([["1", "1"]], [["2", "1"]], update_id=40)
+        assert book.needs_snapshot
+        assert book.apply_snapshot([["1", "1"]], [["2", "1"]], update_id=52)
+        assert book.last_update_id == 55
+
+    def test_max_depth_truncates(self):
+        book = OrderBook("kraken", "BTC", max_depth=2)
+        book.apply_snapshot([[str(p), "1"] for p in range(90, 100)], [["101", "1"]])
+        assert book.top(10)["bids"] == [[99.0, 1.0], [98.0, 1.0]]
+
+
+class TestBinanceDepth:
+    """Diff stream with REST snapshot resync."""
+
+    async def test_buffers_until_snapshot_then_resyncs_on_gap(self):
+        received = []
+        snapshots = [
+            {"lastUpdateId": 100, "bids": [["50000", "1"]], "asks": [["50010", "1"]]},
+            {"lastUpdateId": 300, "bids": [["51000", "1"]], "asks": [["51010", "1"]]},
+        ]
+        connector = BinanceConnector(received.append)
+
+        async def fetch_snapshot(symbol):
+            return snapshots.pop(0)
+
+        connector._fetch_depth_snapshot = fetch_snapshot
+
+        await connector._handle_depth(diff(95, 101, bids=[["50000", "2"]]))
+        await connector._handle_depth(diff(102, 103, asks=[["50005", "1"]]))
+        await asyncio.sleep(0.01)
+
+        book = connector.get_order_book("BTC")
+        assert book.synced
+        assert book.last_update_id == 103
+        assert book.top(1) == {"bids": [[50000.0, 2.0]], "asks": [[50005.0, 1.0]]}
+        assert received[-1].stream_type == StreamType.DEPTH
+        assert received[-1].data["mid"] == 50002.5
+
+        # Missing 104-199 forces a fresh snapshot
+        await connector._handle_depth(diff(200, 301, bids=[["51001", "1"]]))
+        assert not book.synced
+        await asyncio.sleep(0.01)
+        assert book.synced
+        assert book.best_bid() == 51001.0
+        assert book.stats["snapshots"] == 2
+        print("✅ Gap detected and book resynced from snapshot")
+
+
+class TestKrakenDepth:
+    """Checksummed book channel."""
+
+    # Example book and checksum from Kraken's WebSocket v1 checksum guide
+    DOCUMENTED_ASKS = [
+        "0.05005", "0.05010", "0.05015", "0.05020", "0.05025",
+        "0.05030", "0.05035", "0.05040", "0.05045", "0.05050",
+    ]
+    DOCUMENTED_BIDS = [
+        "0.05000", "0.04995", "0.04990", "0.04980", "0.04975",
+        "0.04970", "0.04965", "0.04960", "0.04955", "0.04950",
+    ]
+    DOCUMENTED_CHECKSUM = "974947235"
+
+    async def test_checksum_verified(self):
+        received = []
+        connector = KrakenConnector(received.append)
+        snapshot = {
+            "as": [[price, "0.00000500", "1"] for price in self.DOCUMENTED_ASKS],
+            "bs": [[price, "0.00000500", "1"] for price in self.DOCUMENTED_BIDS],
+        }
+        await connector._handle_message([0, snapshot, "book-10", "XBT/USD"])
+        book = connector.get_order_book("BTC")
+        assert book.kraken_checksum() == int(self.DOCUMENTED_CHECKSUM)
+
+        update = {
+            "a": [["0.05005", "0.00000500", "2"]],
+            "c": self.DOCUMENTED_CHECKSUM,
+        }
+        await connector._handle_message([0, update, "book-10", "XBT/USD"])
+        assert book.synced
+        assert received[-1].data["asks"][0] == [0.05005, 0.000005]
+
+        # Bids and asks in one message, with a checksum that does not match
+        await connector._handle_message([
+            0,
+            {"a": [["0.05005", "2.0", "3"]]},
+            {"b": [["0.05000", "0", "3"]], "c": "12345"},
+            "book-10",
+            "XBT/USD",
+        ])
+        assert not book.synced
+        assert book.stats["gaps"] == 1
+
+
+class TestDepthEndpoint:
+    """GET /depth reads tracked books without side effects."""
+
+    @pytest.fixture
+    def stream_mgr(self, monkeypatch):
+        manager = StreamManager()
+        monkeypatch.setattr(exchange_streams, "_stream_manager", manager)
+        return manager
+
+    async def test_serves_synced_book(self, stream_mgr, book):
+        connector = KrakenConnector(lambda data: None)
+        connector.order_books["BTC"] = book
+        stream_mgr.connectors["kraken"] = connector
+
+        response = await get_order_book_depth("btc", levels=2, exchange="kraken")
+        assert response["data"]["bids"] == [[100.0, 1.0], [99.0, 2.0]]
+        assert set(response["data"]["depth_bps"]) == {"10", "25", "50", "100"}
+
+    async def test_unknown_exchange_and_missing_book(self, stream_mgr):
+        with pytest.raises(HTTPException) as error:
+            await get_order_book_depth("BTC", levels=10, exchange="ftx")
+        assert error.value.status_code == 404
+
+        with pytest.raises(HTTPException) as error:
+            await get_order_book_depth("BTC", levels=10, exchange=None)
+        assert error.value.status_code == 503
+        # Nothing was connected or subscribed by the request
+        assert stream_mgr.connectors == {}
@@ -0,0 +1,86 @@
+"""
+Backtest result cache tests for Odin Trading Bot.
+Covers stored hits, resuming over new bars and invalidation.
+"""
+
+import numpy as np
+import pytest
+
+from odin.core.database import DatabaseManager
+from odin.strategies.macd import MACDStrategy
+from odin.strategies.moving_average import MovingAverageStrategy
+from odin.strategies.result_cache import (
+    CACHE_HIT,
+    CACHE_MISS,
+    CACHE_RESUMED,
+    BacktestResultCache,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return BacktestResultCache(DatabaseManager(str(tmp_path / "backtests.db")))
+
+
+class TestBacktestResultCache:
+    """Persistent backtest results."""
+
+    def test_hit_after_miss(self, cache, make_ohlcv):
+        data = make_ohlcv()
+        first, status = cache.run(MACDStrategy(), data)
+        assert status == CACHE_MISS
+
+        second, status = cache.run(MACDStrategy(), data)
+        assert status == CACHE_HIT
+        np.testing.assert_allclose(
+            second.equity_curve.to_numpy(), first.equity_curve.to_numpy()
+        )
+        assert [t["timestamp"] for t in second.trades] == [
+            t["timestamp"] for t in first.trades
+        ]
+        assert second.performance == first.performance
+        assert second.state == first.state
+
+    def test_resumes_over_new_bars(self, cache, make_ohlcv):
+        data = make_ohlcv(periods=500)
+        cache.run(MACDStrategy(), data.iloc[:300])
+
+        resumed, status = cache.run(MACDStrategy(), data)
+        full = MACDStrategy().backtest(data.copy(), vectorized=True)
+
+        assert status == CACHE_RESUMED
+        np.testing.assert_allclose(
+            resumed.equity_curve.to_numpy(), full.equity_curve.to_numpy()
+        )
+        assert len(resumed.trades) == len(full.trades)
+        assert resumed.performance.sharpe_ratio == pytest.approx(
+            full.performance.sharpe_ratio
+        )
+        assert cache.run(MACDStrategy(), data)[1] == CACHE_HIT
+
+    def test_changed_rows_invalidate(self, cache, make_ohlcv):
+        data = make_ohlcv()
+        cache.run(MACDStrategy(), data)
+
+        revised = data.copy()
+        revised.iloc[50, revised.columns.get_loc("close")] *= 1.01
+        assert cache.run(MACDStrategy(), revised)[1] == CACHE_MISS
+
+    def test_keyed_by_parameters_and_capital(self, cache, make_ohlcv):
+        data = make_ohlcv()
+        cache.run(MovingAverageStrategy(short_window=5, long_window=20), data)
+
+        assert (
+            cache.run(MovingAverageStrategy(short_window=5, long_window=30), data)[1]
+            == CACHE_MISS
+        )
+        assert (
+            cache.run(
+                MovingAverageStrategy(short_window=5, long_window=20), data, 5000.0
+            )[1]
+            == CACHE_MISS
+        )
+        assert (
+            cache.run(MovingAverageStrategy(short_window=5, long_window=20), data)[1]
+            == CACHE_HIT
+        )
@@ -0,0 +1,85 @@
+"""
+Robustness analysis tests for Odin Trading Bot.
+Covers bootstrap and block-bootstrap confidence intervals for backtests.
+"""
+
+import numpy as np
+import pytest
+
+from odin.strategies.robustness import (
+    METRICS,
+    MonteCarloAnalyzer,
+    _sample_paths,
+    path_metrics,
+    trade_growth,
+)
+from odin.strategies.rsi import RSIStrategy
+
+
+@pytest.fixture(scope="module")
+def backtest(make_ohlcv):
+    return RSIStrategy().backtest(make_ohlcv(periods=1500, seed=3), vectorized=True)
+
+
+class TestMonteCarloAnalyzer:
+    """Resampled confidence intervals."""
+
+    def test_block_point_matches_backtest(self, backtest):
+        report = MonteCarloAnalyzer("blocks", paths=500, seed=1).run(backtest)
+
+        performance = backtest.performance
+        for name in METRICS:
+            interval = report.metrics[name]
+            assert interval.point == pytest.approx(getattr(performance, name))
+            assert interval.lower <= interval.median <= interval.upper
+        assert report.steps == 1499
+        assert report.block_size == round(1499 ** (1 / 3))
+        assert 0 <= report.probability_of_loss <= 1
+
+    def test_trade_bootstrap(self, backtest):
+        growth = trade_growth(backtest)
+        report = MonteCarloAnalyzer("trades", paths=500, seed=1).run(backtest)
+
+        assert report.steps == len(growth) > 1
+        assert report.metrics["total_return"].point == pytest.approx(
+            np.prod(growth) - 1
+        )
+        assert report.metrics["max_drawdown"].lower >= 0
+
+    def test_reproducible_across_workers(self, backtest):
+        local = MonteCarloAnalyzer(paths=300, seed=7).run(backtest)
+        pooled = MonteCarloAnalyzer(paths=300, seed=7, workers=2).run(backtest)
+        assert pooled.to_dict()["metrics"] == local.to_dict()["metrics"]
+
+    def test_rejects_bad_options_and_short_results(self, backtest, make_ohlcv):
+        with pytest.raises(ValueError):
+            MonteCarloAnalyzer("prices")
+        with pytest.raises(ValueError):
+            MonteCarloAnalyzer(confidence=1.5)
+
+        flat = RSIStrategy().backtest(make_ohlcv(periods=30), vectorized=True)
+        with pytest.raises(ValueError):
+            MonteCarloAnalyzer("trades").run(flat)
+
+
+class TestPathMetrics:
+    """Batch path generation and scoring."""
+
+    def test_metrics_of_known_path(self):
+        growth = np.array([[1.1, 0.5, 1.2]])
+        metrics = path_metrics(growth, periods_per_year=1)
+
+        assert metrics["total_return"][0] == pytest.approx(1.1 * 0.5 * 1.2 - 1)
+        assert metrics["max_drawdown"][0] == pytest.approx(0.5)
+        returns = growth[0] - 1
+        assert metrics["sharpe_ratio"][0] == pytest.approx(
+            returns.mean() / returns.std(ddof=1)
+        )
+
+    def test_blocks_are_contiguous(self):
+        values = np.arange(20.0)
+        paths = _sample_paths(np.random.default_rng(0), values, 50, block_size=5)
+
+        assert paths.shape == (50, 20)
+        blocks = paths.reshape(50, 4, 5)
+        assert (np.diff(blocks, axis=2) == 1).all()
@@ -0,0 +1,111 @@
+"""
+Backtest session tests for Odin Trading Bot.
+Covers advancing over appended bars and resuming from a checkpoint file.
+"""
+
+import json
+
+import pytest
+
+from odin.core.indicators import StreamingIndicators, StreamingMACD
+from odin.strategies.macd import MACDStrategy
+from odin.strategies.moving_average import MovingAverageStrategy
+from odin.strategies.rsi import RSIStrategy
+from odin.strategies.session import BacktestSession
+
+
+class TestBacktestSession:
+    """Incremental, restartable backtests."""
+
+    @pytest.mark.parametrize("vectorized", [False, True])
+    @pytest.mark.parametrize("strategy_class", [RSIStrategy, MACDStrategy])
+    def test_restarts_match_uninterrupted_run(
+        self, tmp_path, strategy_class, vectorized, make_ohlcv
+    ):
+        data = make_ohlcv(periods=300, seed=3)
+        expected = strategy_class().backtest(data.copy(), vectorized=vectorized)
+        path = tmp_path / "session.json"
+
+        BacktestSession(strategy_class(), path=path, vectorized=vectorized).advance(
+            data.iloc[:150]
+        )
+        BacktestSession.restore(path).advance(data.iloc[:220])
+        result = BacktestSession.restore(path).advance(data)
+
+        assert result.final_capital == pytest.approx(expected.final_capital)
+        assert len(result.equity_curve) == len(expected.equity_curve)
+        assert [t["type"] for t in result.trades] == [
+            t["type"] for t in expected.trades
+        ]
+        assert result.state.bars == 300
+
+    def test_checkpoint_contents(self, tmp_path, make_ohlcv):
+        data = make_ohlcv(periods=200, seed=3)
+        path = tmp_path / "rsi.json"
+        session = BacktestSession(RSIStrategy(), path=path, vectorized=False)
+        session.advance(data)
+
+        saved = json.loads(path.read_text())
+        assert saved["strategy"] == "rsi"
+        assert saved["portfolio"]["bars"] == 200
+        assert saved["strategy_state"] == {
+            "previous_rsi_state": session.strategy.previous_rsi_state
+        }
+        assert len(saved["equity"]) == 200
+
+        restored = BacktestSession.restore(path)
+        assert restored.bars == 200
+        assert (
+            restored.strategy.previous_rsi_state
+            == session.strategy.previous_rsi_state
+        )
+        assert restored.indicators.snapshot() == session.indicators.snapshot()
+
+    def test_indicators_follow_new_bars(self, make_ohlcv):
+        data = make_ohlcv(periods=120, seed=4)
+        session = BacktestSession(MovingAverageStrategy(short_window=5, long_window=20))
+        session.advance(data.iloc[:60])
+        session.advance(data)
+
+        fresh = StreamingIndicators()
+        for timestamp, price in data["close"].items():
+            fresh.update(price, timestamp)
+        assert session.indicators.snapshot() == fresh.snapshot()
+
+    def test_same_data_is_not_resimulated(self, make_ohlcv):
+        data = make_ohlcv(periods=100)
+        session = BacktestSession(RSIStrategy())
+        first = session.advance(data)
+        assert session.advance(data) is first
+
+    def test_rejects_data_that_does_not_continue(self, tmp_path, make_ohlcv):
+        data = make_ohlcv(periods=100)
+        session = BacktestSession(RSIStrategy(), path=tmp_path / "s.json")
+        session.advance(data)
+
+        with pytest.raises(ValueError):
+            session.advance(data.iloc[:50])
+        shifted = make_ohlcv(periods=120)
+        shifted.index = shifted.index + shifted.index.freq
+        with pytest.raises(ValueError):
+            BacktestSession.restore(tmp_path / "s.json").advance(shifted)
+
+
+class TestIndicatorState:
+    """Streaming indicator checkpoints."""
+
+    def test_round_trip_continues_identically(self):
+        prices = [100 + (i * 7 % 13) for i in range(80)]
+        original = StreamingMACD()
+        for price in prices[:50]:
+            original.update(price)
+
+        restored = StreamingMACD()
+        restored.set_state(json.loads(json.dumps(original.get_state())))
+        for price in prices[50:]:
+            assert restored.update(price) == original.update(price)
+        assert restored.signal == original.signal
+
+    def test_rejects_other_period(self):
+        with pytest.raises(ValueError):
+            StreamingMACD(slow=30).set_state(StreamingMACD().get_state())
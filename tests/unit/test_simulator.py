@@ -0,0 +1,153 @@
+"""
+Event-driven simulator tests for Odin Trading Bot.
+Covers fills against the local book, queue position, costs and agreement
+with the bar backtest.
+"""
+
+import heapq
+
+import pytest
+
+from odin.data.exchange_streams import StreamData, StreamType
+from odin.data.order_book import BookSide
+from odin.data.recording import StreamRecorder
+from odin.strategies.moving_average import MovingAverageStrategy
+from odin.strategies.rsi import RSIStrategy
+from odin.strategies.simulator import (
+    DEPTH,
+    TRADE,
+    ExecutionCosts,
+    TickSimulator,
+    _walk,
+    archive_events,
+    recording_events,
+    trade_bars,
+)
+
+
+def arrive(simulator):
+    """Run the scheduled order arrival."""
+    simulator._dispatch(heapq.heappop(simulator._heap), None, None, None, None)
+
+
+class TestTickSimulator:
+    """Simulating bar signals on market events."""
+
+    @pytest.mark.parametrize("strategy_class", [RSIStrategy, MovingAverageStrategy])
+    def test_costless_run_matches_backtest(self, strategy_class, make_ohlcv):
+        bars = make_ohlcv(periods=600, seed=3)
+        backtest = strategy_class().backtest(bars.copy(), vectorized=True)
+        result = TickSimulator(strategy_class()).run(archive_events(bars), bars)
+
+        comparison = result.compare(backtest)
+        assert result.final_capital == pytest.approx(backtest.final_capital)
+        assert comparison["round_trips"]["difference"] == 0
+        assert result.events == 4 * 600
+        assert result.fees_paid == 0
+
+    def test_fees_and_latency(self, make_ohlcv):
+        bars = make_ohlcv(periods=600, seed=3)
+        free = TickSimulator(RSIStrategy()).run(archive_events(bars), bars)
+        costs = ExecutionCosts(taker_fee_bps=10, latency=5)
+        result = TickSimulator(RSIStrategy(), costs=costs).run(
+            archive_events(bars), bars
+        )
+
+        assert result.trades
+        assert result.fees_paid > 0
+        assert result.final_capital < free.final_capital
+        for trade in result.trades:
+            assert trade["latency"] == pytest.approx(5)
+            assert trade["liquidity"] == "taker"
+            assert trade["fee"] == pytest.approx(trade["value"] * 0.001)
+
+    def test_rejects_unknown_order_type(self):
+        with pytest.raises(ValueError):
+            TickSimulator(RSIStrategy(), order_type="stop")
+
+
+class TestExecution:
+    """Order book fills and queue position."""
+
+    def make_simulator(self, **kwargs):
+        simulator = TickSimulator(RSIStrategy(), **kwargs)
+        simulator._reset()
+        simulator.book.apply_snapshot([[100.0, 2.0]], [[101.0, 1.0], [102.0, 1.0]])
+        simulator.last_price = 100.5
+        return simulator
+
+    def test_walk_book(self):
+        asks = BookSide(descending=False)
+        for price, quantity in ((101.0, 1.0), (102.0, 1.0)):
+            asks.update(price, quantity)
+
+        assert _walk(asks, notional=152.0) == pytest.approx((1.5, 152.0))
+        assert _walk(asks, quantity=3.0) == pytest.approx((2.0, 203.0))
+
+    def test_market_buy_walks_book(self):
+        simulator = self.make_simulator(initial_capital=200.0)
+        simulator._decide(0.0, 1, 0.76, 1.0)
+        arrive(simulator)
+
+        trade = simulator.trades[-1]
+        assert trade["amount"] == pytest.approx(1.5)
+        assert trade["price"] == pytest.approx(152.0 / 1.5)
+        assert simulator.position == pytest.approx(1.5)
+        assert simulator.cash == pytest.approx(48.0)
+
+    def test_limit_order_waits_in_queue(self):
+        simulator = self.make_simulator(
+            initial_capital=200.0,
+            order_type="limit",
+            costs=ExecutionCosts(maker_fee_bps=2),
+        )
+        simulator._decide(0.0, 1, 0.5, 1.0)
+        arrive(simulator)
+        order = simulator.working
+        assert order.limit_price == 100.0
+        assert order.queue_ahead == 2.0
+
+        simulator._on_trade(1.0, 100.0, 1.5, "sell")
+        assert order.filled == 0
+        simulator.book.apply_snapshot([[100.0, 0.2]], [[101.0, 1.0]])
+        simulator._on_depth()
+        assert order.queue_ahead == pytest.approx(0.2)
+
+        simulator._on_trade(2.0, 100.0, 1.0, "sell")
+        assert order.filled == pytest.approx(0.8)
+        simulator._on_trade(3.0, 99.0, 0.1, "sell")
+
+        trade = simulator.trades[-1]
+        assert simulator.working is None
+        assert trade["amount"] == pytest.approx(1.0)
+        assert trade["liquidity"] == "maker"
+        assert trade["fee"] == pytest.approx(100.0 * 0.0002)
+
+
+class TestRecordedEvents:
+    """Events and bars from stream recordings."""
+
+    def test_recording_round_trip(self, tmp_path):
+        path = tmp_path / "session.rec"
+        with StreamRecorder(path) as recorder:
+            for i in range(6):
+                recorder.record(
+                    StreamData(
+                        "binance", "BTC", StreamType.TRADE, 60.0 * i,
+                        {"price": 100.0 + i, "quantity": 1.0, "side": "buy"},
+                    )
+                )
+            recorder.record(
+                StreamData(
+                    "binance", "BTC", StreamType.DEPTH, 400.0,
+                    {"bids": [[104.0, 1.0]], "asks": [[106.0, 1.0]], "synced": True},
+                )
+            )
+
+        events = list(recording_events(path, symbol="BTC"))
+        assert [event[1] for event in events] == [TRADE] * 6 + [DEPTH]
+
+        bars = trade_bars(events, seconds=120)
+        assert list(bars["open"]) == [100.0, 102.0, 104.0]
+        assert list(bars["close"]) == [101.0, 103.0, 105.0]
+        assert list(bars["volume"]) == [2.0, 2.0, 2.0]
@@ -245,6 +245,68 @@ class TestRSIStrategy:
             pytest.skip(f"RSI calculation failed: {e}")
 
 
+class TestSwingTradingStrategy:
+    """Test vectorized swing point and support/resistance detection."""
+
+    @staticmethod
+    def loop_swings(values, lookback, pick):
+        swings = pd.Series(index=values.index, dtype=float)
+        for i in range(lookback, len(values) - lookback):
+            if values.iloc[i] == pick(values.iloc[i - lookback:i + lookback + 1]):
+                swings.iloc[i] = values.iloc[i]
+        return swings
+
+    @staticmethod
+    def loop_levels(close, swings, below):
+        points = swings.dropna()
+        levels = pd.Series(index=close.index, dtype=float)
+        for i in range(len(close)):
+            price = close.iloc[i]
+            earlier = points[points.index < close.index[i]]
+            matches = earlier[earlier < price] if below else earlier[earlier > price]
+            if len(matches) > 0:
+                levels.iloc[i] = matches.iloc[-1]
+            else:
+                levels.iloc[i] = price * (0.95 if below else 1.05)
+        return levels
+
+    def test_matches_loop_implementation(self):
+        """Vectorized swings and levels reproduce the per-bar loops."""
+        from odin.strategies.swing_trading import SwingTradingStrategy
+
+        rng = np.random.default_rng(11)
+        close = pd.Series(
+            100 + np.cumsum(rng.normal(0, 1, 600)),
+            index=pd.date_range("2024-01-01", periods=600, freq="h"),
+        )
+        data = pd.DataFrame(
+            {"close": close, "high": close + rng.uniform(0, 1, 600),
+             "low": close - rng.uniform(0, 1, 600)}
+        )
+        strategy = SwingTradingStrategy()
+
+        data["swing_high"] = strategy._detect_swing_highs(data["high"])
+        data["swing_low"] = strategy._detect_swing_lows(data["low"])
+        pd.testing.assert_series_equal(
+            data["swing_high"], self.loop_swings(data["high"], 5, max),
+            check_names=False,
+        )
+        pd.testing.assert_series_equal(
+            data["swing_low"], self.loop_swings(data["low"], 5, min),
+            check_names=False,
+        )
+
+        pd.testing.assert_series_equal(
+            strategy._find_nearest_support(data),
+            self.loop_levels(data["close"], data["swing_low"], below=True),
+        )
+        pd.testing.assert_series_equal(
+            strategy._find_nearest_resistance(data),
+            self.loop_levels(data["close"], data["swing_high"], below=False),
+        )
+        print("✅ Swing detection matches loop implementation")
+
+
 class TestStrategyRegistry:
     """Test strategy registry functions if available."""
     
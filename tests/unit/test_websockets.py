@@ -0,0 +1,217 @@
+"""
+WebSocket client tests for Odin Trading Bot.
+Covers the bounded per-client send queue and pre-serialized broadcast.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from odin.api.routes.websockets import ClientConnection
+from odin.data import exchange_streams
+from odin.data.exchange_streams import StreamData, StreamManager, StreamType
+
+
+class FakeWebSocket:
+    """Records sent messages; optionally blocks until released."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def send_text(self, text: str):
+        await self.gate.wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(text))
+
+
+def ticker(price: float, symbol: str = "BTC", exchange: str = "binance"):
+    return StreamData(exchange, symbol, StreamType.TICKER, 0.0, {"price": price})
+
+
+def trade(price: float, symbol: str = "BTC"):
+    return StreamData("binance", symbol, StreamType.TRADE, 0.0, {"price": price})
+
+
+async def drain(client: ClientConnection):
+    for _ in range(100):
+        if not client._pending:
+            return
+        await asyncio.sleep(0.01)
+
+
+class TestClientSendQueue:
+    """Single writer task with conflation and bounded trades."""
+
+    async def test_messages_sent_in_order(self):
+        websocket = FakeWebSocket()
+        client = ClientConnection(websocket)
+
+        await client.send({"type": "connection"})
+        client.on_stream_data(ticker(100.0))
+        client.on_stream_data(trade(101.0))
+        await drain(client)
+
+        assert [message["type"] for message in websocket.sent] == [
+            "connection",
+            "price_update",
+            "price_update",
+        ]
+        assert websocket.sent[2]["stream_type"] == "trade"
+        await client.close()
+
+    async def test_slow_client_gets_latest_ticker(self):
+        websocket = FakeWebSocket()
+        websocket.gate.clear()
+        client = ClientConnection(websocket)
+
+        # First update is picked up by the writer and blocks in send_text
+        client.on_stream_data(ticker(1.0))
+        await asyncio.sleep(0)
+        for price in range(2, 1001):
+            client.on_stream_data(ticker(float(price)))
+        client.on_stream_data(ticker(5.0, symbol="ETH"))
+
+        assert client.get_metrics()["queue_depth"] == 2
+        websocket.gate.set()
+        await drain(client)
+
+        prices = [(m["symbol"], m["data"]["price"]) for m in websocket.sent]
+        assert prices == [("BTC", 1.0), ("BTC", 1000.0), ("ETH", 5.0)]
+        metrics = client.get_metrics()
+        assert metrics["conflated"] == 998
+        assert metrics["sent"] == 3
+        assert metrics["max_lag_ms"] > 0
+        print("✅ 1000 tickers to a stalled client sent as 2 messages")
+        await client.close()
+
+    async def test_trades_drop_oldest_when_full(self):
+        websocket = FakeWebSocket()
+        websocket.gate.clear()
+        client = ClientConnection(websocket, max_queue=10)
+
+        client.on_stream_data(trade(0.0))
+        await asyncio.sleep(0)
+        for price in range(1, 51):
+            client.on_stream_data(trade(float(price)))
+
+        assert client.get_metrics()["dropped"] == 40
+        websocket.gate.set()
+        await drain(client)
+
+        prices = [message["data"]["price"] for message in websocket.sent]
+        assert prices == [0.0] + [float(price) for price in range(41, 51)]
+        await client.close()
+
+    async def test_trades_batched_per_symbol(self):
+        websocket = FakeWebSocket()
+        websocket.gate.clear()
+        client = ClientConnection(websocket, trade_policy="batch")
+
+        client.on_stream_data(trade(0.0))
+        await asyncio.sleep(0)
+        for price in range(1, 6):
+            client.on_stream_data(trade(float(price)))
+
+        websocket.gate.set()
+        await drain(client)
+
+        batch = websocket.sent[-1]
+        assert batch["stream_type"] == "trade"
+        assert batch["data"]["price"] == 5.0
+        assert [item["price"] for item in batch["data"]["batch"]] == [1, 2, 3, 4, 5]
+        assert client.get_metrics()["batched"] == 4
+        await client.close()
+
+    async def test_stalled_batch_keeps_newest_trades(self):
+        websocket = FakeWebSocket()
+        websocket.gate.clear()
+        client = ClientConnection(websocket, max_queue=10, trade_policy="batch")
+
+        client.on_stream_data(trade(0.0))
+        await asyncio.sleep(0)
+        for price in range(1, 1001):
+            client.on_stream_data(trade(float(price)))
+
+        metrics = client.get_metrics()
+        assert metrics["dropped"] == 990
+        assert metrics["queue_depth"] == 1
+        websocket.gate.set()
+        await drain(client)
+
+        batch = websocket.sent[-1]["data"]["batch"]
+        assert [item["price"] for item in batch] == list(range(991, 1001))
+        await client.close()
+
+    async def test_paused_client_holds_stream_data(self):
+        websocket = FakeWebSocket()
+        client = ClientConnection(websocket)
+        client.paused = True
+
+        client.on_stream_data(ticker(100.0))
+        await asyncio.sleep(0.02)
+        assert websocket.sent == []
+
+        client.paused = False
+        await client.flush_buffer()
+        await drain(client)
+        assert websocket.sent[0]["data"]["price"] == 100.0
+        await client.close()
+
+    async def test_send_error_stops_writer(self):
+        class BrokenWebSocket:
+            async def send_text(self, text):
+                raise RuntimeError("connection reset")
+
+        client = ClientConnection(BrokenWebSocket())
+        client.on_stream_data(ticker(100.0))
+        await asyncio.sleep(0.02)
+
+        assert client.closed
+        assert client.get_metrics()["send_errors"] == 1
+        client.on_stream_data(ticker(101.0))
+        assert client.get_metrics()["queue_depth"] == 0
+        await client.close()
+
+    def test_unknown_trade_policy(self):
+        with pytest.raises(ValueError):
+            ClientConnection(FakeWebSocket(), trade_policy="keep_all")
+
+
+class TestBroadcastSerialization:
+    """StreamManager serializes each update once for all subscribers."""
+
+    async def test_update_encoded_once(self, monkeypatch):
+        calls = 0
+        encode = exchange_streams.encode_message
+
+        def counting_encode(message):
+            nonlocal calls
+            calls += 1
+            return encode(message)
+
+        monkeypatch.setattr(exchange_streams, "encode_message", counting_encode)
+        stream_mgr = StreamManager()
+        sockets = [FakeWebSocket() for _ in range(20)]
+        clients = [ClientConnection(websocket) for websocket in sockets]
+        for client in clients:
+            await stream_mgr.subscribe("BTC", client.on_stream_data)
+
+        stream_mgr._on_stream_data(ticker(50000.0))
+        for client in clients:
+            await drain(client)
+
+        assert calls == 1
+        assert all(ws.sent == [json.loads(ticker(50000.0).encode())] for ws in sockets)
+        for client in clients:
+            await client.close()
+        print("✅ 20 subscribers shared one serialization")
+
+    def test_encoded_message_matches_json(self):
+        update = ticker(50000.5)
+        assert json.loads(update.encode()) == update.to_message()
+        assert update.encode() is update.encode()
@@ -1676,32 +1676,20 @@ calculateAllIndicators(prices) {
     async loadMarketDepth() {
         const loadingKey = "market-depth";
         try {
-            // Try Binance API first (may be geo-restricted)
+            // Served from the backend's streamed local order book
             this.showLoading(loadingKey, "Loading market depth...");
             console.log("📊 Fetching real market depth...");
-            const coinInfo = this.getCoinInfo();
-            let response = await fetch(
-                `https://api.binance.com/api/v3/depth?symbol=${coinInfo.binanceSymbol}&limit=50`,
+            const response = await fetch(
+                `${this.apiBase}/data/depth/${this.selectedCoin}?levels=50`,
             );
 
-            // If Binance fails (geo-restriction), try through our backend or alternative
-            if (!response.ok || response.status === 451) {
-                console.log("⚠️ Binance API unavailable (geo-restriction), trying alternatives...");
-
-                // Try CoinGecko as fallback (no order book depth available on free tier)
-                // Show informative message instead
+            if (!response.ok) {
+                console.log("⚠️ Order book not available yet");
                 this.showDepthUnavailable();
                 return;
             }
 
-            const data = await response.json();
-
-            // Check for Binance error response
-            if (data.code === 0 && data.msg) {
-                console.log("⚠️ Binance API restricted:", data.msg);
-                this.showDepthUnavailable();
-                return;
-            }
+            const { data } = await response.json();
 
             console.log("✅ Real order book data received");
             this.updateDepthChart(data);